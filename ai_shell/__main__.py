@@ -22,6 +22,7 @@ from ai_shell.todo_tool import TodoTool
 from ai_shell.token_tool import TokenCounterTool
 from ai_shell.utils.config_manager import Config
 from ai_shell.utils.console_utils import pretty_console
+from ai_shell.utils.file_index import open_file_index
 
 CONFIG = Config()
 # pylint: disable=unused-argument
@@ -110,6 +111,18 @@ def cat_markdown_command(args):
     )
 
 
+def cat_range_command(args):
+    """Invoke cat_range"""
+    tool = CatTool(".", CONFIG)
+    pretty_console(
+        tool.cat_range(
+            end_line=args.end_line,
+            file_path=args.file_path,
+            start_line=args.start_line,
+        )
+    )
+
+
 def cut_characters_command(args):
     """Invoke cut_characters"""
     tool = CutTool(".", CONFIG)
@@ -151,6 +164,7 @@ def find_files_command(args):
     pretty_console(
         tool.find_files(
             file_type=args.file_type,
+            limit=args.limit,
             name=args.name,
             regex=args.regex,
             size=args.size,
@@ -164,6 +178,7 @@ def find_files_markdown_command(args):
     pretty_console(
         tool.find_files_markdown(
             file_type=args.file_type,
+            limit=args.limit,
             name=args.name,
             regex=args.regex,
             size=args.size,
@@ -287,22 +302,69 @@ def grep_command(args):
     tool = GrepTool(".", CONFIG)
     pretty_console(
         tool.grep(
+            context_after=args.context_after,
+            context_before=args.context_before,
+            fixed_strings=args.fixed_strings,
             glob_pattern=args.glob_pattern,
             maximum_matches_per_file=args.maximum_matches_per_file,
             maximum_matches_total=args.maximum_matches_total,
+            multiline=args.multiline,
             regex=args.regex,
             skip_first_matches=args.skip_first_matches,
         )
     )
 
 
+def grep_count_command(args):
+    """Invoke grep_count"""
+    tool = GrepTool(".", CONFIG)
+    pretty_console(
+        tool.grep_count(
+            fixed_strings=args.fixed_strings,
+            glob_pattern=args.glob_pattern,
+            multiline=args.multiline,
+            regex=args.regex,
+        )
+    )
+
+
+def grep_files_with_matches_command(args):
+    """Invoke grep_files_with_matches"""
+    tool = GrepTool(".", CONFIG)
+    pretty_console(
+        tool.grep_files_with_matches(
+            fixed_strings=args.fixed_strings,
+            glob_pattern=args.glob_pattern,
+            maximum_files=args.maximum_files,
+            multiline=args.multiline,
+            regex=args.regex,
+        )
+    )
+
+
+def grep_many_command(args):
+    """Invoke grep_many"""
+    tool = GrepTool(".", CONFIG)
+    pretty_console(
+        tool.grep_many(
+            glob_pattern=args.glob_pattern,
+            maximum_matches_per_pattern=args.maximum_matches_per_pattern,
+            patterns=args.patterns,
+        )
+    )
+
+
 def grep_markdown_command(args):
     """Invoke grep_markdown"""
     tool = GrepTool(".", CONFIG)
     pretty_console(
         tool.grep_markdown(
+            context_lines=args.context_lines,
+            fixed_strings=args.fixed_strings,
             glob_pattern=args.glob_pattern,
             maximum_matches=args.maximum_matches,
+            multiline=args.multiline,
+            output_mode=args.output_mode,
             regex=args.regex,
             skip_first_matches=args.skip_first_matches,
         )
@@ -593,6 +655,15 @@ def pytest_command(args):
     pretty_console(tool.pytest())
 
 
+def file_index_command(args):
+    """Build or refresh the file metadata index and show what is in it"""
+    with open_file_index(".", CONFIG) as index:
+        if args.rebuild:
+            index.clear()
+        refreshed = index.refresh()
+        pretty_console({**index.summary(), "refresh": refreshed})
+
+
 def run():
     """Create the main parser"""
     program = "ais"
@@ -747,6 +818,26 @@ def run():
     )
     cat_markdown_parser.set_defaults(func=cat_markdown_command)
 
+    # Create a parser for the "cat_range" command
+    cat_range_parser = subparsers.add_parser(
+        "cat_range",
+        help="Return a range of lines of one file, numbered like cat_markdown, without reading the lines before it..",
+    )
+    cat_range_parser.add_argument(
+        "--end-line",
+        dest="end_line",
+        default=-1,
+        help="The last line, included. -1 for the end of the file., defaults to -1",
+    )
+    cat_range_parser.add_argument("--file-path", dest="file_path", help="The file.")
+    cat_range_parser.add_argument(
+        "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
+    )
+    cat_range_parser.add_argument(
+        "--start-line", dest="start_line", default=1, help="The first line, counting from 1., defaults to 1"
+    )
+    cat_range_parser.set_defaults(func=cat_range_command)
+
     # Create a parser for the "cut_characters" command
     cut_characters_parser = subparsers.add_parser(
         "cut_characters", help="Reads a file and extracts characters based on specified ranges.."
@@ -805,6 +896,9 @@ def run():
         help="Recursively search for files or directories matching given criteria in a directory and its subdirectories..",
     )
     find_files_parser.add_argument("--file-type", dest="file_type", help="The type to filter ('file' or 'directory').")
+    find_files_parser.add_argument(
+        "--limit", dest="limit", default=-1, help="Stop after this many results, -1 for all of them., defaults to -1"
+    )
     find_files_parser.add_argument(
         "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
     )
@@ -823,6 +917,9 @@ def run():
     find_files_markdown_parser.add_argument(
         "--file-type", dest="file_type", help="The type to filter ('file' or 'directory')."
     )
+    find_files_markdown_parser.add_argument(
+        "--limit", dest="limit", default=-1, help="Stop after this many results, -1 for all of them., defaults to -1"
+    )
     find_files_markdown_parser.add_argument(
         "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
     )
@@ -920,7 +1017,7 @@ def run():
         "--gitignore-path",
         dest="gitignore_path",
         default=".gitignore",
-        help="The path to the .gitignore file. Defaults to '.gitignore' in the current directory., defaults to .gitignore",
+        help="The ignore file, relative to the repository. The default '.gitignore' applies\nevery ignore file as git does, any other file is used on its own., defaults to .gitignore",
     )
     is_ignored_by_gitignore_parser.add_argument(
         "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
@@ -998,6 +1095,25 @@ def run():
     grep_parser = subparsers.add_parser(
         "grep", help="Search for lines matching a regular expression in files specified by a glob pattern.."
     )
+    grep_parser.add_argument(
+        "--context-after",
+        dest="context_after",
+        default=0,
+        help="Number of lines to show after each match, like grep -A., defaults to 0",
+    )
+    grep_parser.add_argument(
+        "--context-before",
+        dest="context_before",
+        default=0,
+        help="Number of lines to show before each match, like grep -B., defaults to 0",
+    )
+    grep_parser.add_argument(
+        "--fixed-strings",
+        dest="fixed_strings",
+        action="store_true",
+        default=False,
+        help="If True, regex is literal text, one string per line to find any of., defaults to False",
+    )
     grep_parser.add_argument("--glob-pattern", dest="glob_pattern", help="A glob pattern string to specify files.")
     grep_parser.add_argument(
         "--maximum-matches-per-file",
@@ -1014,6 +1130,13 @@ def run():
     grep_parser.add_argument(
         "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
     )
+    grep_parser.add_argument(
+        "--multiline",
+        dest="multiline",
+        action="store_true",
+        default=False,
+        help="If True, the regex can match across lines, e.g. '@property\\s+def'., defaults to False",
+    )
     grep_parser.add_argument("--regex", dest="regex", help="A regular expression string to search for.")
     grep_parser.add_argument(
         "--skip-first-matches",
@@ -1023,11 +1146,108 @@ def run():
     )
     grep_parser.set_defaults(func=grep_command)
 
+    # Create a parser for the "grep_count" command
+    grep_count_parser = subparsers.add_parser(
+        "grep_count", help="Count the lines matching a regular expression in each file, like grep -c.."
+    )
+    grep_count_parser.add_argument(
+        "--fixed-strings",
+        dest="fixed_strings",
+        action="store_true",
+        default=False,
+        help="If True, regex is literal text, one string per line to find any of., defaults to False",
+    )
+    grep_count_parser.add_argument(
+        "--glob-pattern", dest="glob_pattern", help="A glob pattern string to specify files."
+    )
+    grep_count_parser.add_argument(
+        "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
+    )
+    grep_count_parser.add_argument(
+        "--multiline",
+        dest="multiline",
+        action="store_true",
+        default=False,
+        help="If True, the regex can match across lines., defaults to False",
+    )
+    grep_count_parser.add_argument("--regex", dest="regex", help="A regular expression string to search for.")
+    grep_count_parser.set_defaults(func=grep_count_command)
+
+    # Create a parser for the "grep_files_with_matches" command
+    grep_files_with_matches_parser = subparsers.add_parser(
+        "grep_files_with_matches",
+        help="List the files with at least one line matching a regular expression, like grep -l..",
+    )
+    grep_files_with_matches_parser.add_argument(
+        "--fixed-strings",
+        dest="fixed_strings",
+        action="store_true",
+        default=False,
+        help="If True, regex is literal text, one string per line to find any of., defaults to False",
+    )
+    grep_files_with_matches_parser.add_argument(
+        "--glob-pattern", dest="glob_pattern", help="A glob pattern string to specify files."
+    )
+    grep_files_with_matches_parser.add_argument(
+        "--maximum-files",
+        dest="maximum_files",
+        default=-1,
+        help="Maximum number of file names to return., defaults to -1",
+    )
+    grep_files_with_matches_parser.add_argument(
+        "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
+    )
+    grep_files_with_matches_parser.add_argument(
+        "--multiline",
+        dest="multiline",
+        action="store_true",
+        default=False,
+        help="If True, the regex can match across lines., defaults to False",
+    )
+    grep_files_with_matches_parser.add_argument(
+        "--regex", dest="regex", help="A regular expression string to search for."
+    )
+    grep_files_with_matches_parser.set_defaults(func=grep_files_with_matches_command)
+
+    # Create a parser for the "grep_many" command
+    grep_many_parser = subparsers.add_parser(
+        "grep_many", help="Search for several regular expressions at once, reading each file only once.."
+    )
+    grep_many_parser.add_argument("--glob-pattern", dest="glob_pattern", help="A glob pattern string to specify files.")
+    grep_many_parser.add_argument(
+        "--maximum-matches-per-pattern",
+        dest="maximum_matches_per_pattern",
+        default=-1,
+        help="Maximum number of matches to return for each pattern., defaults to -1",
+    )
+    grep_many_parser.add_argument(
+        "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
+    )
+    grep_many_parser.add_argument(
+        "--patterns",
+        dest="patterns",
+        help='Names mapped to regular expressions, e.g. {"todo": "TODO", "print": "print\\\\("}.',
+    )
+    grep_many_parser.set_defaults(func=grep_many_command)
+
     # Create a parser for the "grep_markdown" command
     grep_markdown_parser = subparsers.add_parser(
         "grep_markdown",
         help="Search for lines matching a regular expression in files and returns markdown formatted results..",
     )
+    grep_markdown_parser.add_argument(
+        "--context-lines",
+        dest="context_lines",
+        default=0,
+        help="Number of lines to show before and after each match, like grep -C., defaults to 0",
+    )
+    grep_markdown_parser.add_argument(
+        "--fixed-strings",
+        dest="fixed_strings",
+        action="store_true",
+        default=False,
+        help="If True, regex is literal text, one string per line to find any of., defaults to False",
+    )
     grep_markdown_parser.add_argument(
         "--glob-pattern", dest="glob_pattern", help="A glob pattern string to specify files."
     )
@@ -1040,6 +1260,19 @@ def run():
     grep_markdown_parser.add_argument(
         "--mime-type", dest="mime_type", help="Return value as text/csv, text/markdown, or text/yaml inside the JSON."
     )
+    grep_markdown_parser.add_argument(
+        "--multiline",
+        dest="multiline",
+        action="store_true",
+        default=False,
+        help="If True, the regex can match across lines, e.g. '@property\\s+def'., defaults to False",
+    )
+    grep_markdown_parser.add_argument(
+        "--output-mode",
+        dest="output_mode",
+        default="content",
+        help='"content" for the matching lines, "files_with_matches" for just the file\nnames (maximum_matches limits the files), "count" for the number of matching lines per file., defaults to content',
+    )
     grep_markdown_parser.add_argument("--regex", dest="regex", help="A regular expression string to search for.")
     grep_markdown_parser.add_argument(
         "--skip-first-matches",
@@ -1397,6 +1630,19 @@ def run():
     )
     pytest_parser.set_defaults(func=pytest_command)
 
+    # Create a parser for the "file_index" command
+    file_index_parser = subparsers.add_parser(
+        "file_index", help="Build or refresh the file metadata index and show what is in it."
+    )
+    file_index_parser.add_argument(
+        "--rebuild",
+        dest="rebuild",
+        action="store_true",
+        default=False,
+        help="Drop the index and list every folder again.",
+    )
+    file_index_parser.set_defaults(func=file_index_command)
+
     # Parse the arguments
     args = parser.parse_args()
 
@@ -4,7 +4,9 @@ Attempt to write to log the cli commands to replay on console.
 
 import functools
 import os
+import threading
 from collections.abc import Callable
+from io import StringIO
 from typing import Any
 
 import ai_shell.schemas as schemas
@@ -19,91 +21,94 @@ LOGGING_ENABLED = True
 SESSION_LOG_FILE: str | None = None
 
 
+# Tools on any number of roots may run on threads at once, one lock keeps the session file and its lines whole.
+_LOCK = threading.Lock()
+
+
 def set_log_folder(relative_path: str) -> None:
     """Set the log folder to a custom path"""
     # pylint: disable=global-statement
     global LOG_FOLDER
-    LOG_FOLDER = os.path.join(current_dir, relative_path)
+    with _LOCK:
+        LOG_FOLDER = os.path.join(current_dir, relative_path)
 
 
-def log_to_executable(args: Any, kwargs: Any, func: Callable) -> None:
-    """Log the command to an executable file"""
+def _append_to_session_log(text: str) -> None:
+    """Append text to the session's log file, numbering a new one on first use. Call holding _LOCK."""
     # pylint: disable=global-statement
     global SESSION_LOG_FILE
-    if LOGGING_ENABLED:
-        # Ensure log folder exists
-        if not os.path.exists(LOG_FOLDER):
-            os.makedirs(LOG_FOLDER)
-
-        if not SESSION_LOG_FILE:
-            # Number the log files
-            log_files = [f for f in os.listdir(LOG_FOLDER) if f.endswith(".sh")]
-            log_number = len(log_files) + 1
-            log_filename = f"log_{log_number}.sh"
-            mode = "w"
-            SESSION_LOG_FILE = log_filename
+    # Ensure log folder exists
+    os.makedirs(LOG_FOLDER, exist_ok=True)
+
+    if not SESSION_LOG_FILE:
+        # Number the log files
+        log_files = [f for f in os.listdir(LOG_FOLDER) if f.endswith(".sh")]
+        log_number = len(log_files) + 1
+        log_filename = f"log_{log_number}.sh"
+        mode = "w"
+        SESSION_LOG_FILE = log_filename
+    else:
+        log_filename = SESSION_LOG_FILE
+        mode = "a"
+
+    with open(os.path.join(LOG_FOLDER, log_filename), mode, encoding="utf-8") as file:
+        file.write(text)
+
+
+def log_to_executable(args: Any, kwargs: Any, func: Callable) -> None:
+    """Log the command to an executable file"""
+    if not LOGGING_ENABLED:
+        return
+    command, subcommand = method_to_command_subcommand(func.__name__)
+
+    line = StringIO()
+    line.write(f"ais {command} {subcommand}")
+    for arg in args:
+        if arg is None:
+            pass
+        elif str(arg).startswith("<ai_shell."):
+            # skip self,
+            pass
+        elif isinstance(arg, str) and arg:
+            line.write(f' "{arg}"')
         else:
-            log_filename = SESSION_LOG_FILE
-            mode = "a"
-
-        command, subcommand = method_to_command_subcommand(func.__name__)
-
-        # Write log to file
-        with open(os.path.join(LOG_FOLDER, log_filename), mode, encoding="utf-8") as file:
-            file.write(f"ais {command} {subcommand}")
-            for arg in args:
-                if arg is None:
-                    pass
-                elif str(arg).startswith("<ai_shell."):
-                    # skip self,
-                    pass
-                elif isinstance(arg, str) and arg:
-                    file.write(f' "{arg}"')
-                else:
-                    file.write(f" {arg}")
-            for name, kwarg in kwargs.items():
-                if isinstance(kwarg, bool) and kwarg:
-                    file.write(f" --{name}")
-                elif isinstance(kwarg, bool) and not kwarg:
-                    pass
-                else:
-                    file.write(f' --{name}="{kwarg}"')
-            file.write("\n")
+            line.write(f" {arg}")
+    for name, kwarg in kwargs.items():
+        if isinstance(kwarg, bool) and kwarg:
+            line.write(f" --{name}")
+        elif isinstance(kwarg, bool) and not kwarg:
+            pass
+        else:
+            line.write(f' --{name}="{kwarg}"')
+    line.write("\n")
+
+    # Write log to file
+    with _LOCK:
+        if LOGGING_ENABLED:
+            _append_to_session_log(line.getvalue())
 
 
 def log_success_failure(result: Any, exception: Exception | None) -> None:
     """Log the command to an executable file"""
-    # pylint: disable=global-statement
-    global SESSION_LOG_FILE
-    if LOGGING_ENABLED:
-        # Ensure log folder exists
-        if not os.path.exists(LOG_FOLDER):
-            os.makedirs(LOG_FOLDER)
-
-        if not SESSION_LOG_FILE:
-            # Number the log files
-            log_files = [f for f in os.listdir(LOG_FOLDER) if f.endswith(".sh")]
-            log_number = len(log_files) + 1
-            log_filename = f"log_{log_number}.sh"
-            mode = "w"
-            SESSION_LOG_FILE = log_filename
-        else:
-            log_filename = SESSION_LOG_FILE
-            mode = "a"
+    if not LOGGING_ENABLED:
+        return
+    if not exception:
+        text = f'# Success. Return Value: "{str(result)[:40]}"\n'
+    else:
+        text = f"# Failure. Exception: {exception}\n"
 
-        # Write log to file
-        with open(os.path.join(LOG_FOLDER, log_filename), mode, encoding="utf-8") as file:
-            if not exception:
-                file.write(f'# Success. Return Value: "{str(result)[:40]}"\n')
-            else:
-                file.write(f"# Failure. Exception: {exception}\n")
+    # Write log to file
+    with _LOCK:
+        if LOGGING_ENABLED:
+            _append_to_session_log(text)
 
 
 def enable_logging(flag: bool) -> None:
     """Enable logging to executable file"""
     # pylint: disable=global-statement
     global LOGGING_ENABLED
-    LOGGING_ENABLED = flag
+    with _LOCK:
+        LOGGING_ENABLED = flag
 
 
 def method_to_command_subcommand(method_name: str) -> tuple[str, str]:
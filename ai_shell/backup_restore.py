@@ -2,6 +2,8 @@ import glob
 import os
 import shutil
 
+from ai_shell.utils.change_events import notify_files_changed
+
 
 class BackupRestore:
     @classmethod
@@ -30,6 +32,7 @@ class BackupRestore:
             if os.path.exists(file_path):
                 os.rename(file_path, bad_file_path)
             os.rename(latest_backup, file_path)
+            notify_files_changed([file_path])
             return f"Reverted {file_name} to latest backup."
         except Exception as e:
             raise ValueError(f"An error occurred during revert: {e}") from e
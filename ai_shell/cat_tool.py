@@ -5,17 +5,27 @@ Cat optimized for AI prompts.
 import logging
 import os.path
 from collections.abc import Generator
-from io import StringIO
+from io import BytesIO
+from itertools import islice
 from typing import IO
 
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open
 from ai_shell.utils.cwd_utils import change_directory
-from ai_shell.utils.read_fs import is_file_in_root_folder, safe_glob
+from ai_shell.utils.glob_engine import compile_glob
+from ai_shell.utils.line_index import min_indexed_bytes, open_line_index
+from ai_shell.utils.output_budget import OutputSink, output_sink
+from ai_shell.utils.path_jail import path_jail
+from ai_shell.utils.read_ahead import DEFAULT_WINDOW_BYTES, DEFAULT_WORKERS, ReadAhead
+from ai_shell.utils.read_fs import is_file_in_root_folder, sanitize_path
 from ai_shell.utils.type_repair import convert_to_list
 
 logger = logging.getLogger(__name__)
 
+# Bytes read at a time, a chunk of lines is decoded and formatted at once.
+CHUNK_SIZE = 1 << 20
+
 
 class CatTool:
     """
@@ -32,6 +42,9 @@ class CatTool:
         """
         self.root_folder = root_folder
         self.config = config
+        # Upcoming files are read on this many threads, 1 reads each file when its turn comes.
+        self.workers = int(config.get_value("cat_workers") or DEFAULT_WORKERS)
+        self.read_ahead_bytes = int(config.get_value("cat_read_ahead_bytes") or DEFAULT_WINDOW_BYTES)
 
     @log()
     def cat_markdown(
@@ -51,12 +64,10 @@ class CatTool:
         Returns:
             str: The concatenated and formatted content as a string.
         """
-        output = StringIO()
-        for line in self.cat(file_paths, number_lines, squeeze_blank):
-            output.write(line)
-            # output.write("\n")
-        output.seek(0)
-        return output.read()
+        output = []
+        for lines in self._cat_chunks(file_paths, number_lines, squeeze_blank):
+            output.append("".join(lines))
+        return "".join(output)
 
     @log()
     def cat(
@@ -79,6 +90,57 @@ class CatTool:
         Yields:
             str: Each line of the concatenated files.
         """
+        for lines in self._cat_chunks(file_paths, number_lines, squeeze_blank):
+            yield from lines
+
+    @log()
+    def cat_range(self, file_path: str, start_line: int = 1, end_line: int = -1) -> str:
+        """
+        Return a range of lines of one file, numbered like cat_markdown, without reading the lines before it.
+
+        Big files get a line offset index the first time, later ranges seek straight to their first line.
+
+        Args:
+            file_path (str): The file.
+            start_line (int, optional): The first line, counting from 1.
+            end_line (int, optional): The last line, included. -1 for the end of the file.
+
+        Returns:
+            str: The numbered lines, empty if the file has fewer than start_line lines.
+
+        Raises:
+            ValueError: If start_line is less than 1.
+            FileNotFoundError: If the file is not in the root folder.
+        """
+        logger.info(f"cat_range --file_path {file_path} --start_line {start_line} --end_line {end_line}")
+        if start_line < 1:
+            raise ValueError("start_line counts from 1.")
+        if not is_file_in_root_folder(file_path, self.root_folder):
+            raise FileNotFoundError(f"File {file_path} not found in root folder {self.root_folder}")
+        full_path = path_jail(self.root_folder).absolute(file_path)
+        if end_line != -1 and end_line < start_line:
+            return ""
+        indexed = os.path.getsize(full_path) >= min_indexed_bytes(self.config)
+        # Big files are read from their first wanted line, small ones whole through the content cache.
+        with open(full_path, "rb") if indexed else cached_open(full_path, "rb") as file:
+            if indexed:
+                with open_line_index(self.root_folder, self.config) as index:
+                    index.offsets(full_path).seek_line(file, start_line - 1)
+            else:
+                for _ in range(start_line - 1):
+                    if not file.readline():
+                        break
+            if end_line == -1:
+                selected = file.read()
+            else:
+                selected = b"".join(islice(file, end_line - start_line + 1))
+        return "".join(
+            "".join(lines)
+            for lines in format_chunks(BytesIO(selected), start_line, number_lines=True, squeeze_blank=False)
+        )
+
+    def _matching_files(self, file_paths: list[str], number_lines: bool, squeeze_blank: bool) -> list[str]:
+        """The absolute paths of the files matching each pattern, in the order of the patterns."""
         file_paths = convert_to_list(file_paths)
         for location, file_path in enumerate(file_paths):
             if file_path.startswith("./"):
@@ -89,65 +151,177 @@ class CatTool:
             if not is_file_in_root_folder(file_path, self.root_folder):
                 raise TypeError("No parent folder traversals allowed")
 
-        line_number = 1
-        for glob_pattern in file_paths:
-            for file_path in safe_glob(glob_pattern, self.root_folder):
-                if not os.path.isabs(file_path):
-                    file_path = self.root_folder + "/" + file_path
-                try:
-                    with open(file_path, "rb") as file:
-                        for line in self._process_cat_file(file, line_number, number_lines, squeeze_blank):
-                            yield line
-                            line_number += 1
-                except PermissionError:
-                    logger.warning(f"Permission denied: {file_path}, suppressing from output.")
+        # One walk for all the patterns, then the files of each pattern in turn, like `cat a.py *.py` outputs a.py
+        # twice.
+        patterns = [sanitize_path(file_path) for file_path in file_paths]
+        exclusions = [pattern for pattern in patterns if pattern.startswith("!")]
+        walked = list(compile_glob(patterns, self.root_folder).walk(files_only=True))
+        matching_files = []
+        for number, pattern in enumerate(patterns):
+            if pattern.startswith("!"):
+                continue
+            single = compile_glob([pattern, *exclusions], self.root_folder)
+            for file_path, first_number in walked:
+                absolute = file_path if os.path.isabs(file_path) else self.root_folder + "/" + file_path
+                relative = os.path.relpath(absolute, self.root_folder).replace(os.sep, "/")
+                if first_number == number or single.matches(relative):
+                    matching_files.append(absolute)
+        return matching_files
 
-    def _process_cat_file(
-        self,
-        file: IO[bytes],
-        line_number: int,
-        number_lines: bool,
-        squeeze_blank: bool,
-    ) -> Generator[str, None, None]:
+    def _cat_chunks(
+        self, file_paths: list[str], number_lines: bool, squeeze_blank: bool
+    ) -> Generator[list[str], None, None]:
         """
-        Processes a file for concatenation, applying the specified formatting.
+        The formatted lines of the matching files, a chunk at a time, numbered across the files.
+
+        The lines go through the output sink of the tool call. Once its budget is spent, the truncation is recorded
+        and no more files are read.
 
         Args:
-            file: The file object to process.
-            line_number (int): Current line number for numbering lines.
+            file_paths (list[str]): The patterns of the files.
             number_lines (bool): If True, number all output lines.
             squeeze_blank (bool): If True, consecutive blank lines are squeezed to one.
 
         Returns:
-            Generator[str, None, None]: A generator of processed lines.
+            Generator[list[str], None, None]: The lines of each chunk.
 
         Yields:
-            str: Each processed line of the file.
+            list[str]: Output lines.
         """
-        was_blank = False
-        for byte_lines in file:
-            # if isinstance(byte_lines, bytes):
-            line = byte_lines.decode("utf-8")  # Decode bytes to string
-
-            # Use StringIO for memory-efficient line processing
-            with StringIO() as line_buffer:
-                # Normalize line endings to \n
-                line = line.replace("\r\n", "\n")
-                line_buffer.write(line)
-
-                if squeeze_blank and was_blank and line.strip() == "":
-                    continue  # Skip consecutive blank lines
-
-                was_blank = line.strip() == ""
-
-                if number_lines:
-                    line_buffer.seek(0)
-                    line = f"{line_number}\t{line_buffer.read()}"
-                    line_number += 1
-                else:
-                    line = line_buffer.getvalue()
-
-                yield line
+        sink = output_sink()
+        line_number = 1
+        matching_files = self._matching_files(file_paths, number_lines, squeeze_blank)
+        with ReadAhead(matching_files, self.workers, self.read_ahead_bytes) as read_ahead:
+            for index, file_path in enumerate(matching_files):
+                first_line_number = line_number
+                try:
+                    with read_ahead.open(file_path) as file:
+                        for lines in format_chunks(file, line_number, number_lines, squeeze_blank):
+                            taken = sink.take(lines)
+                            line_number += len(taken)
+                            if taken:
+                                yield taken
+                            if len(taken) < len(lines):
+                                self._truncate(
+                                    sink,
+                                    matching_files[index:],
+                                    line_number - first_line_number + 1,
+                                    len(lines) - len(taken),
+                                    squeeze_blank,
+                                )
+                                return
+                except PermissionError:
+                    logger.warning(f"Permission denied: {file_path}, suppressing from output.")
+
+    def _truncate(
+        self, sink: OutputSink, rest: list[str], next_line: int, more_lines: int, squeeze_blank: bool
+    ) -> None:
+        """Record where the output stopped, the file cut short first in rest."""
+        relative_paths = path_jail(self.root_folder).relativize_many(rest)
+        # Squeezed blank lines make the line of the file unknown.
+        start_line = "" if squeeze_blank else f", start_line={next_line}"
+        continue_with = f'cat_range(file_path="{relative_paths[0]}"{start_line})'
+        if len(rest) > 1:
+            shown = ", ".join(f'"{path}"' for path in relative_paths[1:4])
+            more = ", ..." if len(rest) > 4 else ""
+            continue_with += f", then cat_markdown(file_paths=[{shown}{more}])"
+        sink.truncate(continue_with, more_lines=more_lines, more_lines_exact=False, more_files=len(rest) - 1)
+
+
+def read_whole_lines(file: IO[bytes], chunk_size: int = CHUNK_SIZE) -> Generator[str, None, None]:
+    r"""
+    Read a binary file a chunk at a time into one reused buffer, decoding each chunk once.
+
+    Chunks are cut after their last "\n", the rest is carried over to the next read, so a chunk never ends in the
+    middle of a line or of a UTF-8 character. The buffer grows for a line longer than itself.
+
+    Args:
+        file (IO[bytes]): The file, opened "rb".
+        chunk_size (int): The initial size of the buffer.
+
+    Returns:
+        Generator[str, None, None]: The decoded chunks.
+
+    Yields:
+        str: Whole lines, "\r\n" normalized to "\n". Only the last chunk can end without "\n".
+
+    Raises:
+        UnicodeDecodeError: If the file isn't UTF-8.
+    """
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    filled = 0
+    try:
+        while True:
+            if filled == len(buffer):
+                # A line longer than the buffer, the view has to go before the buffer can grow.
+                view.release()
+                buffer.extend(bytes(len(buffer)))
+                view = memoryview(buffer)
+            read = file.readinto(view[filled:])  # type: ignore[attr-defined]
+            if not read:
+                if filled:
+                    yield _decode(view[:filled])
+                return
+            filled += read
+            end = buffer.rfind(b"\n", 0, filled) + 1
+            if not end:
+                continue
+            yield _decode(view[:end])
+            buffer[: filled - end] = buffer[end:filled]
+            filled -= end
+    finally:
+        view.release()
+
+
+def _decode(chunk: memoryview) -> str:
+    """Decode whole lines without copying them to bytes first."""
+    text = str(chunk, "utf-8")
+    return text.replace("\r\n", "\n") if "\r" in text else text
+
+
+def format_chunks(
+    file: IO[bytes], line_number: int, number_lines: bool, squeeze_blank: bool
+) -> Generator[list[str], None, None]:
+    r"""
+    The formatted lines of a file, a chunk of lines at a time.
+
+    Lines end at "\n" only, like iterating over a binary file, and are blank if they are only whitespace.
+
+    Args:
+        file (IO[bytes]): The file, opened "rb".
+        line_number (int): The number of the first output line.
+        number_lines (bool): If True, number all output lines.
+        squeeze_blank (bool): If True, consecutive blank lines are squeezed to one.
+
+    Returns:
+        Generator[list[str], None, None]: The lines of each chunk.
+
+    Yields:
+        list[str]: Output lines, each with its "\n" except maybe the last line of the file.
+    """
+    was_blank = False
+    for text in read_whole_lines(file):
+        lines = text.split("\n")
+        # "" after a final "\n", else the last line of the file without one.
+        last = lines.pop()
+        if squeeze_blank:
+            kept = []
+            for line in lines:
+                is_blank = not line.strip()
+                if not (is_blank and was_blank):
+                    kept.append(line)
+                was_blank = is_blank
+            lines = kept
+        if number_lines:
+            formatted = [f"{number}\t{line}\n" for number, line in enumerate(lines, line_number)]
+        else:
+            formatted = [f"{line}\n" for line in lines]
+        if last and not (squeeze_blank and was_blank and not last.strip()):
+            formatted.append(f"{line_number + len(formatted)}\t{last}" if number_lines else last)
+        line_number += len(formatted)
+        if formatted:
+            yield formatted
 
 
 if __name__ == "__main__":
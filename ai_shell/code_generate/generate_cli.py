@@ -144,6 +144,7 @@ Generated code, do not edit.
 import argparse
 from ai_shell.utils.console_utils import pretty_console
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.file_index import open_file_index
 from ai_shell.__about__ import __version__, __description__
 """
 
@@ -166,6 +167,18 @@ from ai_shell.__about__ import __version__, __description__
                     middle += f"\n        {arg_name}=args.{arg_name},"
             middle += "\n    ))"
 
+    # Not a tool, the bot has no business rebuilding indexes.
+    middle += """
+
+
+def file_index_command(args):
+    \"\"\"Build or refresh the file metadata index and show what is in it\"\"\"
+    with open_file_index('.', CONFIG) as index:
+        if args.rebuild:
+            index.clear()
+        refreshed = index.refresh()
+        pretty_console({**index.summary(), "refresh": refreshed})"""
+
     argparse_part = """\n\ndef run():
     \"\"\"Create the main parser\"\"\"
     program = 'ais'
@@ -215,7 +228,12 @@ from ai_shell.__about__ import __version__, __description__
 
             argparse_part += f"    {method}_parser.set_defaults(func={method}_command)\n\n"
 
-    argparse_part += """    # Parse the arguments
+    argparse_part += """    # Create a parser for the "file_index" command
+    file_index_parser = subparsers.add_parser('file_index', help='Build or refresh the file metadata index and show what is in it.')
+    file_index_parser.add_argument('--rebuild', dest='rebuild', action='store_true', default=False, help='Drop the index and list every folder again.')
+    file_index_parser.set_defaults(func=file_index_command)
+
+    # Parse the arguments
     args = parser.parse_args()
 """
 
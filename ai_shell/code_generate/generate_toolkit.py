@@ -128,7 +128,7 @@ from ai_shell.pytest_tool import PytestTool
 
 class ToolKit(ToolKitBase):
     \"\"\"AI Shell Toolkit\"\"\"\n\n
-    def __init__(self, root_folder: str, token_model: str, global_max_lines: int, permitted_tools: list[str], config:Config) -> None:
+    def __init__(self, root_folder: str | dict[str, str], token_model: str, global_max_lines: int, permitted_tools: list[str], config:Config) -> None:
         super().__init__(root_folder, token_model, global_max_lines, permitted_tools, config)
         self._lookup: dict[str, Callable[[dict[str, Any]], Any]] = {{
             {tools}
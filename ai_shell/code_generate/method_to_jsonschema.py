@@ -75,6 +75,7 @@ def convert_to_json_schema(cls) -> dict[str, Any]:
         int | None: ["integer", "null"],  # will nullable types work?
         str | None: ["string", "null"],
         dict[str, typing.Any]: ["object"],
+        dict[str, str]: "object",
     }
 
     for method_name, details in methods_info.items():
@@ -84,6 +85,9 @@ def convert_to_json_schema(cls) -> dict[str, Any]:
         # private by convention
         if method_name.startswith("_"):
             continue
+        # streaming generators for python callers, the tool is the non-streaming twin
+        if method_name.startswith("iter_"):
+            continue
 
         # Parse docstring of the method
         method = getattr(cls, method_name)
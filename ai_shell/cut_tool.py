@@ -8,12 +8,13 @@ import csv
 import dataclasses
 import io
 import logging
-import os
 from pathlib import Path
 from typing import Union
 
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open
+from ai_shell.utils.path_jail import path_jail
 from ai_shell.utils.read_fs import is_file_in_root_folder, tree
 
 logger = logging.getLogger(__name__)
@@ -98,7 +99,7 @@ class CutTool:
         output = io.StringIO()
 
         try:
-            with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+            with cached_open(path_jail(self.root_folder).absolute(file_path), errors=self.utf8_errors) as file:
                 for line in file:
                     for i, char in enumerate(line, start=1):
                         if is_in_ranges(i, ranges):
@@ -107,7 +108,7 @@ class CutTool:
                     # Optionally add a newline character after each line
                     output.write("\n")
         except FileNotFoundError:
-            tree_text = tree(Path(os.getcwd()))
+            tree_text = tree(Path(path_jail(self.root_folder).folder))
             markdown_content = f"# File {file_path} not found. Here are all the files you can see\n\n{tree_text}"
             return markdown_content
 
@@ -130,15 +131,14 @@ class CutTool:
         ranges = parse_ranges(field_ranges)
         output = io.StringIO()
         try:
-            with open(filename, encoding="utf-8", errors=self.utf8_errors) as file:
+            with cached_open(path_jail(self.root_folder).absolute(filename), errors=self.utf8_errors) as file:
                 reader = csv.reader(file, delimiter=delimiter)
 
                 for row in reader:
                     selected_fields = [field for i, field in enumerate(row, start=1) if is_in_ranges(i, ranges)]
                     output.write(delimiter.join(selected_fields) + "\n")
         except FileNotFoundError:
-            # Host app should always have cwd == root dir.
-            tree_text = tree(Path(os.getcwd()))
+            tree_text = tree(Path(path_jail(self.root_folder).folder))
             markdown_content = f"# File {filename} not found. Here are all the files you can see\n\n{tree_text}"
             return markdown_content
 
@@ -161,7 +161,7 @@ class CutTool:
         output = io.StringIO()
 
         try:
-            with open(filename, encoding="utf-8", errors=self.utf8_errors) as file:
+            with cached_open(path_jail(self.root_folder).absolute(filename), errors=self.utf8_errors) as file:
                 reader = csv.DictReader(file, delimiter=delimiter)
                 # field_indices = {field: i for i, field in enumerate(reader.fieldnames)}
 
@@ -169,7 +169,7 @@ class CutTool:
                     selected_fields = [row[field] for field in field_names if field in row]
                     output.write(delimiter.join(selected_fields) + "\n")
         except FileNotFoundError:
-            tree_text = tree(Path(os.getcwd()))
+            tree_text = tree(Path(path_jail(self.root_folder).folder))
             markdown_content = f"# File {filename} not found. Here are all the files you can see\n\n{tree_text}"
             return markdown_content
 
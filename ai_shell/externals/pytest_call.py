@@ -16,7 +16,9 @@ from ai_shell.utils.cwd_utils import change_directory
 #     pylint --load-plugins pylint_unittest"""
 
 
-def count_pytest_results(module: str, test_folder: str, min_coverage: float) -> tuple[int, int, float, CommandResult]:
+def count_pytest_results(
+    module: str, test_folder: str, min_coverage: float, cwd: str | None = None
+) -> tuple[int, int, float, CommandResult]:
     """
     Run pytest and count the number of passed and failed tests.
 
@@ -24,13 +26,14 @@ def count_pytest_results(module: str, test_folder: str, min_coverage: float) ->
         module (str): The module to run pytest on.
         test_folder (str): The folder containing the tests.
         min_coverage (float): The minimum coverage percentage.
+        cwd (str | None): The folder to run pytest in, the current directory if None.
 
     Returns:
         A tuple of the number of passed and failed tests.
     """
     args = f"{test_folder} --cov={module} --cov-report term --cov-fail-under {min_coverage}"
     # Run pytest using safe_subprocess
-    pytest_output = safe_subprocess("pytest", args)
+    pytest_output = safe_subprocess("pytest", args, cwd=cwd)
 
     # Low coverage shows as error.
     # # Check if there was an error running pytest
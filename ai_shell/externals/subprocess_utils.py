@@ -31,13 +31,13 @@ class CommandResult:
         return markdown_output
 
 
-def safe_subprocess(command_name: str, arg_string: str) -> CommandResult:
+def safe_subprocess(command_name: str, arg_string: str, cwd: str | None = None) -> CommandResult:
     """
     A wrapper around subprocess to safely execute a command.
     Args:
         command_name: The name of the command to execute.
         arg_string: The arguments to pass to the command.
-        markdown: Whether to format the output as Markdown.
+        cwd: The folder to run the command in, the current directory if None.
 
     Returns:
         The output of the command.
@@ -45,7 +45,9 @@ def safe_subprocess(command_name: str, arg_string: str) -> CommandResult:
     # Split the command using shlex
     args = shlex.split(f"{command_name} {arg_string}")
     # Execute the command
-    with subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=False) as process:  # nosec
+    with subprocess.Popen(
+        args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=False
+    ) as process:  # nosec
         stdout, stderr = process.communicate()
         # Get the return code
         return_code = process.returncode
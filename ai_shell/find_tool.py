@@ -8,12 +8,18 @@ import fnmatch
 import logging
 import os
 import re
+from collections.abc import Iterable
+from contextlib import ExitStack
 from io import StringIO
 
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.utils.config_manager import Config
 from ai_shell.utils.cwd_utils import change_directory
-from ai_shell.utils.read_fs import remove_root_folder
+from ai_shell.utils.file_index import IndexedEntry, open_file_index
+from ai_shell.utils.gitignore import gitignore_for
+from ai_shell.utils.path_jail import path_jail
+from ai_shell.utils.path_list import PathList
+from ai_shell.utils.walk import is_pruned, scan_tree
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +36,9 @@ class FindTool:
         self.root_folder = root_folder
         self.config = config
         self.auto_cat = config.get_flag("auto_cat", True)
+        self.excluded_folders = frozenset(config.get_list("excluded_folders"))
+        self.use_file_index = config.get_flag("file_index", False)
+        self.walk_workers = int(config.get_value("walk_workers") or 1)
 
     @log()
     def find_files(
@@ -38,69 +47,97 @@ class FindTool:
         regex: str | None = None,
         file_type: str | None = None,
         size: str | None = None,
-    ) -> list[str]:
+        limit: int = -1,
+    ) -> PathList:
         """
         Recursively search for files or directories matching given criteria in a directory and its subdirectories.
 
+        Hidden entries and __pycache__ folders are skipped without being walked into, as are folders git ignores
+        when the respect_gitignore config flag is set.
+
         Args:
             name (str | None, optional): The exact name to match filenames against.
             regex (str | None, optional): The regex pattern to match filenames against.
             file_type (str | None, optional): The type to filter ('file' or 'directory').
             size (str | None, optional): The size to filter files by, e.g., '+100' for files larger than 100 bytes.
+            limit (int, optional): Stop after this many results, -1 for all of them.
 
         Returns:
-            list[str]: A list of paths to files or directories that match the criteria.
+            PathList: A list of paths to files or directories that match the criteria, sorted.
         """
-        logger.info(f"find --name {name} --regex {regex} --type {file_type} --size {size}")
-        matching_files = []
-        for root, dirs, files in os.walk(os.getcwd()):
-            # Combine files and directories for type filtering
-            combined = files
-            if file_type == "directory":
-                combined += dirs
-
-            for entry in combined:
-                full_path = os.path.join(root, entry)
-                # TODO: handle this differently
-                if "__pycache__" not in full_path:
-                    # TODO: handle differently. The bot
-                    # is put into the root_folder as cwd, so as long as there isn't .. in path we should be good.
-                    # if is_file_in_root_folder(full_path, self.root_folder):
-                    short_path = remove_root_folder(full_path, self.root_folder)
-                    # Check for name, regex, and size match
-                    if (name and fnmatch.fnmatch(entry, name)) or name is None:
-                        if self._match_type_and_size(full_path, file_type, size):
-                            matching_files.append(short_path)
-                    elif regex and re.search(regex, entry):
-                        if self._match_type_and_size(full_path, file_type, size):
-                            matching_files.append(short_path)
-
-        # Not the best way to remove hidden.
-        return list(sorted(_ for _ in matching_files if not _.startswith(".")))
-
-    def _match_type_and_size(self, path: str, file_type: str | None, size: str | None) -> bool:
+        logger.info(f"find --name {name} --regex {regex} --type {file_type} --size {size} --limit {limit}")
+        matching_files = PathList()
+        if limit == 0:
+            return matching_files
+        pattern = re.compile(regex) if regex else None
+        ignore = gitignore_for(self.root_folder, self.config)
+        with ExitStack() as stack:
+            entries: Iterable[tuple[str, os.DirEntry | IndexedEntry]]
+            if self.use_file_index:
+                index = stack.enter_context(open_file_index(self.root_folder, self.config))
+                index.refresh()
+                entries = index.entries()
+                if ignore is not None:
+                    entries = ((path, entry) for path, entry in entries if not ignore.is_ignored(path, entry.is_dir()))
+            else:
+                skip = self._skip if ignore is None else lambda entry: self._skip(entry) or ignore.skip_entry(entry)
+                entries = scan_tree(path_jail(self.root_folder).folder, skip, self.walk_workers, stat=bool(size))
+            # Both yield in sorted order, so the first `limit` results are the same as with no limit.
+            for path, entry in entries:
+                if self._matches(entry, name, pattern, file_type, size):
+                    matching_files.append(path)
+                    if len(matching_files) == limit:
+                        break
+        return matching_files
+
+    def _skip(self, entry: os.DirEntry) -> bool:
         """
-        Check if a file/directory matches the specified type and size criteria.
+        Prune hidden entries, __pycache__ and the excluded_folders from config.
 
         Args:
-            path (str): The path to the file/directory.
-            file_type (Optional[str]): The type to filter ('file' or 'directory').
-            size (Optional[str]): The size to filter files by.
+            entry (os.DirEntry): The entry.
 
         Returns:
-            bool: True if the file/directory matches the criteria, False otherwise.
+            bool: True to leave the entry and anything under it out.
         """
-        if file_type:
-            if file_type == "file" and not os.path.isfile(path):
-                return False
-            if file_type == "directory" and not os.path.isdir(path):
-                return False
+        return is_pruned(entry, self.excluded_folders)
 
+    def _matches(
+        self,
+        entry: os.DirEntry | IndexedEntry,
+        name: str | None,
+        pattern: re.Pattern | None,
+        file_type: str | None,
+        size: str | None,
+    ) -> bool:
+        """
+        Check the criteria, cheapest first: the type from the directory listing, then the name, then a stat.
+
+        Args:
+            entry (os.DirEntry | IndexedEntry): The file or directory.
+            name (str | None): Wildcard for the name.
+            pattern (re.Pattern | None): Regex searched in the name.
+            file_type (str | None): 'file' or 'directory'. Directories are only returned for 'directory'.
+            size (str | None): The size filter, e.g. '+100' or '-100'.
+
+        Returns:
+            bool: True if the file/directory matches the criteria.
+        """
+        if entry.is_dir() != (file_type == "directory"):
+            return False
+        if name is not None or pattern is not None:
+            if not ((name and fnmatch.fnmatch(entry.name, name)) or (pattern and pattern.search(entry.name))):
+                return False
+        if file_type == "file" and not entry.is_file():
+            # e.g. a broken symlink
+            return False
         if size:
             size_prefix = size[0]
             size_value = int(size[1:])
-            file_size = os.path.getsize(path)
-
+            try:
+                file_size = entry.stat().st_size
+            except OSError:
+                return False
             if size_prefix == "+" and file_size <= size_value:
                 return False
             if size_prefix == "-" and file_size >= size_value:
@@ -114,6 +151,7 @@ class FindTool:
         regex: str | None = None,
         file_type: str | None = None,
         size: str | None = None,
+        limit: int = -1,
     ) -> str:
         """
         Recursively search for files or directories matching given criteria in a directory and its subdirectories.
@@ -123,12 +161,13 @@ class FindTool:
             regex (str | None, optional): The regex pattern to match filenames against.
             file_type (str | None, optional): The type to filter ('file' or 'directory').
             size (str | None, optional): The size to filter files by, e.g., '+100' for files larger than 100 bytes.
+            limit (int, optional): Stop after this many results, -1 for all of them.
 
         Returns:
             str: Markdown of paths to files or directories that match the criteria.
         """
         output = StringIO()
-        results = self.find_files(name, regex, file_type, size)
+        results = self.find_files(name, regex, file_type, size, limit)
         for item in results:
             output.write(item)
             output.write("\n")
@@ -6,7 +6,6 @@ These are intentionally read-only (status/diff/log/show/branch). We shell out vi
 just sugar over the same commands.
 """
 
-import fnmatch
 import logging
 import os
 import shlex
@@ -15,6 +14,7 @@ from typing import Any
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.externals.subprocess_utils import CommandResult, safe_subprocess
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.gitignore import GitIgnore, is_ignored_by
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class GitTool:
             root_folder (str): The root folder path for repo operations.
             config (Config): The developer input that bot shouldn't set.
         """
-        self.repo_path = root_folder
+        self.repo_path = os.path.abspath(root_folder)
         self.config = config
         self.auto_cat = config.get_flag("auto_cat", True)
         self.utf8_errors = config.get_value("utf8_errors", "surrogateescape")
@@ -42,7 +42,7 @@ class GitTool:
         Returns:
             CommandResult: stdout/stderr/return_code of the command.
         """
-        repo = shlex.quote(os.path.abspath(self.repo_path))
+        repo = shlex.quote(self.repo_path)
         result = safe_subprocess("git", f"-C {repo} {args}")
         if result.return_code != 0:
             logger.warning("git %s failed: %s", args, result.stderr)
@@ -52,9 +52,13 @@ class GitTool:
         """
         Check if a file is ignored by .gitignore.
 
+        By default every ignore file that applies is used, including nested .gitignore files, with negations and
+        folder rules as git applies them.
+
         Args:
             file_path (str): The path of the file to check.
-            gitignore_path (str): The path to the .gitignore file. Defaults to '.gitignore' in the current directory.
+            gitignore_path (str): The ignore file, relative to the repository. The default '.gitignore' applies
+                every ignore file as git does, any other file is used on its own.
 
         Returns:
             bool: True if the file is ignored, False otherwise.
@@ -62,22 +66,14 @@ class GitTool:
         Raises:
             FileNotFoundError: If the .gitignore file is not found.
         """
-        full_gitignore_path = os.path.join(self.repo_path, gitignore_path)
+        full_gitignore_path = os.path.normpath(os.path.join(self.repo_path, gitignore_path))
 
         if not os.path.isfile(full_gitignore_path):
             raise FileNotFoundError(f"No .gitignore file found at {full_gitignore_path}")
 
-        file_path = os.path.abspath(file_path)
-
-        with open(full_gitignore_path, encoding="utf-8", errors=self.utf8_errors) as gitignore:
-            for line in gitignore:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                gitignore_pattern = os.path.join(os.path.dirname(gitignore_path), line)
-                if fnmatch.fnmatch(file_path, gitignore_pattern):
-                    return True
-        return False
+        if full_gitignore_path == os.path.join(self.repo_path, ".gitignore"):
+            return GitIgnore(self.repo_path).is_ignored(file_path)
+        return is_ignored_by(full_gitignore_path, os.path.join(self.repo_path, file_path))
 
     @log()
     def git_status(self) -> dict[str, Any]:
@@ -2,20 +2,40 @@
 AI optimized grep tool
 """
 
-import glob
+import functools
 import logging
+import mmap
 import os.path
 import re
+import sys
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from io import StringIO
+from typing import TypeVar, cast
 
 from ai_shell.ai_logs.log_to_bash import log
+from ai_shell.utils.aho_corasick import AhoCorasick, literal_alternatives
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open
 from ai_shell.utils.cwd_utils import change_directory
-from ai_shell.utils.read_fs import is_file_in_root_folder, remove_root_folder
+from ai_shell.utils.fingerprint_cache import fingerprint_files, shared_cache, watched_fingerprints
+from ai_shell.utils.gitignore import gitignore_for
+from ai_shell.utils.glob_engine import glob_in_root
+from ai_shell.utils.index_store import index_folder
+from ai_shell.utils.output_budget import OutputSink, output_sink
+from ai_shell.utils.path_jail import path_jail
+from ai_shell.utils.scan_pool import scan_pool, scan_workers
+from ai_shell.utils.trigram_index import TrigramIndex
+from ai_shell.utils.type_repair import convert_to_dict
+from ai_shell.utils.workspace_watcher import live_watcher
 
+# Bytes read at a time by a literal scan that stops after a few matches.
+LITERAL_CHUNK_SIZE = 1 << 16
 
-@dataclass
+
+@dataclass(slots=True)
 class Match:
     """Represents a single match found in a file."""
 
@@ -23,15 +43,80 @@ class Match:
     line: str
 
 
-@dataclass
+def _line_numbers() -> "array[int]":
+    """An empty column of line numbers, 4 bytes each."""
+    return array("I")
+
+
+@dataclass(slots=True)
 class FileMatches:
-    """Stores matches found in a single file."""
+    """Stores matches found in a single file.
+
+    Matches are stored as columns, an array of line numbers next to a list of lines, instead of an object per
+    match. orjson writes each column as a list.
+    """
 
     filename: str
-    found: list[Match] = field(default_factory=list)
+    line_numbers: "array[int]" = field(default_factory=_line_numbers)
+    lines: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # The same file name turns up in many results, e.g. once per pattern in grep_many, keep one copy.
+        self.filename = sys.intern(self.filename)
+
+    def add(self, line_number: int, line: str) -> None:
+        """Append a match.
+
+        Args:
+            line_number (int): The 1-based line number.
+            line (str): The matching line.
+        """
+        self.line_numbers.append(line_number)
+        self.lines.append(line)
+
+    @property
+    def found(self) -> list[Match]:
+        """The matches as Match objects, built on each access."""
+        return [Match(number, line) for number, line in zip(self.line_numbers, self.lines, strict=True)]
+
+    @property
+    def context(self) -> list[Match]:
+        """The context lines as Match objects, none unless context was asked for."""
+        return []
+
+
+@dataclass(slots=True)
+class FileMatchesWithContext(FileMatches):
+    """Stores matches found in a single file and the lines of context around them.
+
+    Only a grep asking for context returns these, so other results carry no context columns.
+    """
+
+    context_line_numbers: "array[int]" = field(default_factory=_line_numbers)
+    context_lines: list[str] = field(default_factory=list)
+
+    def add_context(self, line_number: int, line: str) -> None:
+        """Append a line of context.
+
+        Args:
+            line_number (int): The 1-based line number.
+            line (str): The line.
+        """
+        self.context_line_numbers.append(line_number)
+        self.context_lines.append(line)
+
+    @property
+    def context(self) -> list[Match]:
+        """The context lines as Match objects, built on each access."""
+        return [Match(number, line) for number, line in zip(self.context_line_numbers, self.context_lines, strict=True)]
 
 
-@dataclass
+def _file_matches(filename: str, with_context: bool) -> FileMatches:
+    """Empty matches of a file, with context columns if context was asked for."""
+    return FileMatchesWithContext(filename=filename) if with_context else FileMatches(filename=filename)
+
+
+@dataclass(slots=True)
 class GrepResults:
     """Stores the results of a grep operation."""
 
@@ -41,6 +126,707 @@ class GrepResults:
 
 logger = logging.getLogger(__name__)
 
+ScanResult = TypeVar("ScanResult")
+
+# From about this many literals on, one Aho-Corasick pass beats the regex engine trying each alternative per
+# byte, see benchmarks/bench_grep_literals.py.
+AHO_CORASICK_MIN_LITERALS = 100
+
+
+def scan_file(
+    open_path: str, regex: str, maximum_matches_per_file: int = -1, utf8_errors: str | None = "surrogateescape"
+) -> list[tuple[int, str]]:
+    """
+    Find the lines of one file that match a regular expression.
+
+    Module level so that it can be pickled and shipped to a process pool.
+
+    Args:
+        open_path (str): The path to open.
+        regex (str): A regular expression string to search for.
+        maximum_matches_per_file (int, optional): Stop after this many matches, -1 for no limit.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+
+    Returns:
+        list[tuple[int, str]]: (line number, stripped line) for each matching line.
+    """
+    # re caches compiled patterns, so each worker process compiles once.
+    pattern = re.compile(regex)
+    found: list[tuple[int, str]] = []
+    # A scan that can stop early streams the file, unless it's already cached.
+    with cached_open(open_path, errors=utf8_errors, fill=maximum_matches_per_file == -1) as file:
+        for line_number, line in enumerate(file, start=1):
+            if pattern.search(line):
+                found.append((line_number, line.strip()))
+                if len(found) == maximum_matches_per_file:
+                    break
+    return found
+
+
+def _matched_lines(
+    buffer: bytes | mmap.mmap,
+    spans: Iterable[tuple[int, int]],
+    maximum_matches_per_file: int,
+    utf8_errors: str | None,
+    context_before: int = 0,
+    context_after: int = 0,
+    context: list[tuple[int, str]] | None = None,
+) -> list[tuple[int, str]]:
+    """
+    Turn match offsets in a whole-file buffer into grep's (line number, stripped lines) results.
+
+    Args:
+        buffer (bytes | mmap.mmap): The file contents.
+        spans (Iterable[tuple[int, int]]): (start, end) offsets of the matches, in increasing start order.
+        maximum_matches_per_file (int): Stop after this many matches, -1 for no limit.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+        context_before (int, optional): Lines of context to collect before each match.
+        context_after (int, optional): Lines of context to collect after each match.
+        context (list[tuple[int, str]], optional): Receives the context lines, each line once.
+
+    Returns:
+        list[tuple[int, str]]: (first line number, stripped text of the lines the match touches) for each match.
+    """
+    errors = utf8_errors or "strict"
+
+    def decode(start: int, end: int) -> str:
+        return buffer[start:end].decode("utf-8", errors=errors).replace("\r\n", "\n").strip()
+
+    found: list[tuple[int, str]] = []
+    line_number = 1
+    counted_to = 0
+    reported_to = 0
+    # Last line reported as a match or context, and where the last match's after context carries on.
+    emitted_to = 0
+    after_from = 0
+    after_left = 0
+
+    def emit_after(below_line: int | None) -> None:
+        nonlocal emitted_to, after_from, after_left
+        assert context is not None  # nosec
+        while after_left and after_from < len(buffer) and (below_line is None or emitted_to + 1 < below_line):
+            line_end = buffer.find(b"\n", after_from)
+            if line_end == -1:
+                line_end = len(buffer)
+            emitted_to += 1
+            context.append((emitted_to, decode(after_from, line_end)))
+            after_from = line_end + 1
+            after_left -= 1
+
+    for start, end in spans:
+        if start < reported_to:
+            # Same line as the last match, grep reports a line once.
+            continue
+        # Count newlines only between consecutive matches, so the whole file is counted at most once.
+        line_number += buffer[counted_to:start].count(b"\n")
+        counted_to = start
+        line_start = buffer.rfind(b"\n", 0, start) + 1
+        line_end = buffer.find(b"\n", max(start, end - 1))
+        if line_end == -1:
+            line_end = len(buffer)
+        reported_to = line_end + 1
+        if context is not None:
+            # Windows that overlap the previous one only add the lines it didn't.
+            emit_after(line_number)
+            before: list[tuple[int, str]] = []
+            position = line_start
+            for number in range(line_number - 1, max(emitted_to, line_number - context_before - 1), -1):
+                previous_start = buffer.rfind(b"\n", 0, position - 1) + 1
+                before.append((number, decode(previous_start, position - 1)))
+                position = previous_start
+            context.extend(reversed(before))
+            emitted_to = line_number + buffer[line_start:line_end].count(b"\n")
+            after_from = line_end + 1
+            after_left = context_after
+        found.append((line_number, decode(line_start, line_end)))
+        if len(found) == maximum_matches_per_file:
+            break
+    if context is not None:
+        emit_after(None)
+    return found
+
+
+def scan_file_multiline(
+    open_path: str, regex: str, maximum_matches_per_file: int = -1, utf8_errors: str | None = "surrogateescape"
+) -> list[tuple[int, str]]:
+    r"""
+    Find the matches of a regular expression in the whole of one file, so matches can span lines.
+
+    The file is memory-mapped and searched with a bytes regex in MULTILINE mode, no per-line decoding happens
+    until something matches.
+
+    Args:
+        open_path (str): The path to open.
+        regex (str): A regular expression string to search for, with bytes semantics (e.g. \w is ascii only).
+        maximum_matches_per_file (int, optional): Stop after this many matches, -1 for no limit.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+
+    Returns:
+        list[tuple[int, str]]: (first line number, stripped text of the lines the match touches) for each match.
+    """
+    return scan_file_multiline_context(open_path, regex, maximum_matches_per_file, 0, 0, utf8_errors)[0]
+
+
+def scan_file_multiline_context(
+    open_path: str,
+    regex: str,
+    maximum_matches_per_file: int = -1,
+    context_before: int = 0,
+    context_after: int = 0,
+    utf8_errors: str | None = "surrogateescape",
+) -> tuple[list[tuple[int, str]], list[tuple[int, str]]]:
+    """
+    Like scan_file_multiline, also collecting the lines around each match from the mapped buffer.
+
+    Args:
+        open_path (str): The path to open.
+        regex (str): A regular expression string to search for, with bytes semantics.
+        maximum_matches_per_file (int, optional): Stop after this many matches, -1 for no limit.
+        context_before (int, optional): Lines of context before each match.
+        context_after (int, optional): Lines of context after each match.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+
+    Returns:
+        tuple[list[tuple[int, str]], list[tuple[int, str]]]: The matches and the context lines.
+    """
+    pattern = re.compile(regex.encode("utf-8"), re.MULTILINE)
+    context: list[tuple[int, str]] = []
+    with open(open_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # can't map an empty file
+            return [], context
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            spans = (match.span() for match in pattern.finditer(buffer))
+            wanted = context if context_before or context_after else None
+            found = _matched_lines(
+                buffer, spans, maximum_matches_per_file, utf8_errors, context_before, context_after, wanted
+            )
+    return found, context
+
+
+def scan_file_context(
+    open_path: str,
+    regex: str,
+    maximum_matches_per_file: int = -1,
+    context_before: int = 0,
+    context_after: int = 0,
+    utf8_errors: str | None = "surrogateescape",
+) -> tuple[list[tuple[int, str]], list[tuple[int, str]]]:
+    """
+    Like scan_file, also collecting the lines around each match during the same pass.
+
+    The lines before a match come from a ring buffer of the last context_before lines, so nothing is re-read.
+    A line is reported once even when the windows of two matches overlap.
+
+    Args:
+        open_path (str): The path to open.
+        regex (str): A regular expression string to search for.
+        maximum_matches_per_file (int, optional): Stop after this many matches, -1 for no limit.
+        context_before (int, optional): Lines of context before each match.
+        context_after (int, optional): Lines of context after each match.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+
+    Returns:
+        tuple[list[tuple[int, str]], list[tuple[int, str]]]: The matches and the context lines.
+    """
+    pattern = re.compile(regex)
+    found: list[tuple[int, str]] = []
+    context: list[tuple[int, str]] = []
+    recent: deque[tuple[int, str]] = deque(maxlen=context_before)
+    after_left = 0
+    with cached_open(open_path, errors=utf8_errors, fill=maximum_matches_per_file == -1) as file:
+        for line_number, line in enumerate(file, start=1):
+            if len(found) != maximum_matches_per_file and pattern.search(line):
+                context.extend((number, text.strip()) for number, text in recent)
+                recent.clear()
+                found.append((line_number, line.strip()))
+                after_left = context_after
+            elif after_left:
+                context.append((line_number, line.strip()))
+                after_left -= 1
+            elif len(found) == maximum_matches_per_file:
+                break
+            elif context_before:
+                recent.append((line_number, line))
+    return found, context
+
+
+def _scan_without_context(
+    scan: Callable[[str], list[tuple[int, str]]], open_path: str
+) -> tuple[list[tuple[int, str]], list[tuple[int, str]]]:
+    """Adapt a scanner to the (matches, context) shape, module level so it can be pickled."""
+    return scan(open_path), []
+
+
+@functools.lru_cache(maxsize=8)
+def _literal_matcher(literals: tuple[str, ...]) -> Callable[[bytes], Iterator[tuple[int, int]]]:
+    """
+    Pick the cheapest way to find any of the literals, built once per process.
+
+    Args:
+        literals (tuple[str, ...]): The literal strings.
+
+    Returns:
+        Callable[[bytes], Iterator[tuple[int, int]]]: Yields (start, end) of the matches in a buffer.
+    """
+    needles = [literal.encode("utf-8") for literal in literals]
+    if len(needles) == 1:
+        needle = needles[0]
+
+        def find_all(buffer: bytes) -> Iterator[tuple[int, int]]:
+            position = buffer.find(needle)
+            while position != -1:
+                yield position, position + len(needle)
+                position = buffer.find(needle, position + 1)
+
+        return find_all
+    if len(needles) < AHO_CORASICK_MIN_LITERALS:
+        # A handful of alternatives is still quickest in the C regex engine.
+        pattern = re.compile(b"|".join(re.escape(needle) for needle in needles))
+        return lambda buffer: (match.span() for match in pattern.finditer(buffer))
+    return AhoCorasick(needles).finditer
+
+
+def _universal_newlines(buffer: bytes) -> bytes:
+    r"""Line ends as the text scanners see them, "\r\n" and a bare "\r" becoming "\n", so line numbers agree."""
+    if b"\r" in buffer:
+        buffer = buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return buffer
+
+
+def scan_file_literals(
+    open_path: str,
+    literals: tuple[str, ...],
+    maximum_matches_per_file: int = -1,
+    utf8_errors: str | None = "surrogateescape",
+) -> list[tuple[int, str]]:
+    """
+    Find the lines of one file that contain any of the literal strings, without the regex engine.
+
+    One literal is found with bytes.find, many with an Aho-Corasick automaton, in a single pass over the file.
+
+    Args:
+        open_path (str): The path to open.
+        literals (tuple[str, ...]): The strings to search for, none of them empty or containing a newline.
+        maximum_matches_per_file (int, optional): Stop after this many matches, -1 for no limit.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+
+    Returns:
+        list[tuple[int, str]]: (line number, stripped line) for each matching line.
+    """
+    find_all = _literal_matcher(literals)
+    if maximum_matches_per_file == -1:
+        with cached_open(open_path, "rb") as file:
+            buffer = _universal_newlines(file.read())
+        return _matched_lines(buffer, find_all(buffer), maximum_matches_per_file, utf8_errors)
+    # A scan stopping at a few matches reads whole lines a chunk at a time and doesn't fill the cache. A literal
+    # has no newline, so carrying the unfinished last line over to the next chunk finds one split across chunks.
+    found: list[tuple[int, str]] = []
+    lines_before = 0
+    carried = b""
+    with cached_open(open_path, "rb", fill=False) as file:
+        while len(found) < maximum_matches_per_file:
+            chunk = file.read(LITERAL_CHUNK_SIZE)
+            carried += chunk
+            cut = carried.rfind(b"\n") + 1 if chunk else len(carried)
+            if not cut:
+                if not chunk:
+                    break
+                continue
+            buffer = _universal_newlines(carried[:cut])
+            carried = carried[cut:]
+            found.extend(
+                (lines_before + line_number, line)
+                for line_number, line in _matched_lines(
+                    buffer, find_all(buffer), maximum_matches_per_file - len(found), utf8_errors
+                )
+            )
+            lines_before += buffer.count(b"\n")
+            if not chunk:
+                break
+    return found
+
+
+def _count_matched_lines(buffer: bytes | mmap.mmap, spans: Iterable[tuple[int, int]]) -> int:
+    """
+    Count the lines that matches in a whole-file buffer start on, without decoding anything.
+
+    Args:
+        buffer (bytes | mmap.mmap): The file contents.
+        spans (Iterable[tuple[int, int]]): (start, end) offsets of the matches, in increasing start order.
+
+    Returns:
+        int: The number of matches grep would report.
+    """
+    count = 0
+    reported_to = 0
+    for start, end in spans:
+        if start < reported_to:
+            continue
+        line_end = buffer.find(b"\n", max(start, end - 1))
+        reported_to = len(buffer) if line_end == -1 else line_end + 1
+        count += 1
+    return count
+
+
+def count_file(open_path: str, regex: str, utf8_errors: str | None = "surrogateescape") -> int:
+    """
+    Count the lines of one file that match a regular expression.
+
+    Args:
+        open_path (str): The path to open.
+        regex (str): A regular expression string to search for.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+
+    Returns:
+        int: The number of matching lines.
+    """
+    pattern = re.compile(regex)
+    with cached_open(open_path, errors=utf8_errors) as file:
+        return sum(1 for line in file if pattern.search(line))
+
+
+def count_file_multiline(open_path: str, regex: str) -> int:
+    """
+    Count the matches of a regular expression in the whole of one file, as scan_file_multiline would report them.
+
+    Args:
+        open_path (str): The path to open.
+        regex (str): A regular expression string to search for, with bytes semantics.
+
+    Returns:
+        int: The number of matches.
+    """
+    pattern = re.compile(regex.encode("utf-8"), re.MULTILINE)
+    with open(open_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return _count_matched_lines(buffer, (match.span() for match in pattern.finditer(buffer)))
+
+
+def count_file_literals(open_path: str, literals: tuple[str, ...]) -> int:
+    """
+    Count the lines of one file that contain any of the literal strings.
+
+    Args:
+        open_path (str): The path to open.
+        literals (tuple[str, ...]): The strings to search for, none of them empty or containing a newline.
+
+    Returns:
+        int: The number of matching lines.
+    """
+    with cached_open(open_path, "rb") as file:
+        buffer = _universal_newlines(file.read())
+    return _count_matched_lines(buffer, _literal_matcher(literals)(buffer))
+
+
+@functools.lru_cache(maxsize=8)
+def _union_prefilter(regexes: tuple[str, ...]) -> re.Pattern[str] | None:
+    """
+    Compile one regex that matches wherever any of the regexes do, to skip lines that match none of them.
+
+    Args:
+        regexes (tuple[str, ...]): The regular expressions.
+
+    Returns:
+        re.Pattern[str] | None: The union, or None when gluing the regexes together could change their meaning.
+    """
+    if len(regexes) < 2 or any(re.compile(regex).groups for regex in regexes):
+        # Group numbers and back references would shift once joined.
+        return None
+    try:
+        return re.compile("|".join(f"(?:{regex})" for regex in regexes))
+    except re.error:
+        # e.g. an inline (?i) that is only legal at the start of a pattern
+        return None
+
+
+def scan_file_many(
+    open_path: str,
+    patterns: tuple[tuple[str, str], ...],
+    maximum_matches_per_pattern: int = -1,
+    utf8_errors: str | None = "surrogateescape",
+) -> dict[str, list[tuple[int, str]]]:
+    """
+    Find the lines of one file that match each of several named regular expressions, reading the file once.
+
+    Args:
+        open_path (str): The path to open.
+        patterns (tuple[tuple[str, str], ...]): (name, regex) pairs.
+        maximum_matches_per_pattern (int, optional): Stop looking for a pattern after this many matches.
+        utf8_errors (str, optional): How to handle undecodable bytes.
+
+    Returns:
+        dict[str, list[tuple[int, str]]]: Pattern name to (line number, stripped line) for each matching line.
+    """
+    active = [(name, re.compile(regex)) for name, regex in patterns]
+    prefilter = _union_prefilter(tuple(regex for _name, regex in patterns))
+    found: dict[str, list[tuple[int, str]]] = {name: [] for name, _regex in patterns}
+    with cached_open(open_path, errors=utf8_errors) as file:
+        for line_number, line in enumerate(file, start=1):
+            if prefilter is not None and not prefilter.search(line):
+                continue
+            exhausted = False
+            for name, pattern in active:
+                if pattern.search(line):
+                    hits = found[name]
+                    hits.append((line_number, line.strip()))
+                    exhausted = exhausted or len(hits) == maximum_matches_per_pattern
+            if exhausted:
+                active = [
+                    (name, pattern) for name, pattern in active if len(found[name]) != maximum_matches_per_pattern
+                ]
+                if not active:
+                    break
+    return found
+
+
+def _add_context_around(
+    file_matches: FileMatches, context_lines: list[tuple[int, str]], context_before: int, context_after: int
+) -> None:
+    """
+    Keep the context lines that belong to the displayed matches, the others were around skipped matches.
+
+    Args:
+        file_matches (FileMatches): The matches being returned, the context is added to it if it has context
+            columns.
+        context_lines (list[tuple[int, str]]): Context collected for every match in the file.
+        context_before (int): Lines of context before each match.
+        context_after (int): Lines of context after each match.
+    """
+    if not context_lines or not isinstance(file_matches, FileMatchesWithContext):
+        return
+    windows = [
+        (line_number - context_before, line_number + line.count("\n") + context_after)
+        for line_number, line in zip(file_matches.line_numbers, file_matches.lines, strict=True)
+    ]
+    for line_number, line in context_lines:
+        if any(first <= line_number <= last for first, last in windows):
+            file_matches.add_context(line_number, line)
+
+
+def files_with_matches_markdown(files: list[str]) -> str:
+    """
+    Markdown for `grep_markdown` with output_mode="files_with_matches".
+
+    Args:
+        files (list[str]): The files with matches.
+
+    Returns:
+        str: One file per line and a total.
+    """
+    return "".join(f"{filename}\n" for filename in files) + f"{len(files)} files with matches.\n"
+
+
+def counts_markdown(counts: dict[str, int]) -> str:
+    """
+    Markdown for `grep_markdown` with output_mode="count".
+
+    Args:
+        counts (dict[str, int]): Matching line count per file.
+
+    Returns:
+        str: One file and count per line and a total.
+    """
+    return (
+        "".join(f"{filename}: {count}\n" for filename, count in counts.items())
+        + f"{sum(counts.values())} matches found in {len(counts)} files.\n"
+    )
+
+
+def matches_markdown(results: GrepResults, skip_first_matches: int, maximum_matches: int) -> str:
+    """
+    Markdown for `grep_markdown` with output_mode="content".
+
+    Args:
+        results (GrepResults): The matches, with any context lines.
+        skip_first_matches (int): The number of initial matches skipped, for the summary.
+        maximum_matches (int): The maximum number of matches asked for, for the summary.
+
+    Returns:
+        str: Each file followed by its numbered lines, and a summary.
+    """
+    matches_found = results.matches_found
+
+    output = StringIO()
+    for file_match in results.data:
+        output.write(file_match.filename + "\n")
+        matches = zip(file_match.line_numbers, file_match.lines, strict=True)
+        if not isinstance(file_match, FileMatchesWithContext) or not file_match.context_lines:
+            for line_number, line in matches:
+                output.write(f"line {line_number}: {line}\n")
+            continue
+        # grep's convention, ":" after the number of a match, "-" after context, "--" between windows.
+        context = zip(file_match.context_line_numbers, file_match.context_lines, strict=True)
+        lines = [(line_number, ":", line) for line_number, line in matches]
+        lines += [(line_number, "-", line) for line_number, line in context]
+        next_line = 0
+        for line_number, separator, line in sorted(lines, key=lambda row: row[0]):
+            if next_line and line_number > next_line:
+                output.write("--\n")
+            output.write(f"line {line_number}{separator} {line}\n")
+            next_line = line_number + line.count("\n") + 1
+    output.write(
+        f"{matches_found} matches found and {min(matches_found, maximum_matches) if maximum_matches != -1 else matches_found} displayed. "
+        f"Skipped {skip_first_matches}\n"
+    )
+    output.seek(0)
+    return output.read()
+
+
+def _spend_on_file(sink: OutputSink, file_matches: FileMatches) -> FileMatches:
+    """
+    The part of a file's matches the output budget has room for, a line each for the file name, the matches and
+    the lines of context.
+
+    Args:
+        sink (OutputSink): The output sink of the tool call.
+        file_matches (FileMatches): The matches of one file.
+
+    Returns:
+        FileMatches: The same matches if they all fit, else the first ones that do.
+    """
+    context_line_numbers, context_lines = (
+        (file_matches.context_line_numbers, file_matches.context_lines)
+        if isinstance(file_matches, FileMatchesWithContext)
+        else (_line_numbers(), [])
+    )
+    lines = [file_matches.filename, *file_matches.lines, *context_lines]
+    taken = len(sink.take(lines))
+    if taken == len(lines):
+        return file_matches
+    kept = _file_matches(file_matches.filename, isinstance(file_matches, FileMatchesWithContext))
+    matches = min(max(taken - 1, 0), len(file_matches.lines))
+    for line_number, line in zip(file_matches.line_numbers[:matches], file_matches.lines[:matches], strict=True):
+        kept.add(line_number, line)
+    if isinstance(kept, FileMatchesWithContext) and matches == len(file_matches.lines):
+        context = taken - 1 - matches
+        for line_number, line in zip(context_line_numbers[:context], context_lines[:context], strict=True):
+            kept.add_context(line_number, line)
+    return kept
+
+
+def _record_truncation(sink: OutputSink, results: GrepResults, skip_count: int, more_matches: int) -> None:
+    """Record that grep stopped at the output budget, with the skip that continues after the matches shown."""
+    shown = sum(len(file_matches.lines) for file_matches in results.data)
+    sink.truncate(
+        f"the same search and skip_first_matches={skip_count + shown}",
+        more_lines=more_matches,
+        more_lines_exact=False,
+    )
+
+
+def _cut_to_budget(sink: OutputSink, results: GrepResults) -> tuple[GrepResults, int]:
+    """Spend the budget on results in order, returning the matches that fit and how many didn't, -1 if all fit."""
+    data = []
+    for file_matches in results.data:
+        kept = _spend_on_file(sink, file_matches)
+        if kept.lines:
+            data.append(kept)
+        if kept is not file_matches:
+            shown = sum(len(shown_matches.lines) for shown_matches in data)
+            total = sum(len(found.lines) for found in results.data)
+            return GrepResults(matches_found=results.matches_found, data=data), total - shown
+    return results, -1
+
+
+def results_within_budget(sink: OutputSink, results: GrepResults, skip_first_matches: int) -> GrepResults:
+    """
+    Cut results found earlier, e.g. cached or merged from several roots, to the output budget.
+
+    Args:
+        sink (OutputSink): The output sink of the tool call.
+        results (GrepResults): The results.
+        skip_first_matches (int): The number of initial matches skipped.
+
+    Returns:
+        GrepResults: The same results if they fit, else the first matches that do.
+    """
+    if sink.unlimited:
+        return results
+    cut, more_matches = _cut_to_budget(sink, results)
+    if more_matches != -1:
+        _record_truncation(sink, cut, max(skip_first_matches, 0), more_matches)
+    return cut
+
+
+def many_within_budget(sink: OutputSink, results: dict[str, GrepResults]) -> dict[str, GrepResults]:
+    """
+    Cut the results of grep_many to the output budget, the patterns in order.
+
+    Args:
+        sink (OutputSink): The output sink of the tool call.
+        results (dict[str, GrepResults]): The results of each pattern.
+
+    Returns:
+        dict[str, GrepResults]: The same results if they fit, else the first matches that do.
+    """
+    if sink.unlimited:
+        return results
+    within = {}
+    more_matches = 0
+    cut_patterns: list[str] = []
+    for name, found in results.items():
+        within[name], more = _cut_to_budget(sink, found)
+        if more != -1:
+            more_matches += more
+        if more != -1 or cut_patterns:
+            # After the first cut, a pattern without results may just not have been searched to the end.
+            cut_patterns.append(name)
+    if cut_patterns:
+        sink.truncate(
+            f"grep on each of {', '.join(cut_patterns)} with skip_first_matches set to the matches shown",
+            more_lines=more_matches,
+            more_lines_exact=False,
+        )
+    return within
+
+
+def merge_grep_results(
+    named_results: Iterable[tuple[str, GrepResults]],
+    skip_first_matches: int = -1,
+    maximum_matches_total: int = -1,
+    context_before: int = 0,
+    context_after: int = 0,
+) -> GrepResults:
+    """
+    Merge the results of several searches, e.g. one per root folder, each file name prefixed with its name.
+
+    The searches ran without skipping and with skip + maximum as their total. The skip and the maximum are applied
+    to the merged matches in order, as one search over all the files would.
+
+    Args:
+        named_results (Iterable[tuple[str, GrepResults]]): (name, results) in order.
+        skip_first_matches (int): Number of initial matches to skip.
+        maximum_matches_total (int): Maximum number of matches to return total.
+        context_before (int): Lines of context before each match.
+        context_after (int): Lines of context after each match.
+
+    Returns:
+        GrepResults: The merged results.
+    """
+    skip_count = 0 if skip_first_matches < 0 else skip_first_matches
+    last_needed = -1 if maximum_matches_total == -1 else skip_count + maximum_matches_total
+    matches_total = 0
+    data = []
+    for name, results in named_results:
+        for file_matches in results.data:
+            if matches_total == last_needed:
+                break
+            shown = _file_matches(f"{name}/{file_matches.filename}", bool(context_before or context_after))
+            for line_number, line in zip(file_matches.line_numbers, file_matches.lines, strict=True):
+                matches_total += 1
+                if matches_total > skip_count:
+                    shown.add(line_number, line)
+                if matches_total == last_needed:
+                    break
+            if shown.lines:
+                context = [(match.line_number, match.line) for match in file_matches.context]
+                _add_context_around(shown, context, context_before, context_after)
+                data.append(shown)
+    return GrepResults(matches_found=matches_total, data=data)
+
 
 class GrepTool:
     """A tool for searching files using regular expressions."""
@@ -57,12 +843,23 @@ class GrepTool:
         self.config = config
         self.auto_cat = config.get_flag("auto_cat", True)
         self.utf8_errors = config.get_value("utf8_errors", "surrogateescape")
+        self.workers = scan_workers(config)
+        self.use_index = config.get_flag("grep_index", False)
+        self.cache_entries = int(config.get_value("grep_cache_entries") or 128)
 
     @log()
     def grep_markdown(
-        self, regex: str, glob_pattern: str, skip_first_matches: int = -1, maximum_matches: int = -1
+        self,
+        regex: str,
+        glob_pattern: str,
+        skip_first_matches: int = -1,
+        maximum_matches: int = -1,
+        multiline: bool = False,
+        fixed_strings: bool = False,
+        output_mode: str = "content",
+        context_lines: int = 0,
     ) -> str:
-        """
+        r"""
         Search for lines matching a regular expression in files and returns markdown formatted results.
 
         Args:
@@ -70,24 +867,38 @@ class GrepTool:
             glob_pattern (str): A glob pattern string to specify files.
             skip_first_matches (int, optional): Number of initial matches to skip.
             maximum_matches (int, optional): Maximum number of matches to return.
+            multiline (bool, optional): If True, the regex can match across lines, e.g. '@property\s+def'.
+            fixed_strings (bool, optional): If True, regex is literal text, one string per line to find any of.
+            output_mode (str, optional): "content" for the matching lines, "files_with_matches" for just the file
+                names (maximum_matches limits the files), "count" for the number of matching lines per file.
+            context_lines (int, optional): Number of lines to show before and after each match, like grep -C.
 
         Returns:
             str: Markdown formatted string of grep results.
         """
-        results = self.grep(regex, glob_pattern, skip_first_matches, maximum_matches)
-        matches_found = results.matches_found
-
-        output = StringIO()
-        for file_match in results.data:
-            output.write(file_match.filename + "\n")
-            for match in file_match.found:
-                output.write(f"line {match.line_number}: {match.line}\n")
-        output.write(
-            f"{matches_found} matches found and {min(matches_found, maximum_matches) if maximum_matches != -1 else matches_found} displayed. "
-            f"Skipped {skip_first_matches}\n"
+        if output_mode == "files_with_matches":
+            files = self.grep_files_with_matches(
+                regex, glob_pattern, maximum_files=maximum_matches, multiline=multiline, fixed_strings=fixed_strings
+            )
+            return files_with_matches_markdown(files)
+        if output_mode == "count":
+            return counts_markdown(
+                self.grep_count(regex, glob_pattern, multiline=multiline, fixed_strings=fixed_strings)
+            )
+        if output_mode != "content":
+            raise ValueError(f"Unknown output_mode {output_mode}, use content, files_with_matches or count.")
+
+        results = self.grep(
+            regex,
+            glob_pattern,
+            skip_first_matches=skip_first_matches,
+            maximum_matches_per_file=maximum_matches,
+            multiline=multiline,
+            fixed_strings=fixed_strings,
+            context_before=context_lines,
+            context_after=context_lines,
         )
-        output.seek(0)
-        return output.read()
+        return matches_markdown(results, skip_first_matches, maximum_matches)
 
     @log()
     def grep(
@@ -97,8 +908,12 @@ class GrepTool:
         skip_first_matches: int = -1,
         maximum_matches_per_file: int = -1,
         maximum_matches_total: int = -1,
+        multiline: bool = False,
+        fixed_strings: bool = False,
+        context_before: int = 0,
+        context_after: int = 0,
     ) -> GrepResults:
-        """
+        r"""
         Search for lines matching a regular expression in files specified by a glob pattern.
 
         Args:
@@ -107,6 +922,10 @@ class GrepTool:
             skip_first_matches (int, optional): Number of initial matches to skip.
             maximum_matches_per_file (int, optional): Maximum number of matches to return for one file.
             maximum_matches_total (int, optional): Maximum number of matches to return total.
+            multiline (bool, optional): If True, the regex can match across lines, e.g. '@property\s+def'.
+            fixed_strings (bool, optional): If True, regex is literal text, one string per line to find any of.
+            context_before (int, optional): Number of lines to show before each match, like grep -B.
+            context_after (int, optional): Number of lines to show after each match, like grep -A.
 
         Returns:
             GrepResults: The results of the grep operation.
@@ -115,52 +934,457 @@ class GrepTool:
             f"grep --regex {regex} --glob_pattern {glob_pattern} "
             f"--skip_first_matches {skip_first_matches} "
             f"--maximum_matches_total {maximum_matches_total} "
-            f"--maximum_matches_per_file {maximum_matches_per_file}"
+            f"--maximum_matches_per_file {maximum_matches_per_file} "
+            f"--multiline {multiline} "
+            f"--fixed_strings {fixed_strings} "
+            f"--context_before {context_before} "
+            f"--context_after {context_after}"
         )
-        pattern = re.compile(regex)
-        matches_total = 0
+        candidates = self._candidate_files(glob_pattern)
+        cache = shared_cache(self.root_folder, "grep", self.cache_entries) if self.cache_entries > 0 else None
+        if cache is not None:
+            key = (
+                regex,
+                glob_pattern,
+                skip_first_matches,
+                maximum_matches_per_file,
+                maximum_matches_total,
+                multiline,
+                fixed_strings,
+                context_before,
+                context_after,
+                self.utf8_errors,
+            )
+            # A live watcher invalidates the cache as changes happen, no need to stat the files in folders it
+            # watches. Hidden and excluded folders aren't watched, their files are still stat'ed.
+            watcher = live_watcher(self.root_folder)
+            generation = cache.generation if watcher is not None else None
+            open_paths = (open_path for _filename, open_path in candidates)
+            fingerprints = (
+                watched_fingerprints(open_paths, watcher.watches_folder)
+                if watcher is not None
+                else fingerprint_files(open_paths)
+            )
+            cached = cache.get(key, fingerprints)
+            if cached is not None:
+                logger.debug(f"grep cache hit, {cache.stats()}")
+                return results_within_budget(output_sink(), cast(GrepResults, cached), skip_first_matches)
+
         skip_count = 0 if skip_first_matches < 0 else skip_first_matches
+        # Once this many matches have been seen, nothing more can be displayed, so stop reading files.
+        last_needed = -1 if maximum_matches_total == -1 else skip_count + maximum_matches_total
+
+        sink = output_sink()
+        matches_total = 0
+        cut_short = False
+        more_matches = 0
+        by_filename: dict[str, FileMatches] = {}
+        files = self._iter_files(
+            regex, candidates, maximum_matches_per_file, multiline, fixed_strings, context_before, context_after
+        )
+        for filename, found_lines, context_lines in files:
+            shown = _file_matches(filename, bool(context_before or context_after))
+            for line_number, line in found_lines:
+                matches_total += 1
+                if matches_total > skip_count:
+                    shown.add(line_number, line)
+                if matches_total == last_needed:
+                    break
+            if shown.lines:
+                _add_context_around(shown, context_lines, context_before, context_after)
+                kept = _spend_on_file(sink, shown)
+                if kept.lines:
+                    by_filename[filename] = kept
+                if kept is not shown:
+                    # The output budget is spent, stop reading files.
+                    cut_short = True
+                    more_matches = len(shown.lines) - len(kept.lines)
+                    break
+            if matches_total == last_needed:
+                break
+        results = GrepResults(
+            matches_found=matches_total, data=[by_filename[filename] for filename in sorted(by_filename)]
+        )
+        if cut_short:
+            _record_truncation(sink, results, skip_count, more_matches)
+        elif cache is not None:
+            cache.put(key, fingerprints, results, generation)
+        return results
 
-        results = GrepResults(matches_found=-1)
+    @log()
+    def grep_many(
+        self, patterns: dict[str, str], glob_pattern: str, maximum_matches_per_pattern: int = -1
+    ) -> dict[str, GrepResults]:
+        r"""
+        Search for several regular expressions at once, reading each file only once.
 
-        for filename in glob.glob(glob_pattern, root_dir=self.root_folder, recursive=True):
-            matches_per_file = 0
-            if os.path.isdir(filename):
-                logging.warning(f"Skipping directory {filename}, because it isn't a file.")
-                continue
-            if not os.path.exists(filename):
-                # What a hack
-                open_path = self.root_folder + "/" + filename
-            else:
-                open_path = filename
-            with open(open_path, encoding="utf-8", errors=self.utf8_errors) as file:
-                if not is_file_in_root_folder(filename, self.root_folder):
-                    logging.warning(f"Skipping file {filename}, because it isn't in the root folder.")
+        Args:
+            patterns (dict[str, str]): Names mapped to regular expressions, e.g. {"todo": "TODO", "print": "print\\("}.
+            glob_pattern (str): A glob pattern string to specify files.
+            maximum_matches_per_pattern (int, optional): Maximum number of matches to return for each pattern.
+
+        Returns:
+            dict[str, GrepResults]: The results for each pattern name.
+        """
+        patterns = convert_to_dict(patterns)
+        logger.info(
+            f"grep_many --patterns {patterns} --glob_pattern {glob_pattern} "
+            f"--maximum_matches_per_pattern {maximum_matches_per_pattern}"
+        )
+        for regex in patterns.values():
+            # raise before any file is read
+            re.compile(regex)
+
+        candidates = self._candidate_files(glob_pattern)
+        if self.use_index:
+            candidates = self._narrow_with_index(list(patterns.values()), candidates)
+        scan_one = functools.partial(
+            scan_file_many,
+            patterns=tuple(patterns.items()),
+            maximum_matches_per_pattern=maximum_matches_per_pattern,
+            utf8_errors=self.utf8_errors,
+        )
+
+        jail = path_jail(self.root_folder)
+        sink = output_sink()
+        # The first pattern's matches come first in the output, once they alone overflow the budget nothing from
+        # later files can be shown.
+        first_pattern = next(iter(patterns), None)
+        first_pattern_lines = 0
+        totals = dict.fromkeys(patterns, 0)
+        by_pattern: dict[str, dict[str, FileMatches]] = {name: {} for name in patterns}
+        scans = self._scan_files([open_path for _filename, open_path in candidates], scan_one)
+        for (filename, _open_path), found in zip(candidates, scans, strict=True):
+            minimal_filename = None
+            for name, found_lines in found.items():
+                if maximum_matches_per_pattern != -1:
+                    found_lines = found_lines[: maximum_matches_per_pattern - totals[name]]
+                if not found_lines:
                     continue
-                line_number = 0
-                for line in file:
-                    below_maximum = matches_per_file < maximum_matches_per_file
-                    maximum_not_set = maximum_matches_per_file == -1
-                    if below_maximum or maximum_not_set:
-                        line_number += 1
-                        if pattern.search(line):
-                            matches_total += 1
-                            matches_per_file += 1
-
-                            if matches_total <= (matches_total + skip_count) or matches_total == -1:
-                                if (0 < skip_first_matches < matches_total) or skip_first_matches == -1:
-                                    # This creates names like \..\..\..\ etc.
-                                    minimal_filename = remove_root_folder(filename, self.root_folder)
-                                    # avoid double count
-                                    found = next((fm for fm in results.data if fm.filename == minimal_filename), None)
-                                    if not found:
-                                        found = FileMatches(filename=minimal_filename)
-                                        results.data.append(found)
-
-                                    found.found.append(Match(line_number=line_number, line=line.strip()))
-        results.data = list(sorted(results.data, key=lambda x: x.filename))
-        results.matches_found = matches_total
-        return results
+                minimal_filename = minimal_filename or jail.relativize(filename)
+                file_matches = by_pattern[name][minimal_filename] = FileMatches(filename=minimal_filename)
+                for line_number, line in found_lines:
+                    file_matches.add(line_number, line)
+                totals[name] += len(found_lines)
+                if name == first_pattern:
+                    # a line for the file name and one per match
+                    first_pattern_lines += 1 + len(found_lines)
+            if 0 < sink.maximum_lines < first_pattern_lines:
+                break
+            if maximum_matches_per_pattern != -1 and all(
+                total >= maximum_matches_per_pattern for total in totals.values()
+            ):
+                # every pattern is full, stop reading files
+                break
+        results = {
+            name: GrepResults(
+                matches_found=totals[name], data=[by_pattern[name][filename] for filename in sorted(by_pattern[name])]
+            )
+            for name in patterns
+        }
+        return many_within_budget(sink, results)
+
+    @log()
+    def grep_files_with_matches(
+        self,
+        regex: str,
+        glob_pattern: str,
+        maximum_files: int = -1,
+        multiline: bool = False,
+        fixed_strings: bool = False,
+    ) -> list[str]:
+        """
+        List the files with at least one line matching a regular expression, like grep -l.
+
+        Each file is only read up to its first match.
+
+        Args:
+            regex (str): A regular expression string to search for.
+            glob_pattern (str): A glob pattern string to specify files.
+            maximum_files (int, optional): Maximum number of file names to return.
+            multiline (bool, optional): If True, the regex can match across lines.
+            fixed_strings (bool, optional): If True, regex is literal text, one string per line to find any of.
+
+        Returns:
+            list[str]: The matching files, sorted.
+        """
+        logger.info(f"grep_files_with_matches --regex {regex} --glob_pattern {glob_pattern}")
+        scan_one, regex = self._file_scanner(regex, 1, multiline, fixed_strings)
+        candidates = self._candidate_files(glob_pattern)
+        if self.use_index:
+            candidates = self._narrow_with_index([regex], candidates)
+        files: list[str] = []
+        if maximum_files == 0:
+            return files
+        scans = self._scan_files([open_path for _filename, open_path in candidates], scan_one)
+        for (filename, _open_path), (found_lines, _context_lines) in zip(candidates, scans, strict=True):
+            if found_lines:
+                files.append(filename)
+                if len(files) == maximum_files:
+                    break
+        return path_jail(self.root_folder).relativize_many(files)
+
+    @log()
+    def grep_count(
+        self, regex: str, glob_pattern: str, multiline: bool = False, fixed_strings: bool = False
+    ) -> dict[str, int]:
+        """
+        Count the lines matching a regular expression in each file, like grep -c.
+
+        Args:
+            regex (str): A regular expression string to search for.
+            glob_pattern (str): A glob pattern string to specify files.
+            multiline (bool, optional): If True, the regex can match across lines.
+            fixed_strings (bool, optional): If True, regex is literal text, one string per line to find any of.
+
+        Returns:
+            dict[str, int]: Matching line count per file, files without matches are left out.
+        """
+        logger.info(f"grep_count --regex {regex} --glob_pattern {glob_pattern}")
+        count_one, regex = self._file_counter(regex, multiline, fixed_strings)
+        candidates = self._candidate_files(glob_pattern)
+        if self.use_index:
+            candidates = self._narrow_with_index([regex], candidates)
+        scans = self._scan_files([open_path for _filename, open_path in candidates], count_one)
+        counted = [(filename, count) for (filename, _open_path), count in zip(candidates, scans, strict=True) if count]
+        relative_paths = path_jail(self.root_folder).relativize_many(filename for filename, _count in counted)
+        return {relative_path: count for relative_path, (_filename, count) in zip(relative_paths, counted, strict=True)}
+
+    def iter_grep(
+        self,
+        regex: str,
+        glob_pattern: str,
+        maximum_matches_per_file: int = -1,
+        multiline: bool = False,
+        fixed_strings: bool = False,
+    ) -> Iterator[tuple[str, Match]]:
+        """
+        Lazily yield lines matching a regular expression, file by file in sorted order.
+
+        Files are only read as the caller asks for more matches, so stopping early stops the reading.
+
+        Args:
+            regex (str): A regular expression string to search for.
+            glob_pattern (str): A glob pattern string to specify files.
+            maximum_matches_per_file (int, optional): Maximum number of matches to yield for one file.
+            multiline (bool, optional): If True, search each whole file so matches can span lines.
+            fixed_strings (bool, optional): If True, regex is one or more newline separated literal strings.
+
+        Yields:
+            tuple[str, Match]: The filename relative to the root folder and the match.
+        """
+        files = self._iter_files(
+            regex, self._candidate_files(glob_pattern), maximum_matches_per_file, multiline, fixed_strings
+        )
+        for filename, found_lines, _context_lines in files:
+            for line_number, line in found_lines:
+                yield filename, Match(line_number=line_number, line=line)
+
+    def _iter_files(
+        self,
+        regex: str,
+        candidates: list[tuple[str, str]],
+        maximum_matches_per_file: int,
+        multiline: bool,
+        fixed_strings: bool,
+        context_before: int = 0,
+        context_after: int = 0,
+    ) -> Iterator[tuple[str, list[tuple[int, str]], list[tuple[int, str]]]]:
+        """
+        Lazily scan already globbed candidate files, yielding those with matches, see iter_grep.
+
+        Args:
+            regex (str): A regular expression string to search for.
+            candidates (list[tuple[str, str]]): (filename as globbed, path to open) pairs.
+            maximum_matches_per_file (int): Maximum number of matches to yield for one file.
+            multiline (bool): If True, search each whole file so matches can span lines.
+            fixed_strings (bool): If True, regex is one or more newline separated literal strings.
+            context_before (int, optional): Lines of context to collect before each match.
+            context_after (int, optional): Lines of context to collect after each match.
+
+        Yields:
+            tuple[str, list[tuple[int, str]], list[tuple[int, str]]]: The filename relative to the root folder,
+                the matching lines and the context lines.
+        """
+        scan_one, regex = self._file_scanner(
+            regex, maximum_matches_per_file, multiline, fixed_strings, context_before, context_after
+        )
+        if self.use_index:
+            candidates = self._narrow_with_index([regex], candidates)
+
+        jail = path_jail(self.root_folder)
+        scans = self._scan_files([open_path for _filename, open_path in candidates], scan_one)
+        for (filename, _open_path), (found_lines, context_lines) in zip(candidates, scans, strict=True):
+            if found_lines:
+                yield jail.relativize(filename), found_lines, context_lines
+
+    def _file_scanner(
+        self,
+        regex: str,
+        maximum_matches_per_file: int,
+        multiline: bool,
+        fixed_strings: bool,
+        context_before: int = 0,
+        context_after: int = 0,
+    ) -> tuple[Callable[[str], tuple[list[tuple[int, str]], list[tuple[int, str]]]], str]:
+        """
+        Choose how to scan each file: literal search when the pattern allows it, else the regex engine.
+
+        Args:
+            regex (str): A regular expression string, or literals when fixed_strings.
+            maximum_matches_per_file (int): Maximum number of matches to return for one file.
+            multiline (bool): If True, search each whole file so matches can span lines.
+            fixed_strings (bool): If True, regex is one or more newline separated literal strings.
+            context_before (int, optional): Lines of context to collect before each match.
+            context_after (int, optional): Lines of context to collect after each match.
+
+        Returns:
+            tuple[Callable, str]: A picklable function of the path to open returning (matches, context), and
+                the pattern as a regex, for the trigram index.
+        """
+        literals, regex = self._literals_or_regex(regex, multiline, fixed_strings)
+        if context_before > 0 or context_after > 0:
+            # Context comes from the line scan's ring buffer, or from the mapped buffer, literal or not.
+            context_scan = functools.partial(
+                scan_file_multiline_context if multiline else scan_file_context,
+                regex=regex,
+                maximum_matches_per_file=maximum_matches_per_file,
+                context_before=max(context_before, 0),
+                context_after=max(context_after, 0),
+                utf8_errors=self.utf8_errors,
+            )
+            return context_scan, regex
+        scan: Callable[[str], list[tuple[int, str]]]
+        if literals:
+            scan = functools.partial(
+                scan_file_literals,
+                literals=literals,
+                maximum_matches_per_file=maximum_matches_per_file,
+                utf8_errors=self.utf8_errors,
+            )
+        else:
+            scan = functools.partial(
+                scan_file_multiline if multiline else scan_file,
+                regex=regex,
+                maximum_matches_per_file=maximum_matches_per_file,
+                utf8_errors=self.utf8_errors,
+            )
+        return functools.partial(_scan_without_context, scan), regex
+
+    def _file_counter(self, regex: str, multiline: bool, fixed_strings: bool) -> tuple[Callable[[str], int], str]:
+        """
+        Like _file_scanner, but for functions that only count the matching lines of a file.
+
+        Args:
+            regex (str): A regular expression string, or literals when fixed_strings.
+            multiline (bool): If True, search each whole file so matches can span lines.
+            fixed_strings (bool): If True, regex is one or more newline separated literal strings.
+
+        Returns:
+            tuple[Callable[[str], int], str]: A picklable function of the path to open, and the pattern as a regex.
+        """
+        literals, regex = self._literals_or_regex(regex, multiline, fixed_strings)
+        if literals:
+            return functools.partial(count_file_literals, literals=literals), regex
+        if multiline:
+            return functools.partial(count_file_multiline, regex=regex), regex
+        return functools.partial(count_file, regex=regex, utf8_errors=self.utf8_errors), regex
+
+    @staticmethod
+    def _literals_or_regex(regex: str, multiline: bool, fixed_strings: bool) -> tuple[tuple[str, ...] | None, str]:
+        """
+        Work out whether a pattern can be searched as literals, and validate it as a regex if not.
+
+        Args:
+            regex (str): A regular expression string, or literals when fixed_strings.
+            multiline (bool): If True, the regex will be used in bytes, multiline mode.
+            fixed_strings (bool): If True, regex is one or more newline separated literal strings.
+
+        Returns:
+            tuple[tuple[str, ...] | None, str]: The literals if any, and the pattern as a regex.
+        """
+        if fixed_strings:
+            parts = regex.split("\n")
+            regex = "|".join(re.escape(part) for part in parts)
+            literals = parts if all(parts) else None
+        else:
+            literals = literal_alternatives(regex)
+        if literals:
+            # Literals never span lines, so this serves multiline too.
+            return tuple(literals), regex
+        # Compile here so a bad regex raises before any file is read or worker started.
+        re.compile(regex.encode("utf-8") if multiline else regex)
+        return None, regex
+
+    def _candidate_files(self, glob_pattern: str) -> list[tuple[str, str]]:
+        """
+        Expand the glob into the files that grep is allowed to read.
+
+        Sorted, so that skipping and limits are deterministic regardless of directory order.
+
+        Args:
+            glob_pattern (str): A glob pattern string to specify files.
+
+        Returns:
+            list[tuple[str, str]]: (filename as globbed, path to open) pairs.
+        """
+        candidates = []
+        jail = path_jail(self.root_folder)
+        ignore = gitignore_for(self.root_folder, self.config)
+        skip = ignore.skip_path if ignore is not None else None
+        # The glob engine only yields files inside the root folder, already sorted.
+        for filename in glob_in_root(glob_pattern, self.root_folder, files_only=True, skip=skip):
+            open_path = filename if os.path.isabs(filename) else self.root_folder + "/" + filename
+            if not jail.resolves_inside(filename):
+                logging.warning(f"Skipping file {filename}, because it links out of the root folder.")
+                continue
+            candidates.append((filename, open_path))
+        return candidates
+
+    def _narrow_with_index(self, regexes: list[str], candidates: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """
+        Drop candidates that the trigram index proves can't match any of the regexes.
+
+        Args:
+            regexes (list[str]): The regular expression strings to search for.
+            candidates (list[tuple[str, str]]): (filename as globbed, path to open) pairs.
+
+        Returns:
+            list[tuple[str, str]]: The candidates that might match, in the same order.
+        """
+        by_path = {os.path.abspath(open_path): (filename, open_path) for filename, open_path in candidates}
+        database = os.path.join(index_folder(self.root_folder, self.config), "trigrams.sqlite3")
+        possible: set[str] = set()
+        with TrigramIndex(database) as index:
+            for regex in regexes:
+                possible.update(index.narrow(regex, list(by_path)))
+        narrowed = [path for path in by_path if path in possible]
+        logger.debug(f"Trigram index narrowed {len(candidates)} files to {len(narrowed)}")
+        return [by_path[path] for path in narrowed]
+
+    def _scan_files(self, open_paths: list[str], scan_one: Callable[[str], ScanResult]) -> Iterator[ScanResult]:
+        """
+        Scan files for matching lines, sharded across the root's process pool when grep_workers > 1.
+
+        Args:
+            open_paths (list[str]): The files to scan.
+            scan_one (Callable[[str], ScanResult]): Picklable function that scans one file.
+
+        Yields:
+            ScanResult: What scan_one found per file, in the same order as open_paths.
+        """
+        count = len(open_paths)
+        if self.workers == 1 or count < 2:
+            for path in open_paths:
+                yield scan_one(path)
+            return
+
+        with scan_pool(self.root_folder, min(self.workers, count)) as (executor, workers):
+            # Big chunks amortize the pickling, small enough that the last shard doesn't dominate.
+            chunk_size = max(1, count // (workers * 4))
+            # map() yields in submission order, which keeps the merge deterministic. Closed early, it cancels the
+            # shards nobody will read.
+            yield from executor.map(scan_one, open_paths, chunksize=chunk_size)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,10 @@ import logging
 
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open
 from ai_shell.utils.cwd_utils import change_directory
+from ai_shell.utils.line_index import existing_line_offsets
+from ai_shell.utils.path_jail import path_jail
 from ai_shell.utils.read_fs import is_file_in_root_folder
 
 logger = logging.getLogger(__name__)
@@ -106,7 +109,17 @@ class HeadTailTool:
         if not is_file_in_root_folder(file_path, self.root_folder):
             raise FileNotFoundError(f"File {file_path} not found in root folder {self.root_folder}")
 
-        with open(file_path, "rb") as file:
+        full_path = path_jail(self.root_folder).absolute(file_path)
+        offsets = None
+        if mode == "tail" and byte_count is None and lines > 0:
+            offsets = existing_line_offsets(self.root_folder, self.config, full_path)
+        if offsets is not None:
+            # Indexed by an earlier cat_range, start at the first wanted line instead of reading them all.
+            with open(full_path, "rb") as file:
+                offsets.seek_line(file, offsets.line_count - lines)
+                return [line.decode("utf-8").rstrip("\r\n") for line in file]
+
+        with cached_open(full_path, "rb") as file:
             if byte_count is not None:
                 if mode == "head":
                     return [file.read(byte_count).decode()]
@@ -10,6 +10,8 @@ from ai_shell.backup_restore import BackupRestore
 from ai_shell.cat_tool import CatTool
 from ai_shell.pyutils.validate import ValidateModule, ValidationMessageForBot, is_python_file
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open, write_through
+from ai_shell.utils.path_jail import path_jail
 
 logger = logging.getLogger(__name__)
 
@@ -53,14 +55,15 @@ class InsertTool:
             raise TypeError("No file_path, please provide file_path for each request.")
         if not context:
             raise TypeError("No context, please context so I can find where to insert the text.")
-        with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+        full_path = path_jail(self.root_folder).absolute_inside(file_path)
+        with cached_open(full_path, errors=self.utf8_errors) as file:
             lines = file.readlines()
         original_lines = list(lines)
 
         context_line_indices = [i for i, line in enumerate(lines) if context in line]
 
         if len(context_line_indices) == 0:
-            with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+            with cached_open(full_path, errors=self.utf8_errors) as file:
                 plain_text = file.read()
             raise ValueError(
                 f"No matches found, no changes made, context is not a substring of any row. "
@@ -69,7 +72,7 @@ class InsertTool:
 
         # Check for ambiguity in the context match
         if len(context_line_indices) > 1:
-            with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+            with cached_open(full_path, errors=self.utf8_errors) as file:
                 plain_text = file.read()
             found_at = ", ".join([str(i) for i in context_line_indices])
             raise ValueError(
@@ -112,7 +115,8 @@ class InsertTool:
             raise TypeError("No text_to_insert, please provide so I have something to insert.")
         if position not in ("start", "end"):
             raise ValueError("position must be start or end, so I know where to insert text.")
-        with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+        full_path = path_jail(self.root_folder).absolute_inside(file_path)
+        with cached_open(full_path, errors=self.utf8_errors) as file:
             lines = file.readlines()
         original_lines = list(lines)
         if position == "start":
@@ -146,7 +150,8 @@ class InsertTool:
             raise TypeError("No file_path, please provide file_path for each request.")
         if not context_lines:
             raise TypeError("No context_lines, please context lines so I can find where to insert the new lines.")
-        with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+        full_path = path_jail(self.root_folder).absolute_inside(file_path)
+        with cached_open(full_path, errors=self.utf8_errors) as file:
             lines = file.readlines()
 
         try:
@@ -163,7 +168,7 @@ class InsertTool:
 
         starts_at = file_string.find(context_string)
         if starts_at == -1:
-            with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+            with cached_open(full_path, errors=self.utf8_errors) as file:
                 plain_text = file.read()
             raise ValueError(
                 f"No matches found, no changes made, context_lines are not found in this document. "
@@ -217,17 +222,16 @@ class InsertTool:
         #         return f"Invalid Python source code. No changes made. {error}."
 
         # Write back to the file
-        BackupRestore.backup_file(file_path)
-        with open(file_path, "w", encoding="utf-8", errors=self.utf8_errors) as file:
-            if isinstance(new_file_string, str):
-                file.write(new_file_string)
-            else:
-                file.writelines(new_file_string)
+        full_path = path_jail(self.root_folder).absolute(file_path)
+        BackupRestore.backup_file(full_path)
+        if not isinstance(new_file_string, str):
+            new_file_string = "".join(new_file_string)
+        write_through(full_path, new_file_string, self.utf8_errors)
 
-        validation = self._validate_code(file_path)
+        validation = self._validate_code(full_path)
 
         if validation:
-            BackupRestore.revert_to_latest_backup(file_path)
+            BackupRestore.revert_to_latest_backup(full_path)
             return f"File not rewritten because of problems.\n{validation.message}"
 
         if self.auto_cat:
@@ -251,7 +255,7 @@ class InsertTool:
         if not self.python_module:
             logger.warning("No python module set, skipping validation.")
             return None
-        validator = ValidateModule(self.python_module)
+        validator = ValidateModule(path_jail(self.root_folder).absolute(self.python_module))
         results = validator.validate()
         explanation = validator.explain_to_bot(results)
         if explanation.is_valid:
@@ -0,0 +1,217 @@
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-0/test_number_lines0/test_grocery_list.txt'] --number_lines
+ais cat cat ['/tmp/pytest-of-root/pytest-0/test_number_lines0/test_grocery_list.txt'] True False
+# Success. Return Value: "<generator object CatTool.cat at 0x7fdc4"
+# Success. Return Value: "1	bread
+2	
+3	
+4	cookies
+"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-0/test_squeeze_blank0/test_grocery_list.txt'] --squeeze_blank
+ais cat cat ['/tmp/pytest-of-root/pytest-0/test_squeeze_blank0/test_grocery_list.txt'] False True
+# Success. Return Value: "<generator object CatTool.cat at 0x7fdc4"
+# Success. Return Value: "bread
+
+cookies
+"
+ais pycat format_code_as_markdown "/tmp/pytest-of-root/pytest-0/test_format_code_with_python_f0" --header="Test Header"
+# Success. Return Value: "# Test Header Source Code
+
+## script2.py"
+ais pycat format_code_as_markdown "/tmp/pytest-of-root/pytest-0/test_format_code_empty_directo0" --header="Empty Dir Header"
+# Success. Return Value: "# Empty Dir Header Source Code
+
+## scrip"
+ais pycat format_code_as_markdown "/tmp/pytest-of-root/pytest-0/test_format_code_with_tree_hea0" --header="tree"
+# Success. Return Value: "# Source Code Filesystem Tree
+
+test_form"
+ais cut cut_fields_by_name CutTool() "/tmp/pytest-of-root/pytest-0/test_cut_fields_by_name0/test.csv" ['Field2']
+# Success. Return Value: "B
+E
+"
+ais cut cut_fields CutTool() "/tmp/pytest-of-root/pytest-0/test_cut_fields_by_index0/test.csv" "1,2"
+# Success. Return Value: "Field1,Field2
+A,B
+D,E
+"
+ais cut cut_characters CutTool() "/tmp/pytest-of-root/pytest-0/test_cut_chars_by_range0/test.csv" "1-1,3-3,5-5"
+# Success. Return Value: "Fed
+ABC
+DEF
+"
+ais find find_files --name="test_file.txt"
+# Success. Return Value: "['test_file.txt']"
+ais find find_files --regex="test_.*\.txt"
+# Success. Return Value: "['small_file.txt', 'test_file.txt']"
+ais find find_files --file_type="file"
+# Success. Return Value: "['small_file.txt', 'test_file.txt']"
+ais find find_files --file_type="directory"
+# Success. Return Value: "['test_dir']"
+ais find find_files --size="+10"
+# Success. Return Value: "['test_file.txt']"
+ais find find_files --size="-10"
+# Success. Return Value: "['small_file.txt']"
+ais find find_files_markdown --file_type="file"
+ais find find_files "file"
+# Success. Return Value: "['small_file.txt', 'test_file.txt']"
+# Success. Return Value: "small_file.txt
+test_file.txt
+"
+ais find find_files_markdown --file_type="directory"
+ais find find_files "directory"
+# Success. Return Value: "['test_dir']"
+# Success. Return Value: "test_dir
+"
+ais git git_status
+# Success. Return Value: "{'changed_files': [], 'untracked_files':"
+ais git git_diff
+# Success. Return Value: "[]"
+ais git git_log_file "log.txt"
+# Success. Return Value: "[]"
+ais git git_log_search "content"
+# Success. Return Value: "[]"
+ais git git_show
+# Success. Return Value: "[]"
+ais git get_current_branch
+# Success. Return Value: "test-branch"
+ais git get_recent_commits 3
+# Success. Return Value: "[{'full_hash': '926c557e248ceaf6cb39f25a"
+ais git git_diff_commit "926c557e248ceaf6cb39f25a0920365b3e9a8774" "982e94cce2fcbfd916ae853782aa4f5fac71a542"
+# Success. Return Value: "[{'file': 'diffcommit.txt'}]"
+ais grep grep "^#.*" "/tmp/tmpohf5vp0g"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "print\(.*\)" "/tmp/tmpp3etc5fn"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep_markdown "print\(.*\)" "/tmp/tmpj7h8klzs"
+ais grep grep "print\(.*\)" "/tmp/tmpj7h8klzs" -1 -1
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+# Success. Return Value: "tmpj7h8klzs
+line 2: print("Hello World")"
+ais headtail head "/tmp/pytest-of-root/pytest-0/test_head0/test.txt" 3
+# Success. Return Value: "['Line 1', 'Line 2', 'Line 3']"
+ais headtail head "/tmp/pytest-of-root/pytest-0/test_head_too_many_lines0/test.txt" 20
+# Success. Return Value: "['Line 1', 'Line 2', 'Line 3', 'Line 4',"
+ais headtail tail "/tmp/pytest-of-root/pytest-0/test_tail0/test.txt" 3
+# Success. Return Value: "['Line 3', 'Line 4', 'Line 5']"
+ais headtail tail "/tmp/pytest-of-root/pytest-0/test_tail_too_many0/test.txt" 15
+# Success. Return Value: "['Line 1', 'Line 2', 'Line 3', 'Line 4',"
+ais headtail head "/tmp/pytest-of-root/pytest-0/test_head_bytes0/test.txt" --byte_count="6"
+# Success. Return Value: "['12345\n']"
+ais headtail tail "/tmp/pytest-of-root/pytest-0/test_tail_bytes0/test.txt" --byte_count="5"
+# Success. Return Value: "['abcde']"
+ais insert insert_text_after_context "/tmp/pytest-of-root/pytest-0/test_insert_text_after_context0/sample.txt" "Context Line" "Inserted Text"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-0/test_insert_text_after_context0/sample.txt']
+ais cat cat ['/tmp/pytest-of-root/pytest-0/test_insert_text_after_context0/sample.txt'] True False
+# Success. Return Value: "<generator object CatTool.cat at 0x7fdc4"
+# Success. Return Value: "1	Line 1
+2	Context Line
+3	Inserted Text
+"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_after_context "/tmp/pytest-of-root/pytest-0/test_insert_text_after_context1/sample.txt" "Non-existent Context" "Inserted Text"
+# Failure. Exception: No matches found, no changes made, context is not a substring of any row. For reference, here is the contents of the file:
+Line 1
+Line 2
+Line 3
+
+ais insert insert_text_at_start_or_end "/tmp/pytest-of-root/pytest-0/test_insert_text_at_position_p0/sample.txt" "Inserted Text" "start"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-0/test_insert_text_at_position_p0/sample.txt']
+ais cat cat ['/tmp/pytest-of-root/pytest-0/test_insert_text_at_position_p0/sample.txt'] True False
+# Success. Return Value: "<generator object CatTool.cat at 0x7fdc4"
+# Success. Return Value: "1	Inserted Text
+2	Line 1
+3	Line 2
+4	Line"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_at_start_or_end "/tmp/pytest-of-root/pytest-0/test_insert_text_at_position_p1/sample.txt" "Inserted Text" "end"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-0/test_insert_text_at_position_p1/sample.txt']
+ais cat cat ['/tmp/pytest-of-root/pytest-0/test_insert_text_at_position_p1/sample.txt'] True False
+# Success. Return Value: "<generator object CatTool.cat at 0x7fdc4"
+# Success. Return Value: "1	Line 1
+2	Line 2
+3	Line 3
+4	Inserted Te"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_at_start_or_end "/tmp/pytest-of-root/pytest-0/test_insert_text_at_position_n0/sample.txt" "Inserted Text" "middle"
+# Failure. Exception: position must be start or end, so I know where to insert text.
+ais insert insert_text_after_multiline_context "/tmp/pytest-of-root/pytest-0/test_insert_text_after_multili0/sample.txt" ['Context Line 1', 'Context Line 2'] "Inserted Text"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-0/test_insert_text_after_multili0/sample.txt']
+ais cat cat ['/tmp/pytest-of-root/pytest-0/test_insert_text_after_multili0/sample.txt'] True False
+# Success. Return Value: "<generator object CatTool.cat at 0x7fdc4"
+# Success. Return Value: "1	Line 1
+2	Context Line 1
+3	Context Line"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_after_multiline_context "/tmp/pytest-of-root/pytest-0/test_insert_text_after_multili1/sample.txt" ['Non-existent Context Line 1', 'Non-existent Context Line 2'] "Inserted Text"
+# Failure. Exception: No matches found, no changes made, context_lines are not found in this document. For reference, here is the contents of the file:
+Line 1
+Line 2
+Line 3
+
+ais ls ls "/tmp/pytest-of-root/pytest-0/test_ls_basic0"
+# Success. Return Value: "['file1.txt', 'file2.txt']"
+ais ls ls_markdown "/tmp/pytest-of-root/pytest-0/test_ls_basic_markdown0"
+ais ls ls "/tmp/pytest-of-root/pytest-0/test_ls_basic_markdown0" False False
+# Success. Return Value: "['file1.txt', 'file2.txt']"
+# Success. Return Value: "file1.txt
+file2.txt"
+ais ls ls "/tmp/pytest-of-root/pytest-0/test_ls_all0" --all_files
+# Success. Return Value: "['.hidden1', '.hidden2', 'file1.txt', 'f"
+ais ls ls "/tmp/pytest-of-root/pytest-0/test_ls_long0" --long
+# Success. Return Value: "['0 Bytes 2026-10-18 20:15 file1.txt', '"
+ais ls ls "/tmp/pytest-of-root/pytest-0/test_ls_all_long0" --all_files --long
+# Success. Return Value: "['0 Bytes 2026-10-18 20:15 .hidden1', '0"
+ais ls ls "/tmp/pytest-of-root/pytest-0/test_ls_empty_directory0"
+# Success. Return Value: "[]"
+ais ls ls "/non/existent/directory"
+# Success. Return Value: "# Bad `ls` command. Here are all the fil"
+ais patch apply_git_patch "diff --git a/file.txt b/file.txt
+new file mode 100644
+index 0000000..e69de29"
+# Success. Return Value: "Patch applied without exception, please "
+ais patch apply_git_patch "diff --git a/file.txt b/file.txt
+--- a/file.txt
++++ b/file.txt
+@@ -1 +1 @@
+-a
++b
+"
+# Failure. Exception: Failed to apply patch: patch failed
+ais patch apply_git_patch "diff --git a//tmp/pytest-of-root/pytest-0/test_apply_git_patch_outside_r0/secret.txt b//tmp/pytest-of-root/pytest-0/test_apply_git_patch_outside_r0/secret.txt
+--- a//tmp/pytest-of-root/pytest-0/test_apply_git_patch_outside_r0/secret.txt
++++ b//tmp/pytest-of-root/pytest-0/test_apply_git_patch_outside_r0/secret.txt
+"
+# Failure. Exception: Patch targets '/tmp/pytest-of-root/pytest-0/test_apply_git_patch_outside_r0/secret.txt' outside the root folder, which is not allowed.
+ais patch apply_git_patch "this is not a diff at all"
+# Failure. Exception: No target files found in patch. Is this a valid unified diff?
+ais replace replace_line_by_line "/tmp/pytest-of-root/pytest-0/test_replacement_in_single_lin0/dummy.txt" "World" "Universe"
+# Success. Return Value: "Changes applied without exception, pleas"
+ais replace replace_line_by_line "/tmp/pytest-of-root/pytest-0/test_replacement_in_multiple_l0/dummy.txt" "World" "Universe" 0 2
+# Success. Return Value: "Changes applied without exception, pleas"
+ais replace replace_line_by_line "/tmp/pytest-of-root/pytest-0/test_no_replacement_needed0/dummy.txt" "Universe" "Galaxy"
+# Success. Return Value: "No changes made, this means the old file"
+ais replace replace_all "/tmp/pytest-of-root/pytest-0/test_replace_all_occurrences0/dummy.txt" "World" "Universe"
+# Success. Return Value: "Changes applied without exception, pleas"
+ais replace replace_with_regex "/tmp/pytest-of-root/pytest-0/test_replace_with_regex0/dummy.txt" --regex_match_expression="\bWorld[0-9]+\b" --replacement=""
+# Success. Return Value: "Changes applied without exception, pleas"
+ais rewrite write_new_file "test_file.txt" "Hello, world!"
+# Success. Return Value: "File written to test_file.txt"
+ais rewrite write_new_file "test_file.txt" "New content"
+# Failure. Exception: File already exists. # File test_file.txt already exists. Here are all the files you can see
+
+test_write_new_file_failure_fi0
+└── test_file.txt
+
+0 directories, 1 files
+
+ Consider using rewrite_file method if you want to overwrite.
+ais rewrite write_new_file "/outside_test_file.txt" "Some content"
+# Failure. Exception: File path must be within the root folder.
+ais rewrite rewrite_file "test_file.txt" "Updated content"
+# Success. Return Value: "File rewritten to test_file.txt, please "
+ais rewrite rewrite_file "nonexistent_file.txt" "Some content"
+# Failure. Exception: File does not exist, use ls tool to see what files there are.
+ais rewrite rewrite_file "/outside_test_file.txt" "Some content"
+# Failure. Exception: File path must be within the root folder.
+ais grep grep --glob_pattern="**/*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="test_grep" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=5, data=[FileM"
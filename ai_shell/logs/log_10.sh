@@ -0,0 +1,29 @@
+ais grep grep "^#.*" "/tmp/tmpnf2y1by4"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "print\(.*\)" "/tmp/tmpwuhtlb2j"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep_markdown "print\(.*\)" "/tmp/tmplhdexj7p"
+ais grep grep "print\(.*\)" "/tmp/tmplhdexj7p" --skip_first_matches="-1" --maximum_matches_per_file="-1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+# Success. Return Value: "tmplhdexj7p
+line 2: print("Hello World")"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "TODO" "*.py" --skip_first_matches="1" --maximum_matches_total="3"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep "TODO" "*.py" --maximum_matches_total="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "TODO two" "*.py"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "TODO two" "*.py"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "@property\s+def \w+" "*.py" --multiline
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "property" "*.py" --multiline
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "property" "*.py"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
@@ -0,0 +1,378 @@
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais cat cat_markdown --file_paths="['big.py']" --number_lines
+# Success. Return Value: "1	value_0 = compute(0)  # note
+2	value_1"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais grep grep_count --glob_pattern="*.py" --regex="compute\("
+# Success. Return Value: "{'big.py': 50000}"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail head --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_0 = compute(0)  # note', 'value_"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
+ais headtail tail --byte_count="None" --file_path="big.py" --lines="5"
+# Success. Return Value: "['value_49995 = compute(49995)  # note',"
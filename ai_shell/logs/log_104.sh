@@ -0,0 +1,102 @@
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-96/test_number_lines0/test_grocery_list.txt'] --number_lines
+# Success. Return Value: "1	bread
+2	
+3	
+4	cookies
+"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-96/test_squeeze_blank0/test_grocery_list.txt'] --squeeze_blank
+# Success. Return Value: "bread
+
+cookies
+"
+ais cat cat_markdown ['odd.txt'] --number_lines --squeeze_blank
+# Success. Return Value: "1	a
+2	bcd e
+3	 	
+4	ééééééééééééééééééé"
+ais cat cat ['odd.txt'] --number_lines --squeeze_blank
+# Success. Return Value: "<generator object CatTool.cat at 0x7f5aa"
+ais   <_io.BufferedReader name='/tmp/pytest-of-root/pytest-96/test_chunked_read_keeps_lines_0/odd.txt'> 1 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais cat cat_markdown ['*.txt'] --squeeze_blank
+# Success. Return Value: "1	
+2	end
+3	file 1
+4	
+5	end
+6	file 2
+7	fi"
+ais cat cat_markdown ['*.txt'] --squeeze_blank
+# Success. Return Value: "1	
+2	end
+3	file 1
+4	
+5	end
+6	file 2
+7	fi"
+ais cat cat ['*.txt'] --squeeze_blank
+# Success. Return Value: "<generator object CatTool.cat at 0x7f5aa"
+ais   <_io.BytesIO object at 0x7f5aa3c79030> 1 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78090> 3 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b010> 6 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78ea0> 10 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b240> 15 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c781d0> 17 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7ad40> 20 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c79030> 24 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78680> 29 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c79030> 31 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78ea0> 34 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b240> 38 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c780e0> 43 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b240> 45 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78ef0> 48 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78680> 52 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b010> 57 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c79030> 59 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b100> 62 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c780e0> 66 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c781d0> 71 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c780e0> 73 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b240> 76 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78ea0> 80 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78680> 85 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78ea0> 87 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b100> 90 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c78e50> 94 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c79080> 99 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f5aa3c7b240> 101 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais cat cat ['*.txt']
+# Success. Return Value: "<generator object CatTool.cat at 0x7f5aa"
+ais   <_io.BytesIO object at 0x7f5aa3c78ef0> 1 True False
+# Success. Return Value: "<generator object CatTool._process_cat_f"
@@ -0,0 +1,777 @@
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-97/test_number_lines0/test_grocery_list.txt'] --number_lines
+# Success. Return Value: "1	bread
+2	
+3	
+4	cookies
+"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-97/test_squeeze_blank0/test_grocery_list.txt'] --squeeze_blank
+# Success. Return Value: "bread
+
+cookies
+"
+ais cat cat_markdown ['odd.txt'] --number_lines --squeeze_blank
+# Success. Return Value: "1	a
+2	bcd e
+3	 	
+4	ééééééééééééééééééé"
+ais cat cat ['odd.txt'] --number_lines --squeeze_blank
+# Success. Return Value: "<generator object CatTool.cat at 0x7f1a8"
+ais   <_io.BufferedReader name='/tmp/pytest-of-root/pytest-97/test_chunked_read_keeps_lines_0/odd.txt'> 1 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais cat cat_markdown ['*.txt'] --squeeze_blank
+# Success. Return Value: "1	
+2	end
+3	file 1
+4	
+5	end
+6	file 2
+7	fi"
+ais cat cat_markdown ['*.txt'] --squeeze_blank
+# Success. Return Value: "1	
+2	end
+3	file 1
+4	
+5	end
+6	file 2
+7	fi"
+ais cat cat ['*.txt'] --squeeze_blank
+# Success. Return Value: "<generator object CatTool.cat at 0x7f1a8"
+ais   <_io.BytesIO object at 0x7f1a88f34130> 1 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f1bf10> 3 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f347c0> 6 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34950> 10 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f340e0> 15 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f1bf60> 17 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34400> 20 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34b80> 24 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a89058c20> 29 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34b80> 31 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a8904bfb0> 34 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34450> 38 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f1bfb0> 43 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34450> 45 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a89058c20> 48 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34ef0> 52 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f18c20> 57 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34ef0> 59 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f1bfb0> 62 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f345e0> 66 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a8904bfb0> 71 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f345e0> 73 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f18c20> 76 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f343b0> 80 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a89058c20> 85 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f343b0> 87 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a8904bfb0> 90 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f34360> 94 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f1bfb0> 99 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais   <_io.BytesIO object at 0x7f1a88f1bdd0> 101 True True
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais cat cat ['*.txt']
+# Success. Return Value: "<generator object CatTool.cat at 0x7f1a8"
+ais   <_io.BytesIO object at 0x7f1a88f34c70> 1 True False
+# Success. Return Value: "<generator object CatTool._process_cat_f"
+ais pycat format_code_as_markdown "/tmp/pytest-of-root/pytest-97/test_format_code_with_python_f0" --header="Test Header"
+# Success. Return Value: "# Test Header Source Code
+
+## script2.py"
+ais pycat format_code_as_markdown "/tmp/pytest-of-root/pytest-97/test_format_code_empty_directo0" --header="Empty Dir Header"
+# Success. Return Value: "# Empty Dir Header Source Code
+
+## scrip"
+ais pycat format_code_as_markdown "/tmp/pytest-of-root/pytest-97/test_format_code_with_tree_hea0" --header="tree"
+# Success. Return Value: "# Source Code Filesystem Tree
+
+test_form"
+ais cut cut_fields_by_name CutTool() "/tmp/pytest-of-root/pytest-97/test_cut_fields_by_name0/test.csv" ['Field2']
+# Success. Return Value: "B
+E
+"
+ais cut cut_fields CutTool() "/tmp/pytest-of-root/pytest-97/test_cut_fields_by_index0/test.csv" "1,2"
+# Success. Return Value: "Field1,Field2
+A,B
+D,E
+"
+ais cut cut_characters CutTool() "/tmp/pytest-of-root/pytest-97/test_cut_chars_by_range0/test.csv" "1-1,3-3,5-5"
+# Success. Return Value: "Fed
+ABC
+DEF
+"
+ais find find_files --name="test_file.txt"
+# Success. Return Value: "PathList(['test_file.txt'])"
+ais find find_files --regex="test_.*\.txt"
+# Success. Return Value: "PathList(['test_file.txt'])"
+ais find find_files --file_type="file"
+# Success. Return Value: "PathList(['small_file.txt', 'test_file.t"
+ais find find_files --file_type="directory"
+# Success. Return Value: "PathList(['test_dir'])"
+ais find find_files --size="+10"
+# Success. Return Value: "PathList(['test_file.txt'])"
+ais find find_files --size="-10"
+# Success. Return Value: "PathList(['small_file.txt'])"
+ais find find_files_markdown --file_type="file"
+ais find find_files "file" -1
+# Success. Return Value: "PathList(['small_file.txt', 'test_file.t"
+# Success. Return Value: "small_file.txt
+test_file.txt
+"
+ais find find_files_markdown --file_type="directory"
+ais find find_files "directory" -1
+# Success. Return Value: "PathList(['test_dir'])"
+# Success. Return Value: "test_dir
+"
+ais find find_files
+# Success. Return Value: "PathList(['a.txt', 'a/b/y.py', 'a/x.py',"
+ais find find_files --file_type="directory"
+# Success. Return Value: "PathList(['a', 'a/b'])"
+ais find find_files --regex="\.py$"
+# Success. Return Value: "PathList(['a/b/y.py', 'a/x.py', 'b.py', "
+ais find find_files --name="*.py" --limit="2"
+# Success. Return Value: "PathList(['a/b/y.py', 'a/x.py'])"
+ais find find_files --limit="1"
+# Success. Return Value: "PathList(['a.txt'])"
+ais find find_files
+# Success. Return Value: "PathList(['a.txt', 'a/b/y.py', 'a/x.py',"
+ais find find_files
+# Success. Return Value: "PathList(['a.txt', 'a/b/y.py', 'a/x.py',"
+ais find find_files --limit="2"
+# Success. Return Value: "PathList(['a.txt', 'a/b/y.py'])"
+ais find find_files --size="-8"
+# Success. Return Value: "PathList(['a.txt', 'a/b/y.py', 'a/x.py',"
+ais git git_status
+# Success. Return Value: "{'changed_files': [], 'untracked_files':"
+ais git git_diff
+# Success. Return Value: "[]"
+ais git git_log_file "log.txt"
+# Success. Return Value: "[]"
+ais git git_log_search "content"
+# Success. Return Value: "[]"
+ais git git_show
+# Success. Return Value: "[]"
+ais git get_current_branch
+# Success. Return Value: "test-branch"
+ais git get_recent_commits 3
+# Success. Return Value: "[{'full_hash': '1d50813e8f91a540a3f3beaf"
+ais git git_diff_commit "1d50813e8f91a540a3f3beaf507db50887b7c132" "0bb48aae73c2774f7b62950e85cac824d65e4932"
+# Success. Return Value: "[{'file': 'diffcommit.txt'}]"
+ais grep grep "^#.*" "/tmp/tmpa1xsx714"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "print\(.*\)" "/tmp/tmp2kak23_s"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep_markdown "print\(.*\)" "/tmp/tmpelafncpc"
+ais grep grep "print\(.*\)" "/tmp/tmpelafncpc" --skip_first_matches="-1" --maximum_matches_per_file="-1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+# Success. Return Value: "tmpelafncpc
+line 2: print("Hello World")"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "TODO" "*.py" --skip_first_matches="1" --maximum_matches_total="3"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep "TODO" "*.py" --maximum_matches_total="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "TODO two" "*.py"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "TODO two" "*.py"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "@property\s+def \w+" "*.py" --multiline
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "property" "*.py" --multiline
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "property" "*.py"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "name_0
+name_1
+name_2
+name_3
+name_4
+name_5
+name_6
+name_7
+name_8
+name_9
+name_10
+name_11
+name_12
+name_13
+name_14
+name_15
+name_16
+name_17
+name_18
+name_19
+name_20
+name_21
+name_22
+name_23
+name_24
+name_25
+name_26
+name_27
+name_28
+name_29
+name_30
+name_31
+name_32
+name_33
+name_34
+name_35
+name_36
+name_37
+name_38
+name_39
+name_40
+name_41
+name_42
+name_43
+name_44
+name_45
+name_46
+name_47
+name_48
+name_49
+name_50
+name_51
+name_52
+name_53
+name_54
+name_55
+name_56
+name_57
+name_58
+name_59
+name_60
+name_61
+name_62
+name_63
+name_64
+name_65
+name_66
+name_67
+name_68
+name_69
+name_70
+name_71
+name_72
+name_73
+name_74
+name_75
+name_76
+name_77
+name_78
+name_79
+name_80
+name_81
+name_82
+name_83
+name_84
+name_85
+name_86
+name_87
+name_88
+name_89
+name_90
+name_91
+name_92
+name_93
+name_94
+name_95
+name_96
+name_97
+name_98
+name_99
+name_100
+name_101
+name_102
+name_103
+name_104
+name_105
+name_106
+name_107
+name_108
+name_109
+name_110
+name_111
+name_112
+name_113
+name_114
+name_115
+name_116
+name_117
+name_118
+name_119
+name_120
+name_121
+name_122
+name_123
+name_124
+name_125
+name_126
+name_127
+name_128
+name_129
+name_130
+name_131
+name_132
+name_133
+name_134
+name_135
+name_136
+name_137
+name_138
+name_139
+name_140
+name_141
+name_142
+name_143
+name_144
+name_145
+name_146
+name_147
+name_148
+name_149" "*.py" --fixed_strings
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "name_0|name_1|name_2|name_3|name_4|name_5|name_6|name_7|name_8|name_9|name_10|name_11|name_12|name_13|name_14|name_15|name_16|name_17|name_18|name_19|name_20|name_21|name_22|name_23|name_24|name_25|name_26|name_27|name_28|name_29|name_30|name_31|name_32|name_33|name_34|name_35|name_36|name_37|name_38|name_39|name_40|name_41|name_42|name_43|name_44|name_45|name_46|name_47|name_48|name_49|name_50|name_51|name_52|name_53|name_54|name_55|name_56|name_57|name_58|name_59|name_60|name_61|name_62|name_63|name_64|name_65|name_66|name_67|name_68|name_69|name_70|name_71|name_72|name_73|name_74|name_75|name_76|name_77|name_78|name_79|name_80|name_81|name_82|name_83|name_84|name_85|name_86|name_87|name_88|name_89|name_90|name_91|name_92|name_93|name_94|name_95|name_96|name_97|name_98|name_99|name_100|name_101|name_102|name_103|name_104|name_105|name_106|name_107|name_108|name_109|name_110|name_111|name_112|name_113|name_114|name_115|name_116|name_117|name_118|name_119|name_120|name_121|name_122|name_123|name_124|name_125|name_126|name_127|name_128|name_129|name_130|name_131|name_132|name_133|name_134|name_135|name_136|name_137|name_138|name_139|name_140|name_141|name_142|name_143|name_144|name_145|name_146|name_147|name_148|name_149" "*.py"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "name_3(x)" "*.py" --fixed_strings
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "print\(" "*.py"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep_many {'todo': 'TODO', 'print': 'print\\(', 'two': 'two \\d', 'none': 'nothing'} "*.py"
+# Success. Return Value: "{'todo': GrepResults(matches_found=13, d"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "print\(" "*.py"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "two \d" "*.py"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "nothing" "*.py"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep_many "{"todo": "TODO", "print": "print\\("}" "*.py" --maximum_matches_per_pattern="3"
+# Success. Return Value: "{'todo': GrepResults(matches_found=3, da"
+ais grep grep "TODO one" "*.py"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "TODO one" "*.py"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais replace replace_all "module_2.py" "TODO one" "DONE one"
+# Success. Return Value: "Changes applied without exception, pleas"
+ais grep grep "TODO one" "*.py"
+# Success. Return Value: "GrepResults(matches_found=5, data=[FileM"
+ais grep grep_files_with_matches "TODO \w+" "*.py"
+# Success. Return Value: "['module_0.py', 'module_1.py', 'module_2"
+ais grep grep_files_with_matches "TODO" "*.py" --maximum_files="2"
+# Success. Return Value: "['module_0.py', 'module_1.py']"
+ais grep grep_count "TODO" "*.py"
+# Success. Return Value: "{'module_0.py': 2, 'module_1.py': 2, 'mo"
+ais grep grep_count "TODO \w+" "*.py"
+# Success. Return Value: "{'module_0.py': 2, 'module_1.py': 2, 'mo"
+ais grep grep_count "one \d\nx = 1" "*.py" --multiline
+# Success. Return Value: "{'module_0.py': 1, 'module_1.py': 1, 'mo"
+ais grep grep_markdown "TODO" "*.py" --output_mode="count"
+ais grep grep_count "TODO" "*.py"
+# Success. Return Value: "{'module_0.py': 2, 'module_1.py': 2, 'mo"
+# Success. Return Value: "module_0.py: 2
+module_1.py: 2
+module_2.p"
+ais grep grep_markdown "x = 1" "*.py" --maximum_matches="1" --output_mode="files_with_matches"
+ais grep grep_files_with_matches "x = 1" "*.py" --maximum_files="1"
+# Success. Return Value: "['module_0.py']"
+# Success. Return Value: "module_0.py
+1 files with matches.
+"
+ais grep grep_markdown "x" "*.py" --output_mode="lines"
+# Failure. Exception: Unknown output_mode lines, use content, files_with_matches or count.
+ais grep grep "line (5|7|15)$" "*.txt" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "line (5|7|15)$" "*.txt" --multiline --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "line (5|7|15)$" "*.txt" --skip_first_matches="2" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep_markdown "line 1[0-1]$" "*.txt" --context_lines="1"
+ais grep grep "line 1[0-1]$" "*.txt" --skip_first_matches="-1" --maximum_matches_per_file="-1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+# Success. Return Value: "lines.txt
+line 9- line 9
+line 10: line 1"
+ais grep grep_markdown "line (2|9)$" "*.txt" --context_lines="1"
+ais grep grep "line (2|9)$" "*.txt" --skip_first_matches="-1" --maximum_matches_per_file="-1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+# Success. Return Value: "lines.txt
+line 1- line 1
+line 2: line 2
+"
+ais grep grep "beta" "*.txt" --context_before="5" --context_after="5"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "beta" "*.txt" --multiline --context_before="5" --context_after="5"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "TODO" "*.py" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais headtail head "/tmp/pytest-of-root/pytest-97/test_head0/test.txt" 3
+# Success. Return Value: "['Line 1', 'Line 2', 'Line 3']"
+ais headtail head "/tmp/pytest-of-root/pytest-97/test_head_too_many_lines0/test.txt" 20
+# Success. Return Value: "['Line 1', 'Line 2', 'Line 3', 'Line 4',"
+ais headtail tail "/tmp/pytest-of-root/pytest-97/test_tail0/test.txt" 3
+# Success. Return Value: "['Line 3', 'Line 4', 'Line 5']"
+ais headtail tail "/tmp/pytest-of-root/pytest-97/test_tail_too_many0/test.txt" 15
+# Success. Return Value: "['Line 1', 'Line 2', 'Line 3', 'Line 4',"
+ais headtail head "/tmp/pytest-of-root/pytest-97/test_head_bytes0/test.txt" --byte_count="6"
+# Success. Return Value: "['12345\n']"
+ais headtail tail "/tmp/pytest-of-root/pytest-97/test_tail_bytes0/test.txt" --byte_count="5"
+# Success. Return Value: "['abcde']"
+ais insert insert_text_after_context "/tmp/pytest-of-root/pytest-97/test_insert_text_after_context0/sample.txt" "Context Line" "Inserted Text"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-97/test_insert_text_after_context0/sample.txt']
+# Success. Return Value: "1	Line 1
+2	Context Line
+3	Inserted Text
+"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_after_context "/tmp/pytest-of-root/pytest-97/test_insert_text_after_context1/sample.txt" "Non-existent Context" "Inserted Text"
+# Failure. Exception: No matches found, no changes made, context is not a substring of any row. For reference, here is the contents of the file:
+Line 1
+Line 2
+Line 3
+
+ais insert insert_text_at_start_or_end "/tmp/pytest-of-root/pytest-97/test_insert_text_at_position_p0/sample.txt" "Inserted Text" "start"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-97/test_insert_text_at_position_p0/sample.txt']
+# Success. Return Value: "1	Inserted Text
+2	Line 1
+3	Line 2
+4	Line"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_at_start_or_end "/tmp/pytest-of-root/pytest-97/test_insert_text_at_position_p1/sample.txt" "Inserted Text" "end"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-97/test_insert_text_at_position_p1/sample.txt']
+# Success. Return Value: "1	Line 1
+2	Line 2
+3	Line 3
+4	Inserted Te"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_at_start_or_end "/tmp/pytest-of-root/pytest-97/test_insert_text_at_position_n0/sample.txt" "Inserted Text" "middle"
+# Failure. Exception: position must be start or end, so I know where to insert text.
+ais insert insert_text_after_multiline_context "/tmp/pytest-of-root/pytest-97/test_insert_text_after_multili0/sample.txt" ['Context Line 1', 'Context Line 2'] "Inserted Text"
+ais cat cat_markdown ['/tmp/pytest-of-root/pytest-97/test_insert_text_after_multili0/sample.txt']
+# Success. Return Value: "1	Line 1
+2	Context Line 1
+3	Context Line"
+# Success. Return Value: "Tool feedback: Insert completed and no e"
+ais insert insert_text_after_multiline_context "/tmp/pytest-of-root/pytest-97/test_insert_text_after_multili1/sample.txt" ['Non-existent Context Line 1', 'Non-existent Context Line 2'] "Inserted Text"
+# Failure. Exception: No matches found, no changes made, context_lines are not found in this document. For reference, here is the contents of the file:
+Line 1
+Line 2
+Line 3
+
+ais ls ls "/tmp/pytest-of-root/pytest-97/test_ls_basic0"
+# Success. Return Value: "PathList(['file1.txt', 'file2.txt'])"
+ais ls ls_markdown "/tmp/pytest-of-root/pytest-97/test_ls_basic_markdown0"
+ais ls ls "/tmp/pytest-of-root/pytest-97/test_ls_basic_markdown0" False False
+# Success. Return Value: "PathList(['file1.txt', 'file2.txt'])"
+# Success. Return Value: "file1.txt
+file2.txt"
+ais ls ls "/tmp/pytest-of-root/pytest-97/test_ls_all0" --all_files
+# Success. Return Value: "PathList(['.hidden1', '.hidden2', 'file1"
+ais ls ls "/tmp/pytest-of-root/pytest-97/test_ls_long0" --long
+# Success. Return Value: "PathList(['0 Bytes 2026-10-18 21:22 file"
+ais ls ls "/tmp/pytest-of-root/pytest-97/test_ls_all_long0" --all_files --long
+# Success. Return Value: "PathList(['0 Bytes 2026-10-18 21:22 .hid"
+ais ls ls "/tmp/pytest-of-root/pytest-97/test_ls_empty_directory0"
+# Success. Return Value: "PathList([])"
+ais ls ls "/non/existent/directory"
+# Success. Return Value: "# Bad `ls` command. Here are all the fil"
+ais ls ls "."
+# Success. Return Value: "PathList(['file1.txt', 'file2.txt'])"
+ais ls ls "." --all_files
+# Success. Return Value: "PathList(['.hidden1', '.hidden2', 'file1"
+ais ls ls "." --long
+# Success. Return Value: "PathList(['5.0 Bytes 2026-10-18 21:22 fi"
+ais ls ls "."
+# Success. Return Value: "PathList(['file1.txt', 'file2.txt', 'fil"
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="**/*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="**/*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="**/*.py" --maximum_matches_per_file="-1" --maximum_matches_total="3" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="**/*.py" --maximum_matches_per_file="-1" --maximum_matches_total="3" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep_count --glob_pattern="**/*.py" --regex="needle"
+# Success. Return Value: "{'src/server.py': 2}"
+ais find find_files --file_type="None" --limit="2" --name="*.py" --regex="None" --size="None"
+# Success. Return Value: "PathList(['src/app.py', 'src/view.py'])"
+ais find find_files --file_type="None" --limit="2" --name="*.py" --regex="None" --size="None"
+# Success. Return Value: "PathList(['src/server.py'])"
+ais ls ls --path="src/*.py"
+# Success. Return Value: "PathList(['src/app.py', 'src/view.py'])"
+ais ls ls --path="src/*.py"
+# Success. Return Value: "PathList(['src/server.py'])"
+ais grep grep_count --glob_pattern="*/*.py" --regex="needle"
+ais grep grep_count --glob_pattern="*/*.py" --regex="needle"
+# Success. Return Value: "{'src/server.py': 2}"
+# Success. Return Value: "{'src/app.py': 1, 'src/view.py': 1}"
+ais ls ls --path="."
+# Success. Return Value: "PathList(['README.md', 'src'])"
+ais headtail head --byte_count="None" --file_path="src/server.py" --lines="1"
+# Success. Return Value: "['needle = 1']"
+ais headtail head --byte_count="None" --file_path="../outside.txt" --lines="10"
+# Failure. Exception: File ../outside.txt not found in root folder /tmp/pytest-of-root/pytest-97/test_paths_are_routed_and_jail0/api
+ais headtail head --byte_count="None" --file_path="../api/README.md" --lines="10"
+# Failure. Exception: File ../api/README.md not found in root folder /tmp/pytest-of-root/pytest-97/test_paths_are_routed_and_jail0/web
+ais patch apply_git_patch "diff --git a/file.txt b/file.txt
+new file mode 100644
+index 0000000..e69de29"
+# Success. Return Value: "Patch applied without exception, please "
+ais patch apply_git_patch "diff --git a/file.txt b/file.txt
+--- a/file.txt
++++ b/file.txt
+@@ -1 +1 @@
+-a
++b
+"
+# Failure. Exception: Failed to apply patch: patch failed
+ais patch apply_git_patch "diff --git a//tmp/pytest-of-root/pytest-97/test_apply_git_patch_outside_r0/secret.txt b//tmp/pytest-of-root/pytest-97/test_apply_git_patch_outside_r0/secret.txt
+--- a//tmp/pytest-of-root/pytest-97/test_apply_git_patch_outside_r0/secret.txt
++++ b//tmp/pytest-of-root/pytest-97/test_apply_git_patch_outside_r0/secret.txt
+"
+# Failure. Exception: Patch targets '/tmp/pytest-of-root/pytest-97/test_apply_git_patch_outside_r0/secret.txt' outside the root folder, which is not allowed.
+ais patch apply_git_patch "this is not a diff at all"
+# Failure. Exception: No target files found in patch. Is this a valid unified diff?
+ais replace replace_line_by_line "/tmp/pytest-of-root/pytest-97/test_replacement_in_single_lin0/dummy.txt" "World" "Universe"
+# Success. Return Value: "Changes applied without exception, pleas"
+ais replace replace_line_by_line "/tmp/pytest-of-root/pytest-97/test_replacement_in_multiple_l0/dummy.txt" "World" "Universe" 0 2
+# Success. Return Value: "Changes applied without exception, pleas"
+ais replace replace_line_by_line "/tmp/pytest-of-root/pytest-97/test_no_replacement_needed0/dummy.txt" "Universe" "Galaxy"
+# Success. Return Value: "No changes made, this means the old file"
+ais replace replace_all "/tmp/pytest-of-root/pytest-97/test_replace_all_occurrences0/dummy.txt" "World" "Universe"
+# Success. Return Value: "Changes applied without exception, pleas"
+ais replace replace_with_regex "/tmp/pytest-of-root/pytest-97/test_replace_with_regex0/dummy.txt" --regex_match_expression="\bWorld[0-9]+\b" --replacement=""
+# Success. Return Value: "Changes applied without exception, pleas"
+ais rewrite write_new_file "test_file.txt" "Hello, world!"
+# Success. Return Value: "File written to test_file.txt"
+ais rewrite write_new_file "test_file.txt" "New content"
+# Failure. Exception: File already exists. # File test_file.txt already exists. Here are all the files you can see
+
+test_write_new_file_failure_fi0
+└── test_file.txt
+
+0 directories, 1 files
+
+ Consider using rewrite_file method if you want to overwrite.
+ais rewrite write_new_file "/outside_test_file.txt" "Some content"
+# Failure. Exception: File path must be within the root folder.
+ais rewrite rewrite_file "test_file.txt" "Updated content"
+# Success. Return Value: "File rewritten to test_file.txt, please "
+ais rewrite rewrite_file "nonexistent_file.txt" "Some content"
+# Failure. Exception: File does not exist, use ls tool to see what files there are.
+ais rewrite rewrite_file "/outside_test_file.txt" "Some content"
+# Failure. Exception: File path must be within the root folder.
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="**/*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="test_grep" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=18, data=[File"
+ais grep grep_many --glob_pattern="tests/test_tools/test_toolkit.py" --maximum_matches_per_pattern="-1" --patterns="{'dispatch': 'def test_dispatch_grep_[m]any', 'nope': 'x{99}'}"
+# Success. Return Value: "{'dispatch': GrepResults(matches_found=1"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais ls ls --path="src"
+# Success. Return Value: "PathList(['module.py'])"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais ls ls --path="src"
+# Success. Return Value: "PathList(['module.py'])"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais ls ls --path="src"
+# Success. Return Value: "PathList(['module.py'])"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+ais cat cat_markdown ['src/module.py']
+ais cat cat_markdown ['src/module.py']
+ais ls ls --path="src"
+# Success. Return Value: "1	ANSWER = 5
+"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais ls ls --path="src"
+# Success. Return Value: "PathList(['module.py'])"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais ls ls --path="src"
+# Success. Return Value: "PathList(['module.py'])"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+# Success. Return Value: "PathList(['module.py'])"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais ls ls --path="src"
+# Success. Return Value: "PathList(['module.py'])"
+# Success. Return Value: "PathList(['src/module.py'])"
+ais ls ls --path="src"
+# Success. Return Value: "PathList(['module.py'])"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+# Success. Return Value: "['ANSWER = 5']"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+# Success. Return Value: "1	ANSWER = 1
+"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+# Success. Return Value: "['ANSWER = 1']"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+# Success. Return Value: "['src/module.py']"
+ais cat cat_markdown ['src/module.py']
+# Success. Return Value: "1	ANSWER = 0
+"
+ais replace replace_all --file_path="src/module.py" --new_text="ANSWER" --old_text="VALUE"
+ais cat cat_markdown ['src/module.py']
+# Success. Return Value: "1	ANSWER = 2
+"
+ais cat cat_markdown ['src/module.py']
+# Success. Return Value: "1	ANSWER = 6
+"
+# Success. Return Value: "['src/module.py']"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+# Success. Return Value: "['ANSWER = 0']"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+ais cat cat_markdown ['src/module.py']
+ais cat cat_markdown ['src/module.py']
+# Success. Return Value: "['src/module.py']"
+# Success. Return Value: "['ANSWER = 2']"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+# Success. Return Value: "['src/module.py']"
+ais cat cat_markdown ['src/module.py']
+# Success. Return Value: "1	ANSWER = 3
+"
+# Success. Return Value: "1	ANSWER = 4
+"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+# Success. Return Value: "['ANSWER = 6']"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+# Success. Return Value: "['src/module.py']"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+# Success. Return Value: "['ANSWER = 4']"
+# Success. Return Value: "1	ANSWER = 7
+"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+# Success. Return Value: "['ANSWER = 7']"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+# Success. Return Value: "['src/module.py']"
+# Success. Return Value: "['src/module.py']"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais headtail head --byte_count="None" --file_path="src/module.py" --lines="1"
+# Success. Return Value: "['ANSWER = 3']"
+ais grep grep_files_with_matches --glob_pattern="**/*.py" --maximum_files="-1" --regex="ANSWER"
+# Success. Return Value: "['src/module.py']"
+ais cat cat_markdown --file_paths="['module.py']" --number_lines
+# Success. Return Value: "1	def needle():
+2	    return 1
+"
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais replace replace_all --file_path="module.py" --new_text="2" --old_text="1"
+ais cat cat_markdown ['module.py']
+# Success. Return Value: "1	def needle():
+2	    return 2
+"
+# Success. Return Value: "Tool feedback: Changes applied without e"
+ais find find_files
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['src/app.py', 'src/lib/util.py"
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['src/app.py', 'src/lib/util.py"
+ais find find_files --file_type="directory"
+# Success. Return Value: "PathList(['src', 'src/lib'])"
+ais find find_files --file_type="directory"
+# Success. Return Value: "PathList(['src', 'src/lib'])"
+ais find find_files --size="+3"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files --size="+3"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files --limit="2"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml'])"
+ais find find_files --limit="2"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml'])"
+ais ls ls "src/*"
+# Success. Return Value: "PathList(['src/app.py', 'src/lib'])"
+ais find find_files --name="*.js"
+# Success. Return Value: "PathList([])"
+ais find find_files --name="*.js"
+# Success. Return Value: "PathList(['node_modules/pkg/index.js'])"
+ais grep grep "needle" "**/*"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais ls ls "logs/*"
+# Success. Return Value: "PathList(['logs/important'])"
+ais ls ls "."
+# Success. Return Value: "PathList(['ax.txt', 'docs', 'keep.log', "
+ais cat cat_markdown ['tests/*.py', 'src/{app,lib/util}.py']
+# Success. Return Value: "tests/test_app.py
+src/app.py
+src/lib/uti"
+ais cat cat_range "big.log" 4999
+# Success. Return Value: "4999	entry 4999
+5000	entry 5000
+"
+ais cat cat_range "big.log" 1200 1201
+# Success. Return Value: "1200	entry 1200
+1201	entry 1201
+"
+ais cat cat_range "big.log" 6000
+# Success. Return Value: ""
+ais headtail tail "big.log" 2
+# Success. Return Value: "['entry 4999', 'entry 5000']"
+ais replace replace_line_by_line "big.log" "entry" "item" 10 12
+# Success. Return Value: "Changes applied without exception, pleas"
+ais cat cat_range "big.log" 12 12
+# Success. Return Value: "12	item 12
+"
+ais grep grep_files_with_matches "needle" "src/many/*"
+# Success. Return Value: "['src/many/alias.py', 'src/many/module_0"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "TODO" "*.py"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
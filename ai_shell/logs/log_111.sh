@@ -0,0 +1,8 @@
+ais cat cat_markdown --file_paths="['*.py']" --number_lines
+# Success. Return Value: "1	needle_0 = 0
+2	needle_0 = 1
+3	needle_0"
+ais cat cat --file_paths="['module_4.py', 'module_3.py']" --number_lines
+# Success. Return Value: "<generator object CatTool.cat at 0x7f4fd"
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
@@ -0,0 +1,36 @@
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
+ais cat cat_markdown ['*.py']
+# Success. Return Value: "1	value_0 = compute(0, 0)
+2	value_1 = co"
@@ -0,0 +1,28 @@
+ais cat cat_markdown --file_paths="['*.py']" --number_lines
+# Success. Return Value: "1	needle_0 = 0
+2	needle_0 = 1
+3	needle_0"
+ais cat cat --file_paths="['module_4.py', 'module_3.py']" --number_lines
+# Success. Return Value: "<generator object CatTool.cat at 0x7ff3c"
+ais grep grep --context_after="1" --context_before="0" --glob_pattern="*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep --context_after="1" --context_before="0" --glob_pattern="*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="needle" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep_markdown --context_lines="0" --glob_pattern="*.py" --maximum_matches="-1" --output_mode="content" --regex="needle" --skip_first_matches="-1"
+ais grep grep "needle" "*.py" --skip_first_matches="-1" --maximum_matches_per_file="-1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+# Success. Return Value: "module_0.py
+line 1: needle_0 = 0
+line 2:"
+ais find find_files --file_type="None" --limit="-1" --name="*.py" --regex="None" --size="None"
+# Success. Return Value: "PathList(['module_0.py', 'module_1.py', "
+ais cat cat_markdown --file_paths="['*.py']" --number_lines
+# Success. Return Value: "1	needle_0 = 0
+2	needle_0 = 1
+3	needle_0"
+ais grep grep_many --glob_pattern="*.py" --maximum_matches_per_pattern="-1" --patterns="{'a': 'needle', 'b': '= 1'}"
+# Success. Return Value: "{'a': GrepResults(matches_found=10, data"
+ais grep grep_count --glob_pattern="*.py" --regex="needle"
+# Success. Return Value: "{'module_0.py': 10, 'module_1.py': 10, '"
+ais grep grep_count --glob_pattern="*.py" --regex="needle"
+# Success. Return Value: "{'module_0.py': 10, 'module_1.py': 10, '"
@@ -0,0 +1,4 @@
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="TODO" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep --context_after="0" --context_before="0" --glob_pattern="*.py" --maximum_matches_per_file="-1" --maximum_matches_total="-1" --regex="TODO" --skip_first_matches="-1"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
@@ -0,0 +1,2 @@
+ais grep grep "TODO" "*.txt"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
@@ -0,0 +1,245 @@
+ais cat cat_markdown ['a.py'] True True
+# Success. Return Value: "1	x
+2	
+3	b
+4	last  "
+ais cat cat_markdown ['a.py'] True False
+# Success. Return Value: "1	x
+2	
+3	
+4	  
+5	b
+6	last  "
+ais cat cat_markdown ['a.py'] False True
+# Success. Return Value: "x
+
+b
+last  "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x
+
+
+  
+b
+last  "
+ais cat cat_markdown ['a.py', 'a.py'] True True
+# Success. Return Value: "1	x
+2	
+3	b
+4	last  "
+ais cat cat_markdown ['a.py', 'a.py'] True False
+# Success. Return Value: "1	x
+2	
+3	
+4	  
+5	b
+6	last  "
+ais cat cat_markdown ['a.py', 'a.py'] False True
+# Success. Return Value: "x
+
+b
+last  "
+ais cat cat_markdown ['a.py', 'a.py'] False False
+# Success. Return Value: "x
+
+
+  
+b
+last  "
+ais cat cat_markdown ['*.py', 'a.py'] True True
+# Success. Return Value: "1	x
+2	
+3	b
+4	last  5	one
+6	
+"
+ais cat cat_markdown ['*.py', 'a.py'] True False
+# Success. Return Value: "1	x
+2	
+3	
+4	  
+5	b
+6	last  7	one
+8	
+9	
+"
+ais cat cat_markdown ['*.py', 'a.py'] False True
+# Success. Return Value: "x
+
+b
+last  one
+
+"
+ais cat cat_markdown ['*.py', 'a.py'] False False
+# Success. Return Value: "x
+
+
+  
+b
+last  one
+
+
+"
+ais cat cat_markdown ['b.py', 'a.py'] True True
+# Success. Return Value: "1	one
+2	
+3	x
+4	
+5	b
+6	last  "
+ais cat cat_markdown ['b.py', 'a.py'] True False
+# Success. Return Value: "1	one
+2	
+3	
+4	x
+5	
+6	
+7	  
+8	b
+9	last  "
+ais cat cat_markdown ['b.py', 'a.py'] False True
+# Success. Return Value: "one
+
+x
+
+b
+last  "
+ais cat cat_markdown ['b.py', 'a.py'] False False
+# Success. Return Value: "one
+
+
+x
+
+
+  
+b
+last  "
+ais cat cat_markdown ['*'] True True
+# Success. Return Value: "1	x
+2	
+3	b
+4	last  5	one
+6	
+"
+ais cat cat_markdown ['*'] True False
+# Success. Return Value: "1	x
+2	
+3	
+4	  
+5	b
+6	last  7	one
+8	
+9	
+"
+ais cat cat_markdown ['*'] False True
+# Success. Return Value: "x
+
+b
+last  one
+
+"
+ais cat cat_markdown ['*'] False False
+# Success. Return Value: "x
+
+
+  
+b
+last  one
+
+
+"
+ais cat cat_markdown ['**/*.py'] True True
+# Success. Return Value: "1	x
+2	
+3	b
+4	last  5	one
+6	
+7	deep
+"
+ais cat cat_markdown ['**/*.py'] True False
+# Success. Return Value: "1	x
+2	
+3	
+4	  
+5	b
+6	last  7	one
+8	
+9	
+"
+ais cat cat_markdown ['**/*.py'] False True
+# Success. Return Value: "x
+
+b
+last  one
+
+deep
+"
+ais cat cat_markdown ['**/*.py'] False False
+# Success. Return Value: "x
+
+
+  
+b
+last  one
+
+
+deep
+"
+ais cat cat_markdown ['sub/*.py'] True True
+# Success. Return Value: "1	deep
+"
+ais cat cat_markdown ['sub/*.py'] True False
+# Success. Return Value: "1	deep
+"
+ais cat cat_markdown ['sub/*.py'] False True
+# Success. Return Value: "deep
+"
+ais cat cat_markdown ['sub/*.py'] False False
+# Success. Return Value: "deep
+"
+ais cat cat_markdown ['.h.py'] True True
+# Success. Return Value: "1	hid
+"
+ais cat cat_markdown ['.h.py'] True False
+# Success. Return Value: "1	hid
+"
+ais cat cat_markdown ['.h.py'] False True
+# Success. Return Value: "hid
+"
+ais cat cat_markdown ['.h.py'] False False
+# Success. Return Value: "hid
+"
+ais cat cat_markdown ['*.py'] True True
+# Success. Return Value: "1	x
+2	
+3	b
+4	last  5	one
+6	
+"
+ais cat cat_markdown ['*.py'] True False
+# Success. Return Value: "1	x
+2	
+3	
+4	  
+5	b
+6	last  7	one
+8	
+9	
+"
+ais cat cat_markdown ['*.py'] False True
+# Success. Return Value: "x
+
+b
+last  one
+
+"
+ais cat cat_markdown ['*.py'] False False
+# Success. Return Value: "x
+
+
+  
+b
+last  one
+
+
+"
@@ -0,0 +1,8 @@
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
+ais ls ls "src/*"
+# Success. Return Value: "PathList(['src/b.py'])"
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
+ais ls ls "src/*"
+# Success. Return Value: "PathList(['src/b.py'])"
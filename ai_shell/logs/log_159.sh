@@ -0,0 +1,12 @@
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
+ais ls ls "*/*"
+# Success. Return Value: "PathList(['__pycache__/x.pyc', 'src/b.py"
+ais ls ls "."
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'src'])"
+ais ls ls "*/*"
+# Success. Return Value: "PathList(['src/b.py'])"
+ais ls ls "."
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
@@ -0,0 +1,16 @@
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['a-b.py', 'a.py', 'a/x.py'])"
+ais find find_files --name="*.py" --limit="1"
+# Success. Return Value: "PathList(['a-b.py'])"
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['a-b.py', 'a.py', 'a/x.py'])"
+ais find find_files --name="*.py" --limit="1"
+# Success. Return Value: "PathList(['a-b.py'])"
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['a-b.py', 'a.py', 'a/x.py'])"
+ais find find_files --name="*.py" --limit="1"
+# Success. Return Value: "PathList(['a-b.py'])"
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['a-b.py', 'a.py', 'a/x.py'])"
+ais find find_files --name="*.py" --limit="1"
+# Success. Return Value: "PathList(['a-b.py'])"
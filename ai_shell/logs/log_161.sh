@@ -0,0 +1,800 @@
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=11, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=5, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=15, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=14, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=14, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=19, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=10, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=10, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=10, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=11, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=15, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=11, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=5, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=10, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=14, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=14, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=5, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=17, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=14, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=15, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=15, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=5, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=11, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=7, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=10, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=6, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=17, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=8, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=11, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=4, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="3" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=0, data=[])"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=12, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=13, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=9, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="2" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="2" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=11, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="0" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="3" --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=3, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="0" --context_after="1"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="2" --context_after="0"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="1" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=10, data=[File"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="2" --fixed_strings --context_before="3" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="-1" --fixed_strings --context_before="2" --context_after="2"
+# Success. Return Value: "GrepResults(matches_found=2, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
+ais grep grep "a" "f.txt" --maximum_matches_per_file="1" --fixed_strings --context_before="1" --context_after="3"
+# Success. Return Value: "GrepResults(matches_found=1, data=[FileM"
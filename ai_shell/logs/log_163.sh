@@ -0,0 +1,38 @@
+ais find find_files
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['src/app.py', 'src/lib/util.py"
+ais find find_files --name="*.py"
+# Success. Return Value: "PathList(['src/app.py', 'src/lib/util.py"
+ais find find_files --file_type="directory"
+# Success. Return Value: "PathList(['src', 'src/lib'])"
+ais find find_files --file_type="directory"
+# Success. Return Value: "PathList(['src', 'src/lib'])"
+ais find find_files --size="+3"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files --size="+3"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml', "
+ais find find_files --limit="2"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml'])"
+ais find find_files --limit="2"
+# Success. Return Value: "PathList(['README.md', 'ai_shell.toml'])"
+ais ls ls "src/*"
+# Success. Return Value: "PathList(['src/app.py', 'src/lib'])"
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
+ais ls ls "*/*"
+# Success. Return Value: "PathList(['__pycache__/x.pyc', 'node_mod"
+ais ls ls "*/*"
+# Success. Return Value: "PathList(['__pycache__/x.pyc', 'node_mod"
+ais ls ls "node_*"
+# Success. Return Value: "PathList(['node_modules'])"
+ais ls ls "node_*"
+# Success. Return Value: "PathList(['node_modules'])"
+ais ls ls "src/*"
+# Success. Return Value: "PathList(['src/b.py'])"
+ais ls ls "src/*"
+# Success. Return Value: "PathList(['src/b.py'])"
@@ -0,0 +1,4 @@
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'node_modules', 'src']"
+ais ls ls "*"
+# Success. Return Value: "PathList(['a.py', 'src'])"
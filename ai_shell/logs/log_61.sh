@@ -0,0 +1,6 @@
+ais cat cat_markdown ['tests/*.py', 'src/{app,lib/util}.py']
+ais cat cat ['tests/*.py', 'src/{app,lib/util}.py'] False False
+# Success. Return Value: "<generator object CatTool.cat at 0x7f45f"
+# Success. Return Value: "tests/test_app.py
+src/app.py
+src/lib/uti"
@@ -0,0 +1,72 @@
+ais cat cat_markdown ['small.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['small.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['small.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['small.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['small.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['small.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['small.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['small.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['small.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['small.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['small.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['small.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['medium.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['medium.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['medium.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['medium.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['medium.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['huge.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['huge.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['huge.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat_markdown ['huge.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat_markdown ['huge.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
@@ -0,0 +1,8000 @@
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
+ais cat cat_markdown ['a.py'] False False
+# Success. Return Value: "x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = 1
+x = "
@@ -0,0 +1,24 @@
+ais cat cat <__main__.FormerCatTool object at 0x7f0ad1d60650> ['small.py'] True False
+# Success. Return Value: "<generator object CatTool.cat at 0x7f0ad"
+ais cat cat_markdown ['small.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat <__main__.FormerCatTool object at 0x7f0ad1d60650> ['small.py'] True False
+# Success. Return Value: "<generator object CatTool.cat at 0x7f0ad"
+ais cat cat_markdown ['small.py'] True False
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat <__main__.FormerCatTool object at 0x7f0ad1d60650> ['small.py'] False False
+# Success. Return Value: "<generator object CatTool.cat at 0x7f0ad"
+ais cat cat_markdown ['small.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat <__main__.FormerCatTool object at 0x7f0ad1d60650> ['small.py'] False False
+# Success. Return Value: "<generator object CatTool.cat at 0x7f0ad"
+ais cat cat_markdown ['small.py'] False False
+# Success. Return Value: "    value_0 = compute('naïve', 0)  # lin"
+ais cat cat <__main__.FormerCatTool object at 0x7f0ad1d60650> ['small.py'] True True
+# Success. Return Value: "<generator object CatTool.cat at 0x7f0ad"
+ais cat cat_markdown ['small.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
+ais cat cat <__main__.FormerCatTool object at 0x7f0ad1d60650> ['small.py'] True True
+# Success. Return Value: "<generator object CatTool.cat at 0x7f0ad"
+ais cat cat_markdown ['small.py'] True True
+# Success. Return Value: "1	    value_0 = compute('naïve', 0)  # l"
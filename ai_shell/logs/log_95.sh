@@ -0,0 +1,6 @@
+ais cat cat_range "big.log" 1500000 1500080
+# Success. Return Value: "1500000	entry 1499999 with some more tex"
+ais cat cat_range "big.log" 1500000 1500080
+# Success. Return Value: "1500000	entry 1499999 with some more tex"
+ais cat cat_range "big.log" 1500000 1500080
+# Success. Return Value: "1500000	entry 1499999 with some more tex"
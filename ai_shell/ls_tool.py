@@ -4,7 +4,9 @@ Directory listing tool, optimized for AI.
 
 import logging
 import os
+import stat
 import time
+from collections.abc import Iterable
 from io import StringIO
 from pathlib import Path
 from typing import Union
@@ -12,7 +14,13 @@ from typing import Union
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.utils.config_manager import Config
 from ai_shell.utils.cwd_utils import change_directory
-from ai_shell.utils.read_fs import human_readable_size, is_file_in_root_folder, safe_glob, tree
+from ai_shell.utils.file_index import open_file_index
+from ai_shell.utils.gitignore import GitIgnore, gitignore_for
+from ai_shell.utils.glob_engine import has_magic
+from ai_shell.utils.listing_cache import ListedEntry, list_folder
+from ai_shell.utils.path_jail import path_jail
+from ai_shell.utils.path_list import PathList
+from ai_shell.utils.read_fs import human_readable_size, is_file_in_root_folder, safe_glob, sanitize_path, tree
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,9 @@ class LsTool:
         self.root_folder = root_folder
         self.config = config
         self.auto_cat = config.get_flag("auto_cat", True)
+        self.use_file_index = config.get_flag("file_index", False)
+        self.walk_workers = int(config.get_value("walk_workers") or 1)
+        self.cache_entries = int(config.get_value("ls_cache_entries") or 256)
 
     @log()
     def ls_markdown(self, path: str | None = ".", all_files: bool = False, long: bool = False) -> str:
@@ -45,7 +56,7 @@ class LsTool:
         try:
             entries_info = self.ls(path, all_files, long)
         except (FileNotFoundError, NotADirectoryError):
-            tree_text = tree(Path(os.getcwd()))
+            tree_text = tree(Path(path_jail(self.root_folder).folder), workers=self.walk_workers)
             markdown_content = f"# Bad `ls` command. Here are all the files you can see\n\n{tree_text}"
             return markdown_content
 
@@ -62,7 +73,7 @@ class LsTool:
         return output.read()
 
     @log()
-    def ls(self, path: str | None = None, all_files: bool = False, long: bool = False) -> Union[list[str], str]:
+    def ls(self, path: str | None = None, all_files: bool = False, long: bool = False) -> Union[PathList, str]:
         """
         List directory contents, with options to include all files and detailed view.
 
@@ -72,46 +83,50 @@ class LsTool:
             long (bool, optional): If True, include details like permissions, owner, size, and modification date. Defaults to False.
 
         Returns:
-            list[str] | str: List of files and directories, optionally with details.
+            PathList | str: List of files and directories, optionally with details.
         """
         logger.info(f"ls --path {path} --all_files {all_files} --long  {long}")
 
         if path is None:
             path = ""
 
-        if path is not None and ("?" in path or "*" in path or "[" in path or "]" in path):
+        jail = path_jail(self.root_folder)
+        ignore = gitignore_for(self.root_folder, self.config)
+        listing: Iterable[ListedEntry]
+        if has_magic(path):
             # Globs behave very different from non-globs. :(
-            #  or "{" in path or "}"  <-- is this a glob pattern?
-            entries = safe_glob(path, self.root_folder)
+            # Globbed paths are already inside the root folder.
+            listing = (self._describe(jail.absolute(entry), entry, long) for entry in self._glob(path, ignore))
         else:
-            try:
-                # enumerate list to check if the path exists
-                # os.listdir order is OS-dependent (arbitrary on Linux), so sort
-                # for deterministic output that matches real `ls` behavior.
-                entries = sorted(
-                    (_ for _ in os.listdir(path))
-                    if all_files
-                    else (entry for entry in os.listdir(path) if not entry.startswith("."))
-                )
-            except (FileNotFoundError, NotADirectoryError):
+            if not is_file_in_root_folder(path, self.root_folder):
+                # Then neither is anything in it.
+                return PathList()
+            folder = jail.absolute(path)
+            if not os.path.isdir(folder):
                 # if not, just tell the bot everything.
-                tree_text = tree(Path(os.getcwd()))
+                tree_text = tree(Path(jail.folder), workers=self.walk_workers)
                 markdown_content = f"# Bad `ls` command. Here are all the files you can see\n\n{tree_text}"
                 return markdown_content
-        entries_info = []
+            # Sorted for deterministic output that matches real `ls` behavior. The listing is reused while the
+            # folder is unchanged, with the types and stat results from the directory listing.
+            listing = [
+                listed_entry
+                for listed_entry in list_folder(self.root_folder, folder, long, self.cache_entries)
+                if (all_files or not listed_entry[0].startswith("."))
+                and not (
+                    ignore is not None
+                    and ignore.is_ignored(os.path.join(folder, listed_entry[0]), listed_entry[1], check_parents=False)
+                )
+            ]
+        entries_info = PathList()
 
-        for entry in entries:
-            # is this None-safety here correct?
-            full_path = entry if path is None else os.path.join(path, entry)
-            if not is_file_in_root_folder(full_path, self.root_folder):
-                continue
-            if os.path.isdir(full_path) and entry.endswith("__pycache__"):
+        for entry, is_dir, size_in_bytes, mtime in listing:
+            if is_dir and entry.endswith("__pycache__"):
                 continue
             if long:
-                stats = os.stat(full_path)
                 # Always human readable, too many tokens for byte count.
-                size = human_readable_size(stats.st_size)
-                mod_time = time.strftime("%Y-%m-%d %H:%M", time.localtime(stats.st_mtime))
+                size = human_readable_size(size_in_bytes)
+                mod_time = time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime))
                 entries_info.append(f"{size:} {mod_time} {entry}")
             else:
                 entries_info.append(entry)
@@ -120,6 +135,43 @@ class LsTool:
                 logger.debug(line)
         return entries_info
 
+    @staticmethod
+    def _describe(full_path: str, entry: str, long: bool) -> ListedEntry:
+        """
+        The type, and for a long listing the stat results, of a globbed path.
+
+        Args:
+            full_path (str): The absolute path.
+            entry (str): The path as listed.
+            long (bool): Also stat it.
+
+        Returns:
+            ListedEntry: The entry.
+        """
+        if not long:
+            return entry, os.path.isdir(full_path), 0, 0.0
+        stats = os.stat(full_path)
+        return entry, stat.S_ISDIR(stats.st_mode), stats.st_size, stats.st_mtime
+
+    def _glob(self, pattern: str, ignore: GitIgnore | None = None) -> Iterable[str]:
+        """
+        Glob relative to the root folder, from the file index when it's on and can answer the pattern.
+
+        Args:
+            pattern (str): The glob pattern.
+            ignore (GitIgnore | None): Leaves out what git ignores.
+
+        Returns:
+            Iterable[str]: The matching paths.
+        """
+        if self.use_file_index:
+            with open_file_index(self.root_folder, self.config) as index:
+                index.refresh()
+                found = index.glob(sanitize_path(pattern))
+            if found is not None:
+                return found if ignore is None else ignore.filter_ignored(found)
+        return safe_glob(pattern, self.root_folder, ignore.skip_path if ignore is not None else None)
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,316 @@
+"""
+One toolkit over several named root folders, e.g. the parts of a monorepo mounted side by side.
+
+Paths start with the name of their root, "web/src/app.py". A tool given a path runs on the toolkit of that root
+with the rest of the path, so each root keeps its own jail. Tools without a path run on the root named by a
+`root` argument, or the first root.
+
+The read-only searches, grep, find and ls with a glob, run on every root at once on a thread pool. Their file
+names come back prefixed with the root name, merged in root order, with the limits applied to the merged result.
+A glob pattern that starts with a root name only searches that root, any other pattern is used in every root.
+
+Each root searches with its own output sink of the call's budget, so it stops reading files where a search of that
+root alone would. The merged result is then cut to the budget of the call.
+"""
+
+import contextvars
+import os
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from ai_shell.grep_tool import (
+    GrepResults,
+    counts_markdown,
+    files_with_matches_markdown,
+    many_within_budget,
+    matches_markdown,
+    merge_grep_results,
+    results_within_budget,
+)
+from ai_shell.utils.glob_engine import has_magic
+from ai_shell.utils.output_budget import OutputSink, output_sink, using_sink
+from ai_shell.utils.path_list import PathList
+
+# Arguments that hold one path, relative to the root folder.
+PATH_ARGUMENTS = ("file_path", "filename", "base_path", "path")
+
+# More roots than this are searched a batch at a time.
+MAXIMUM_THREADS = 32
+
+ToolFor = Callable[[str, str], Callable[[dict[str, Any]], Any]]
+
+
+def check_root_names(roots: Mapping[str, str]) -> dict[str, str]:
+    """
+    Check the names of the roots, which become the first part of every path.
+
+    Args:
+        roots (Mapping[str, str]): Root names mapped to folders.
+
+    Returns:
+        dict[str, str]: The names mapped to absolute folders, in the same order.
+
+    Raises:
+        ValueError: If there are no roots, or a name couldn't be the first part of a path.
+    """
+    if not roots:
+        raise ValueError("At least one root folder is needed.")
+    for name in roots:
+        if not name or name in (".", "..") or "/" in name or "\\" in name or has_magic(name):
+            raise ValueError(f"Root name {name!r} can't be used as the first part of a path.")
+    return {name: os.path.abspath(folder) for name, folder in roots.items()}
+
+
+class MultiRoot:
+    """Routes tool calls to the toolkit of each root, and fans out the searches."""
+
+    def __init__(self, roots: Mapping[str, str], tool_for: ToolFor) -> None:
+        """
+        Args:
+            roots (Mapping[str, str]): Root names mapped to absolute folders, the first is the default.
+            tool_for (ToolFor): Returns the tool function of a root, from the root name and the tool name.
+        """
+        self.roots = dict(roots)
+        self.tool_for = tool_for
+        self._fan_outs: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "grep": self._grep,
+            "grep_many": self._grep_many,
+            "grep_count": self._grep_count,
+            "grep_files_with_matches": self._grep_files_with_matches,
+            "grep_markdown": self._grep_markdown,
+            "find_files": self._find_files,
+            "find_files_markdown": self._find_files_markdown,
+            "ls": self._ls,
+            "ls_markdown": self._ls_markdown,
+        }
+
+    def call(self, name: str, arguments: dict[str, Any]) -> Any:
+        """
+        Invoke a tool by name on the roots it concerns.
+
+        Args:
+            name (str): The tool name.
+            arguments (dict[str, Any]): The arguments, not modified.
+
+        Returns:
+            Any: The tool result, paths in it prefixed with their root name if the tool searched.
+
+        Raises:
+            ValueError: If a path doesn't start with a root name, or the root argument isn't one.
+        """
+        arguments = dict(arguments)
+        root = arguments.pop("root", None)
+        if root is not None and root not in self.roots:
+            raise ValueError(f"Unknown root {root}, use one of {', '.join(self.roots)}.")
+        if name in self._fan_outs:
+            return self._fan_outs[name](arguments)
+        root = self._route(arguments) or root or next(iter(self.roots))
+        return self.tool_for(root, name)(arguments)
+
+    def split_path(self, path: str) -> tuple[str, str]:
+        """
+        Split a path into its root name and the path in that root.
+
+        Args:
+            path (str): "name/path/in/root", or an absolute path inside one of the roots.
+
+        Returns:
+            tuple[str, str]: The root name and the rest of the path, "." for the root itself.
+
+        Raises:
+            ValueError: If the path isn't in a root.
+        """
+        if os.path.isabs(path):
+            absolute_path = os.path.normcase(os.path.normpath(path))
+            # Nested roots: the deepest one wins.
+            for name, folder in sorted(self.roots.items(), key=lambda item: -len(item[1])):
+                folder = os.path.normcase(folder)
+                if absolute_path == folder or absolute_path.startswith(os.path.join(folder, "")):
+                    return name, path
+            raise ValueError(f"{path} is not in any of the root folders.")
+        normalized = path.replace("\\", "/")
+        if normalized.startswith("./"):
+            normalized = normalized[2:]
+        name, _, rest = normalized.partition("/")
+        if name not in self.roots:
+            raise ValueError(f"Paths start with the name of a root folder, one of {', '.join(self.roots)}: {path}")
+        return name, rest or "."
+
+    def _route(self, arguments: dict[str, Any]) -> str | None:
+        """Replace the path arguments with paths in their root, returning the root, None if there are none."""
+        root = None
+        for argument in PATH_ARGUMENTS:
+            if isinstance(arguments.get(argument), str):
+                root, arguments[argument] = self.split_path(arguments[argument])
+        file_paths = arguments.get("file_paths")
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+        if isinstance(file_paths, list) and file_paths:
+            split = [self.split_path(file_path) for file_path in file_paths]
+            roots = {name for name, _path in split}
+            if len(roots) > 1:
+                raise ValueError(f"All the file_paths must be in one root folder, got {', '.join(sorted(roots))}.")
+            root = split[0][0]
+            arguments["file_paths"] = [path for _name, path in split]
+        return root
+
+    def _patterns(self, pattern: str) -> list[tuple[str, str]]:
+        """The roots a glob pattern searches and the pattern for each."""
+        normalized = pattern.replace("\\", "/")
+        name, _, rest = normalized.partition("/")
+        if name in self.roots:
+            return [(name, rest or ".")]
+        return [(name, pattern) for name in self.roots]
+
+    def _each_root(self, tool: str, calls: Iterable[tuple[str, dict[str, Any]]]) -> list[tuple[str, Any]]:
+        """Run a tool on several roots at once, returning (root name, result) in the order given."""
+        calls = list(calls)
+        sink = output_sink()
+        if len(calls) == 1:
+            root, arguments = calls[0]
+            return [(root, _with_sink(sink.like(), self.tool_for(root, tool), arguments))]
+        with ThreadPoolExecutor(max_workers=min(len(calls), MAXIMUM_THREADS)) as pool:
+            futures = [
+                (
+                    root,
+                    # The worker threads see the context of the call, e.g. the logging of the tool.
+                    pool.submit(
+                        contextvars.copy_context().run, _with_sink, sink.like(), self.tool_for(root, tool), arguments
+                    ),
+                )
+                for root, arguments in calls
+            ]
+            return [(root, future.result()) for root, future in futures]
+
+    def _search(self, tool: str, arguments: dict[str, Any]) -> list[tuple[str, Any]]:
+        """Run a search on the roots its glob_pattern concerns, or every root without one."""
+        if "glob_pattern" not in arguments:
+            return self._each_root(tool, ((root, arguments) for root in self.roots))
+        calls = [
+            (root, {**arguments, "glob_pattern": pattern})
+            for root, pattern in self._patterns(arguments["glob_pattern"])
+        ]
+        return self._each_root(tool, calls)
+
+    def _grep(self, arguments: dict[str, Any]) -> GrepResults:
+        """grep, with the skip and the maximum applied to all the roots' matches together."""
+        skip_first_matches = arguments.get("skip_first_matches", -1)
+        maximum_matches_total = arguments.get("maximum_matches_total", -1)
+        skip_count = max(skip_first_matches, 0)
+        per_root = {
+            **arguments,
+            "skip_first_matches": -1,
+            "maximum_matches_total": -1 if maximum_matches_total == -1 else skip_count + maximum_matches_total,
+        }
+        merged = merge_grep_results(
+            self._search("grep", per_root),
+            skip_first_matches,
+            maximum_matches_total,
+            arguments.get("context_before", 0),
+            arguments.get("context_after", 0),
+        )
+        return results_within_budget(output_sink(), merged, skip_first_matches)
+
+    def _grep_many(self, arguments: dict[str, Any]) -> dict[str, GrepResults]:
+        """grep_many, with the maximum per pattern applied to all the roots' matches together."""
+        per_root = self._search("grep_many", arguments)
+        if not per_root:
+            return {}
+        maximum = arguments.get("maximum_matches_per_pattern", -1)
+        merged = {
+            pattern: merge_grep_results(((root, results[pattern]) for root, results in per_root), -1, maximum)
+            for pattern in per_root[0][1]
+        }
+        return many_within_budget(output_sink(), merged)
+
+    def _grep_count(self, arguments: dict[str, Any]) -> dict[str, int]:
+        """grep_count, with the file names prefixed."""
+        return {
+            f"{root}/{filename}": count
+            for root, counts in self._search("grep_count", arguments)
+            for filename, count in counts.items()
+        }
+
+    def _grep_files_with_matches(self, arguments: dict[str, Any]) -> list[str]:
+        """grep_files_with_matches, with maximum_files applied to all the roots' files together."""
+        files = _prefixed(self._search("grep_files_with_matches", arguments))
+        maximum_files = arguments.get("maximum_files", -1)
+        return files if maximum_files == -1 else files[:maximum_files]
+
+    def _grep_markdown(self, arguments: dict[str, Any]) -> str:
+        """grep_markdown, formatted from the merged results."""
+        search: dict[str, Any] = {
+            key: arguments[key] for key in ("regex", "glob_pattern", "multiline", "fixed_strings") if key in arguments
+        }
+        output_mode = arguments.get("output_mode", "content")
+        maximum_matches = arguments.get("maximum_matches", -1)
+        if output_mode == "files_with_matches":
+            return files_with_matches_markdown(
+                self._grep_files_with_matches({**search, "maximum_files": maximum_matches})
+            )
+        if output_mode == "count":
+            return counts_markdown(self._grep_count(search))
+        if output_mode != "content":
+            raise ValueError(f"Unknown output_mode {output_mode}, use content, files_with_matches or count.")
+        skip_first_matches = arguments.get("skip_first_matches", -1)
+        context_lines = arguments.get("context_lines", 0)
+        results = self._grep(
+            {
+                **search,
+                "skip_first_matches": skip_first_matches,
+                "maximum_matches_per_file": maximum_matches,
+                "context_before": context_lines,
+                "context_after": context_lines,
+            }
+        )
+        return matches_markdown(results, skip_first_matches, maximum_matches)
+
+    def _find_files(self, arguments: dict[str, Any]) -> PathList:
+        """find_files on every root, with the limit applied to all the roots' results together."""
+        found = PathList(_prefixed(self._search("find_files", arguments)))
+        limit = arguments.get("limit", -1)
+        return found if limit == -1 else found[:limit]
+
+    def _find_files_markdown(self, arguments: dict[str, Any]) -> str:
+        """find_files_markdown, formatted from the merged results."""
+        return "".join(f"{path}\n" for path in self._find_files(arguments))
+
+    def _ls(self, arguments: dict[str, Any]) -> PathList | str:
+        """ls: a glob on the roots it concerns, a folder on its root, and the roots themselves at the top."""
+        path = arguments.get("path") or "."
+        if path in (".", "./"):
+            return PathList(self.roots)
+        if not has_magic(path):
+            root, arguments["path"] = self.split_path(path)
+            return self.tool_for(root, "ls")(arguments)
+        calls = [(root, {**arguments, "path": pattern}) for root, pattern in self._patterns(path)]
+        listed = []
+        for root, entries in self._each_root("ls", calls):
+            if isinstance(entries, str):
+                # not a listing, e.g. the bad command help
+                return entries
+            for entry in entries:
+                if arguments.get("long"):
+                    # The size and the modification time come first, two words each.
+                    size, unit, date, time, name = entry.split(" ", 4)
+                    listed.append(f"{size} {unit} {date} {time} {root}/{name}")
+                else:
+                    listed.append(f"{root}/{entry}")
+        return PathList(listed)
+
+    def _ls_markdown(self, arguments: dict[str, Any]) -> str:
+        """ls_markdown, formatted from the merged listing."""
+        listed = self._ls(arguments)
+        return listed if isinstance(listed, str) else "\n".join(listed)
+
+
+def _with_sink(sink: OutputSink, tool: Callable[[dict[str, Any]], Any], arguments: dict[str, Any]) -> Any:
+    """Run the tool of one root with its own output sink."""
+    with using_sink(sink):
+        return tool(arguments)
+
+
+def _prefixed(per_root: list[tuple[str, Iterable[str]]]) -> list[str]:
+    """Paths of each root, prefixed with the root name, in root order."""
+    return [f"{root}/{path}" for root, paths in per_root for path in paths]
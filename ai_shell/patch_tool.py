@@ -14,7 +14,9 @@ import tempfile
 
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.cat_tool import CatTool
+from ai_shell.utils.change_events import notify_files_changed
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.path_jail import path_jail
 from ai_shell.utils.read_fs import is_file_in_root_folder
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,7 @@ class PatchTool:
             ValueError: If the patch targets a file outside the root folder.
             RuntimeError: If the patch application fails.
         """
+        jail = path_jail(self.root_folder)
         target_files = self._extract_files_from_patch(patch_content)
         if not target_files:
             raise ValueError("No target files found in patch. Is this a valid unified diff?")
@@ -67,7 +70,9 @@ class PatchTool:
 
         cmd = ["git", "apply", tmp_patch_name, "--reject", "--verbose"]
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, shell=False)  # nosec
+            result = subprocess.run(
+                cmd, cwd=jail.folder, capture_output=True, text=True, check=True, shell=False
+            )  # nosec
             logger.info("STDOUT:\n%s", result.stdout)
             logger.info("STDERR:\n%s", result.stderr)
             if result.returncode != 0:
@@ -75,13 +80,15 @@ class PatchTool:
         except subprocess.CalledProcessError as cpe:
             raise RuntimeError(f"Failed to apply patch: {cpe.stderr or cpe.stdout}") from cpe
         finally:
+            # --reject can leave some hunks applied even on failure.
+            notify_files_changed([jail.absolute(file_name) for file_name in target_files])
             try:
                 os.remove(tmp_patch_name)
             except OSError:
                 pass
 
         if self.auto_cat:
-            existing = [f for f in sorted(target_files) if os.path.exists(f)]
+            existing = [f for f in sorted(target_files) if os.path.exists(jail.absolute(f))]
             if existing:
                 contents = CatTool(self.root_folder, self.config).cat_markdown(existing)
                 return (
@@ -10,6 +10,9 @@ from pathlib import Path
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.pyutils.validate import is_python_file
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open
+from ai_shell.utils.gitignore import gitignore_for
+from ai_shell.utils.path_jail import path_jail
 from ai_shell.utils.read_fs import is_file_in_root_folder, tree
 
 # import python_minifier
@@ -55,6 +58,9 @@ class PyCatTool:
         Returns:
             str: The Markdown file contents.
         """
+        if not is_file_in_root_folder(base_path, self.root_folder):
+            raise ValueError(f"Folder {base_path} is not in root folder {self.root_folder}.")
+        base_path = path_jail(self.root_folder).absolute(base_path)
         output_file = StringIO()
         if header == "tree":
             tree_text = tree(Path(base_path))
@@ -63,16 +69,20 @@ class PyCatTool:
 
         markdown_content = f"# {header} Source Code\n\n"
 
-        for root, _dirs, files in os.walk(base_path):
+        ignore = gitignore_for(self.root_folder, self.config)
+        for root, dirs, files in os.walk(base_path):
+            if ignore is not None:
+                # Pruned in place, so os.walk doesn't go into ignored folders.
+                dirs[:] = [name for name in dirs if not ignore.is_ignored(os.path.join(root, name), True)]
             for file in files:
-                if not is_file_in_root_folder(file, self.root_folder):
+                if ignore is not None and ignore.is_ignored(os.path.join(root, file), False):
                     continue
                 if is_python_file(file):
                     full_path = os.path.join(root, file)
                     relative_path = os.path.relpath(full_path, base_path)
                     markdown_content += format_path_as_header(relative_path)
                     markdown_content += "```python\n"
-                    with open(full_path, encoding="utf-8", errors=self.utf8_errors) as handle:
+                    with cached_open(full_path, errors=self.utf8_errors) as handle:
                         text = handle.read()
                     markdown_content += text
                     markdown_content += "\n```\n\n"
@@ -6,6 +6,7 @@ from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.externals.pytest_call import count_pytest_results
 from ai_shell.utils.config_manager import Config
 from ai_shell.utils.json_utils import FatalConfigurationError
+from ai_shell.utils.path_jail import path_jail
 
 
 class PytestTool:
@@ -37,13 +38,12 @@ class PytestTool:
         Returns:
             str: Output from pytest.
         """
-        # Host script must set env vars, temp folder location and pwd!
-        # with change_directory(self.root_folder):
+        # Host script must set env vars and temp folder location, pytest runs in the root folder.
         # What is -rA
         if not self.module or not self.tests_folder or self.min_coverage:
             raise FatalConfigurationError("Please set in ai_config module, test_folder and min_coverage")
         _passed_tests, _failed_tests, _coverage, command_result = count_pytest_results(
-            self.module, self.tests_folder, self.min_coverage
+            self.module, self.tests_folder, self.min_coverage, cwd=path_jail(self.root_folder).folder
         )
         markdown_output = f"""## Pytest Output
 ### Standard Output
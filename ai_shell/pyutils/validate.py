@@ -9,6 +9,7 @@ from dataclasses import dataclass
 
 import ai_shell.externals as externals
 from ai_shell.externals.subprocess_utils import CommandResult
+from ai_shell.utils.content_cache import cached_open
 
 
 def hash_file(file_path: str) -> str:
@@ -42,7 +43,7 @@ def is_valid_python_file(file_name: str) -> bool:
     Returns:
         bool: True if the file is a valid Python file, False otherwise.
     """
-    with open(file_name, encoding="utf-8") as file:
+    with cached_open(file_name) as file:
         contents = file.read()
     is_valid, _error = is_valid_python_source(contents)
     return is_valid
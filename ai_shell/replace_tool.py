@@ -6,15 +6,22 @@ However, the bot keeps trying to use features of real sed that this tool doesn't
 
 import logging
 import re
+from io import BytesIO
 
 from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.backup_restore import BackupRestore
 from ai_shell.cat_tool import CatTool
 from ai_shell.pyutils.validate import ValidateModule, ValidationMessageForBot, is_python_file
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open, write_through
+from ai_shell.utils.line_index import existing_line_offsets
+from ai_shell.utils.path_jail import path_jail
 
 logger = logging.getLogger(__name__)
 
+# Besides "\n", str.splitlines breaks lines at these, as UTF-8. Reading in text mode already turned "\r" into "\n".
+_OTHER_LINE_BREAKS = re.compile(rb"[\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
 
 class ReplaceTool:
     def __init__(self, root_folder: str, config: Config) -> None:
@@ -60,7 +67,12 @@ class ReplaceTool:
             raise TypeError("No file_path, please provide file_path for each request.")
         if not old_text:
             raise TypeError("No old_text, please context so I can find the text to replace.")
-        with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+        full_path = path_jail(self.root_folder).absolute_inside(file_path)
+        in_range = self._replace_in_indexed_lines(full_path, old_text, new_text, line_start, line_end)
+        if in_range is not None:
+            final, input_text = in_range
+            return self._save_if_changed(file_path, final, input_text)
+        with cached_open(full_path, errors=self.utf8_errors) as file:
             input_text = file.read()
         lines = []
         input_lines = input_text.splitlines()
@@ -99,7 +111,7 @@ class ReplaceTool:
             raise TypeError("No file_path, please provide file_path for each request.")
         if not old_text:
             raise TypeError("No old_text, please context so I can find the text to replace.")
-        with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+        with cached_open(path_jail(self.root_folder).absolute_inside(file_path), errors=self.utf8_errors) as file:
             input_text = file.read()
         final = input_text.replace(old_text, new_text)
         return self._save_if_changed(file_path, final, input_text)
@@ -127,11 +139,51 @@ class ReplaceTool:
             raise TypeError("No file_path, please provide file_path for each request.")
         if not regex_match_expression:
             raise TypeError("No regex_match_expression, please context so I can find the text to replace.")
-        with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+        with cached_open(path_jail(self.root_folder).absolute_inside(file_path), errors=self.utf8_errors) as file:
             input_text = file.read()
         final = re.sub(regex_match_expression, replacement, input_text)
         return self._save_if_changed(file_path, final, input_text)
 
+    def _replace_in_indexed_lines(
+        self, full_path: str, old_text: str, new_text: str, line_start: int, line_end: int
+    ) -> tuple[str, str] | None:
+        r"""
+        replace_line_by_line, finding the line range with the file's line offset index instead of splitting every line.
+
+        Only used when the file was indexed by cat_range and is unchanged since, and when "\n" is its only line
+        break, so the index's lines are the lines `str.splitlines` would see.
+
+        Args:
+            full_path (str): The absolute path of the file.
+            old_text (str): The text to be replaced.
+            new_text (str): The new text to replace the old text.
+            line_start (int): The first line, 0-indexed.
+            line_end (int): The line after the last, -1 for the end of the file.
+
+        Returns:
+            tuple[str, str] | None: The new text and the text read, None to split the lines instead.
+        """
+        offsets = existing_line_offsets(self.root_folder, self.config, full_path)
+        if offsets is None or "\n" in old_text:
+            return None
+        with cached_open(full_path, "rb") as file:
+            data = file.read()
+        if len(data) != offsets.size or _OTHER_LINE_BREAKS.search(data):
+            return None
+        buffer = BytesIO(data)
+        start = offsets.seek_line(buffer, line_start)
+        end = max(start, offsets.seek_line(buffer, offsets.line_count if line_end == -1 else line_end))
+        # The lines are joined without a final newline.
+        body = len(data) - 1 if data.endswith(b"\n") else len(data)
+        start, end = min(start, body), min(end, body)
+        # Cut at line ends, so decoding the parts separately gives the same text as decoding the file.
+        before, middle, after, last_newline = (
+            part.decode("utf-8", errors=self.utf8_errors or "strict")
+            for part in (data[:start], data[start:end], data[end:body], data[body:])
+        )
+        final = before + middle.replace(old_text, new_text) + after
+        return final, before + middle + after + last_newline
+
     def _save_if_changed(self, file_path: str, final: str, input_text: str) -> str:
         """Saves the modified text to the file if changes have been made.
 
@@ -154,14 +206,14 @@ class ReplaceTool:
             raise TypeError("Something went wrong in replace and all text disappeared. Cancelling.")
 
         if input_text != final:
-            BackupRestore.backup_file(file_path)
-            with open(file_path, "w", encoding="utf-8", errors=self.utf8_errors) as output_file:
-                output_file.write(final)
+            full_path = path_jail(self.root_folder).absolute(file_path)
+            BackupRestore.backup_file(full_path)
+            write_through(full_path, final, self.utf8_errors)
 
-            validation = self._validate_code(file_path)
+            validation = self._validate_code(full_path)
 
             if validation:
-                BackupRestore.revert_to_latest_backup(file_path)
+                BackupRestore.revert_to_latest_backup(full_path)
                 return f"File not written because of problems.\n{validation.message}"
 
             if self.auto_cat:
@@ -189,7 +241,7 @@ class ReplaceTool:
         if not self.python_module:
             logger.warning("No python module set, skipping validation.")
             return None
-        validator = ValidateModule(self.python_module)
+        validator = ValidateModule(path_jail(self.root_folder).absolute(self.python_module))
         results = validator.validate()
         explanation = validator.explain_to_bot(results)
         if explanation.is_valid:
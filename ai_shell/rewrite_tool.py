@@ -13,7 +13,10 @@ from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.backup_restore import BackupRestore
 from ai_shell.cat_tool import CatTool
 from ai_shell.pyutils.validate import ValidateModule, ValidationMessageForBot, is_python_file
+from ai_shell.utils.change_events import notify_files_changed
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open, write_through
+from ai_shell.utils.path_jail import path_jail
 from ai_shell.utils.read_fs import is_file_in_root_folder, sanitize_path, tree
 
 logger = logging.getLogger(__name__)
@@ -40,7 +43,7 @@ def file_similarity(file1_path: str, file2_lines: list[str]) -> tuple[float, int
             - removed (int): The number of lines that were removed in the second file.
     """
     # Read the contents of the files
-    with open(file1_path, encoding="utf-8") as file1:
+    with cached_open(file1_path) as file1:
         file1_lines = file1.readlines()
 
     # Use difflib to get differences
@@ -95,28 +98,27 @@ class RewriteTool:
             ValueError: If the file already exists or if the file_path is outside the root_folder.
         """
         file_path = sanitize_path(file_path)
-        # Don't prepend root folder, we will have already cd'd to it.
-        full_path = file_path
-        if not is_file_in_root_folder(full_path, self.root_folder):
+        if not is_file_in_root_folder(file_path, self.root_folder):
             raise ValueError("File path must be within the root folder.")
+        full_path = path_jail(self.root_folder).absolute(file_path)
 
         try:
             if os.path.exists(full_path):
                 raise FileExistsError("File already exists.")
 
-            with open(full_path, "w", encoding="utf-8") as file:
-                file.write(text)
+            write_through(full_path, text)
 
             validation = self._validate_code(full_path)
 
             if validation:
                 os.remove(full_path)
+                notify_files_changed([full_path])
                 return f"File not written because of problems.\n{validation.message}"
 
-            return f"File written to {full_path}"
+            return f"File written to {file_path}"
         except FileExistsError as e:
-            tree_text = tree(Path(os.getcwd()))
-            markdown_content = f"# File {full_path} already exists. Here are all the files you can see\n\n{tree_text}"
+            tree_text = tree(Path(path_jail(self.root_folder).folder))
+            markdown_content = f"# File {file_path} already exists. Here are all the files you can see\n\n{tree_text}"
             raise ValueError(
                 str(e) + f" {markdown_content}\n Consider using rewrite_file method if you want to overwrite."
             ) from e
@@ -142,10 +144,9 @@ class RewriteTool:
 
         file_path = sanitize_path(file_path)
 
-        # Don't prepend root folder, we will have already cd'd to it.
-        full_path = file_path
-        if not is_file_in_root_folder(full_path, self.root_folder):
+        if not is_file_in_root_folder(file_path, self.root_folder):
             raise ValueError("File path must be within the root folder.")
+        full_path = path_jail(self.root_folder).absolute(file_path)
 
         if not os.path.exists(full_path):
             raise FileNotFoundError("File does not exist, use ls tool to see what files there are.")
@@ -171,8 +172,7 @@ class RewriteTool:
         try:
             BackupRestore.backup_file(full_path)
 
-            with open(full_path, "w", encoding="utf-8") as file:
-                file.write(text)
+            write_through(full_path, text)
 
             validation = self._validate_code(full_path)
 
@@ -180,7 +180,7 @@ class RewriteTool:
                 BackupRestore.revert_to_latest_backup(full_path)
                 return f"File not rewritten because of problems.\n{validation.message}"
 
-            feedback = f"File rewritten to {full_path}"
+            feedback = f"File rewritten to {file_path}"
             if self.auto_cat:
                 feedback = "Changes made without exception, please verify by other means.\n"
                 contents = CatTool(self.root_folder, self.config).cat_markdown([file_path])
@@ -206,7 +206,7 @@ class RewriteTool:
         if not self.python_module:
             logger.warning("No python module set, skipping validation.")
             return None
-        validator = ValidateModule(self.python_module)
+        validator = ValidateModule(path_jail(self.root_folder).absolute(self.python_module))
         results = validator.validate()
         explanation = validator.explain_to_bot(results)
         if explanation.is_valid:
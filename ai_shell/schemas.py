@@ -235,6 +235,25 @@ SCHEMAS = {
             "required": ["file_paths"],
             "type": "object",
         },
+        "cat_range": {
+            "description": "Return a range of lines of one file, numbered like cat_markdown, without "
+            "reading the lines before it.",
+            "properties": {
+                "end_line": {
+                    "default": -1,
+                    "description": "The last line, included. -1 for the end of the " "file.",
+                    "type": "integer",
+                },
+                "file_path": {"description": "The file.", "type": "string"},
+                "mime_type": {
+                    "description": "Return value as text/csv, text/markdown, or " "text/yaml inside the JSON.",
+                    "type": "string",
+                },
+                "start_line": {"default": 1, "description": "The first line, counting from 1.", "type": "integer"},
+            },
+            "required": ["file_path"],
+            "type": "object",
+        },
     },
     "cut": {
         "cut_characters": {
@@ -300,6 +319,11 @@ SCHEMAS = {
             "directory and its subdirectories.",
             "properties": {
                 "file_type": {"description": "The type to filter ('file' or 'directory').", "type": ["string", "null"]},
+                "limit": {
+                    "default": -1,
+                    "description": "Stop after this many results, -1 for all of " "them.",
+                    "type": "integer",
+                },
                 "mime_type": {
                     "description": "Return value as text/csv, text/markdown, or " "text/yaml inside the JSON.",
                     "type": "string",
@@ -322,6 +346,11 @@ SCHEMAS = {
                     "description": "The type to filter ('file' or " "'directory').",
                     "type": ["string", "null"],
                 },
+                "limit": {
+                    "default": -1,
+                    "description": "Stop after this many results, -1 for " "all of them.",
+                    "type": "integer",
+                },
                 "mime_type": {
                     "description": "Return value as text/csv, " "text/markdown, or text/yaml inside " "the JSON.",
                     "type": "string",
@@ -449,10 +478,13 @@ SCHEMAS = {
                 "file_path": {"description": "The path of the file to check.", "type": "string"},
                 "gitignore_path": {
                     "default": ".gitignore",
-                    "description": "The path to the .gitignore "
-                    "file. Defaults to "
-                    "'.gitignore' in the "
-                    "current directory.",
+                    "description": "The ignore file, relative "
+                    "to the repository. The "
+                    "default '.gitignore' "
+                    "applies\n"
+                    "every ignore file as git "
+                    "does, any other file is "
+                    "used on its own.",
                     "type": "string",
                 },
                 "mime_type": {
@@ -468,6 +500,21 @@ SCHEMAS = {
         "grep": {
             "description": "Search for lines matching a regular expression in files specified by a glob " "pattern.",
             "properties": {
+                "context_after": {
+                    "default": 0,
+                    "description": "Number of lines to show after each match, " "like grep -A.",
+                    "type": "integer",
+                },
+                "context_before": {
+                    "default": 0,
+                    "description": "Number of lines to show before each match, " "like grep -B.",
+                    "type": "integer",
+                },
+                "fixed_strings": {
+                    "default": False,
+                    "description": "If True, regex is literal text, one string " "per line to find any of.",
+                    "type": "boolean",
+                },
                 "glob_pattern": {"description": "A glob pattern string to specify files.", "type": "string"},
                 "maximum_matches_per_file": {
                     "default": -1,
@@ -483,6 +530,11 @@ SCHEMAS = {
                     "description": "Return value as text/csv, text/markdown, or " "text/yaml inside the JSON.",
                     "type": "string",
                 },
+                "multiline": {
+                    "default": False,
+                    "description": "If True, the regex can match across lines, e.g. " "'@property\\s+def'.",
+                    "type": "boolean",
+                },
                 "regex": {"description": "A regular expression string to search for.", "type": "string"},
                 "skip_first_matches": {
                     "default": -1,
@@ -493,10 +545,93 @@ SCHEMAS = {
             "required": ["regex", "glob_pattern"],
             "type": "object",
         },
+        "grep_count": {
+            "description": "Count the lines matching a regular expression in each file, like grep -c.",
+            "properties": {
+                "fixed_strings": {
+                    "default": False,
+                    "description": "If True, regex is literal text, one " "string per line to find any of.",
+                    "type": "boolean",
+                },
+                "glob_pattern": {"description": "A glob pattern string to specify files.", "type": "string"},
+                "mime_type": {
+                    "description": "Return value as text/csv, text/markdown, or " "text/yaml inside the JSON.",
+                    "type": "string",
+                },
+                "multiline": {
+                    "default": False,
+                    "description": "If True, the regex can match across lines.",
+                    "type": "boolean",
+                },
+                "regex": {"description": "A regular expression string to search for.", "type": "string"},
+            },
+            "required": ["regex", "glob_pattern"],
+            "type": "object",
+        },
+        "grep_files_with_matches": {
+            "description": "List the files with at least one line matching a regular " "expression, like grep -l.",
+            "properties": {
+                "fixed_strings": {
+                    "default": False,
+                    "description": "If True, regex is literal " "text, one string per line " "to find any of.",
+                    "type": "boolean",
+                },
+                "glob_pattern": {"description": "A glob pattern string to " "specify files.", "type": "string"},
+                "maximum_files": {
+                    "default": -1,
+                    "description": "Maximum number of file " "names to return.",
+                    "type": "integer",
+                },
+                "mime_type": {
+                    "description": "Return value as text/csv, " "text/markdown, or text/yaml " "inside the JSON.",
+                    "type": "string",
+                },
+                "multiline": {
+                    "default": False,
+                    "description": "If True, the regex can match " "across lines.",
+                    "type": "boolean",
+                },
+                "regex": {"description": "A regular expression string to " "search for.", "type": "string"},
+            },
+            "required": ["regex", "glob_pattern"],
+            "type": "object",
+        },
+        "grep_many": {
+            "description": "Search for several regular expressions at once, reading each file only " "once.",
+            "properties": {
+                "glob_pattern": {"description": "A glob pattern string to specify files.", "type": "string"},
+                "maximum_matches_per_pattern": {
+                    "default": -1,
+                    "description": "Maximum number of matches " "to return for each " "pattern.",
+                    "type": "integer",
+                },
+                "mime_type": {
+                    "description": "Return value as text/csv, text/markdown, or " "text/yaml inside the JSON.",
+                    "type": "string",
+                },
+                "patterns": {
+                    "description": "Names mapped to regular expressions, e.g. "
+                    '{"todo": "TODO", "print": "print\\\\("}.',
+                    "type": "object",
+                },
+            },
+            "required": ["patterns", "glob_pattern"],
+            "type": "object",
+        },
         "grep_markdown": {
             "description": "Search for lines matching a regular expression in files and returns "
             "markdown formatted results.",
             "properties": {
+                "context_lines": {
+                    "default": 0,
+                    "description": "Number of lines to show before and " "after each match, like grep -C.",
+                    "type": "integer",
+                },
+                "fixed_strings": {
+                    "default": False,
+                    "description": "If True, regex is literal text, one " "string per line to find any of.",
+                    "type": "boolean",
+                },
                 "glob_pattern": {"description": "A glob pattern string to specify " "files.", "type": "string"},
                 "maximum_matches": {
                     "default": -1,
@@ -507,6 +642,21 @@ SCHEMAS = {
                     "description": "Return value as text/csv, text/markdown, " "or text/yaml inside the JSON.",
                     "type": "string",
                 },
+                "multiline": {
+                    "default": False,
+                    "description": "If True, the regex can match across " "lines, e.g. '@property\\s+def'.",
+                    "type": "boolean",
+                },
+                "output_mode": {
+                    "default": "content",
+                    "description": '"content" for the matching lines, '
+                    '"files_with_matches" for just the '
+                    "file\n"
+                    "names (maximum_matches limits the "
+                    'files), "count" for the number of '
+                    "matching lines per file.",
+                    "type": "string",
+                },
                 "regex": {"description": "A regular expression string to search for.", "type": "string"},
                 "skip_first_matches": {
                     "default": -1,
@@ -10,6 +10,8 @@ from ai_shell.ai_logs.log_to_bash import log
 from ai_shell.cat_tool import CatTool
 from ai_shell.pyutils.validate import is_python_file, is_valid_python_source
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import cached_open, write_through
+from ai_shell.utils.path_jail import path_jail
 from ai_shell.utils.read_fs import is_file_in_root_folder
 
 
@@ -51,8 +53,9 @@ class SedTool:
         """
         if not is_file_in_root_folder(file_path, self.root_folder):
             raise ValueError(f"File {file_path} is not in root folder {self.root_folder}.")
+        full_path = path_jail(self.root_folder).absolute(file_path)
 
-        with open(file_path, encoding="utf-8", errors=self.utf8_errors) as file:
+        with cached_open(full_path, errors=self.utf8_errors) as file:
             input_text = file.read()
         output_text = SedTool._process_sed(input_text, commands)
         if is_python_file(file_path):
@@ -61,8 +64,7 @@ class SedTool:
                 return f"Invalid Python source code. No changes made. {error.lineno} {error.msg} {error.text}"
 
         if input_text != output_text:
-            with open(file_path, "w", encoding="utf-8") as output_file:
-                output_file.write(output_text)
+            write_through(full_path, output_text)
 
             if self.auto_cat:
                 feedback = "Changes without exception, please verify by other means.\n"
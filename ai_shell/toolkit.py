@@ -32,7 +32,12 @@ class ToolKit(ToolKitBase):
     """AI Shell Toolkit"""
 
     def __init__(
-        self, root_folder: str, token_model: str, global_max_lines: int, permitted_tools: list[str], config: Config
+        self,
+        root_folder: str | dict[str, str],
+        token_model: str,
+        global_max_lines: int,
+        permitted_tools: list[str],
+        config: Config,
     ) -> None:
         super().__init__(root_folder, token_model, global_max_lines, permitted_tools, config)
         self._lookup: dict[str, Callable[[dict[str, Any]], Any]] = {
@@ -49,6 +54,7 @@ class ToolKit(ToolKitBase):
             "report_xml": self.report_xml,
             "cat": self.cat,
             "cat_markdown": self.cat_markdown,
+            "cat_range": self.cat_range,
             "cut_characters": self.cut_characters,
             "cut_fields": self.cut_fields,
             "cut_fields_by_name": self.cut_fields_by_name,
@@ -64,6 +70,9 @@ class ToolKit(ToolKitBase):
             "git_status": self.git_status,
             "is_ignored_by_gitignore": self.is_ignored_by_gitignore,
             "grep": self.grep,
+            "grep_count": self.grep_count,
+            "grep_files_with_matches": self.grep_files_with_matches,
+            "grep_many": self.grep_many,
             "grep_markdown": self.grep_markdown,
             "head": self.head,
             "head_markdown": self.head_markdown,
@@ -356,6 +365,27 @@ class ToolKit(ToolKitBase):
         squeeze_blank = cast(bool, arguments.get("squeeze_blank", False))
         return tool.cat_markdown(file_paths=file_paths, number_lines=number_lines, squeeze_blank=squeeze_blank)
 
+    def cat_range(self, arguments: dict[str, Any]) -> Any:
+        """Generated Do Not Edit
+
+        Args:
+            arguments (dict[str, Any]): The arguments for the tool.
+
+        Returns:
+            Any: The result of the tool invocation.
+        """
+        tool = CatTool(self.root_folder, self.config)
+
+        end_line = cast(int, arguments.get("end_line", -1))
+        file_path = cast(
+            str,
+            arguments.get(
+                "file_path",
+            ),
+        )
+        start_line = cast(int, arguments.get("start_line", 1))
+        return tool.cat_range(end_line=end_line, file_path=file_path, start_line=start_line)
+
     def cut_characters(self, arguments: dict[str, Any]) -> Any:
         """Generated Do Not Edit
 
@@ -450,6 +480,7 @@ class ToolKit(ToolKitBase):
                 "file_type",
             ),
         )
+        limit = cast(int, arguments.get("limit", -1))
         name = cast(
             str | None,
             arguments.get(
@@ -468,7 +499,7 @@ class ToolKit(ToolKitBase):
                 "size",
             ),
         )
-        return tool.find_files(file_type=file_type, name=name, regex=regex, size=size)
+        return tool.find_files(file_type=file_type, limit=limit, name=name, regex=regex, size=size)
 
     def find_files_markdown(self, arguments: dict[str, Any]) -> Any:
         """Generated Do Not Edit
@@ -487,6 +518,7 @@ class ToolKit(ToolKitBase):
                 "file_type",
             ),
         )
+        limit = cast(int, arguments.get("limit", -1))
         name = cast(
             str | None,
             arguments.get(
@@ -505,7 +537,7 @@ class ToolKit(ToolKitBase):
                 "size",
             ),
         )
-        return tool.find_files_markdown(file_type=file_type, name=name, regex=regex, size=size)
+        return tool.find_files_markdown(file_type=file_type, limit=limit, name=name, regex=regex, size=size)
 
     def get_current_branch(self, arguments: dict[str, Any]) -> Any:
         """Generated Do Not Edit
@@ -668,6 +700,9 @@ class ToolKit(ToolKitBase):
         """
         tool = GrepTool(self.root_folder, self.config)
 
+        context_after = cast(int, arguments.get("context_after", 0))
+        context_before = cast(int, arguments.get("context_before", 0))
+        fixed_strings = cast(bool, arguments.get("fixed_strings", False))
         glob_pattern = cast(
             str,
             arguments.get(
@@ -676,6 +711,7 @@ class ToolKit(ToolKitBase):
         )
         maximum_matches_per_file = cast(int, arguments.get("maximum_matches_per_file", -1))
         maximum_matches_total = cast(int, arguments.get("maximum_matches_total", -1))
+        multiline = cast(bool, arguments.get("multiline", False))
         regex = cast(
             str,
             arguments.get(
@@ -684,13 +720,106 @@ class ToolKit(ToolKitBase):
         )
         skip_first_matches = cast(int, arguments.get("skip_first_matches", -1))
         return tool.grep(
+            context_after=context_after,
+            context_before=context_before,
+            fixed_strings=fixed_strings,
             glob_pattern=glob_pattern,
             maximum_matches_per_file=maximum_matches_per_file,
             maximum_matches_total=maximum_matches_total,
+            multiline=multiline,
             regex=regex,
             skip_first_matches=skip_first_matches,
         )
 
+    def grep_count(self, arguments: dict[str, Any]) -> Any:
+        """Generated Do Not Edit
+
+        Args:
+            arguments (dict[str, Any]): The arguments for the tool.
+
+        Returns:
+            Any: The result of the tool invocation.
+        """
+        tool = GrepTool(self.root_folder, self.config)
+
+        fixed_strings = cast(bool, arguments.get("fixed_strings", False))
+        glob_pattern = cast(
+            str,
+            arguments.get(
+                "glob_pattern",
+            ),
+        )
+        multiline = cast(bool, arguments.get("multiline", False))
+        regex = cast(
+            str,
+            arguments.get(
+                "regex",
+            ),
+        )
+        return tool.grep_count(fixed_strings=fixed_strings, glob_pattern=glob_pattern, multiline=multiline, regex=regex)
+
+    def grep_files_with_matches(self, arguments: dict[str, Any]) -> Any:
+        """Generated Do Not Edit
+
+        Args:
+            arguments (dict[str, Any]): The arguments for the tool.
+
+        Returns:
+            Any: The result of the tool invocation.
+        """
+        tool = GrepTool(self.root_folder, self.config)
+
+        fixed_strings = cast(bool, arguments.get("fixed_strings", False))
+        glob_pattern = cast(
+            str,
+            arguments.get(
+                "glob_pattern",
+            ),
+        )
+        maximum_files = cast(int, arguments.get("maximum_files", -1))
+        multiline = cast(bool, arguments.get("multiline", False))
+        regex = cast(
+            str,
+            arguments.get(
+                "regex",
+            ),
+        )
+        return tool.grep_files_with_matches(
+            fixed_strings=fixed_strings,
+            glob_pattern=glob_pattern,
+            maximum_files=maximum_files,
+            multiline=multiline,
+            regex=regex,
+        )
+
+    def grep_many(self, arguments: dict[str, Any]) -> Any:
+        """Generated Do Not Edit
+
+        Args:
+            arguments (dict[str, Any]): The arguments for the tool.
+
+        Returns:
+            Any: The result of the tool invocation.
+        """
+        tool = GrepTool(self.root_folder, self.config)
+
+        glob_pattern = cast(
+            str,
+            arguments.get(
+                "glob_pattern",
+            ),
+        )
+        maximum_matches_per_pattern = cast(int, arguments.get("maximum_matches_per_pattern", -1))
+        patterns = cast(
+            Any,
+            arguments.get(
+                "patterns",
+            ),
+        )
+        return tool.grep_many(
+            glob_pattern=glob_pattern, maximum_matches_per_pattern=maximum_matches_per_pattern, patterns=patterns
+        )
+
     def grep_markdown(self, arguments: dict[str, Any]) -> Any:
         """Generated Do Not Edit
 
@@ -702,6 +831,8 @@ class ToolKit(ToolKitBase):
         """
         tool = GrepTool(self.root_folder, self.config)
 
+        context_lines = cast(int, arguments.get("context_lines", 0))
+        fixed_strings = cast(bool, arguments.get("fixed_strings", False))
         glob_pattern = cast(
             str,
             arguments.get(
@@ -709,6 +840,8 @@ class ToolKit(ToolKitBase):
             ),
         )
         maximum_matches = cast(int, arguments.get("maximum_matches", -1))
+        multiline = cast(bool, arguments.get("multiline", False))
+        output_mode = cast(str, arguments.get("output_mode", "content"))
         regex = cast(
             str,
             arguments.get(
@@ -717,8 +850,12 @@ class ToolKit(ToolKitBase):
         )
         skip_first_matches = cast(int, arguments.get("skip_first_matches", -1))
         return tool.grep_markdown(
+            context_lines=context_lines,
+            fixed_strings=fixed_strings,
             glob_pattern=glob_pattern,
             maximum_matches=maximum_matches,
+            multiline=multiline,
+            output_mode=output_mode,
             regex=regex,
             skip_first_matches=skip_first_matches,
         )
@@ -4,21 +4,29 @@ Provider-agnostic tool dispatch.
 The tools are optimized for LLMs but not for any specific vendor. This base class
 handles the boilerplate of turning a tool name + argument dict (as produced by any
 tool-calling model) into a result: permission gating, usage stats, media-type
-handling, and error-to-RFC7807 conversion.
+handling, the output budget, and error-to-RFC7807 conversion.
 """
 
 import logging
 import os
+import threading
 import traceback
+import types
+import weakref
 from collections.abc import Callable
 from typing import Any
 
 import orjson as json
 
 from ai_shell.import_plugins import convert_to_toolkit, handle_tool
+from ai_shell.multi_root import MultiRoot, check_root_names
 from ai_shell.utils import medias
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import ContentCache, content_cache, release_content_cache
 from ai_shell.utils.json_utils import FatalConfigurationError, exception_to_rfc7807_dict, loosy_goosy_default_encoder
+from ai_shell.utils.output_budget import OutputSink, using_sink
+from ai_shell.utils.scan_pool import hold_scan_pool, release_scan_pool, scan_workers
+from ai_shell.utils.workspace_watcher import watch_root
 
 logger = logging.getLogger(__name__)
 
@@ -31,32 +39,120 @@ class ToolKitBase:
     """Non-generated base class for the generated toolkit.
 
     Subclasses populate ``self._lookup`` with ``name -> callable(arguments)``.
+
+    Given several named root folders, paths start with a root name and the searches run on every root, see
+    `ai_shell.multi_root`.
     """
 
     def __init__(
-        self, root_folder: str, token_model: str, global_max_lines: int, permitted_tools: list[str], config: Config
+        self,
+        root_folder: str | dict[str, str],
+        token_model: str,
+        global_max_lines: int,
+        permitted_tools: list[str],
+        config: Config,
     ) -> None:
         """
         Args:
-            root_folder (str): The root folder path for file operations.
-            token_model (str): The token model to use for the toolkit.
-            global_max_lines (int): The global max lines to use for the toolkit.
+            root_folder (str | dict[str, str]): The root folder path for file operations, or root names mapped to
+                root folders.
+            token_model (str): The model whose tokens the output budget counts.
+            global_max_lines (int): The most lines one tool call returns, 0 or less for no limit. The most tokens
+                come from the `global_max_tokens` config value, see `ai_shell.utils.output_budget`.
             permitted_tools (list[str]): The tools the caller is allowed to invoke.
             config (Config): Developer config the model shouldn't set.
         """
+        self.multi_root: MultiRoot | None = None
+        if isinstance(root_folder, dict):
+            roots = check_root_names(root_folder)
+            self.multi_root = MultiRoot(roots, self._tool_of_root)
+            # The generated tool methods act on the first root.
+            root_folder = next(iter(roots.values()))
         self.root_folder = os.path.abspath(root_folder)
         self.token_model = token_model
         self.global_max_lines = global_max_lines
+        self.global_max_tokens = int(config.get_value("global_max_tokens") or 0)
         self._lookup: dict[str, Callable[[Any], Any]] = {}
         self.config = config
         self.plugin_folder = config.get_value("plugin_folder")
         self.plugin_tools: dict[str, Any] = (
-            convert_to_toolkit(self.plugin_folder, root_folder) if self.plugin_folder else {}
+            convert_to_toolkit(self.plugin_folder, self.root_folder) if self.plugin_folder else {}
         )
 
         self.permitted_tools: list[str] = permitted_tools
         self.tool_usage_stats: dict[str, dict[str, int]] = {}
-        """Name: {count, success, failure}"""
+        """Name: {count, success, failure}, and "content_cache": the hits, misses and bytes saved of the root
+        folders' content caches, which every toolkit on the same roots shares."""
+        self._root_kits: dict[str, ToolKitBase] = {}
+        self._root_kits_lock = threading.Lock()
+        # The tools read files through it, see `ai_shell.utils.content_cache`. Each root of a multi-root kit has its own.
+        self.content_cache: ContentCache | None = (
+            content_cache(self.root_folder, config) if self.multi_root is None else None
+        )
+        self._releases: list[tuple[weakref.finalize, Callable[[str], None]]] = []
+        if self.content_cache is not None:
+            self._release_on_close(release_content_cache)
+        workers = scan_workers(config)
+        if workers > 1 and self.multi_root is None:
+            # Searches reuse the worker processes instead of starting them per call.
+            hold_scan_pool(self.root_folder, workers)
+            self._release_on_close(release_scan_pool)
+        if config.get_flag("watch_workspace", False) and self.multi_root is None:
+            # Keeps the caches and indexes of this root current without re-checking every file.
+            watch_root(self.root_folder, config)
+
+    def close(self) -> None:
+        """Let go of what the toolkit holds for its roots, the content caches and search worker processes. The
+        toolkit isn't used after.
+        """
+        with self._root_kits_lock:
+            kits = list(self._root_kits.values())
+            self._root_kits.clear()
+        for kit in kits:
+            kit.close()
+        for finalizer, release in self._releases:
+            if finalizer.detach() is not None:
+                release(self.root_folder)
+
+    def _release_on_close(self, release: Callable[..., None]) -> None:
+        """Call release with the root folder on close, or queue it once the toolkit is garbage collected.
+
+        Args:
+            release (Callable[..., None]): Takes the root folder, and later=True from a finalizer.
+        """
+        self._releases.append((weakref.finalize(self, release, self.root_folder, True), release))
+
+    def __enter__(self) -> "ToolKitBase":
+        """Use as a context manager that closes the toolkit."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the toolkit."""
+        self.close()
+
+    def _tool_of_root(self, root: str, name: str) -> Callable[[dict[str, Any]], Any]:
+        """The tool function of one root, from a single root toolkit of the same class made on first use.
+
+        Args:
+            root (str): The root name.
+            name (str): The tool name.
+
+        Returns:
+            Callable[[dict[str, Any]], Any]: The tool function.
+        """
+        if self.multi_root is None:
+            raise TypeError("Only a toolkit with several roots has tools per root.")
+        with self._root_kits_lock:
+            kit = self._root_kits.get(root)
+            if kit is None:
+                kit = self._root_kits[root] = type(self)(
+                    self.multi_root.roots[root],
+                    self.token_model,
+                    self.global_max_lines,
+                    self.permitted_tools,
+                    self.config,
+                )
+        return kit._lookup[name]
 
     def get_tool_usage_for(self, name: str) -> dict[str, int]:
         """Get tool usage stats for a given tool.
@@ -102,7 +198,16 @@ class ToolKitBase:
                 original_name = name
                 media_type, name = self._media_type_to_method_name(arguments, name)
 
-                result = self._lookup[name](arguments)
+                sink = OutputSink(self.global_max_lines, self.global_max_tokens, self.token_model)
+                with using_sink(sink):
+                    if self.multi_root is not None:
+                        result = self.multi_root.call(name, arguments)
+                    else:
+                        result = self._lookup[name](arguments)
+                    if isinstance(result, types.GeneratorType):
+                        # Consumed while the sink is current, a generator stops at the budget too.
+                        result = list(result)
+                result = sink.finish(result)
                 self.tool_usage_stats[name]["success"] += 1
 
                 if media_type and original_name == name:
@@ -128,6 +233,8 @@ class ToolKitBase:
             self.tool_usage_stats[name]["failure"] += 1
             raise TypeError(f"Unknown function name {name}")
 
+        self._record_content_cache_stats()
+
         if isinstance(result, bytes):
             result = result.decode("utf-8")
 
@@ -138,6 +245,25 @@ class ToolKitBase:
             logger.error(f"Result that json can't handle: {result}")
             raise
 
+    def _record_content_cache_stats(self) -> None:
+        """Copy the counters of the content caches of the roots into tool_usage_stats, summed over the roots."""
+        if self.multi_root is None:
+            caches = [self.content_cache]
+        else:
+            with self._root_kits_lock:
+                caches = [kit.content_cache for kit in self._root_kits.values()]
+        totals: dict[str, int] = {}
+        for cache in caches:
+            if cache is None:
+                continue
+            for name, value in cache.stats().items():
+                totals[name] = totals.get(name, 0) + value
+        if not totals:
+            return
+        lookups = totals["hits"] + totals["misses"]
+        totals["hit_rate_percent"] = round(100 * totals["hits"] / lookups) if lookups else 0
+        self.tool_usage_stats["content_cache"] = totals
+
     def _media_type_to_method_name(self, arguments: dict[str, Any], name: str) -> tuple[str, str]:
         """Pop a ``mime_type`` argument and redirect to a markdown variant if asked.
 
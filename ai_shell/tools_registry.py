@@ -6,13 +6,16 @@ the lingua franca for tool-calling across providers; this module exposes the
 generated schemas and helpers to select which tools to expose.
 """
 
+import functools
 import logging
+import os
 from collections.abc import Collection
 from typing import Any, Union
 
-from ai_shell.ls_tool import LsTool
 from ai_shell.schemas import SCHEMAS
 from ai_shell.utils.config_manager import Config
+from ai_shell.utils.file_index import open_file_index
+from ai_shell.utils.walk import is_pruned, scan_tree
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +61,24 @@ def initialize_all_tools(skips: list[str] | None = None, keeps: list[str] | None
     logger.info(f"Active tools {active_tools_string}")
 
 
+def file_extensions(root_folder: str, config: Config) -> set[str]:
+    """The lower-cased file extensions under the root folder, from the file index when it's on.
+
+    Args:
+        root_folder (str): The root folder.
+        config (Config): The developer input that bot shouldn't set.
+
+    Returns:
+        set[str]: Extensions like ".py", "" for files without one.
+    """
+    if config.get_flag("file_index", False):
+        with open_file_index(root_folder, config) as index:
+            index.refresh()
+            return set(index.extensions())
+    skip = functools.partial(is_pruned, excluded_folders=frozenset(config.get_list("excluded_folders")))
+    return {os.path.splitext(entry.name)[1].lower() for _path, entry in scan_tree(root_folder, skip) if entry.is_file()}
+
+
 def recommendations(root_folder: str, config: Config) -> list[str]:
     """Recommend tools based on the root folder.
 
@@ -68,28 +89,21 @@ def recommendations(root_folder: str, config: Config) -> list[str]:
     Returns:
         list[str]: A list of recommended tools.
     """
-    tool = LsTool(root_folder, config)
-    files = tool.ls("**/*")
-    tool_set = set()
-    all_of_em = just_tool_names()
+    extensions = file_extensions(root_folder, config)
+    unneeded: set[str] = set()
 
     # Only need for csv and the like
-    all_of_em.remove("cut")
+    if ".csv" not in extensions:
+        unneeded.update(SCHEMAS["cut"])
 
     # Only need for python
-    all_of_em.remove("pycat")
-    all_of_em.remove("pytest")
+    if ".py" not in extensions:
+        unneeded.update(SCHEMAS["pycat"])
+        unneeded.update(SCHEMAS["pytest"])
     # Other python themed tools.
 
     # TODO: detect git repo & if not git, remove git.
-    # all_of_em.remove("git")
-
-    for _file, file_type in files:
-        if file_type == ".csv":
-            tool_set.add("cut")
-        elif file_type == ".py":
-            tool_set.add("pycat")
-    return list(tool_set)
+    return [name for name in just_tool_names() if name not in unneeded]
 
 
 def initialize_recommended_tools(root_folder: str, config: Config) -> None:
@@ -0,0 +1,122 @@
+"""
+Literal string search helpers for grep: spotting regexes that are really literals, and an Aho-Corasick automaton
+to look for many literals in one pass.
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+# Everything that makes a regex more than a literal, `|` is handled separately as the literal separator.
+_METACHARACTERS = frozenset(".^$*+?{}[]()\n")
+
+
+def literal_alternatives(regex: str) -> list[str] | None:
+    r"""Return the literals a regex is an alternation of, or None if it uses any regex feature.
+
+    Backslash-escaped punctuation counts as a literal, escapes like \d or \b don't.
+
+    Args:
+        regex (str): A regular expression string.
+
+    Returns:
+        list[str] | None: The literals, e.g. ["TODO", "FIXME"] for "TODO|FIXME".
+
+    Examples:
+        >>> literal_alternatives("TODO|FIXME")
+        ['TODO', 'FIXME']
+        >>> literal_alternatives(r"print\(")
+        ['print(']
+        >>> literal_alternatives(r"def \w+") is None
+        True
+        >>> literal_alternatives("TODO|") is None
+        True
+    """
+    literals: list[str] = []
+    current: list[str] = []
+    index = 0
+    while index < len(regex):
+        char = regex[index]
+        if char == "\\":
+            escaped = regex[index + 1 : index + 2]
+            if not escaped or escaped.isalnum() or escaped == "\n":
+                return None
+            current.append(escaped)
+            index += 2
+            continue
+        if char in _METACHARACTERS:
+            return None
+        if char == "|":
+            literals.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+        index += 1
+    literals.append("".join(current))
+    if not all(literals):
+        # An empty branch matches every line, leave that to the regex engine.
+        return None
+    return literals
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over bytes, finds every occurrence of many needles in one pass."""
+
+    def __init__(self, needles: Iterable[bytes]) -> None:
+        """
+        Build the trie and its failure links.
+
+        Args:
+            needles (Iterable[bytes]): The non-empty byte strings to look for.
+        """
+        self.goto: list[dict[int, int]] = [{}]
+        self.fail: list[int] = [0]
+        # Length of the longest needle that ends in each state, 0 if none does.
+        self.output: list[int] = [0]
+        for needle in needles:
+            state = 0
+            for byte in needle:
+                next_state = self.goto[state].get(byte)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][byte] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(0)
+                state = next_state
+            self.output[state] = max(self.output[state], len(needle))
+
+        # Breadth first, so a state's failure target is always finished before the state itself.
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for byte, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and byte not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(byte, 0)
+                self.output[child] = max(self.output[child], self.output[self.fail[child]])
+
+    def finditer(self, data: bytes) -> Iterator[tuple[int, int]]:
+        """Yield (start, end) of a needle ending at each position where one does, longest needle first.
+
+        Args:
+            data (bytes): The haystack.
+
+        Yields:
+            tuple[int, int]: Start and end offsets of the match.
+
+        Examples:
+            >>> list(AhoCorasick([b"he", b"she", b"hers"]).finditer(b"ushers"))
+            [(1, 4), (2, 6)]
+        """
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        state = 0
+        for index, byte in enumerate(data):
+            while state and byte not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(byte, 0)
+            if output[state]:
+                yield index + 1 - output[state], index + 1
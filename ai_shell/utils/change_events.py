@@ -0,0 +1,60 @@
+"""
+Tell the caches when a tool writes to a file.
+
+Write tools call `notify_files_changed` after touching a file, caches register a listener to drop what they hold
+for it. Changes made outside the tools are caught by the caches' own validation, not here.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+ChangeListener = Callable[[list[str]], None]
+
+_LISTENERS: list[ChangeListener] = []
+_LOCK = threading.Lock()
+
+
+def add_change_listener(listener: ChangeListener) -> None:
+    """Call listener with the absolute paths of files each time a tool changes some.
+
+    Args:
+        listener (ChangeListener): Receives a list of absolute paths.
+    """
+    with _LOCK:
+        if listener not in _LISTENERS:
+            _LISTENERS.append(listener)
+
+
+def remove_change_listener(listener: ChangeListener) -> None:
+    """Stop calling listener.
+
+    Args:
+        listener (ChangeListener): A listener previously added.
+    """
+    with _LOCK:
+        if listener in _LISTENERS:
+            _LISTENERS.remove(listener)
+
+
+def notify_files_changed(paths: Iterable[str]) -> None:
+    """Report files that were written, created or deleted.
+
+    Args:
+        paths (Iterable[str]): The files, relative paths are relative to the current directory.
+    """
+    absolute_paths = [os.path.abspath(path) for path in paths]
+    if not absolute_paths:
+        return
+    with _LOCK:
+        listeners = list(_LISTENERS)
+    for listener in listeners:
+        try:
+            listener(absolute_paths)
+        # pylint: disable=broad-exception-caught
+        except Exception as exception:
+            # A broken cache must not turn a successful write into a failed tool call.
+            logger.error(f"Change listener {listener} failed: {exception}")
@@ -89,6 +89,16 @@ class Config:
         """
         return self._values_data.get(name, default)
 
+    def set_value(self, name: str, value: str) -> None:
+        """Set a named value.
+
+        Args:
+            name (str): The name of the config value.
+            value (str): The value.
+        """
+        self._values_data[name] = value
+        self.save_config()
+
     def get_required_value(self, name: str) -> str:
         """Return a required named value.
 
@@ -6,6 +6,8 @@ from typing import Any
 
 import orjson
 
+from ai_shell.utils.json_utils import loosy_goosy_default_encoder
+
 
 def pretty_console(result: Any) -> None:
     """
@@ -16,5 +18,5 @@ def pretty_console(result: Any) -> None:
     if isinstance(result, str):
         print(result)
     else:
-        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+        print(orjson.dumps(result, default=loosy_goosy_default_encoder, option=orjson.OPT_INDENT_2).decode())
         # json.dump(result, sys.stdout, indent=4, cls=LoosyGoosyEncoderForSlowJson)
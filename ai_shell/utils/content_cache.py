@@ -0,0 +1,384 @@
+"""
+File contents shared by the tools of a root folder, so a file read by `cat_markdown`, then `grep`, then an edit
+tool, then the auto-cat after the edit, comes off the disk and is decoded once.
+
+An entry is the file's bytes plus its decoded text for each error handler asked for, valid while the file has the
+same (inode, size, mtime_ns). The cache is an LRU bounded by a byte budget; files bigger than an eighth of it are
+never cached. Files read while their mtime is still within the racy window aren't stored, see `fingerprint_cache`.
+
+A `ToolKit` holds the cache of its root while it's open, sized by the `content_cache_bytes` config value. Toolkits
+on the same root share one cache, dropped when the last of them is closed. The caches of all roots together stay
+under `content_cache_total_bytes`, each one shrinking as more roots are open. Tools open files with `cached_open`,
+which reads through the cache of the root a path is in, or opens the file when there is none, e.g. in a grep worker
+process. Write tools write with `write_through`, which updates the entry in place rather than dropping it, so the
+auto-cat after an edit is a hit. A write is still in the racy window, so its entry is served only until the window
+passes, then the file is read once more for an entry whose key can be trusted.
+"""
+
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import IO
+
+from ai_shell.utils.change_events import add_change_listener, notify_files_changed
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.fingerprint_cache import RACY_NANOSECONDS
+from ai_shell.utils.root_holds import RootHolds
+
+DEFAULT_MAXIMUM_BYTES = 64 * 1024 * 1024
+DEFAULT_TOTAL_BYTES = 256 * 1024 * 1024
+
+# (st_ino, st_size, st_mtime_ns)
+FileKey = tuple[int, int, int]
+
+
+@dataclass(slots=True)
+class _Entry:
+    """The contents of one version of a file."""
+
+    key: FileKey
+    data: bytes
+    # Decoded with universal newlines, per errors handler.
+    texts: dict[str, str] = field(default_factory=dict)
+    # For bytes a tool wrote within the racy window, when the window passes and the file is to be read again.
+    racy_until_ns: int = 0
+
+    @property
+    def size(self) -> int:
+        """What the entry counts against the budget, a character of text taken as a byte."""
+        return len(self.data) + sum(len(text) for text in self.texts.values())
+
+
+def _file_key(stat: os.stat_result) -> FileKey:
+    """What an entry is validated by."""
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def decode_text(data: bytes, errors: str | None = None) -> str:
+    r"""Decode UTF-8 like reading a file opened in text mode, "\r\n" and "\r" becoming "\n".
+
+    Args:
+        data (bytes): The file contents.
+        errors (str | None): The error handler, None for strict.
+
+    Returns:
+        str: The text.
+    """
+    text = data.decode("utf-8", errors=errors or "strict")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def encode_text(text: str, errors: str | None = None) -> bytes:
+    r"""Encode text like writing it to a file opened in text mode, "\n" becoming os.linesep.
+
+    Args:
+        text (str): The text.
+        errors (str | None): The error handler, None for strict.
+
+    Returns:
+        bytes: The file contents.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8", errors=errors or "strict")
+
+
+class ContentCache:
+    """Byte budgeted LRU of file contents, each valid for one (inode, size, mtime_ns)."""
+
+    def __init__(self, maximum_bytes: int = DEFAULT_MAXIMUM_BYTES) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            maximum_bytes (int): Least recently used files are evicted beyond this many bytes, 0 to cache nothing.
+        """
+        self.maximum_bytes = maximum_bytes
+        self.maximum_file_bytes = maximum_bytes // 8
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        """Bytes not read from disk thanks to a hit."""
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def resize(self, maximum_bytes: int) -> None:
+        """Change the budget, evicting down to it.
+
+        Args:
+            maximum_bytes (int): The new budget.
+        """
+        with self._lock:
+            self.maximum_bytes = maximum_bytes
+            self.maximum_file_bytes = maximum_bytes // 8
+            for path in [path for path, entry in self._entries.items() if len(entry.data) > self.maximum_file_bytes]:
+                self._bytes -= self._entries.pop(path).size
+            self._evict()
+
+    def _lookup(self, path: str, stat: os.stat_result) -> _Entry | None:
+        """The entry of a file if still valid, counting the hit or miss. Call with the lock held."""
+        entry = self._entries.get(path)
+        if entry is not None and entry.racy_until_ns and time.time_ns() >= entry.racy_until_ns:
+            # Another write in the tick of the stored one wouldn't have changed the key, read the file again.
+            self._bytes -= self._entries.pop(path).size
+            entry = None
+        if entry is None or entry.key != _file_key(stat):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(path)
+        self.hits += 1
+        self.bytes_saved += len(entry.data)
+        return entry
+
+    def _store(self, path: str, entry: _Entry) -> None:
+        """Add or replace an entry, evicting down to the budget. Call with the lock held."""
+        old = self._entries.pop(path, None)
+        if old is not None:
+            self._bytes -= old.size
+        if len(entry.data) > self.maximum_file_bytes:
+            return
+        self._entries[path] = entry
+        self._bytes += entry.size
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within the budget. Call with the lock held."""
+        while self._bytes > self.maximum_bytes:
+            _path, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def read(self, path: str, errors: str | None = None, as_text: bool = True, fill: bool = True) -> bytes | str | None:
+        """The text or the bytes of a file, from the cache if it's unchanged.
+
+        Args:
+            path (str): Absolute path of the file.
+            errors (str | None): The error handler for text, None for strict.
+            as_text (bool): Return the text, read as `open(path, encoding="utf-8", errors=errors)` reads it.
+            fill (bool): Read and cache the file on a miss, else only return what's cached.
+
+        Returns:
+            bytes | str | None: The text or the bytes, None if the file is too big to cache, or on a miss without
+                fill.
+
+        Raises:
+            OSError: If the file can't be read.
+        """
+        stat = os.stat(path)
+        if stat.st_size > self.maximum_file_bytes:
+            return None
+        errors = errors or "strict"
+        with self._lock:
+            entry = self._lookup(path, stat)
+            if entry is not None:
+                if not as_text:
+                    return entry.data
+                text = entry.texts.get(errors)
+                if text is not None:
+                    return text
+                data = entry.data
+        if entry is None:
+            if not fill:
+                return None
+            with open(path, "rb") as file:
+                stat = os.fstat(file.fileno())
+                data = file.read()
+            if stat.st_mtime_ns > time.time_ns() - RACY_NANOSECONDS:
+                # Could change again without its key changing.
+                return decode_text(data, errors) if as_text else data
+            entry = _Entry(_file_key(stat), data)
+        if not as_text:
+            with self._lock:
+                self._store(path, entry)
+            return data
+        text = decode_text(data, errors)
+        with self._lock:
+            if self._entries.get(path) is entry:
+                # Still cached, add the text to it.
+                entry.texts[errors] = text
+                self._bytes += len(text)
+                self._evict()
+            else:
+                entry.texts[errors] = text
+                self._store(path, entry)
+        return text
+
+    def store(self, path: str, data: bytes) -> None:
+        """Record what a tool just wrote to a file, instead of dropping the entry.
+
+        A write is within the racy window, so the entry is kept only until the window passes.
+
+        Args:
+            path (str): Absolute path of the file.
+            data (bytes): The bytes written.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        if stat.st_size != len(data):
+            # Someone else wrote to it too.
+            self.forget([path])
+            return
+        entry = _Entry(_file_key(stat), data)
+        if stat.st_mtime_ns > time.time_ns() - RACY_NANOSECONDS:
+            entry.racy_until_ns = stat.st_mtime_ns + RACY_NANOSECONDS
+        with self._lock:
+            self._store(path, entry)
+
+    def forget(self, paths: list[str]) -> None:
+        """Drop the entries of changed files.
+
+        Args:
+            paths (list[str]): Absolute paths.
+        """
+        with self._lock:
+            for path in paths:
+                entry = self._entries.pop(path, None)
+                if entry is not None:
+                    self._bytes -= entry.size
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and eviction counts, bytes saved, and the current size.
+
+        Returns:
+            dict[str, int]: The counters, the hit rate in percent.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate_percent": round(100 * self.hits / lookups) if lookups else 0,
+                "bytes_saved": self.bytes_saved,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+@dataclass(slots=True)
+class _Held:
+    """The cache of a root and the budget configured for it."""
+
+    cache: ContentCache
+    configured_bytes: int
+
+
+_total_bytes = DEFAULT_TOTAL_BYTES
+
+
+def _share_total_bytes(held_caches: list[_Held]) -> None:
+    """Size each cache to its configured budget or its share of the total, the lesser."""
+    if not held_caches:
+        return
+    share = _total_bytes // len(held_caches)
+    for held in held_caches:
+        maximum_bytes = min(held.configured_bytes, share)
+        if held.cache.maximum_bytes != maximum_bytes:
+            held.cache.resize(maximum_bytes)
+
+
+_CACHES: RootHolds[_Held] = RootHolds(on_change=_share_total_bytes)
+
+
+def content_cache(root_folder: str, config: Config) -> ContentCache | None:
+    """Hold the content cache of a root folder, creating it on first use. Release it with `release_content_cache`.
+
+    Args:
+        root_folder (str): The root folder.
+        config (Config): Supplies the `content_cache_bytes` budget, 0 turns the cache off, and the
+            `content_cache_total_bytes` budget of all roots together.
+
+    Returns:
+        ContentCache | None: The cache, None when turned off.
+    """
+    # pylint: disable=global-statement
+    global _total_bytes
+    maximum_bytes = int(config.get_value("content_cache_bytes") or DEFAULT_MAXIMUM_BYTES)
+    if maximum_bytes <= 0:
+        return None
+    _total_bytes = int(config.get_value("content_cache_total_bytes") or DEFAULT_TOTAL_BYTES)
+    return _CACHES.hold(root_folder, lambda: _Held(ContentCache(maximum_bytes), maximum_bytes)).cache
+
+
+def release_content_cache(root_folder: str, later: bool = False) -> None:
+    """Let go of the content cache of a root folder, dropping it once no toolkit holds it.
+
+    Args:
+        root_folder (str): The root folder given to `content_cache`.
+        later (bool): Only queue the release, for a finalizer.
+    """
+    _CACHES.release(root_folder, later)
+
+
+def _cache_of(path: str) -> ContentCache | None:
+    """The cache of the deepest root folder the absolute path is in."""
+    found = None
+    found_length = -1
+    for root_folder, held in _CACHES.items():
+        if len(root_folder) > found_length and path.startswith(os.path.join(root_folder, "")):
+            found, found_length = held.cache, len(root_folder)
+    return found
+
+
+def cached_open(path: str, mode: str = "r", errors: str | None = None, fill: bool = True) -> IO:
+    """Open a file for reading through the content cache of its root folder.
+
+    Text is UTF-8 read with universal newlines, as `open` reads it. Without a cache for the root, or for a file
+    too big to cache, the file itself is opened.
+
+    Args:
+        path (str): The file.
+        mode (str): "r" or "rb".
+        errors (str | None): The error handler for text, None for strict.
+        fill (bool): On a miss, read the whole file into the cache. False opens the file itself instead, for a
+            reader that may stop early, e.g. at the first match.
+
+    Returns:
+        IO: A file object, to use as a context manager.
+    """
+    path = os.path.abspath(path)
+    cache = _cache_of(path)
+    if cache is not None:
+        cached = cache.read(path, errors, as_text=mode != "rb", fill=fill)
+        if isinstance(cached, str):
+            return io.StringIO(cached)
+        if cached is not None:
+            return io.BytesIO(cached)
+    if mode == "rb":
+        return open(path, "rb")
+    return open(path, encoding="utf-8", errors=errors)
+
+
+def write_through(path: str, text: str, errors: str | None = None) -> None:
+    """Write text to a file like `open(path, "w", encoding="utf-8")`, report it changed and keep it cached.
+
+    Args:
+        path (str): Absolute path of the file.
+        text (str): The new contents.
+        errors (str | None): The error handler, None for strict.
+    """
+    data = encode_text(text, errors)
+    with open(path, "wb") as file:
+        file.write(data)
+    notify_files_changed([path])
+    cache = _cache_of(os.path.abspath(path))
+    if cache is not None:
+        cache.store(os.path.abspath(path), data)
+
+
+def _forget_changed(paths: list[str]) -> None:
+    """Drop changed files from every content cache."""
+    for _root_folder, held in _CACHES.items():
+        held.cache.forget(paths)
+
+
+add_change_listener(_forget_changed)
@@ -0,0 +1,373 @@
+"""
+Persistent index of the paths, types, sizes and mtimes under a root folder, locate style.
+
+A refresh stats each indexed directory and only lists the ones whose mtime changed, adding or removing an entry
+changes its directory's mtime. File sizes and mtimes in the index are only as fresh as the last listing of their
+directory, so callers that filter on size stat the file itself.
+
+The index is a sqlite database next to the trigram index, see `index_store`.
+"""
+
+import fnmatch
+import logging
+import os
+import sqlite3
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.fingerprint_cache import RACY_NANOSECONDS
+from ai_shell.utils.glob_engine import expand_braces
+from ai_shell.utils.index_store import index_folder
+from ai_shell.utils.walk import is_pruned
+from ai_shell.utils.workspace_watcher import live_watcher
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    name TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    is_dir INTEGER NOT NULL,
+    is_file INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    extension TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_by_parent ON entries (parent);
+CREATE INDEX IF NOT EXISTS entries_by_depth ON entries (depth, path);
+CREATE TABLE IF NOT EXISTS folders (
+    path TEXT PRIMARY KEY,
+    parent TEXT,
+    mtime_ns INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS pruned (
+    path TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    depth INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Bumped when what is recorded changes, an older index is cleared and listed again.
+_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedEntry:
+    """A file or directory from the index, with the parts of the os.DirEntry interface the tools use."""
+
+    path: str
+    name: str
+    directory: bool
+    regular_file: bool
+    size: int
+    mtime_ns: int
+    extension: str
+
+    def is_dir(self) -> bool:
+        """True for directories and symlinks to directories."""
+        return self.directory
+
+    def is_file(self) -> bool:
+        """True for files and symlinks to files."""
+        return self.regular_file
+
+    def stat(self) -> os.stat_result:
+        """Stat the file now, the indexed size and mtime may be stale."""
+        return os.stat(self.path)
+
+
+class FileIndex:
+    """On-disk metadata index of the files and directories under a root folder."""
+
+    def __init__(self, database_path: str, root_folder: str, excluded_folders: frozenset[str] = frozenset()) -> None:
+        """
+        Open, creating if needed, the index database.
+
+        Args:
+            database_path (str): The sqlite file to keep the index in.
+            root_folder (str): The folder that is indexed.
+            excluded_folders (frozenset[str]): Folder names left out of the index, like hidden entries.
+        """
+        self.database_path = database_path
+        self.root_folder = os.path.abspath(root_folder)
+        self.excluded_folders = excluded_folders
+        # Writing the database changes its folder, which would otherwise be listed again on every refresh.
+        self._database_folder = os.path.dirname(os.path.abspath(database_path))
+        self.connection = sqlite3.connect(database_path, timeout=30)
+        self.connection.executescript(_SCHEMA)
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            self.clear()
+            self.connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def __enter__(self) -> "FileIndex":
+        """Use as a context manager that closes the database."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the database."""
+        self.close()
+
+    def clear(self) -> None:
+        """Forget everything, the next refresh lists every directory."""
+        with self.connection:
+            self.connection.execute("DELETE FROM entries")
+            self.connection.execute("DELETE FROM folders")
+            self.connection.execute("DELETE FROM pruned")
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the index up to date, listing only the directories whose mtime changed.
+
+        Under a live workspace watcher only the folders it reported are checked, nothing else is even stat'ed.
+
+        Returns:
+            dict[str, int]: How many folders were checked, listed again and dropped.
+        """
+        watcher = live_watcher(self.root_folder)
+        changed = watcher.changed_folders(self.database_path) if watcher else None
+        if changed is not None:
+            return self._refresh_folders(changed)
+        known = dict(self.connection.execute("SELECT path, mtime_ns FROM folders"))
+        subfolders: defaultdict[str, list[str]] = defaultdict(list)
+        for path, parent in self.connection.execute("SELECT path, parent FROM folders WHERE parent IS NOT NULL"):
+            subfolders[parent].append(path)
+        racy_after = time.time_ns() - RACY_NANOSECONDS
+        seen: set[str] = set()
+        listed = 0
+        with self.connection:
+            stack = [""]
+            while stack:
+                folder = stack.pop()
+                try:
+                    mtime_ns = os.stat(os.path.join(self.root_folder, folder)).st_mtime_ns
+                except OSError:
+                    continue
+                seen.add(folder)
+                if known.get(folder) == mtime_ns:
+                    stack.extend(subfolders[folder])
+                    continue
+                listed += 1
+                # A directory changed this recently could change again without its mtime moving, list it next time.
+                stack.extend(self._list_folder(folder, -1 if mtime_ns > racy_after else mtime_ns))
+            gone = set(known) - seen
+            for folder in gone:
+                self.connection.execute("DELETE FROM folders WHERE path = ?", (folder,))
+                self.connection.execute("DELETE FROM entries WHERE parent = ?", (folder,))
+                self.connection.execute("DELETE FROM pruned WHERE parent = ?", (folder,))
+        logger.debug(f"File index checked {len(seen)} folders, listed {listed}, dropped {len(gone)}")
+        return {"folders": len(seen), "listed": listed, "dropped": len(gone)}
+
+    def _refresh_folders(self, folders: set[str]) -> dict[str, int]:
+        """List again the folders a watcher reported, and any new folders under them.
+
+        Args:
+            folders (set[str]): Absolute paths of folders whose entries changed.
+
+        Returns:
+            dict[str, int]: How many folders were checked, listed again and dropped.
+        """
+        known = dict(self.connection.execute("SELECT path, mtime_ns FROM folders"))
+        racy_after = time.time_ns() - RACY_NANOSECONDS
+        listed = dropped = 0
+        with self.connection:
+            for absolute_folder in sorted(folders):
+                folder = os.path.relpath(absolute_folder, self.root_folder).replace(os.sep, "/")
+                folder = "" if folder == "." else folder
+                parts = folder.split("/") if folder else []
+                if any(part == ".." or part.startswith(".") or part == "__pycache__" for part in parts):
+                    continue
+                if any(part in self.excluded_folders for part in parts):
+                    continue
+                try:
+                    mtime_ns = os.stat(absolute_folder).st_mtime_ns
+                except OSError:
+                    mtime_ns = None
+                if mtime_ns is None or not os.path.isdir(absolute_folder):
+                    if folder in known:
+                        dropped += self._drop_folder(folder)
+                    continue
+                stack = [(folder, mtime_ns)]
+                while stack:
+                    folder, mtime_ns = stack.pop()
+                    listed += 1
+                    for subfolder in self._list_folder(folder, -1 if mtime_ns > racy_after else mtime_ns):
+                        if subfolder not in known:
+                            # New, so nothing under it is indexed yet either.
+                            stack.append((subfolder, os.stat(os.path.join(self.root_folder, subfolder)).st_mtime_ns))
+                    known[folder] = mtime_ns
+        logger.debug(f"File index listed {listed} reported folders, dropped {dropped}")
+        return {"folders": len(folders), "listed": listed, "dropped": dropped}
+
+    def _drop_folder(self, folder: str) -> int:
+        """Forget a folder and everything under it, inside the caller's transaction.
+
+        Args:
+            folder (str): "/" separated path relative to the root.
+
+        Returns:
+            int: How many folders were dropped.
+        """
+        # Every path under folder sorts between "folder/" and "folder0", "0" being the character after "/".
+        below = (folder + "/", folder + "0")
+        for table in ("entries", "pruned"):
+            self.connection.execute(
+                f"DELETE FROM {table} WHERE parent = ? OR (parent >= ? AND parent < ?)", (folder, *below)  # nosec
+            )
+        cursor = self.connection.execute(
+            "DELETE FROM folders WHERE path = ? OR (path >= ? AND path < ?)", (folder, *below)
+        )
+        return cursor.rowcount
+
+    def _list_folder(self, folder: str, mtime_ns: int) -> list[str]:
+        """(Re)write the entries of one folder, inside the caller's transaction.
+
+        Args:
+            folder (str): "/" separated path relative to the root, "" for the root itself.
+            mtime_ns (int): The folder's mtime to record, -1 to list it again on the next refresh.
+
+        Returns:
+            list[str]: The subfolders to descend into, symlinks to folders are not followed.
+        """
+        try:
+            with os.scandir(os.path.join(self.root_folder, folder)) as entries:
+                listing = list(entries)
+        except OSError as error:
+            logger.warning(f"Not indexing {folder}: {error}")
+            listing = []
+        prefix = folder + "/" if folder else ""
+        depth = prefix.count("/")
+        rows = []
+        descend = []
+        pruned = []
+        for entry in listing:
+            if is_pruned(entry, self.excluded_folders) or entry.path == self._database_folder:
+                if not entry.name.startswith("."):
+                    # Not indexed, but globs without a leading "." match it, see glob().
+                    pruned.append((prefix + entry.name, folder, depth))
+                continue
+            relative_path = prefix + entry.name
+            try:
+                stat = entry.stat()
+                size, entry_mtime_ns = stat.st_size, stat.st_mtime_ns
+            except OSError:
+                # e.g. a broken symlink
+                size = entry_mtime_ns = -1
+            is_dir = entry.is_dir()
+            extension = "" if is_dir else os.path.splitext(entry.name)[1].lower()
+            rows.append(
+                (relative_path, folder, entry.name, depth, is_dir, entry.is_file(), size, entry_mtime_ns, extension)
+            )
+            if entry.is_dir(follow_symlinks=False):
+                descend.append(relative_path)
+        self.connection.execute("DELETE FROM entries WHERE parent = ?", (folder,))
+        self.connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self.connection.execute("DELETE FROM pruned WHERE parent = ?", (folder,))
+        self.connection.executemany("INSERT INTO pruned VALUES (?, ?, ?)", pruned)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO folders (path, parent, mtime_ns) VALUES (?, ?, ?)",
+            (folder, os.path.dirname(folder) if folder else None, mtime_ns),
+        )
+        return descend
+
+    def entries(self) -> Iterator[tuple[str, IndexedEntry]]:
+        """Yield every indexed entry with its "/" separated relative path, in sorted path order like scan_tree.
+
+        Yields:
+            tuple[str, IndexedEntry]: The relative path and the entry.
+        """
+        rows = self.connection.execute(
+            "SELECT path, name, is_dir, is_file, size, mtime_ns, extension FROM entries ORDER BY path"
+        )
+        for path, name, is_dir, is_file, size, mtime_ns, extension in rows:
+            absolute_path = os.path.join(self.root_folder, path)
+            yield path, IndexedEntry(absolute_path, name, bool(is_dir), bool(is_file), size, mtime_ns, extension)
+
+    def glob(self, pattern: str) -> list[str] | None:
+        """Answer a non-recursive glob relative to the root, like glob.glob(pattern, root_dir=root).
+
+        Args:
+            pattern (str): A "/" separated glob pattern.
+
+        Returns:
+            list[str] | None: The matching paths, sorted, or None if the index can't answer this pattern, e.g. it
+                names hidden files, which aren't indexed, uses ** or {a,b}, or matches a folder inside __pycache__
+                or an excluded folder.
+        """
+        segments = pattern.split("/")
+        if (
+            os.path.isabs(pattern)
+            or "\\" in pattern
+            or any(not segment or segment[0] == "." or segment == "**" for segment in segments)
+            or len(expand_braces(pattern)) > 1
+        ):
+            return None
+        depth = len(segments) - 1
+
+        def matches(path: str) -> bool:
+            return all(fnmatch.fnmatch(part, segment) for part, segment in zip(path.split("/"), segments, strict=False))
+
+        found = []
+        # The pruned entries are recorded but not what's in them: one matched as a folder on the way means the
+        # index doesn't know the answer, one matched last is part of it.
+        for path, pruned_depth in self.connection.execute("SELECT path, depth FROM pruned WHERE depth <= ?", (depth,)):
+            if matches(path):
+                if pruned_depth < depth:
+                    return None
+                found.append(path)
+        rows = self.connection.execute("SELECT path FROM entries WHERE depth = ?", (depth,))
+        found.extend(path for (path,) in rows if matches(path))
+        return sorted(found)
+
+    def extensions(self) -> Counter[str]:
+        """Count the files by extension.
+
+        Returns:
+            Counter[str]: Lower-cased extension, e.g. ".py", to number of files.
+        """
+        rows = self.connection.execute("SELECT extension, COUNT(*) FROM entries WHERE is_dir = 0 GROUP BY extension")
+        return Counter(dict(rows))
+
+    def summary(self) -> dict[str, object]:
+        """Describe what is in the index.
+
+        Returns:
+            dict[str, object]: The database path, file and directory counts, total bytes and the top extensions.
+        """
+        files, directories, total_bytes = self.connection.execute(
+            "SELECT COALESCE(SUM(is_dir = 0), 0), COALESCE(SUM(is_dir), 0), COALESCE(SUM(MAX(size, 0)), 0) "
+            "FROM entries"
+        ).fetchone()
+        return {
+            "database": self.database_path,
+            "root_folder": self.root_folder,
+            "files": files,
+            "directories": directories,
+            "bytes": total_bytes,
+            "extensions": dict(self.extensions().most_common(10)),
+        }
+
+
+def open_file_index(root_folder: str, config: Config) -> FileIndex:
+    """Open the file index of a root folder, in the index folder from config.
+
+    Args:
+        root_folder (str): The root folder, a file means the folder it is in.
+        config (Config): The developer input that bot shouldn't set.
+
+    Returns:
+        FileIndex: The index, not yet refreshed.
+    """
+    root_folder = os.path.abspath(root_folder)
+    if os.path.isfile(root_folder):
+        root_folder = os.path.dirname(root_folder)
+    database = os.path.join(index_folder(root_folder, config), "files.sqlite3")
+    return FileIndex(database, root_folder, frozenset(config.get_list("excluded_folders")))
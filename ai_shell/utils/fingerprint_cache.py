@@ -0,0 +1,228 @@
+"""
+Bounded LRU caches of results that stay valid only while the files they were computed from are unchanged.
+
+A result is stored with the (path, mtime_ns, size) fingerprints of its input files and is only returned if the
+caller's fresh fingerprints are identical. Entries are also dropped as soon as a write tool reports touching one
+of their files. One cache per root folder and purpose is shared by every tool instance in the process.
+"""
+
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+from ai_shell.utils.change_events import add_change_listener
+
+Fingerprint = tuple[str, int, int]
+
+# Timestamps are coarse on some file systems, a file written this recently could change again without its
+# fingerprint changing, so results computed from it are not stored. The same "racy" rule git uses for its index.
+RACY_NANOSECONDS = 2_000_000_000
+
+
+def fingerprint_files(paths: Iterable[str]) -> tuple[Fingerprint, ...]:
+    """Stat the files, a file that is gone gets a size of -1.
+
+    Args:
+        paths (Iterable[str]): The files.
+
+    Returns:
+        tuple[Fingerprint, ...]: (absolute path, mtime_ns, size) per file, in the same order.
+    """
+    fingerprints = []
+    for path in paths:
+        absolute_path = os.path.abspath(path)
+        try:
+            stat = os.stat(absolute_path)
+        except OSError:
+            fingerprints.append((absolute_path, -1, -1))
+            continue
+        fingerprints.append((absolute_path, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprints)
+
+
+def unverified_fingerprints(paths: Iterable[str]) -> tuple[Fingerprint, ...]:
+    """Fingerprints without a stat, for files a live watcher reports changes of.
+
+    Args:
+        paths (Iterable[str]): The files.
+
+    Returns:
+        tuple[Fingerprint, ...]: (absolute path, 0, 0) per file, in the same order.
+    """
+    return tuple((os.path.abspath(path), 0, 0) for path in paths)
+
+
+def watched_fingerprints(paths: Iterable[str], watches_folder: Callable[[str], bool]) -> tuple[Fingerprint, ...]:
+    """Fingerprints without a stat for the files in folders a live watcher watches, stat'ed for the others.
+
+    Args:
+        paths (Iterable[str]): The files.
+        watches_folder (Callable[[str], bool]): True for an absolute folder whose changes are known live, e.g.
+            `WorkspaceWatcher.watches_folder`.
+
+    Returns:
+        tuple[Fingerprint, ...]: The fingerprints, in the same order.
+    """
+    fingerprints = []
+    for path in paths:
+        absolute_path = os.path.abspath(path)
+        if watches_folder(os.path.dirname(absolute_path)):
+            fingerprints.append((absolute_path, 0, 0))
+        else:
+            fingerprints.extend(fingerprint_files([absolute_path]))
+    return tuple(fingerprints)
+
+
+class FingerprintCache:
+    """LRU cache of values keyed by a hashable key, each valid for one set of file fingerprints."""
+
+    def __init__(self, maximum_entries: int = 128, copy_values: bool = True) -> None:
+        """
+        Create an empty cache.
+
+        Args:
+            maximum_entries (int): Least recently used entries are evicted beyond this many.
+            copy_values (bool): Store and return copies, False for values nobody can mutate, e.g. tuples of str.
+        """
+        self.maximum_entries = maximum_entries
+        self.copy_values = copy_values
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.generation = 0
+        """Counts invalidations, see `put`."""
+        self._entries: OrderedDict[Hashable, tuple[tuple[Fingerprint, ...], frozenset[str], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, fingerprints: tuple[Fingerprint, ...]) -> Any | None:
+        """Return a copy of the value stored for key if the files still have these fingerprints.
+
+        Args:
+            key (Hashable): What was computed, e.g. the query and its options.
+            fingerprints (tuple[Fingerprint, ...]): The current fingerprints of the input files.
+
+        Returns:
+            Any | None: The value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != fingerprints:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[2]
+        # Callers may mutate what they get, the cached copy must stay as computed.
+        return copy.deepcopy(value) if self.copy_values else value
+
+    def put(
+        self, key: Hashable, fingerprints: tuple[Fingerprint, ...], value: Any, generation: int | None = None
+    ) -> bool:
+        """Store a copy of value for key, unless one of the files changed too recently to trust its fingerprint.
+
+        Args:
+            key (Hashable): What was computed.
+            fingerprints (tuple[Fingerprint, ...]): The fingerprints of the input files when value was computed.
+            value (Any): The result.
+            generation (int | None): The cache's generation when computing started. If any invalidation happened
+                since, the value may be stale and is not stored. Needed when the fingerprints carry no mtimes.
+
+        Returns:
+            bool: True if stored.
+        """
+        if self.maximum_entries <= 0:
+            return False
+        if generation is not None and generation != self.generation:
+            return False
+        racy_after = time.time_ns() - RACY_NANOSECONDS
+        if any(mtime_ns > racy_after for _path, mtime_ns, _size in fingerprints):
+            return False
+        paths = frozenset(path for path, _mtime_ns, _size in fingerprints)
+        stored = copy.deepcopy(value) if self.copy_values else value
+        with self._lock:
+            self._entries[key] = (fingerprints, paths, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maximum_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def invalidate(self, paths: Iterable[str]) -> int:
+        """Drop every entry computed from any of the files.
+
+        Args:
+            paths (Iterable[str]): Absolute paths of changed files.
+
+        Returns:
+            int: How many entries were dropped.
+        """
+        changed = set(paths)
+        with self._lock:
+            self.generation += 1
+            stale = [
+                key for key, (_fingerprints, entry_paths, _value) in self._entries.items() if entry_paths & changed
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and eviction counts and the current size.
+
+        Returns:
+            dict[str, int]: The counters.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+            }
+
+
+_CACHES: dict[tuple[str, str], FingerprintCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def shared_cache(
+    root_folder: str, purpose: str, maximum_entries: int = 128, copy_values: bool = True
+) -> FingerprintCache:
+    """Return the process wide cache for a root folder and purpose, creating it on first use.
+
+    Args:
+        root_folder (str): The root folder the cached results are about.
+        purpose (str): What is cached, e.g. "grep".
+        maximum_entries (int): Size bound, used when the cache is created.
+        copy_values (bool): Whether the cache copies values, used when the cache is created.
+
+    Returns:
+        FingerprintCache: The cache.
+    """
+    key = (os.path.abspath(root_folder), purpose)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = _CACHES[key] = FingerprintCache(maximum_entries, copy_values)
+        return cache
+
+
+def _invalidate_shared_caches(paths: list[str]) -> None:
+    """Drop entries about changed files from every shared cache."""
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+    for cache in caches:
+        cache.invalidate(paths)
+
+
+add_change_listener(_invalidate_shared_caches)
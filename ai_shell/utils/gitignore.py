@@ -0,0 +1,397 @@
+"""
+.gitignore matching without shelling out to git.
+
+Follows gitignore(5): nested .gitignore files and .git/info/exclude, "!" negation, trailing "/" for folders only,
+patterns with a "/" anchored to their file's folder, "**" for any number of folders, and last matching rule wins,
+deeper files overriding shallower ones. Nothing inside an ignored folder can be re-included, the way git never
+looks inside one.
+
+Each ignore file is compiled into two regexes, one for files and one for folders, with the rules as alternatives
+in reverse order so the first alternative that matches is the last rule. Compiled files are shared by the whole
+process and recompiled only when their mtime or size changes.
+"""
+
+import os
+import re
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from ai_shell.utils.config_manager import Config
+
+
+def _translate_segment(segment: str) -> str:
+    """Regex source for one "/" separated part of a pattern, where wildcards never match "/"."""
+    output = []
+    position = 0
+    while position < len(segment):
+        char = segment[position]
+        if char == "\\" and position + 1 < len(segment):
+            output.append(re.escape(segment[position + 1]))
+            position += 2
+            continue
+        if char == "*":
+            output.append("[^/]*")
+        elif char == "?":
+            output.append("[^/]")
+        elif char == "[":
+            end = position + 1
+            if end < len(segment) and segment[end] in "!^":
+                end += 1
+            if end < len(segment) and segment[end] == "]":
+                end += 1
+            while end < len(segment) and segment[end] != "]":
+                end += 1
+            if end >= len(segment):
+                output.append(re.escape(char))
+            else:
+                content = segment[position + 1 : end].replace("\\", "\\\\")
+                if content[0] in "!^":
+                    output.append("[^/" + content[1:] + "]")
+                else:
+                    output.append("[" + content + "]")
+                position = end + 1
+                continue
+        else:
+            output.append(re.escape(char))
+        position += 1
+    return "".join(output)
+
+
+def translate(pattern: str) -> str:
+    r"""Regex source for a gitignore pattern, matched against a path relative to the ignore file's folder.
+
+    The pattern has its "!" and trailing "/" already removed.
+
+    Args:
+        pattern (str): The pattern.
+
+    Returns:
+        str: Regex source to use with fullmatch.
+
+    Examples:
+        >>> translate("*.log")
+        '(?:.*/)?[^/]*\\.log'
+        >>> translate("/build")
+        'build'
+        >>> translate("docs/**/*.md")
+        'docs/(?:.*/)?[^/]*\\.md'
+    """
+    # Only a "/" at the start or in the middle anchors a pattern to its folder.
+    anchored = "/" in pattern
+    parts = pattern.lstrip("/").split("/")
+    output = [] if anchored else ["(?:.*/)?"]
+    for index, part in enumerate(parts):
+        last = index == len(parts) - 1
+        if part == "**":
+            output.append(".*" if last else "(?:.*/)?")
+        else:
+            output.append(_translate_segment(part) + ("" if last else "/"))
+    return "".join(output)
+
+
+@dataclass(frozen=True, slots=True)
+class IgnoreRule:
+    """One line of an ignore file."""
+
+    pattern: str
+    negated: bool
+    folders_only: bool
+
+
+def parse_ignore_lines(lines: Iterable[str]) -> list[IgnoreRule]:
+    """Parse the lines of an ignore file, skipping blank lines and comments.
+
+    Args:
+        lines (Iterable[str]): The lines.
+
+    Returns:
+        list[IgnoreRule]: The rules, in file order.
+    """
+    rules = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        # Trailing spaces are dropped unless escaped with a backslash.
+        stripped = line.rstrip(" ")
+        if stripped.endswith("\\") and len(stripped) < len(line):
+            stripped += " "
+        line = stripped
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith(("\\!", "\\#")):
+            line = line[1:]
+        folders_only = line.endswith("/")
+        line = line.rstrip("/")
+        if line:
+            rules.append(IgnoreRule(line, negated, folders_only))
+    return rules
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledIgnoreFile:
+    """The rules of one folder's ignore files, compiled."""
+
+    files: re.Pattern[str] | None
+    folders: re.Pattern[str] | None
+    # Whether each alternative, i.e. regex group, is a negation.
+    file_negations: tuple[bool, ...]
+    folder_negations: tuple[bool, ...]
+
+    @classmethod
+    def compile(cls, rules: list[IgnoreRule]) -> "CompiledIgnoreFile":
+        """Compile rules, later rules taking precedence.
+
+        Args:
+            rules (list[IgnoreRule]): The rules, in file order.
+
+        Returns:
+            CompiledIgnoreFile: The compiled rules.
+        """
+        latest_first = rules[::-1]
+        file_rules = [rule for rule in latest_first if not rule.folders_only]
+
+        def combine(chosen: list[IgnoreRule]) -> re.Pattern[str] | None:
+            if not chosen:
+                return None
+            return re.compile("|".join(f"({translate(rule.pattern)})" for rule in chosen), re.DOTALL)
+
+        return cls(
+            combine(file_rules),
+            combine(latest_first),
+            tuple(rule.negated for rule in file_rules),
+            tuple(rule.negated for rule in latest_first),
+        )
+
+    def decide(self, relative_path: str, is_folder: bool) -> bool | None:
+        """Apply the rules to a path relative to their folder.
+
+        Args:
+            relative_path (str): "/" separated path.
+            is_folder (bool): Whether the path is a folder, folder-only rules skip files.
+
+        Returns:
+            bool | None: True if ignored, False if re-included by a negation, None if no rule matches.
+        """
+        regex, negations = (self.folders, self.folder_negations) if is_folder else (self.files, self.file_negations)
+        if regex is None:
+            return None
+        match = regex.fullmatch(relative_path)
+        if match is None or match.lastindex is None:
+            return None
+        return not negations[match.lastindex - 1]
+
+
+_COMPILED: dict[str, tuple[tuple[tuple[int, int], ...], CompiledIgnoreFile | None]] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def _compiled_rules(paths: tuple[str, ...]) -> CompiledIgnoreFile | None:
+    """Compile the ignore files of one folder, reusing the process wide copy while they are unchanged."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signature.append((-1, -1))
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    key = "\0".join(paths)
+    with _COMPILED_LOCK:
+        cached = _COMPILED.get(key)
+    if cached is not None and cached[0] == tuple(signature):
+        return cached[1]
+    rules: list[IgnoreRule] = []
+    for path, (_mtime, size) in zip(paths, signature, strict=True):
+        if size < 0:
+            continue
+        try:
+            with open(path, encoding="utf-8", errors="surrogateescape") as handle:
+                rules.extend(parse_ignore_lines(handle))
+        except OSError:
+            continue
+    compiled = CompiledIgnoreFile.compile(rules) if rules else None
+    with _COMPILED_LOCK:
+        _COMPILED[key] = (tuple(signature), compiled)
+    return compiled
+
+
+def is_ignored_by(ignore_file: str, path: str) -> bool:
+    """True if the rules of one ignore file, on their own, ignore a path.
+
+    Args:
+        ignore_file (str): Absolute path of the ignore file, its rules relative to its folder.
+        path (str): Absolute path.
+
+    Returns:
+        bool: True if the path, or a folder it is in, is ignored. Paths outside the file's folder aren't.
+    """
+    rules = _compiled_rules((ignore_file,))
+    relative = os.path.relpath(path, os.path.dirname(ignore_file))
+    if rules is None or relative == os.curdir or relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return False
+    parts = relative.replace(os.sep, "/").split("/")
+    for end in range(1, len(parts)):
+        if rules.decide("/".join(parts[:end]), True):
+            return True
+    return bool(rules.decide(relative.replace(os.sep, "/"), os.path.isdir(path)))
+
+
+def repository_top(folder: str) -> str:
+    """The nearest folder at or above folder that has a .git, or folder itself outside a repository.
+
+    Args:
+        folder (str): An absolute folder.
+
+    Returns:
+        str: The folder whose ignore rules apply from the top.
+    """
+    current = folder
+    while True:
+        if os.path.exists(os.path.join(current, ".git")):
+            return current
+        parent = os.path.dirname(current)
+        if parent == current:
+            return folder
+        current = parent
+
+
+class GitIgnore:
+    """Answers whether paths under a root folder are ignored, by every ignore file from the repository top down.
+
+    Cheap to create. Each ignore file is checked for changes once per instance, so make one per tool call.
+    """
+
+    def __init__(self, root_folder: str) -> None:
+        """
+        Find the repository the root folder belongs to.
+
+        Args:
+            root_folder (str): The folder relative paths are relative to. A file means its folder.
+        """
+        root_folder = os.path.abspath(root_folder)
+        if os.path.isfile(root_folder):
+            root_folder = os.path.dirname(root_folder)
+        self.root_folder = root_folder
+        self.top = repository_top(root_folder)
+        self._top_prefix = self.top if self.top.endswith(os.sep) else self.top + os.sep
+        self._rules: dict[str, CompiledIgnoreFile | None] = {}
+        self._ignored_folders: dict[str, bool] = {}
+
+    def _rules_for(self, folder: str) -> CompiledIgnoreFile | None:
+        """The compiled ignore files of a folder given relative to the top, "" or ending in "/"."""
+        if folder not in self._rules:
+            absolute_folder = os.path.join(self.top, folder)
+            paths: tuple[str, ...] = (os.path.join(absolute_folder, ".gitignore"),)
+            if not folder:
+                # Lower precedence than the top .gitignore, so read first.
+                paths = (os.path.join(self.top, ".git", "info", "exclude"),) + paths
+            self._rules[folder] = _compiled_rules(paths)
+        return self._rules[folder]
+
+    def _decide(self, relative_path: str, is_folder: bool) -> bool:
+        """Apply the ignore files of every folder above a top-relative path, deepest first, parents unchecked."""
+        if relative_path == ".git" or relative_path.endswith("/.git"):
+            return True
+        cut = len(relative_path)
+        while cut > 0:
+            cut = relative_path.rfind("/", 0, cut)
+            folder = relative_path[: cut + 1]
+            rules = self._rules_for(folder)
+            if rules is not None:
+                decision = rules.decide(relative_path[cut + 1 :], is_folder)
+                if decision is not None:
+                    return decision
+        return False
+
+    def _top_relative(self, path: str) -> str | None:
+        """The "/" separated path relative to the top, None for the top itself or paths outside it."""
+        path = os.path.normpath(path)
+        if not path.startswith(self._top_prefix):
+            return None
+        relative = path[len(self._top_prefix) :]
+        return relative.replace(os.sep, "/") if os.altsep else relative
+
+    def is_ignored(self, path: str, is_folder: bool | None = None, check_parents: bool = True) -> bool:
+        """True if git would ignore the path.
+
+        Args:
+            path (str): A path relative to the root folder, or absolute. A trailing "/" marks a folder.
+            is_folder (bool | None): Whether it's a folder, None to look.
+            check_parents (bool): Also check the folders above it, walkers that prune ignored folders don't need to.
+
+        Returns:
+            bool: True if the path, or a folder it is in, is ignored. Paths outside the repository aren't.
+        """
+        if is_folder is None and path.endswith(("/", os.sep)):
+            is_folder = True
+        absolute_path = path if os.path.isabs(path) else os.path.join(self.root_folder, path)
+        relative = self._top_relative(absolute_path)
+        if relative is None:
+            return False
+        if is_folder is None:
+            is_folder = os.path.isdir(absolute_path)
+        if check_parents:
+            cut = relative.find("/")
+            while cut != -1:
+                folder = relative[:cut]
+                ignored = self._ignored_folders.get(folder)
+                if ignored is None:
+                    ignored = self._ignored_folders[folder] = self._decide(folder, True)
+                if ignored:
+                    return True
+                cut = relative.find("/", cut + 1)
+        return self._decide(relative, is_folder)
+
+    def filter_ignored(self, paths: Iterable[str]) -> list[str]:
+        """Drop the ignored paths, checking each folder they share only once.
+
+        Args:
+            paths (Iterable[str]): Paths relative to the root folder, or absolute.
+
+        Returns:
+            list[str]: The paths git would not ignore, in the same order.
+        """
+        return [path for path in paths if not self.is_ignored(path)]
+
+    def skip_entry(self, entry: os.DirEntry) -> bool:
+        """A skip function for `scan_tree` and `DirectoryLister`, which never enter ignored folders.
+
+        Args:
+            entry (os.DirEntry): The entry, its path relative to the current folder or absolute.
+
+        Returns:
+            bool: True if the entry is ignored.
+        """
+        try:
+            is_folder = entry.is_dir()
+        except OSError:
+            is_folder = False
+        return self.is_ignored(os.path.abspath(entry.path), is_folder, check_parents=False)
+
+    def skip_path(self, relative_path: str, is_folder: bool) -> bool:
+        """A skip function for the glob engine's walk, which never enters ignored folders.
+
+        Args:
+            relative_path (str): "/" separated path relative to the root folder.
+            is_folder (bool): Whether it's a folder.
+
+        Returns:
+            bool: True if the path is ignored.
+        """
+        return self.is_ignored(relative_path, is_folder, check_parents=False)
+
+
+def gitignore_for(root_folder: str, config: Config) -> GitIgnore | None:
+    """The matcher the listing tools prune with, if the respect_gitignore config flag is set.
+
+    Args:
+        root_folder (str): The root folder.
+        config (Config): Supplies the respect_gitignore flag.
+
+    Returns:
+        GitIgnore | None: A fresh matcher, or None when ignore files aren't respected.
+    """
+    return GitIgnore(root_folder) if config.get_flag("respect_gitignore", False) else None
@@ -0,0 +1,407 @@
+"""
+Compiled globs for the tools that take file patterns.
+
+One call can take several patterns, each with {a,b} alternatives and ** for any number of folders, plus
+exclusions, written as "!pattern" or passed separately, a bare name like "node_modules" is excluded at any depth.
+They are all matched in a single walk of the root
+folder. Folders that no pattern can match under, or that an exclusion matches, are never listed, and
+segments without wildcards are looked up with one stat instead of a listing.
+
+Patterns are normalized against the root folder when compiled, and the walk only ever joins names it listed
+onto the root, so every path it yields is inside the root folder without checking each one. Like glob.glob,
+wildcards don't match names starting with "." unless the pattern segment does, ** doesn't enter hidden
+folders, and symlinked folders are not followed by **.
+"""
+
+import fnmatch
+import functools
+import logging
+import os
+import posixpath
+import re
+import stat
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = re.compile(r"[*?[]")
+
+# A segment is a literal name, a compiled wildcard, or None for **.
+_Segment = str | re.Pattern[str] | None
+# (pattern number, segment position)
+_State = tuple[int, int]
+# Called with a "/" separated path relative to the root and whether it's a folder.
+SkipPath = Callable[[str, bool], bool]
+
+
+def _split_alternatives(text: str) -> list[str]:
+    """Split brace contents on the commas that aren't inside nested braces."""
+    alternatives = []
+    depth = 0
+    start = 0
+    for position, char in enumerate(text):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+        elif char == "," and depth == 0:
+            alternatives.append(text[start:position])
+            start = position + 1
+    alternatives.append(text[start:])
+    return alternatives
+
+
+def expand_braces(pattern: str) -> list[str]:
+    """Expand {a,b} alternatives, nested ones too. Braces without a comma are left as they are.
+
+    Args:
+        pattern (str): The pattern.
+
+    Returns:
+        list[str]: The patterns it stands for, in order.
+
+    Examples:
+        >>> expand_braces("src/{a,b}/*.{py,md}")
+        ['src/a/*.py', 'src/a/*.md', 'src/b/*.py', 'src/b/*.md']
+        >>> expand_braces("{x}/{y,z{1,2}}")
+        ['{x}/y', '{x}/z1', '{x}/z2']
+    """
+    depth = 0
+    start = 0
+    for position, char in enumerate(pattern):
+        if char == "{":
+            if depth == 0:
+                start = position
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                alternatives = _split_alternatives(pattern[start + 1 : position])
+                if len(alternatives) > 1:
+                    prefix, suffix = pattern[:start], pattern[position + 1 :]
+                    return [
+                        expanded
+                        for alternative in alternatives
+                        for expanded in expand_braces(prefix + alternative + suffix)
+                    ]
+    return [pattern]
+
+
+def has_magic(pattern: str) -> bool:
+    """True if the pattern has wildcards or brace alternatives, i.e. it isn't just a path.
+
+    Examples:
+        >>> has_magic("src/*.py"), has_magic("src/{a,b}.py"), has_magic("src/a.py")
+        (True, True, False)
+    """
+    return bool(_MAGIC.search(pattern)) or len(expand_braces(pattern)) > 1
+
+
+def _compile_segment(segment: str) -> _Segment:
+    """Compile one "/" separated part of a pattern."""
+    if segment == "**":
+        return None
+    if not _MAGIC.search(segment):
+        return segment
+    hidden_guard = "" if segment.startswith(".") else r"(?!\.)"
+    return re.compile(hidden_guard + fnmatch.translate(segment))
+
+
+def _segment_matches(segment: _Segment, name: str) -> bool:
+    """True if a literal or wildcard segment matches a name."""
+    if isinstance(segment, str):
+        return segment == name
+    return segment is not None and segment.match(name) is not None
+
+
+def _full_match(segments: tuple[_Segment, ...], parts: Sequence[str]) -> bool:
+    """True if the segments match a whole path given as its parts, ** matching any number of them."""
+    if not segments:
+        return not parts
+    segment = segments[0]
+    if segment is None:
+        return any(_full_match(segments[1:], parts[skip:]) for skip in range(len(parts) + 1))
+    return bool(parts) and _segment_matches(segment, parts[0]) and _full_match(segments[1:], parts[1:])
+
+
+@dataclass(frozen=True, slots=True)
+class _Pattern:
+    """A brace-free pattern, relative to the root folder."""
+
+    segments: tuple[_Segment, ...]
+    # Yield absolute paths, because the pattern was absolute.
+    absolute: bool
+    # A trailing "/" only matches folders.
+    folders_only: bool
+    # Position of the pattern it was expanded from, in the patterns given.
+    source: int
+
+
+def _relative_to_root(pattern: str, root_folder: str) -> str | None:
+    """Normalize a pattern to a "/" separated one relative to the root, None if it points outside the root."""
+    if os.altsep:
+        pattern = pattern.replace(os.sep, "/")
+    if os.path.isabs(pattern):
+        try:
+            pattern = os.path.relpath(pattern, root_folder).replace(os.sep, "/")
+        except ValueError:
+            # On another drive.
+            return None
+    pattern = posixpath.normpath(pattern)
+    if pattern == ".." or pattern.startswith(("../", "/")):
+        return None
+    return pattern
+
+
+class CompiledGlob:
+    """Glob patterns and exclusions, compiled for one root folder. Get one from `compile_glob`."""
+
+    def __init__(self, patterns: Sequence[str], root_folder: str, exclude: Sequence[str] = ()) -> None:
+        """
+        Compile the patterns.
+
+        Args:
+            patterns (Sequence[str]): Glob patterns, relative to the root folder or absolute. Patterns starting
+                with "!" are exclusions.
+            root_folder (str): The absolute root folder.
+            exclude (Sequence[str]): More exclusions. A folder that matches one is not entered. Exclusions
+                without a "/", like "node_modules" or "*.md", match at any depth.
+        """
+        self.root_folder = root_folder
+        self.patterns: list[_Pattern] = []
+        # The pattern naming the root itself, which tools given a file as their root folder glob for.
+        self.root_pattern: _Pattern | None = None
+        self.exclusions: list[tuple[_Segment, ...]] = []
+        for source, text in enumerate(patterns):
+            if text.startswith("!"):
+                self._add_exclusion(text[1:])
+                continue
+            for expanded in expand_braces(text):
+                relative = _relative_to_root(expanded, root_folder)
+                if relative is None:
+                    logger.warning(f"Pattern {expanded} is not in root folder {root_folder}")
+                    continue
+                pattern = _Pattern(
+                    tuple(_compile_segment(segment) for segment in relative.split("/")),
+                    os.path.isabs(expanded),
+                    expanded.endswith(("/", os.sep)),
+                    source,
+                )
+                if relative == ".":
+                    self.root_pattern = self.root_pattern or pattern
+                else:
+                    self.patterns.append(pattern)
+        for text in exclude:
+            self._add_exclusion(text)
+
+    def _add_exclusion(self, text: str) -> None:
+        """Compile an exclusion pattern, and its brace alternatives."""
+        for expanded in expand_braces(text):
+            relative = _relative_to_root(expanded, self.root_folder)
+            if relative is None:
+                continue
+            if "/" not in relative:
+                # Like .gitignore, a bare name is excluded at any depth.
+                relative = "**/" + relative
+            self.exclusions.append(tuple(_compile_segment(segment) for segment in relative.split("/")))
+
+    def excluded(self, relative_path: str) -> bool:
+        """True if an exclusion matches the "/" separated path relative to the root.
+
+        Args:
+            relative_path (str): The path.
+
+        Returns:
+            bool: True to leave it, and anything under it, out.
+        """
+        parts = relative_path.split("/")
+        return any(_full_match(exclusion, parts) for exclusion in self.exclusions)
+
+    def matches(self, relative_path: str) -> bool:
+        """True if the "/" separated path relative to the root matches a pattern and no exclusion.
+
+        Only the path is compared, the file system isn't looked at.
+
+        Args:
+            relative_path (str): The path.
+
+        Returns:
+            bool: True if the walk would yield it, were it there.
+        """
+        parts = relative_path.split("/")
+        return any(_full_match(pattern.segments, parts) for pattern in self.patterns) and not self.excluded(
+            relative_path
+        )
+
+    def iglob(self, files_only: bool = False, skip: SkipPath | None = None) -> Iterator[str]:
+        """Yield the matching paths, in sorted order.
+
+        Args:
+            files_only (bool): Leave out folders.
+            skip (SkipPath | None): Called with each relative path and whether it's a folder, True leaves it out
+                and doesn't enter it, e.g. `GitIgnore.skip_path`.
+
+        Yields:
+            str: Each path, "/" separated relative to the root, or absolute if the pattern that matched it was.
+        """
+        for path, _source in self.walk(files_only, skip):
+            yield path
+
+    def walk(self, files_only: bool = False, skip: SkipPath | None = None) -> Iterator[tuple[str, int]]:
+        """Walk the root folder once for all the patterns, yielding matches in sorted order.
+
+        Args:
+            files_only (bool): Leave out folders.
+            skip (SkipPath | None): Called with each relative path and whether it's a folder, True leaves it out
+                and doesn't enter it.
+
+        Yields:
+            tuple[str, int]: The path, as `iglob` yields it, and the position of the first pattern given that
+                matched it.
+        """
+        if self.root_pattern is not None and (os.path.isfile(self.root_folder) or not files_only):
+            if os.path.exists(self.root_folder):
+                yield (self.root_folder if self.root_pattern.absolute else "."), self.root_pattern.source
+        if self.patterns:
+            states = self._closure((number, 0) for number in range(len(self.patterns)))
+            yield from self._walk_folder(self.root_folder, "", states, files_only, skip)
+
+    def _closure(self, states: Iterable[_State]) -> set[_State]:
+        """Add the states reached by letting each ** match no folder at all."""
+        closed = set()
+        for number, position in states:
+            segments = self.patterns[number].segments
+            closed.add((number, position))
+            while position < len(segments) and segments[position] is None:
+                position += 1
+                closed.add((number, position))
+        return closed
+
+    def _children(self, folder: str, names: set[str] | None) -> list[tuple[str, bool, bool, bool]]:
+        """(name, is folder, is file, is a real folder ** may enter) for the named children, or all of them."""
+        children = []
+        if names is not None:
+            for name in names:
+                try:
+                    stat_result = os.stat(os.path.join(folder, name))
+                except (OSError, ValueError):
+                    continue
+                is_folder = stat.S_ISDIR(stat_result.st_mode)
+                children.append((name, is_folder, stat.S_ISREG(stat_result.st_mode), is_folder))
+            return children
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    try:
+                        is_folder = entry.is_dir()
+                        children.append((entry.name, is_folder, entry.is_file(), is_folder and not entry.is_symlink()))
+                    except OSError:
+                        continue
+        except OSError:
+            # Unreadable or vanished folders are skipped, as glob.glob does.
+            pass
+        return children
+
+    def _walk_folder(
+        self, folder: str, prefix: str, states: set[_State], files_only: bool, skip: SkipPath | None
+    ) -> Iterator[tuple[str, int]]:
+        """Match the children of a folder against the states that are still open, and descend where needed."""
+        open_states = [
+            (number, position) for number, position in states if position < len(self.patterns[number].segments)
+        ]
+        segments = [self.patterns[number].segments[position] for number, position in open_states]
+        literal_names = {segment for segment in segments if isinstance(segment, str)}
+        # Only literal names left, look them up instead of listing the folder.
+        names = literal_names if len(literal_names) == len(segments) else None
+
+        # A folder sorts as "name" for itself and "name/" for its contents, which is the order of the full paths.
+        items: list[tuple[str, str, _Pattern | None, set[_State] | None]] = []
+        for name, is_folder, is_file, walkable in self._children(folder, names):
+            reached: set[_State] = set()
+            for number, position in open_states:
+                segment = self.patterns[number].segments[position]
+                if segment is None:
+                    if name.startswith("."):
+                        continue
+                    if walkable:
+                        reached.add((number, position))
+                    if position == len(self.patterns[number].segments) - 1:
+                        reached.add((number, position + 1))
+                elif _segment_matches(segment, name):
+                    reached.add((number, position + 1))
+            if not reached:
+                continue
+            relative_path = prefix + name
+            if self.exclusions and self.excluded(relative_path):
+                continue
+            if skip is not None and skip(relative_path, is_folder):
+                continue
+            reached.update(self._closure(reached))
+            sources = [
+                number
+                for number, position in reached
+                if position == len(self.patterns[number].segments)
+                and (is_folder or not self.patterns[number].folders_only)
+            ]
+            if sources and (is_file or not files_only):
+                first = min(sources, key=lambda number: self.patterns[number].source)
+                items.append((name, name, self.patterns[first], None))
+            if is_folder and any(position < len(self.patterns[number].segments) for number, position in reached):
+                items.append((name + "/", name, None, reached))
+        items.sort(key=lambda item: item[0])
+
+        for _key, name, pattern, folder_states in items:
+            relative_path = prefix + name
+            if pattern is not None:
+                path = os.path.join(self.root_folder, relative_path) if pattern.absolute else relative_path
+                yield path, pattern.source
+            elif folder_states is not None:
+                yield from self._walk_folder(
+                    os.path.join(folder, name), relative_path + "/", folder_states, files_only, skip
+                )
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(patterns: tuple[str, ...], root_folder: str, exclude: tuple[str, ...]) -> CompiledGlob:
+    """Compile, remembering recent globs."""
+    return CompiledGlob(patterns, root_folder, exclude)
+
+
+def compile_glob(patterns: str | Sequence[str], root_folder: str, exclude: Sequence[str] = ()) -> CompiledGlob:
+    """Compile glob patterns for a root folder, recently used globs are not compiled again.
+
+    Args:
+        patterns (str | Sequence[str]): One pattern or several, "!pattern" is an exclusion.
+        root_folder (str): The root folder, every path the glob yields is inside it.
+        exclude (Sequence[str]): More exclusions.
+
+    Returns:
+        CompiledGlob: The compiled glob.
+    """
+    if isinstance(patterns, str):
+        patterns = (patterns,)
+    return _compile_cached(tuple(patterns), os.path.abspath(root_folder), tuple(exclude))
+
+
+def glob_in_root(
+    patterns: str | Sequence[str],
+    root_folder: str,
+    exclude: Sequence[str] = (),
+    files_only: bool = False,
+    skip: SkipPath | None = None,
+) -> Iterator[str]:
+    """Find the paths under the root folder matching any of the patterns, in sorted order.
+
+    Args:
+        patterns (str | Sequence[str]): One pattern or several, "!pattern" is an exclusion.
+        root_folder (str): The root folder, relative patterns are relative to it.
+        exclude (Sequence[str]): More exclusions.
+        files_only (bool): Leave out folders.
+        skip (SkipPath | None): Leaves out paths, and folders' contents, it returns True for.
+
+    Returns:
+        Iterator[str]: Each path, "/" separated relative to the root, or absolute if the pattern that matched it
+            was.
+    """
+    return compile_glob(patterns, root_folder, exclude).iglob(files_only, skip)
@@ -0,0 +1,35 @@
+"""
+Where the persistent indexes for a root folder live.
+"""
+
+import os
+
+from ai_shell.utils.config_manager import Config
+
+DEFAULT_INDEX_FOLDER = ".ai_shell"
+
+
+def index_folder(root_folder: str, config: Config, create: bool = True) -> str:
+    """Return (and create) the folder that holds the persistent indexes for a root folder.
+
+    Defaults to a hidden `.ai_shell` folder in the root, which the tools already skip as hidden. Set the
+    `index_folder` config value to move it, e.g. outside of a read-only checkout.
+
+    Args:
+        root_folder (str): The root folder being indexed.
+        config (Config): The developer input that bot shouldn't set.
+        create (bool): Create the folder if it doesn't exist, readers of an optional index pass False.
+
+    Returns:
+        str: The absolute path of the index folder.
+    """
+    root_folder = os.path.abspath(root_folder)
+    if os.path.isfile(root_folder):
+        root_folder = os.path.dirname(root_folder)
+    folder = os.path.join(root_folder, config.get_value("index_folder") or DEFAULT_INDEX_FOLDER)
+    if create and not os.path.isdir(folder):
+        os.makedirs(folder, exist_ok=True)
+        # Keep the indexes out of the user's commits, the same trick .pytest_cache uses.
+        with open(os.path.join(folder, ".gitignore"), "w", encoding="utf-8") as gitignore:
+            gitignore.write("*\n")
+    return folder
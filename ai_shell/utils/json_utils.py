@@ -2,6 +2,7 @@
 Tools for handling AI's peculiar way of making json
 """
 
+import array
 import dataclasses
 import datetime
 import http
@@ -9,6 +10,7 @@ import json as slowjson
 import logging
 import sys
 import types
+from collections.abc import Sequence
 from typing import Any
 
 import orjson
@@ -29,6 +31,11 @@ def loosy_goosy_default_encoder(o: Any) -> Any:
     #     return list(o)
     if isinstance(o, types.GeneratorType):
         return list(o)
+    # Compact result containers, e.g. line number columns and PathList
+    if isinstance(o, array.array):
+        return o.tolist()
+    if isinstance(o, Sequence):
+        return list(o)
     # if dataclasses.is_dataclass(o):
     #     return dataclasses.asdict(o)
     # if isinstance(o, datetime.datetime):
@@ -47,6 +54,10 @@ class LoosyGoosyEncoderForSlowJson(slowjson.JSONEncoder):
             return list(o)
         if isinstance(o, types.GeneratorType):
             return list(o)
+        if isinstance(o, array.array):
+            return o.tolist()
+        if isinstance(o, Sequence):
+            return list(o)
         if dataclasses.is_dataclass(o):
             return dataclasses.asdict(o)  # type: ignore
         if isinstance(o, datetime.datetime):
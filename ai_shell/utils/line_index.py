@@ -0,0 +1,230 @@
+r"""
+Persistent line offsets, to read line N of a huge file without reading the lines before it.
+
+A file is indexed lazily, in one pass, the first time a range of its lines is asked for. The index records the byte
+offset of every `STRIDE`th line, so finding any line is a seek and at most `STRIDE - 1` line reads, while a million
+line file costs 62 KB of offsets. Lines end at "\n", like iterating over a binary file.
+
+The offsets are kept in a sqlite database next to the other indexes, keyed by each file's path, mtime and size. An
+entry whose file has changed is ignored and rebuilt on the next range read.
+"""
+
+import logging
+import os
+import sqlite3
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import IO
+
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.index_store import index_folder
+
+logger = logging.getLogger(__name__)
+
+# The offset of one line in this many is recorded.
+STRIDE = 128
+
+# Smaller files are read from the start, an index isn't worth its upkeep.
+DEFAULT_MIN_INDEXED_BYTES = 1024 * 1024
+
+_CHUNK_SIZE = 1 << 20
+
+_DATABASE = "lines.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS line_offsets (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    line_count INTEGER NOT NULL,
+    stride INTEGER NOT NULL,
+    offsets BLOB NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class LineOffsets:
+    """Where the lines of one version of a file start."""
+
+    mtime_ns: int
+    size: int
+    # Lines as iterating over the file yields them, an unterminated last line counts.
+    line_count: int
+    stride: int
+    # offsets[k] is where line k * stride starts, line 0 being the first.
+    offsets: array
+
+    def seek_line(self, file: IO[bytes], line: int) -> int:
+        """Position a file at the start of a line.
+
+        Args:
+            file (IO[bytes]): The file, opened "rb".
+            line (int): The 0-based line number, past the last line means the end of the file.
+
+        Returns:
+            int: The byte offset of the line.
+        """
+        if line >= self.line_count:
+            file.seek(self.size)
+            return self.size
+        line = max(line, 0)
+        file.seek(self.offsets[line // self.stride])
+        for _ in range(line % self.stride):
+            file.readline()
+        return file.tell()
+
+
+def scan_line_offsets(path: str, stride: int = STRIDE) -> LineOffsets:
+    """Find the line offsets of a file in one pass.
+
+    Args:
+        path (str): The file.
+        stride (int): Record one line offset in this many.
+
+    Returns:
+        LineOffsets: The offsets, for the file's mtime and size before the pass.
+    """
+    stat = os.stat(path)
+    offsets = array("q", [0])
+    newlines = 0
+    position = 0
+    last_byte = b""
+    with open(path, "rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            count = chunk.count(b"\n")
+            # Line newlines + i + 1 starts after the i-th newline of the chunk, keep those divisible by stride.
+            first = -(newlines + 1) % stride
+            if count > first:
+                ends = list(accumulate(map(len, chunk.split(b"\n"))))
+                offsets.extend(position + ends[i] + i + 1 for i in range(first, count, stride))
+            newlines += count
+            position += len(chunk)
+            last_byte = chunk[-1:]
+    line_count = newlines + (1 if last_byte not in (b"", b"\n") else 0)
+    # A line starting at the end of the file doesn't exist.
+    while len(offsets) > 1 and offsets[-1] >= position:
+        offsets.pop()
+    return LineOffsets(stat.st_mtime_ns, stat.st_size, line_count, stride, offsets)
+
+
+class LineIndex:
+    """On-disk line offsets of the big files under a root folder."""
+
+    def __init__(self, database_path: str) -> None:
+        """
+        Open, creating if needed, the index database.
+
+        Args:
+            database_path (str): The sqlite file to keep the offsets in.
+        """
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path, timeout=30)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def __enter__(self) -> "LineIndex":
+        """Use as a context manager that closes the database."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the database."""
+        self.close()
+
+    def lookup(self, path: str) -> LineOffsets | None:
+        """The offsets of a file, if indexed since it last changed.
+
+        Args:
+            path (str): Absolute path of the file.
+
+        Returns:
+            LineOffsets | None: The offsets, None if missing or stale.
+        """
+        row = self.connection.execute(
+            "SELECT mtime_ns, size, line_count, stride, offsets FROM line_offsets WHERE path = ?", (path,)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        mtime_ns, size, line_count, stride, blob = row
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+            return None
+        offsets = array("q")
+        offsets.frombytes(blob)
+        return LineOffsets(mtime_ns, size, line_count, stride, offsets)
+
+    def offsets(self, path: str) -> LineOffsets:
+        """The offsets of a file, indexing it first if it's new or changed.
+
+        Args:
+            path (str): Absolute path of the file.
+
+        Returns:
+            LineOffsets: The offsets.
+        """
+        found = self.lookup(path)
+        if found is not None:
+            return found
+        found = scan_line_offsets(path)
+        logger.debug(f"Indexed {found.line_count} lines of {path}")
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO line_offsets (path, mtime_ns, size, line_count, stride, offsets) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (path, found.mtime_ns, found.size, found.line_count, found.stride, found.offsets.tobytes()),
+            )
+        return found
+
+
+def min_indexed_bytes(config: Config) -> int:
+    """Files from this size on get a line index, the `line_index_min_bytes` config value.
+
+    Args:
+        config (Config): The developer input that bot shouldn't set.
+
+    Returns:
+        int: The size in bytes.
+    """
+    return int(config.get_value("line_index_min_bytes") or DEFAULT_MIN_INDEXED_BYTES)
+
+
+def open_line_index(root_folder: str, config: Config) -> LineIndex:
+    """Open the line index of a root folder, in the index folder from config.
+
+    Args:
+        root_folder (str): The root folder.
+        config (Config): The developer input that bot shouldn't set.
+
+    Returns:
+        LineIndex: The index.
+    """
+    return LineIndex(os.path.join(index_folder(root_folder, config), _DATABASE))
+
+
+def existing_line_offsets(root_folder: str, config: Config, path: str) -> LineOffsets | None:
+    """The offsets of a file if it has already been indexed and hasn't changed since, without indexing it.
+
+    Args:
+        root_folder (str): The root folder.
+        config (Config): The developer input that bot shouldn't set.
+        path (str): Absolute path of the file.
+
+    Returns:
+        LineOffsets | None: The offsets, None if there is no up to date entry.
+    """
+    database = os.path.join(index_folder(root_folder, config, create=False), _DATABASE)
+    if not os.path.isfile(database):
+        return None
+    try:
+        with LineIndex(database) as index:
+            return index.lookup(path)
+    except sqlite3.Error as error:
+        logger.warning(f"Not using the line index: {error}")
+        return None
@@ -0,0 +1,93 @@
+"""
+Directory listings for `ls`, reused while the directory is unchanged.
+
+A listing is validated by the directory's mtime_ns and size, one stat instead of a scandir. The sizes and
+modification times of the entries are not covered by the directory's mtime, so a long listing is only reused while
+a live workspace watcher watches the folder and reports every change to the files in it, otherwise the entries are
+stat'ed each time.
+One cache per root folder is shared by every `LsTool`.
+"""
+
+import os
+
+from ai_shell.utils.fingerprint_cache import fingerprint_files, shared_cache, unverified_fingerprints
+from ai_shell.utils.workspace_watcher import live_watcher
+
+# (name, is a directory, size, mtime), size and mtime are 0 unless stat'ed.
+ListedEntry = tuple[str, bool, int, float]
+
+
+def scan_folder(folder: str, stat: bool = False) -> tuple[ListedEntry, ...]:
+    """
+    List a folder, sorted by name, the types and stat results coming from the directory listing.
+
+    Args:
+        folder (str): The absolute folder.
+        stat (bool): Fill in the size and modification time.
+
+    Returns:
+        tuple[ListedEntry, ...]: The entries.
+    """
+    with os.scandir(folder) as entries:
+        listing = list(entries)
+    listed = []
+    for entry in listing:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        size, mtime = 0, 0.0
+        if stat:
+            try:
+                stats = entry.stat()
+            except OSError:
+                # e.g. a broken symlink, describe the link itself
+                stats = entry.stat(follow_symlinks=False)
+            size, mtime = stats.st_size, stats.st_mtime
+        listed.append((entry.name, is_dir, size, mtime))
+    listed.sort(key=lambda listed_entry: listed_entry[0])
+    return tuple(listed)
+
+
+def list_folder(
+    root_folder: str, folder: str, stat: bool = False, maximum_entries: int = 256
+) -> tuple[ListedEntry, ...]:
+    """
+    `scan_folder`, from the root folder's cache while the folder is unchanged.
+
+    Args:
+        root_folder (str): The root folder, whose cache is used.
+        folder (str): The absolute folder to list.
+        stat (bool): Fill in the size and modification time.
+        maximum_entries (int): Bound of the cache, 0 to always scan.
+
+    Returns:
+        tuple[ListedEntry, ...]: The entries, sorted by name.
+    """
+    if maximum_entries <= 0:
+        return scan_folder(folder, stat)
+    if stat:
+        # Hidden and excluded folders aren't watched.
+        watcher = live_watcher(root_folder)
+        if watcher is None or not watcher.watches_folder(folder):
+            return scan_folder(folder, stat)
+    # Listings are tuples of immutable values, no need to copy them in and out.
+    cache = shared_cache(root_folder, "ls", maximum_entries, copy_values=False)
+    generation = cache.generation
+    folder_fingerprint = fingerprint_files([folder])
+    if not stat:
+        key = (folder, False)
+        fingerprints = folder_fingerprint
+    else:
+        # The watcher reports changed files, the entries of the listing are what a long listing depends on.
+        names = list_folder(root_folder, folder, False, maximum_entries)
+        key = (folder, True)
+        fingerprints = folder_fingerprint + unverified_fingerprints(
+            os.path.join(folder, name) for name, _is_dir, _size, _mtime in names
+        )
+    cached = cache.get(key, fingerprints)
+    if cached is not None:
+        return cached
+    listed = scan_folder(folder, stat)
+    cache.put(key, fingerprints, listed, generation if stat else None)
+    return listed
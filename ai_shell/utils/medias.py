@@ -5,6 +5,7 @@ Support various media types without a function for each.
 import csv
 import io
 import logging
+from collections.abc import Sequence
 from typing import Any, Union
 
 import toml
@@ -46,7 +47,7 @@ def convert_to_media_type(result: dict[str, Any], media_type: str) -> Union[str,
     return result
 
 
-def dict_to_csv(result: Union[dict[str, Any], list[str], str]) -> str:
+def dict_to_csv(result: Union[dict[str, Any], Sequence[str], str]) -> str:
     """
     Converts a dictionary to a CSV format string.
 
@@ -61,9 +62,9 @@ def dict_to_csv(result: Union[dict[str, Any], list[str], str]) -> str:
     if isinstance(result, dict):
         for key, value in result.items():
             writer.writerow([key, value])
-    if isinstance(result, list):
-        for item in result:
-            writer.writerow([item])
     if isinstance(result, str):
         writer.writerow([result])
+    elif isinstance(result, Sequence):
+        for item in result:
+            writer.writerow([item])
     return output.getvalue()
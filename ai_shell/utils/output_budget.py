@@ -0,0 +1,263 @@
+"""
+A budget of lines and tokens for what one tool call returns, so a careless `cat_markdown` or `grep` can't fill the
+model's context window.
+
+`ToolKitBase.dispatch` makes an `OutputSink` per call, from `global_max_lines` and the `global_max_tokens` config
+value, tokens counted with the encoding of `token_model`. Tools that produce a lot, `cat`, `cat_markdown`, `grep`
+and `grep_markdown`, pass their output through the sink of the call, `output_sink()`, as they go. It stops taking
+lines once the budget is spent, and the tool stops reading files. Called outside of dispatch, the sink takes
+everything.
+
+The output of every other tool is cut to the budget by dispatch, once the tool has returned. Output cut short ends
+with a trailer saying how much was left out and how to get the rest.
+"""
+
+import contextlib
+import dataclasses
+import logging
+from collections.abc import Callable, Iterator, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# Estimate for models tiktoken doesn't know.
+CHARACTERS_PER_TOKEN = 4
+
+TRUNCATED_KEY = "truncated"
+
+_COUNTERS: dict[str, Callable[[str], int]] = {}
+
+
+def _estimate_tokens(text: str) -> int:
+    """Token count estimated from the length."""
+    return -(-len(text) // CHARACTERS_PER_TOKEN)
+
+
+def token_counter(token_model: str) -> Callable[[str], int]:
+    """
+    The token count function of a model, estimated from the length if tiktoken has no encoding for it.
+
+    Args:
+        token_model (str): The model name, e.g. "gpt-4o-mini".
+
+    Returns:
+        Callable[[str], int]: Counts the tokens of a text.
+    """
+    counter = _COUNTERS.get(token_model)
+    if counter is None:
+        try:
+            encoding = tiktoken.encoding_for_model(token_model)
+            counter = lambda text: len(encoding.encode_ordinary(text))  # noqa: E731
+        # pylint: disable=broad-exception-caught
+        except Exception as exception:
+            # An unknown model, or the encoding couldn't be downloaded.
+            logger.warning(f"No token encoding for {token_model}, estimating tokens from length: {exception}")
+            counter = _estimate_tokens
+        _COUNTERS[token_model] = counter
+    return counter
+
+
+@dataclass(frozen=True, slots=True)
+class Truncation:
+    """What a tool left out of its output, and the call that gets the rest."""
+
+    budget: str
+    """The limit reached, e.g. "500 lines"."""
+    continue_with: str
+    more_lines: int = 0
+    more_lines_exact: bool = True
+    """False if there are more_lines or more."""
+    more_files: int = 0
+
+    def trailer(self) -> str:
+        """
+        The line ending output cut short.
+
+        Returns:
+            str: e.g. "[truncated at 500 lines: 80 more lines not shown, continue with ...]" and a newline.
+        """
+        left_out = []
+        if self.more_lines:
+            left_out.append(f"{'' if self.more_lines_exact else 'at least '}{self.more_lines} more lines")
+        if self.more_files:
+            left_out.append(f"{self.more_files} more files")
+        not_shown = " and ".join(left_out) or "more output"
+        return f"[truncated at {self.budget}: {not_shown} not shown, continue with {self.continue_with}]\n"
+
+
+class OutputSink:
+    """Takes the output of one tool call, line by line, until the budget is spent."""
+
+    def __init__(self, maximum_lines: int = 0, maximum_tokens: int = 0, token_model: str = "") -> None:
+        """
+        Args:
+            maximum_lines (int): Lines of output, 0 or less for no limit.
+            maximum_tokens (int): Tokens of output, 0 or less for no limit.
+            token_model (str): The model whose tokens are counted.
+        """
+        self.maximum_lines = maximum_lines
+        self.maximum_tokens = maximum_tokens
+        self.token_model = token_model
+        self.count_tokens = token_counter(token_model) if maximum_tokens > 0 else _estimate_tokens
+        self.lines = 0
+        self.tokens = 0
+        self.used = False
+        """True once a tool has passed output through the sink."""
+        self.full = False
+        """True once lines were left out."""
+        self.budget = ""
+        """The limit that was reached."""
+        self.truncation: Truncation | None = None
+
+    @property
+    def unlimited(self) -> bool:
+        """True if the sink takes everything."""
+        return self.maximum_lines <= 0 and self.maximum_tokens <= 0
+
+    def like(self) -> "OutputSink":
+        """
+        An empty sink with the same budget, e.g. for one root of a search merged afterwards.
+
+        Returns:
+            OutputSink: The new sink.
+        """
+        return OutputSink(self.maximum_lines, self.maximum_tokens, self.token_model)
+
+    def take(self, lines: list[str]) -> list[str]:
+        """
+        Spend the budget on the next lines of output.
+
+        Args:
+            lines (list[str]): The lines.
+
+        Returns:
+            list[str]: The lines that fit, the first ones. Fewer than given means the budget is spent.
+        """
+        self.used = True
+        if self.unlimited:
+            return lines
+        if self.full:
+            return []
+        if 0 < self.maximum_lines < self.lines + len(lines):
+            lines = lines[: self.maximum_lines - self.lines]
+            self.full, self.budget = True, f"{self.maximum_lines} lines"
+        if self.maximum_tokens > 0:
+            tokens = self.count_tokens("".join(lines))
+            if self.tokens + tokens > self.maximum_tokens:
+                kept = []
+                for line in lines:
+                    tokens = self.count_tokens(line)
+                    if self.tokens + tokens > self.maximum_tokens:
+                        break
+                    self.tokens += tokens
+                    kept.append(line)
+                lines = kept
+                self.full, self.budget = True, f"{self.maximum_tokens} tokens"
+            else:
+                self.tokens += tokens
+        self.lines += len(lines)
+        return lines
+
+    def truncate(
+        self, continue_with: str, more_lines: int = 0, more_lines_exact: bool = True, more_files: int = 0
+    ) -> None:
+        """
+        Record what was left out once the budget is spent, for the trailer.
+
+        Args:
+            continue_with (str): How to get the rest, e.g. 'cat_range(file_path="a.py", start_line=501)'.
+            more_lines (int): Lines left out.
+            more_lines_exact (bool): False if there are more_lines or more.
+            more_files (int): Files not read.
+        """
+        self.truncation = Truncation(self.budget, continue_with, more_lines, more_lines_exact, more_files)
+
+    def finish(self, result: Any) -> Any:
+        """
+        Cut a tool result that didn't go through the sink to the budget, and add the trailer if anything was cut.
+
+        Text is cut by lines, a list of strings or a dict of plain values by items, e.g. the counts of grep_count.
+        Other results are left as they are, the tools returning them cut them themselves. A dict, or a dataclass,
+        gets the trailer as a "truncated" key.
+
+        Args:
+            result (Any): What the tool returned, a generator already turned into a list.
+
+        Returns:
+            Any: The result within the budget.
+        """
+        if not self.used and not self.unlimited:
+            result = self._cut(result)
+        if self.truncation is None:
+            return result
+        trailer = self.truncation.trailer()
+        if isinstance(result, str):
+            return result + trailer if not result or result.endswith("\n") else f"{result}\n{trailer}"
+        if isinstance(result, Sequence):
+            return [*result, trailer.rstrip("\n")]
+        if isinstance(result, dict):
+            return {**result, TRUNCATED_KEY: trailer.rstrip("\n")}
+        if dataclasses.is_dataclass(result) and not isinstance(result, type):
+            fields = {field.name: getattr(result, field.name) for field in dataclasses.fields(result)}
+            return {**fields, TRUNCATED_KEY: trailer.rstrip("\n")}
+        return result
+
+    def _cut(self, result: Any) -> Any:
+        """Cut text, a list of strings or a dict of plain values to the budget, recording the truncation."""
+        if isinstance(result, str):
+            lines = result.splitlines(keepends=True)
+            taken = self.take(lines)
+            if len(taken) == len(lines):
+                return result
+            self.truncate("a narrower call, e.g. fewer files or a line range", more_lines=len(lines) - len(taken))
+            return "".join(taken)
+        if isinstance(result, Sequence) and all(isinstance(item, str) for item in result):
+            items = list(result)
+            taken = self.take([f"{item}\n" for item in items])
+            if len(taken) == len(items):
+                return result
+            self.truncate("a narrower call, e.g. a narrower pattern or a limit", more_lines=len(items) - len(taken))
+            return items[: len(taken)]
+        if isinstance(result, dict) and all(isinstance(value, (str, int, float, bool)) for value in result.values()):
+            taken = self.take([f"{key}: {value}\n" for key, value in result.items()])
+            if len(taken) == len(result):
+                return result
+            self.truncate("a narrower call, e.g. a narrower pattern", more_lines=len(result) - len(taken))
+            return dict(list(result.items())[: len(taken)])
+        return result
+
+
+_SINK: ContextVar[OutputSink | None] = ContextVar("output_sink", default=None)
+
+
+def output_sink() -> OutputSink:
+    """
+    The sink of the tool call being dispatched, a sink taking everything outside of dispatch.
+
+    Returns:
+        OutputSink: The sink.
+    """
+    sink = _SINK.get()
+    return sink if sink is not None else OutputSink()
+
+
+@contextlib.contextmanager
+def using_sink(sink: OutputSink) -> Iterator[OutputSink]:
+    """
+    Make the sink the one `output_sink` returns, for the duration of a tool call.
+
+    Args:
+        sink (OutputSink): The sink of the call.
+
+    Yields:
+        OutputSink: The same sink.
+    """
+    token = _SINK.set(sink)
+    try:
+        yield sink
+    finally:
+        _SINK.reset(token)
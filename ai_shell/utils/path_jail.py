@@ -0,0 +1,265 @@
+"""
+Root folder checks for the paths tools read, write and report, with the root resolved once per root.
+
+`is_file_in_root_folder` and `remove_root_folder` used to resolve the root and the path on every call. A
+`PathJail` keeps the absolute and real root, and remembers real paths in an LRU, where a miss costs one lstat
+because the folder above is usually already known. One jail per root is shared by every tool instance; entries
+for files a tool reports changed are dropped.
+"""
+
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+
+from ai_shell.utils.change_events import add_change_listener
+
+logger = logging.getLogger(__name__)
+
+# relativize_many lists a folder rather than lstat each path in it from this many paths on.
+_LISTING_THRESHOLD = 16
+
+
+def _symlink_names(folder: str) -> frozenset[str] | None:
+    """Names of the symlinks in a folder, None if it can't be listed."""
+    try:
+        with os.scandir(folder) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_symlink())
+    except OSError:
+        return None
+
+
+class PathJail:
+    """The root folder of a tool, and the checks that keep paths inside it."""
+
+    def __init__(self, root_folder: str, maximum_entries: int = 65536) -> None:
+        """
+        Resolve the root folder.
+
+        Args:
+            root_folder (str): The root folder, a file means its folder for relative paths.
+            maximum_entries (int): Bound of the real path LRU.
+
+        Raises:
+            ValueError: If the root folder has wildcards.
+        """
+        if "*" in root_folder or "?" in root_folder:
+            raise ValueError("Root folder cannot contain wildcards")
+        self.root_folder = os.path.abspath(root_folder)
+        self.folder = os.path.dirname(self.root_folder) if os.path.isfile(self.root_folder) else self.root_folder
+        self.real_folder = os.path.realpath(self.folder)
+        self.maximum_entries = maximum_entries
+        self._root_key = os.path.normcase(self.root_folder)
+        self._root_prefix = os.path.join(self._root_key, "")
+        self._folder_prefix = os.path.join(self.folder, "")
+        self._real_key = os.path.normcase(self.real_folder)
+        self._real_prefix = os.path.join(self._real_key, "")
+        self._real_paths: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def contains(self, file_path: str) -> bool:
+        """True if the path could be in the root folder or its subfolders, going by the path alone.
+
+        Args:
+            file_path (str): The path, relative to the root folder or absolute. It does not mean it exists!
+
+        Returns:
+            bool: True if the path is in the root folder.
+        """
+        normalized_file_path = file_path.replace("/", os.sep).replace("\\", os.sep)
+        if normalized_file_path.startswith(os.sep) and not os.path.isabs(file_path):
+            logger.warning("File %s is rooted but not relative to root folder %s", file_path, self.root_folder)
+            return False
+        if not os.path.isabs(file_path):
+            file_path = self.root_folder + "/" + file_path
+        key = os.path.normcase(os.path.normpath(file_path))
+        is_inside = key == self._root_key or key.startswith(self._root_prefix)
+        if not is_inside:
+            logger.warning(f"File {os.path.normpath(file_path)} is not in root folder {self.root_folder}")
+        return is_inside
+
+    def absolute(self, file_path: str) -> str:
+        """The normalized absolute path, relative paths being relative to the root folder.
+
+        Args:
+            file_path (str): The path.
+
+        Returns:
+            str: The absolute path, symlinks not resolved.
+        """
+        return os.path.normpath(file_path if os.path.isabs(file_path) else os.path.join(self.folder, file_path))
+
+    def absolute_inside(self, file_path: str) -> str:
+        """The absolute path of a file that has to be in the root folder, e.g. one a tool writes to.
+
+        Args:
+            file_path (str): The path, relative to the root folder or absolute.
+
+        Returns:
+            str: The absolute path, symlinks not resolved.
+
+        Raises:
+            ValueError: If the file is not in the root folder.
+        """
+        if not self.contains(file_path):
+            raise ValueError(f"File {file_path} is not in root folder {self.root_folder}.")
+        return self.absolute(file_path)
+
+    def realpath(self, file_path: str) -> str:
+        """os.path.realpath, remembered.
+
+        Args:
+            file_path (str): The path, relative to the root folder or absolute.
+
+        Returns:
+            str: The absolute path with symlinks resolved.
+        """
+        return self._realpath(self.absolute(file_path))
+
+    def _realpath(self, absolute_path: str) -> str:
+        """Resolve a normalized absolute path from its folder's cached real path and one lstat."""
+        with self._lock:
+            real_path = self._real_paths.get(absolute_path)
+            if real_path is not None:
+                self._real_paths.move_to_end(absolute_path)
+                self.hits += 1
+                return real_path
+            self.misses += 1
+        folder, name = os.path.split(absolute_path)
+        if not name or folder == absolute_path:
+            real_path = os.path.realpath(absolute_path)
+        elif os.path.islink(absolute_path):
+            real_path = os.path.realpath(absolute_path)
+        else:
+            real_path = os.path.join(self._realpath(folder), name)
+        with self._lock:
+            self._real_paths[absolute_path] = real_path
+            if len(self._real_paths) > self.maximum_entries:
+                self._real_paths.popitem(last=False)
+        return real_path
+
+    def resolves_inside(self, file_path: str) -> bool:
+        """True if the path, with symlinks resolved, is the root folder or in it.
+
+        Args:
+            file_path (str): The path, relative to the root folder or absolute.
+
+        Returns:
+            bool: False for a symlink leading out of the root folder.
+        """
+        key = os.path.normcase(self.realpath(file_path))
+        return key == self._real_key or key.startswith(self._real_prefix)
+
+    def relativize(self, file_path: str) -> str:
+        """The "/" separated path relative to the root folder.
+
+        Args:
+            file_path (str): The path, relative to the root folder or absolute.
+
+        Returns:
+            str: The relative path, "." for the root folder itself. Symlinks inside the root folder keep their own
+                name.
+
+        Raises:
+            ValueError: If the path, with symlinks resolved, is not under the root folder.
+        """
+        absolute_path = self.absolute(file_path)
+        return self._relative(absolute_path, self._realpath(absolute_path))
+
+    def _relative(self, absolute_path: str, real_path: str) -> str:
+        """Relativize a path whose real path is known, see `relativize`."""
+        real_key = os.path.normcase(real_path)
+        if real_key == self._real_key:
+            return "."
+        if not real_key.startswith(self._real_prefix):
+            raise ValueError("File path is not under the root folder")
+        if absolute_path.startswith(self._folder_prefix):
+            relative_path = absolute_path[len(self._folder_prefix) :]
+        else:
+            # Reached through a symlinked parent of the root folder.
+            relative_path = real_path[len(self._real_prefix) :]
+        return relative_path.replace("\\", "/")
+
+    def relativize_many(self, file_paths: Iterable[str]) -> list[str]:
+        """`relativize` for a list of results, in the same order.
+
+        Folders holding many of the paths are listed once to learn which names are symlinks, instead of one lstat
+        per path, and the files' own real paths aren't added to the LRU.
+
+        Args:
+            file_paths (Iterable[str]): The paths.
+
+        Returns:
+            list[str]: The relative paths.
+
+        Raises:
+            ValueError: If a path is not under the root folder.
+        """
+        absolute_paths = [self.absolute(file_path) for file_path in file_paths]
+        per_folder = Counter(os.path.dirname(absolute_path) for absolute_path in absolute_paths)
+        symlinks = {
+            folder: _symlink_names(folder) for folder, count in per_folder.items() if count >= _LISTING_THRESHOLD
+        }
+        relative_paths = []
+        for absolute_path in absolute_paths:
+            folder, name = os.path.split(absolute_path)
+            folder_symlinks = symlinks.get(folder)
+            if folder_symlinks is None or not name:
+                real_path = self._realpath(absolute_path)
+            elif name in folder_symlinks:
+                real_path = os.path.realpath(absolute_path)
+            else:
+                real_path = os.path.join(self._realpath(folder), name)
+            relative_paths.append(self._relative(absolute_path, real_path))
+        return relative_paths
+
+    def forget(self, paths: list[str]) -> None:
+        """Drop remembered real paths after files changed, everything if a folder or symlink did.
+
+        Args:
+            paths (list[str]): Absolute paths.
+        """
+        with self._lock:
+            if not self._real_paths:
+                return
+            for path in paths:
+                path = os.path.normpath(path)
+                if os.path.isdir(path) or os.path.islink(path):
+                    self._real_paths.clear()
+                    return
+                self._real_paths.pop(path, None)
+
+
+_JAILS: dict[str, PathJail] = {}
+_JAILS_LOCK = threading.Lock()
+
+
+def path_jail(root_folder: str) -> PathJail:
+    """Return the process wide jail of a root folder, creating it on first use.
+
+    Args:
+        root_folder (str): The root folder.
+
+    Returns:
+        PathJail: The jail.
+    """
+    key = os.path.abspath(root_folder)
+    with _JAILS_LOCK:
+        jail = _JAILS.get(key)
+        if jail is None:
+            jail = _JAILS[key] = PathJail(root_folder)
+        return jail
+
+
+def _forget_changed(paths: list[str]) -> None:
+    """Drop changed paths from every jail."""
+    with _JAILS_LOCK:
+        jails = list(_JAILS.values())
+    for jail in jails:
+        jail.forget(paths)
+
+
+add_change_listener(_forget_changed)
@@ -0,0 +1,94 @@
+"""
+A compact list of paths for find and ls results.
+
+Paths in a big listing mostly share a few folders, so each folder is stored once and every entry is just a small
+folder number plus its own name, instead of one full string per entry.
+"""
+
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+
+def _folder_length(path: str) -> int:
+    """Length of the folder part of path, including its trailing separator."""
+    if os.altsep:
+        return max(path.rfind(os.sep), path.rfind(os.altsep)) + 1
+    return path.rfind(os.sep) + 1
+
+
+class PathList(Sequence[str]):
+    """Sequence of paths, stored as shared folder strings plus one name per path.
+
+    Compares equal to a list or tuple of the same strings. orjson writes it as a list of strings through
+    `loosy_goosy_default_encoder`.
+
+    Examples:
+        >>> paths = PathList(["src/a.py", "src/b.py", "README.md"])
+        >>> list(paths)
+        ['src/a.py', 'src/b.py', 'README.md']
+        >>> paths[1], len(paths), paths == ["src/a.py", "src/b.py", "README.md"]
+        ('src/b.py', 3, True)
+    """
+
+    __slots__ = ("_folders", "_folder_numbers", "_folder_ids", "_names")
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        """
+        Store the paths, in the order given.
+
+        Args:
+            paths (Iterable[str]): The paths.
+        """
+        self._folders: list[str] = []
+        self._folder_numbers: dict[str, int] = {}
+        # 4 bytes per entry instead of a pointer to its own copy of the folder.
+        self._folder_ids = array("I")
+        self._names: list[str] = []
+        for path in paths:
+            self.append(path)
+
+    def append(self, path: str) -> None:
+        """Add a path at the end.
+
+        Args:
+            path (str): The path.
+        """
+        cut = _folder_length(path)
+        folder = path[:cut]
+        folder_id = self._folder_numbers.get(folder)
+        if folder_id is None:
+            folder_id = self._folder_numbers[folder] = len(self._folders)
+            self._folders.append(folder)
+        self._folder_ids.append(folder_id)
+        self._names.append(path[cut:])
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PathList": ...
+
+    def __getitem__(self, index: int | slice) -> "str | PathList":
+        if isinstance(index, slice):
+            return PathList(self[position] for position in range(*index.indices(len(self))))
+        return self._folders[self._folder_ids[index]] + self._names[index]
+
+    def __iter__(self) -> Iterator[str]:
+        folders = self._folders
+        for folder_id, name in zip(self._folder_ids, self._names, strict=True):
+            yield folders[folder_id] + name
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (PathList, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PathList({list(self)!r})"
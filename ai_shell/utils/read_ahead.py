@@ -0,0 +1,116 @@
+"""
+Files read ahead on a few threads, for a tool going through a list of files in order, e.g. `cat` of a glob.
+
+While the caller formats one file, the next ones are read on a thread pool, so on cold caches and slow disks the
+waits for the disk overlap instead of adding up. Files are read whole through the content cache, and at most
+`window_bytes` of them are held between being read and being opened. A file bigger than the window isn't read
+ahead, the caller streams it from the disk when its turn comes.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from typing import IO
+
+from ai_shell.utils.content_cache import cached_open
+
+DEFAULT_WORKERS = 4
+DEFAULT_WINDOW_BYTES = 16 * 1024 * 1024
+
+# Files queued per worker, however small they are.
+_FILES_PER_WORKER = 4
+
+
+def _read(path: str) -> bytes:
+    """The whole file, through the content cache."""
+    with cached_open(path, "rb") as file:
+        return file.read()
+
+
+class ReadAhead:
+    """Reads the files of a list ahead of the caller, who opens them one after another in the same order."""
+
+    def __init__(
+        self, paths: list[str], workers: int = DEFAULT_WORKERS, window_bytes: int = DEFAULT_WINDOW_BYTES
+    ) -> None:
+        """
+        Start reading the first files.
+
+        Args:
+            paths (list[str]): The files, in the order they will be opened.
+            workers (int): Threads reading, 1 or less to open each file when its turn comes.
+            window_bytes (int): Bytes read but not yet opened are kept under this.
+        """
+        self._paths = paths
+        self._window_bytes = window_bytes
+        self._maximum_queued = max(workers, 1) * _FILES_PER_WORKER
+        # (path, the read or None if the file is streamed, size counted against the window)
+        self._queued: deque[tuple[str, Future[bytes] | None, int]] = deque()
+        self._next = 0
+        self._in_flight_bytes = 0
+        self._pool = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="read_ahead")
+            if workers > 1 and len(paths) > 1
+            else None
+        )
+        self._fill()
+
+    def _fill(self) -> None:
+        """Queue reads of the next files while they fit in the window."""
+        if self._pool is None:
+            return
+        while self._next < len(self._paths) and len(self._queued) < self._maximum_queued:
+            path = self._paths[self._next]
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                # The error comes up when it's read.
+                size = 0
+            if size > self._window_bytes:
+                self._queued.append((path, None, 0))
+            elif self._in_flight_bytes + size > self._window_bytes:
+                break
+            else:
+                self._queued.append((path, self._pool.submit(_read, path), size))
+                self._in_flight_bytes += size
+            self._next += 1
+
+    def open(self, path: str) -> IO[bytes]:
+        """
+        Open the next file of the list for reading bytes.
+
+        Args:
+            path (str): The next file.
+
+        Returns:
+            IO[bytes]: The contents read ahead, or the file itself.
+
+        Raises:
+            ValueError: If the path isn't the next one in the list.
+            OSError: If the file couldn't be read.
+        """
+        if self._pool is None:
+            return cached_open(path, "rb")
+        queued_path, future, size = self._queued.popleft() if self._queued else (None, None, 0)
+        if queued_path != path:
+            raise ValueError(f"Files are opened in the order given, got {path} instead of {queued_path}.")
+        self._in_flight_bytes -= size
+        self._fill()
+        if future is None:
+            return cached_open(path, "rb")
+        return BytesIO(future.result())
+
+    def close(self) -> None:
+        """Stop reading ahead, files being read are let finish."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._queued.clear()
+
+    def __enter__(self) -> "ReadAhead":
+        """Use as a context manager that stops reading ahead."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Stop reading ahead."""
+        self.close()
@@ -2,17 +2,20 @@
 Grab bag of functions for file system.
 """
 
-import glob
 import logging
 import math
 import os
 import re
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from itertools import islice
 from pathlib import Path
 from typing import Union
 
+from ai_shell.utils.glob_engine import SkipPath, glob_in_root
+from ai_shell.utils.path_jail import path_jail
+from ai_shell.utils.walk import DirectoryLister
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,20 +40,18 @@ def sanitize_path(file_path: str) -> str:
     return sanitized_path
 
 
-def safe_glob(match_patten: str, root_dir: str):
-    """Safely check for anything that doesn't break out of the root_dir"""
-    match_patten = sanitize_path(match_patten)
-    # dir_fd=None, recursive=False, include_hidden=False
-    for result in glob.glob(
-        match_patten,
-        root_dir=root_dir,
-    ):
-        is_safe = is_file_in_root_folder(result, root_dir)
-        if not is_safe:
-            logger.warning(f"File {result} is not in root folder {root_dir}")
-            continue
+def safe_glob(match_patten: str, root_dir: str, skip: SkipPath | None = None) -> Iterator[str]:
+    """Safely glob for anything that doesn't break out of the root_dir.
 
-        yield result
+    Args:
+        match_patten (str): The glob pattern, with {a,b} alternatives and ** allowed.
+        root_dir (str): The root folder, nothing outside it is yielded.
+        skip (SkipPath | None): Leaves out paths, and folders' contents, it returns True for.
+
+    Returns:
+        Iterator[str]: The matching paths, sorted.
+    """
+    return glob_in_root(sanitize_path(match_patten), root_dir, skip=skip)
 
 
 def is_file_in_root_folder(file_path: str, root_folder: str) -> bool:
@@ -68,34 +69,21 @@ def is_file_in_root_folder(file_path: str, root_folder: str) -> bool:
         >>> is_file_in_root_folder("foo/bar", ".")
         True
     """
-    if "*" in root_folder or "?" in root_folder:
-        raise ValueError("Root folder cannot contain wildcards")
-
-    normalized_file_path = file_path.replace("/", os.sep).replace("\\", os.sep)
-    if normalized_file_path.startswith(os.sep) and not os.path.isabs(file_path):
-        logger.warning("File %s is rooted but not relative to root folder %s", file_path, root_folder)
-        return False
+    return path_jail(root_folder).contains(file_path)
 
-    # Normalize paths to create absolute paths
-    if not os.path.isabs(file_path):
-        file_path = root_folder + "/" + file_path
-    absolute_file_path = os.path.abspath(file_path)
 
-    absolute_root_folder = os.path.abspath(root_folder)
-
-    # Use os.path.commonpath to check if the root folder is a prefix of the file path
-    common_path = os.path.commonpath([absolute_file_path, absolute_root_folder])
-    # This won't work on linux, but on Windows I'm getting e: and E:!
-    is_same = common_path.lower() == absolute_root_folder.lower()
-
-    if not is_same:
-        logger.warning(f"File {absolute_file_path} is not in root folder {absolute_root_folder}")
-    return is_same
-
-
-def tree(dir_path: Union[str, Path], level: int = -1, limit_to_directories: bool = False, length_limit: int = 1000):
+def tree(
+    dir_path: Union[str, Path],
+    level: int = -1,
+    limit_to_directories: bool = False,
+    length_limit: int = 1000,
+    workers: int = 1,
+):
     """Given a directory Path object print a visual tree structure
     Credits: https://stackoverflow.com/a/59109706/33264
+
+    Symlinks to directories are followed. With workers > 1 directories are listed ahead on a thread pool, the
+    output is the same.
     """
     space = "    "
     branch = "│   "
@@ -109,31 +97,33 @@ def tree(dir_path: Union[str, Path], level: int = -1, limit_to_directories: bool
 
     result = ""
 
-    def inner(dir_path: Path, prefix: str = "", level: int = -1):
+    def inner(lister: DirectoryLister, dir_path: str, prefix: str = "", level: int = -1):
         nonlocal files, directories
         if not level:
             return  # 0, stop iterating
+        contents = [entry for _key, _path, entry, is_contents in lister.listing(dir_path) if not is_contents]
         if limit_to_directories:
-            contents = sorted(d for d in dir_path.iterdir() if d.is_dir())
-        else:
-            contents = sorted(_ for _ in dir_path.iterdir() if "__pycache__" not in str(_))
+            contents = [entry for entry in contents if entry.is_dir()]
         pointers = [tee] * (len(contents) - 1) + [last]
-        for pointer, path in zip(pointers, contents, strict=False):
-            if path.is_dir():
-                yield prefix + pointer + path.name
+        for pointer, entry in zip(pointers, contents, strict=False):
+            if entry.is_dir():
+                yield prefix + pointer + entry.name
                 directories += 1
                 extension = branch if pointer == tee else space
-                yield from inner(path, prefix=prefix + extension, level=level - 1)
+                yield from inner(lister, entry.path, prefix=prefix + extension, level=level - 1)
             elif not limit_to_directories:
-                yield prefix + pointer + path.name
+                yield prefix + pointer + entry.name
                 files += 1
 
     result += dir_path.name + "\n"
-    iterator = inner(dir_path, level=level)
-    for line in islice(iterator, length_limit):
-        result += line + "\n"
-    if next(iterator, None):
-        result += f"... length_limit, {length_limit}, reached, counted:" + "\n"
+    # Only a listing of files leaves out __pycache__.
+    skip = None if limit_to_directories else lambda entry: "__pycache__" in entry.name
+    with DirectoryLister(skip, workers) as lister:
+        iterator = inner(lister, str(dir_path), level=level)
+        for line in islice(iterator, length_limit):
+            result += line + "\n"
+        if next(iterator, None):
+            result += f"... length_limit, {length_limit}, reached, counted:" + "\n"
     result += f"\n{directories} directories" + (f", {files} files" if files else "") + "\n"
     return result
 
@@ -210,29 +200,16 @@ def remove_root_folder(file_path: str, root_folder: str) -> str:
     """Removing root folder from path
 
     Args:
-        file_path (str): The path to the file.
+        file_path (str): The path to the file, relative to the root folder or absolute.
         root_folder (str): The root folder path. It must exist for this to succeed.
 
     Returns:
         str: The relative path of the file.
+
+    Raises:
+        ValueError: If the file, with symlinks resolved, is not under the root folder.
     """
-    if not is_in_root_now(root_folder):
-        raise ValueError(f"Root folder ({root_folder}) must be the current working directory, current {os.getcwd()}")
-    # with temporary_change_dir(root_folder):
-    root = Path(".").resolve()
-    file = Path(file_path)
-
-    # Handling the case where file_path is the same as root_folder
-    if file.resolve() == root:
-        return "."
-
-    # Handling relative paths
-    file = root / file if not file.is_absolute() else file
-    file = file.resolve()
-
-    if root in file.parents:
-        return str(file.relative_to(root)).replace("\\", "/")
-    raise ValueError("File path is not under the root folder")
+    return path_jail(root_folder).relativize(file_path)
 
 
 def human_readable_size(size_in_bytes: int) -> str:
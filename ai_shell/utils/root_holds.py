@@ -0,0 +1,117 @@
+"""
+Values the toolkits of a root folder share while any of them is open, e.g. its content cache or its search worker
+processes.
+
+A toolkit holds what it uses when it's created and releases it on close, or from a `weakref.finalize` once it's
+garbage collected. The garbage collector runs finalizers in whatever thread it interrupts, maybe one holding the
+registry's lock or a lock of the value, so a release from a finalizer is only queued, and done by the next hold or
+release.
+"""
+
+import os
+import threading
+from collections import deque
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+Value = TypeVar("Value")
+
+
+class RootHolds(Generic[Value]):
+    """One value per root folder, dropped once nothing holds it."""
+
+    def __init__(
+        self,
+        on_change: Callable[[list[Value]], None] | None = None,
+        on_drop: Callable[[Value], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            on_change (Callable[[list[Value]], None] | None): Called with every value after a value is added or
+                dropped, under the registry's lock.
+            on_drop (Callable[[Value], None] | None): Called with a value nothing holds anymore, under the lock.
+        """
+        self._on_change = on_change
+        self._on_drop = on_drop
+        self._values: dict[str, Value] = {}
+        self._holders: dict[str, int] = {}
+        self._queued: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    def hold(self, root_folder: str, create: Callable[[], Value]) -> Value:
+        """
+        Hold the value of a root folder, creating it on first use.
+
+        Args:
+            root_folder (str): The root folder.
+            create (Callable[[], Value]): Makes the value.
+
+        Returns:
+            Value: The value.
+        """
+        key = os.path.abspath(root_folder)
+        with self._lock:
+            changed = self._release_queued()
+            value = self._values.get(key)
+            if value is None:
+                value = self._values[key] = create()
+                changed = True
+            self._holders[key] = self._holders.get(key, 0) + 1
+            if changed and self._on_change is not None:
+                self._on_change(list(self._values.values()))
+            return value
+
+    def release(self, root_folder: str, later: bool = False) -> None:
+        """
+        Let go of the value of a root folder, dropping it once nothing holds it.
+
+        Args:
+            root_folder (str): The root folder given to `hold`.
+            later (bool): Only queue the release, as a finalizer has to.
+        """
+        self._queued.append(os.path.abspath(root_folder))
+        if later:
+            return
+        with self._lock:
+            if self._release_queued() and self._on_change is not None:
+                self._on_change(list(self._values.values()))
+
+    def _release_queued(self) -> bool:
+        """Carry out the queued releases, True if a value was dropped. Call with the lock held."""
+        dropped = False
+        while self._queued:
+            key = self._queued.popleft()
+            holders = self._holders.get(key, 0) - 1
+            if holders > 0:
+                self._holders[key] = holders
+                continue
+            self._holders.pop(key, None)
+            value = self._values.pop(key, None)
+            if value is not None:
+                dropped = True
+                if self._on_drop is not None:
+                    self._on_drop(value)
+        return dropped
+
+    def get(self, root_folder: str) -> Value | None:
+        """
+        The value of a root folder, if held.
+
+        Args:
+            root_folder (str): The root folder.
+
+        Returns:
+            Value | None: The value.
+        """
+        with self._lock:
+            return self._values.get(os.path.abspath(root_folder))
+
+    def items(self) -> list[tuple[str, Value]]:
+        """
+        Every held value.
+
+        Returns:
+            list[tuple[str, Value]]: Absolute root folder and value.
+        """
+        with self._lock:
+            return list(self._values.items())
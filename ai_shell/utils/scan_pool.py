@@ -0,0 +1,109 @@
+"""
+Worker processes for searches sharded across files, `grep` and friends with `grep_workers` other than 1.
+
+Starting worker processes costs far more than scanning a few files, so a `ToolKit` holds one pool per root folder
+while it's open, started on the first search and shut down when the last toolkit on the root is closed. A tool used
+without a toolkit gets a pool for the one call.
+
+Workers are started with forkserver, or spawn where there is none, never fork. A forked child gets a copy of every
+lock of the parent, e.g. of the workspace watcher or the read-ahead threads, in whatever state another thread left
+it, and can deadlock on one.
+"""
+
+import contextlib
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.root_holds import RootHolds
+
+
+def scan_workers(config: Config) -> int:
+    """
+    The number of worker processes a search uses.
+
+    Args:
+        config (Config): Supplies `grep_workers`, 0 for one per cpu.
+
+    Returns:
+        int: The workers, 1 to scan in the calling process.
+    """
+    workers = int(config.get_value("grep_workers") or 1)
+    return workers if workers > 0 else os.cpu_count() or 1
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    """A pool whose workers don't inherit the parent's threads and locks."""
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method))
+
+
+@dataclass(slots=True)
+class _Held:
+    """The pool of a root, started on the first search."""
+
+    workers: int
+    pool: ProcessPoolExecutor | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _shut_down(held: _Held) -> None:
+    """Stop the workers of a pool nothing holds anymore, without waiting for them."""
+    if held.pool is not None:
+        held.pool.shutdown(wait=False, cancel_futures=True)
+
+
+_POOLS: RootHolds[_Held] = RootHolds(on_drop=_shut_down)
+
+
+def hold_scan_pool(root_folder: str, workers: int) -> None:
+    """
+    Keep a pool of worker processes for the searches of a root folder, until `release_scan_pool`.
+
+    Args:
+        root_folder (str): The root folder.
+        workers (int): Worker processes, the first holder's count is used.
+    """
+    _POOLS.hold(root_folder, lambda: _Held(workers))
+
+
+def release_scan_pool(root_folder: str, later: bool = False) -> None:
+    """
+    Let go of the pool of a root folder, shutting it down once nothing holds it.
+
+    Args:
+        root_folder (str): The root folder given to `hold_scan_pool`.
+        later (bool): Only queue the release, for a finalizer.
+    """
+    _POOLS.release(root_folder, later)
+
+
+@contextlib.contextmanager
+def scan_pool(root_folder: str, workers: int) -> Iterator[tuple[ProcessPoolExecutor, int]]:
+    """
+    The pool held for a root folder, started on first use, else a pool shut down on exit.
+
+    Args:
+        root_folder (str): The root folder searched.
+        workers (int): Worker processes of a pool for this call alone.
+
+    Yields:
+        tuple[ProcessPoolExecutor, int]: The pool and its number of workers.
+    """
+    held = _POOLS.get(root_folder)
+    if held is not None:
+        with held.lock:
+            if held.pool is None:
+                held.pool = _new_pool(held.workers)
+        yield held.pool, held.workers
+        return
+    pool = _new_pool(workers)
+    try:
+        yield pool, workers
+    finally:
+        # The caller may have stopped early, don't start shards nobody will read.
+        pool.shutdown(cancel_futures=True)
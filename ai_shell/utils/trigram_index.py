@@ -0,0 +1,357 @@
+"""
+Persistent trigram index, to skip reading files that can't possibly match a regex.
+
+Same idea as Google Code Search and Zoekt: every file is indexed by the set of 3-byte sequences it contains. A regex
+is reduced to the literal strings any match must contain, and only files holding all the trigrams of those literals
+are read. Regexes without usable literals (e.g. `^#.*`) fall back to a full scan.
+
+The index is a sqlite database, updated incrementally from each file's mtime and size. A file modified within the
+racy window could change again without its mtime changing, see `fingerprint_cache`, so it is recorded unindexed,
+always a candidate, and indexed on a later refresh.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+
+from ai_shell.utils.fingerprint_cache import RACY_NANOSECONDS
+
+logger = logging.getLogger(__name__)
+
+# Bigger files are recorded but never indexed, they are always candidates.
+MAX_INDEXED_BYTES = 16 * 1024 * 1024
+
+# Only this many trigrams per literal are queried, any subset still gives a superset of the matching files.
+MAX_QUERY_TRIGRAMS = 24
+
+# With re.IGNORECASE these also match non-ascii letters (İ, ı, K, ſ) that an ascii-lowered index can't see.
+_UNSAFE_IGNORECASE = frozenset("iks")
+
+_TRIGRAM = re.compile(rb"...", re.DOTALL)
+_BRACE_QUANTIFIER = re.compile(r"\{(\d*)(,?)(\d*)\}")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    indexed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    trigram BLOB NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_file ON postings (file_id);
+"""
+
+
+def trigrams(data: bytes) -> set[bytes]:
+    """Return every distinct 3-byte sequence in data, ascii lower-cased.
+
+    Args:
+        data (bytes): The bytes to split.
+
+    Returns:
+        set[bytes]: The trigrams.
+
+    Examples:
+        >>> sorted(trigrams(b"Abcd"))
+        [b'abc', b'bcd']
+    """
+    data = data.lower()
+    found: set[bytes] = set()
+    # findall walks in C, three staggered passes cover every offset.
+    for start in range(3):
+        found.update(_TRIGRAM.findall(data, start))
+    return found
+
+
+def _split_top_level(regex: str) -> list[str]:
+    """Split a regex on `|` that isn't escaped or inside a group or character class."""
+    alternatives = []
+    depth = 0
+    in_class = False
+    start = 0
+    index = 0
+    while index < len(regex):
+        char = regex[index]
+        if char == "\\":
+            index += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A ] straight after [ or [^ is a literal member of the class.
+            if regex[index + 1 : index + 2] == "^":
+                index += 1
+            if regex[index + 1 : index + 2] == "]":
+                index += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            alternatives.append(regex[start:index])
+            start = index + 1
+        index += 1
+    alternatives.append(regex[start:])
+    return alternatives
+
+
+def _skip_class(regex: str, index: int) -> int:
+    """Return the index just past the character class that starts at index."""
+    index += 1
+    if regex[index : index + 1] == "^":
+        index += 1
+    if regex[index : index + 1] == "]":
+        index += 1
+    while index < len(regex) and regex[index] != "]":
+        index += 2 if regex[index] == "\\" else 1
+    return index + 1
+
+
+def _skip_group(regex: str, index: int) -> int:
+    """Return the index just past the group that starts at index."""
+    depth = 0
+    while index < len(regex):
+        char = regex[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            index = _skip_class(regex, index)
+            continue
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return index
+
+
+def _literal_runs(alternative: str, ignore_case: bool) -> list[str]:
+    r"""Return the runs of literal characters that every match of a branch must contain.
+
+    Conservative: anything that isn't plainly a literal (classes, groups, escapes like \d) just ends a run.
+    """
+    runs: list[str] = []
+    current: list[str] = []
+
+    def flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    index = 0
+    while index < len(alternative):
+        char = alternative[index]
+        if char == "\\":
+            escaped = alternative[index + 1 : index + 2]
+            index += 2
+            if not escaped or escaped.isalnum():
+                # \d, \w, \b, \1, \n ... not worth decoding.
+                flush()
+                continue
+            literal = escaped
+        elif char == "[":
+            flush()
+            index = _skip_class(alternative, index)
+            continue
+        elif char == "(":
+            flush()
+            index = _skip_group(alternative, index)
+            continue
+        elif char in "*?+" or (char == "{" and _BRACE_QUANTIFIER.match(alternative, index)):
+            if char == "{":
+                quantifier = _BRACE_QUANTIFIER.match(alternative, index)
+                assert quantifier is not None  # nosec
+                index = quantifier.end()
+                optional = quantifier.group(1) in ("", "0")
+            else:
+                index += 1
+                optional = char != "+"
+            if optional and current:
+                # The repeated character might not be there at all.
+                current.pop()
+            flush()
+            # lazy or possessive suffix
+            if alternative[index : index + 1] in ("?", "+"):
+                index += 1
+            continue
+        elif char in ".^$":
+            flush()
+            index += 1
+            continue
+        else:
+            literal = char
+            index += 1
+        if ignore_case and (not literal.isascii() or literal.lower() in _UNSAFE_IGNORECASE):
+            flush()
+            continue
+        current.append(literal)
+    flush()
+    return runs
+
+
+def required_trigrams(regex: str) -> list[set[bytes]] | None:
+    """Reduce a regex to the trigrams a matching line must contain.
+
+    Args:
+        regex (str): A regular expression string.
+
+    Returns:
+        list[set[bytes]] | None: One trigram set per top-level alternative, a line must contain every trigram of
+            at least one set. None if some alternative has no literal of three or more bytes, then every file is
+            a candidate.
+
+    Examples:
+        >>> sorted(required_trigrams("def main")[0])
+        [b' ma', b'ain', b'def', b'ef ', b'f m', b'mai']
+        >>> required_trigrams("^#.*") is None
+        True
+        >>> [sorted(alternative) for alternative in required_trigrams("TODO|FIXME")]
+        [[b'odo', b'tod'], [b'fix', b'ixm', b'xme']]
+    """
+    try:
+        flags = re.compile(regex).flags
+    except re.error:
+        return None
+    if flags & re.VERBOSE:
+        return None
+    ignore_case = bool(flags & re.IGNORECASE)
+    alternatives = []
+    for alternative in _split_top_level(regex):
+        found: set[bytes] = set()
+        for run in _literal_runs(alternative, ignore_case):
+            run_trigrams = sorted(trigrams(run.encode("utf-8")))
+            found.update(run_trigrams[:MAX_QUERY_TRIGRAMS])
+        if not found:
+            return None
+        alternatives.append(found)
+    return alternatives
+
+
+class TrigramIndex:
+    """On-disk trigram index of the files under a root folder."""
+
+    def __init__(self, database_path: str) -> None:
+        """
+        Open, creating if needed, the index database.
+
+        Args:
+            database_path (str): The sqlite file to keep the index in.
+        """
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path, timeout=30)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def __enter__(self) -> "TrigramIndex":
+        """Use as a context manager that closes the database."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the database."""
+        self.close()
+
+    def refresh(self, paths: Iterable[str]) -> dict[str, int]:
+        """Re-index any of the given files that are new or whose mtime or size changed.
+
+        Args:
+            paths (Iterable[str]): Absolute paths of the files to bring up to date.
+
+        Returns:
+            dict[str, int]: path to file id for the given paths that still exist.
+        """
+        known = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in self.connection.execute("SELECT id, path, mtime_ns, size FROM files")
+        }
+        file_ids: dict[str, int] = {}
+        racy_after = time.time_ns() - RACY_NANOSECONDS
+        with self.connection:
+            for path in paths:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                existing = known.get(path)
+                if existing and existing[1] == stat.st_mtime_ns and existing[2] == stat.st_size:
+                    file_ids[path] = existing[0]
+                    continue
+                file_ids[path] = self._index_file(
+                    path, stat.st_mtime_ns, stat.st_size, existing and existing[0], stat.st_mtime_ns > racy_after
+                )
+        return file_ids
+
+    def _index_file(self, path: str, mtime_ns: int, size: int, file_id: int | None, racy: bool = False) -> int:
+        """(Re)write the postings of one file, inside the caller's transaction, a racy file without them."""
+        file_trigrams: set[bytes] = set()
+        indexed = size <= MAX_INDEXED_BYTES and not racy
+        if racy:
+            # Recorded with no mtime, the next refresh indexes it again.
+            mtime_ns = 0
+        if indexed:
+            try:
+                with open(path, "rb") as file:
+                    file_trigrams = trigrams(file.read())
+            except OSError as error:
+                logger.warning(f"Not indexing {path}: {error}")
+                indexed = False
+        if file_id is None:
+            cursor = self.connection.execute(
+                "INSERT INTO files (path, mtime_ns, size, indexed) VALUES (?, ?, ?, ?)",
+                (path, mtime_ns, size, int(indexed)),
+            )
+            file_id = int(cursor.lastrowid or 0)
+        else:
+            self.connection.execute(
+                "UPDATE files SET mtime_ns = ?, size = ?, indexed = ? WHERE id = ?",
+                (mtime_ns, size, int(indexed), file_id),
+            )
+            self.connection.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        self.connection.executemany(
+            "INSERT INTO postings (trigram, file_id) VALUES (?, ?)",
+            ((trigram, file_id) for trigram in file_trigrams),
+        )
+        return file_id
+
+    def narrow(self, regex: str, paths: list[str]) -> list[str]:
+        """Drop the files that can't contain a match for regex, refreshing the index for them first.
+
+        Args:
+            regex (str): A regular expression string.
+            paths (list[str]): Absolute paths of the candidate files.
+
+        Returns:
+            list[str]: The paths that might match, in their original order.
+        """
+        alternatives = required_trigrams(regex)
+        if alternatives is None:
+            return paths
+        file_ids = self.refresh(paths)
+        possible: set[int] = {
+            file_id for (file_id,) in self.connection.execute("SELECT id FROM files WHERE indexed = 0")
+        }
+        for alternative in alternatives:
+            placeholders = ",".join("?" * len(alternative))
+            rows = self.connection.execute(
+                f"SELECT file_id FROM postings WHERE trigram IN ({placeholders}) "  # nosec
+                "GROUP BY file_id HAVING COUNT(*) = ?",
+                (*alternative, len(alternative)),
+            )
+            possible.update(file_id for (file_id,) in rows)
+        # Files that vanished since globbing are left in, grep reports them as it always has.
+        return [path for path in paths if path not in file_ids or file_ids[path] in possible]
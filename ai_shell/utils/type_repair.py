@@ -3,6 +3,7 @@ Bot frequently does lists in 3 different ways.
 """
 
 import csv
+import json
 from io import StringIO
 from typing import Union
 
@@ -38,3 +39,31 @@ def convert_to_list(possible_list: Union[str, list[str]]) -> list[str]:
     elif isinstance(possible_list, list):
         return possible_list
     raise TypeError(f"This list of strings is of invalid type: {possible_list}")
+
+
+def convert_to_dict(possible_dict: Union[str, dict[str, str]]) -> dict[str, str]:
+    """
+    Convert a JSON object string to a dict if it isn't already a dict.
+
+    Args:
+        possible_dict (Union[str, dict[str, str]]): A JSON string or dict.
+
+    Returns:
+        A dict.
+
+    Examples:
+        >>> convert_to_dict('{"todo": "TODO"}')
+        {'todo': 'TODO'}
+        >>> convert_to_dict({"todo": "TODO"})
+        {'todo': 'TODO'}
+        >>> convert_to_dict("")
+        {}
+    """
+    if possible_dict == "" or possible_dict is None:
+        # Degenerate case.
+        return {}
+    if isinstance(possible_dict, str):
+        possible_dict = json.loads(possible_dict)
+    if isinstance(possible_dict, dict):
+        return possible_dict
+    raise TypeError(f"This dict of strings is of invalid type: {possible_dict}")
@@ -0,0 +1,181 @@
+"""
+Directory walking for the tools that list files, built on os.scandir so the file type and stat results come
+from the directory listing and are cached on each entry.
+
+On file systems where every stat is a round trip (FUSE, overlay, network mounts) directories can be listed ahead
+of the walk on a thread pool, the walk itself still goes in sorted order.
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+
+SkipEntry = Callable[[os.DirEntry], bool]
+
+
+def is_pruned(entry: os.DirEntry, excluded_folders: frozenset[str] = frozenset()) -> bool:
+    """
+    The entries the listing tools leave out: hidden ones, __pycache__ and excluded folders.
+
+    Args:
+        entry (os.DirEntry): The entry.
+        excluded_folders (frozenset[str]): Folder names to leave out, e.g. the excluded_folders config list.
+
+    Returns:
+        bool: True to leave the entry and anything under it out.
+    """
+    if entry.name.startswith(".") or entry.name == "__pycache__":
+        return True
+    return entry.name in excluded_folders and entry.is_dir()
+
+
+# (sort key, path relative to the top, entry, True if this item stands for the entries inside the directory)
+_Item = tuple[str, str, os.DirEntry, bool]
+
+
+def _sorted_listing(folder: str, prefix: str, skip: SkipEntry | None, stat: bool = False) -> list[_Item]:
+    """
+    List a folder, each directory twice: once for itself and once for its contents.
+
+    The contents sort under "name/", so walking the items in order gives the same order as sorting the full
+    paths as strings.
+
+    Args:
+        folder (str): The folder to list.
+        prefix (str): Relative path of the folder, with a trailing "/", or "" for the top.
+        skip (SkipEntry | None): Leaves out entries it returns True for.
+        stat (bool): Also stat every entry now, so later entry.stat() calls are answered from its cache.
+
+    Returns:
+        list[_Item]: The items, sorted.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            listing = list(entries)
+    except OSError:
+        # Unreadable or vanished directories are skipped, as os.walk does.
+        return []
+    items: list[_Item] = []
+    for entry in listing:
+        if skip is not None and skip(entry):
+            continue
+        relative_path = prefix + entry.name
+        items.append((entry.name, relative_path, entry, False))
+        try:
+            if stat:
+                entry.stat()
+            # Like os.walk, do not follow symlinks into directories.
+            descend = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            descend = False
+        if descend:
+            items.append((entry.name + "/", relative_path, entry, True))
+    items.sort(key=lambda item: item[0])
+    return items
+
+
+class DirectoryLister:
+    """Sorted directory listings, listed ahead of time on a bounded thread pool when workers > 1.
+
+    After each listing, its subfolders are queued to be listed in the background, most recently found first,
+    which is roughly the order a depth first walk asks for them. At most `workers` * 4 listings are pending or
+    held at any time.
+    """
+
+    def __init__(self, skip: SkipEntry | None = None, workers: int = 1, stat: bool = False) -> None:
+        """
+        Set up the lister, use it as a context manager to shut the pool down.
+
+        Args:
+            skip (SkipEntry | None): Leaves out entries it returns True for, it's called from the pool's threads.
+            workers (int): Threads listing directories, 1 lists each directory when asked.
+            stat (bool): Also stat every entry while listing.
+        """
+        self.skip = skip
+        self.stat = stat
+        self.maximum_pending = workers * 4
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="ai_shell walk") if workers > 1 else None
+        self._pending: dict[str, Future[list[_Item]]] = {}
+        self._listed: set[str] = set()
+        self._queued: list[deque[tuple[str, str]]] = []
+
+    def __enter__(self) -> "DirectoryLister":
+        """Use as a context manager that stops the pool."""
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Stop the pool, dropping listings nobody asked for yet."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def listing(self, folder: str, prefix: str = "") -> list[_Item]:
+        """Return the sorted listing of a folder, see `_sorted_listing`.
+
+        Args:
+            folder (str): The folder to list.
+            prefix (str): Relative path of the folder, with a trailing "/", or "" for the top.
+
+        Returns:
+            list[_Item]: The items, sorted.
+        """
+        self._listed.add(folder)
+        future = self._pending.pop(folder, None)
+        items = future.result() if future is not None else _sorted_listing(folder, prefix, self.skip, self.stat)
+        if self._executor is not None:
+            self._queued.append(
+                deque(
+                    (entry.path, relative_path + "/")
+                    for _key, relative_path, entry, is_contents in items
+                    if is_contents
+                )
+            )
+            self._fill()
+        return items
+
+    def _fill(self) -> None:
+        """Start listing queued folders until the bound is reached."""
+        if self._executor is None:
+            return
+        while self._queued and len(self._pending) < self.maximum_pending:
+            queue = self._queued[-1]
+            if not queue:
+                self._queued.pop()
+                continue
+            folder, prefix = queue.popleft()
+            if folder not in self._listed and folder not in self._pending:
+                self._pending[folder] = self._executor.submit(_sorted_listing, folder, prefix, self.skip, self.stat)
+
+
+def scan_tree(
+    top: str, skip: SkipEntry | None = None, workers: int = 1, stat: bool = False
+) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield every entry under top with its "/" separated path relative to top, in sorted path order.
+
+    Entries skip returns True for are left out, and skipped directories are not descended into, so pruning
+    happens before any listing. Stopping the iteration stops the walk.
+
+    Args:
+        top (str): The folder to walk.
+        skip (SkipEntry | None): Called with each os.DirEntry, e.g. to prune hidden folders.
+        workers (int): Threads listing directories ahead of the walk, the order is the same for any number.
+        stat (bool): Stat every entry while listing, worth it when the caller will stat most of them anyway.
+
+    Yields:
+        tuple[str, os.DirEntry]: The relative path and the entry.
+    """
+    with DirectoryLister(skip, workers, stat) as lister:
+        stack = [iter(lister.listing(top))]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+                continue
+            _key, relative_path, entry, is_contents = item
+            if is_contents:
+                stack.append(iter(lister.listing(entry.path, relative_path + "/")))
+            else:
+                yield relative_path, entry
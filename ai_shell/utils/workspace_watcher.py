@@ -0,0 +1,385 @@
+"""
+Optional live watcher of a root folder, so caches hear about changes instead of re-checking every file.
+
+On Linux it uses inotify through ctypes, one watch per directory, in a background thread. Where inotify isn't
+available, or its limits (fs.inotify.max_user_watches, max_user_instances) are reached, it falls back to polling
+mtimes. Either way changes are published with `notify_files_changed`, the same event the write tools send.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import functools
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Iterable
+
+from ai_shell.utils.change_events import notify_files_changed
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.walk import is_pruned, scan_tree
+
+logger = logging.getLogger(__name__)
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+
+# struct inotify_event { int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[]; }
+_EVENT = struct.Struct("iIII")
+
+
+@functools.lru_cache(maxsize=1)
+def _libc() -> ctypes.CDLL:
+    """Load libc, raising OSError where inotify can't exist."""
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOSYS, "inotify is Linux only")
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def _raise_errno() -> None:
+    """Raise the OSError for the errno the last libc call left."""
+    error_number = ctypes.get_errno()
+    raise OSError(error_number, os.strerror(error_number))
+
+
+class Inotify:
+    """A non-blocking inotify instance."""
+
+    def __init__(self) -> None:
+        """
+        Create the instance.
+
+        Raises:
+            OSError: If inotify is unavailable or too many instances exist (EMFILE).
+        """
+        self._libc = _libc()
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            _raise_errno()
+
+    def add_watch(self, path: str) -> int:
+        """Watch a directory.
+
+        Args:
+            path (str): The directory.
+
+        Returns:
+            int: The watch descriptor.
+
+        Raises:
+            OSError: ENOSPC when the max_user_watches limit is reached.
+        """
+        watch = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if watch < 0:
+            _raise_errno()
+        return int(watch)
+
+    def read_events(self, timeout: float) -> list[tuple[int, int, str]]:
+        """Wait up to timeout seconds for events and return those available.
+
+        Args:
+            timeout (float): Seconds to wait.
+
+        Returns:
+            list[tuple[int, int, str]]: (watch descriptor, mask, name) per event, name is "" for the directory itself.
+        """
+        readable, _writable, _errors = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            watch, mask, _cookie, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((watch, mask, name))
+        return events
+
+    def close(self) -> None:
+        """Close the instance, dropping every watch."""
+        os.close(self.fd)
+
+
+class WorkspaceWatcher:
+    """Background thread that publishes changes under a root folder as they happen."""
+
+    def __init__(
+        self, root_folder: str, excluded_folders: frozenset[str] = frozenset(), poll_seconds: float = 2.0
+    ) -> None:
+        """
+        Set up the watcher, call `start` to run it.
+
+        Args:
+            root_folder (str): The folder to watch, recursively.
+            excluded_folders (frozenset[str]): Folder names not to watch, hidden folders and __pycache__ never are.
+            poll_seconds (float): Interval of the mtime polling fallback.
+        """
+        self.root_folder = os.path.abspath(root_folder)
+        self.excluded_folders = excluded_folders
+        self.poll_seconds = poll_seconds
+        # "inotify" for live events, "polling" for the fallback
+        self.mode = "stopped"
+        self._skip = functools.partial(is_pruned, excluded_folders=excluded_folders)
+        self._folders: dict[int, str] = {}
+        # The folders with a watch, changes of their entries are published as they happen.
+        self._watched_folders: set[str] = set()
+        self._changed_folders: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"ai_shell watcher {self.root_folder}", daemon=True)
+
+    @property
+    def live(self) -> bool:
+        """True while inotify events are flowing, so a change is known within milliseconds."""
+        return self.mode == "inotify"
+
+    def watches_folder(self, folder: str) -> bool:
+        """True if changes to the entries of the folder are known live.
+
+        Hidden folders, __pycache__ and the excluded folders are never watched, nor anything under them, though
+        tools can still reach them with an explicit path or glob.
+
+        Args:
+            folder (str): An absolute folder.
+
+        Returns:
+            bool: False if the folder's files have to be stat'ed to know they are unchanged.
+        """
+        return self.live and os.path.normpath(folder) in self._watched_folders
+
+    def start(self, timeout: float = 30.0) -> None:
+        """Start the thread and wait until the watches are in place.
+
+        Args:
+            timeout (float): Seconds to wait for the initial watches or snapshot.
+        """
+        self._thread.start()
+        self._ready.wait(timeout)
+
+    def stop(self) -> None:
+        """Stop the thread."""
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.mode = "stopped"
+
+    def changed_folders(self, consumer: str) -> set[str] | None:
+        """Return the folders whose entries changed since this consumer last asked.
+
+        Args:
+            consumer (str): Who is asking, e.g. an index database path.
+
+        Returns:
+            set[str] | None: Absolute folder paths, or None on the first call or when the watcher isn't live, in
+                which case the consumer has to check everything itself.
+        """
+        with self._lock:
+            if not self.live:
+                self._changed_folders.pop(consumer, None)
+                return None
+            changed = self._changed_folders.get(consumer)
+            self._changed_folders[consumer] = set()
+        return changed
+
+    def _publish(self, paths: Iterable[str]) -> None:
+        """Record the folders that changed and tell the listeners."""
+        changed = sorted(set(paths))
+        if not changed:
+            return
+        folders = {os.path.dirname(path) for path in changed}
+        folders.update(path for path in changed if os.path.isdir(path))
+        with self._lock:
+            for pending in self._changed_folders.values():
+                pending.update(folders)
+        notify_files_changed(changed)
+
+    def _run(self) -> None:
+        """Watch with inotify, or poll if that fails."""
+        try:
+            self._watch_with_inotify()
+        except OSError as error:
+            if self._stopping.is_set():
+                return
+            logger.warning(f"inotify unavailable for {self.root_folder} ({error}), polling every {self.poll_seconds}s")
+            self._poll()
+        finally:
+            self._ready.set()
+
+    def _add_tree(self, inotify: Inotify, top: str) -> list[str]:
+        """Watch a directory and every directory under it, except pruned ones.
+
+        Args:
+            inotify (Inotify): The instance.
+            top (str): The directory.
+
+        Returns:
+            list[str]: The files found, for a directory that just appeared these are all new.
+        """
+        self._watch(inotify, top)
+        files = []
+        for _path, entry in scan_tree(top, self._skip):
+            if entry.is_dir(follow_symlinks=False):
+                self._watch(inotify, entry.path)
+            else:
+                files.append(entry.path)
+        return files
+
+    def _watch(self, inotify: Inotify, folder: str) -> None:
+        """Watch one directory."""
+        self._folders[inotify.add_watch(folder)] = folder
+        self._watched_folders.add(os.path.normpath(folder))
+
+    def _watch_with_inotify(self) -> None:
+        """Publish inotify events until stopped, batching each read into one notification."""
+        inotify = Inotify()
+        try:
+            self._add_tree(inotify, self.root_folder)
+            self.mode = "inotify"
+            self._ready.set()
+            while not self._stopping.is_set():
+                changed: set[str] = set()
+                for watch, mask, name in inotify.read_events(0.2):
+                    if mask & IN_Q_OVERFLOW:
+                        # Events were lost, report everything.
+                        logger.warning(f"inotify queue overflowed for {self.root_folder}")
+                        changed.update(entry.path for _path, entry in scan_tree(self.root_folder, self._skip))
+                        continue
+                    folder = self._folders.get(watch)
+                    if folder is None:
+                        continue
+                    if mask & IN_IGNORED:
+                        del self._folders[watch]
+                        self._watched_folders.discard(os.path.normpath(folder))
+                        continue
+                    path = os.path.join(folder, name) if name else folder
+                    changed.add(path)
+                    if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and not self._skip_name(name):
+                        changed.update(self._add_tree(inotify, path))
+                self._publish(changed)
+        finally:
+            self.mode = "stopped"
+            self._watched_folders.clear()
+            inotify.close()
+
+    def _skip_name(self, name: str) -> bool:
+        """True for directory names that are not watched."""
+        return name.startswith(".") or name == "__pycache__" or name in self.excluded_folders
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        """(mtime_ns, size) of everything under the root folder."""
+        snapshot = {}
+        for _path, entry in scan_tree(self.root_folder, self._skip):
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def _poll(self) -> None:
+        """Publish the differences between snapshots taken every poll_seconds, until stopped."""
+        snapshot = self._snapshot()
+        self.mode = "polling"
+        self._ready.set()
+        while not self._stopping.wait(self.poll_seconds):
+            current = self._snapshot()
+            self._publish(path for path in current.keys() | snapshot.keys() if current.get(path) != snapshot.get(path))
+            snapshot = current
+        self.mode = "stopped"
+
+
+_WATCHERS: dict[str, WorkspaceWatcher] = {}
+_WATCHERS_LOCK = threading.Lock()
+
+
+def _folder_of(root_folder: str) -> str:
+    """Absolute folder of a root, which some tools are given as a file."""
+    root_folder = os.path.abspath(root_folder)
+    return os.path.dirname(root_folder) if os.path.isfile(root_folder) else root_folder
+
+
+def watch_root(root_folder: str, config: Config) -> WorkspaceWatcher:
+    """Return the watcher of a root folder, starting it on first use. One watcher per root for the whole process.
+
+    Args:
+        root_folder (str): The folder to watch.
+        config (Config): Supplies excluded_folders and watch_poll_seconds.
+
+    Returns:
+        WorkspaceWatcher: The running watcher.
+    """
+    folder = _folder_of(root_folder)
+    with _WATCHERS_LOCK:
+        watcher = _WATCHERS.get(folder)
+        if watcher is None:
+            watcher = _WATCHERS[folder] = WorkspaceWatcher(
+                folder,
+                frozenset(config.get_list("excluded_folders")),
+                float(config.get_value("watch_poll_seconds") or 2.0),
+            )
+            watcher.start()
+    return watcher
+
+
+def live_watcher(root_folder: str) -> WorkspaceWatcher | None:
+    """Return a live inotify watcher covering root_folder, if one is running.
+
+    Args:
+        root_folder (str): A root folder, or a file or folder under a watched one.
+
+    Returns:
+        WorkspaceWatcher | None: The watcher, None if changes under the folder aren't known live.
+    """
+    folder = _folder_of(root_folder)
+    with _WATCHERS_LOCK:
+        watchers = list(_WATCHERS.values())
+    for watcher in watchers:
+        if watcher.live and (folder == watcher.root_folder or folder.startswith(watcher.root_folder + os.sep)):
+            return watcher
+    return None
+
+
+def stop_watchers() -> None:
+    """Stop every watcher, e.g. at shutdown or between tests."""
+    with _WATCHERS_LOCK:
+        watchers = list(_WATCHERS.values())
+        _WATCHERS.clear()
+    for watcher in watchers:
+        watcher.stop()
@@ -0,0 +1,105 @@
+"""
+Measure cat_markdown: the former per-line StringIO and decode vs whole chunks decoded and numbered at once.
+
+Usage:
+    python benchmarks/bench_cat.py [repeats]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Generator
+from functools import partial
+from io import StringIO
+from typing import IO, Any
+
+from ai_shell.cat_tool import CatTool
+from ai_shell.utils.config_manager import Config
+
+SIZES = {"small": 200, "medium": 50_000, "huge": 1_000_000}
+
+
+class FormerCatTool(CatTool):
+    """CatTool with the former per-line path, a StringIO and a decode for every line."""
+
+    def cat_markdown(self, file_paths: list[str], number_lines: bool = True, squeeze_blank: bool = False) -> str:
+        """The former cat_markdown, lines written to a StringIO."""
+        output = StringIO()
+        line_number = 1
+        for file_path in self._matching_files(file_paths, number_lines, squeeze_blank):
+            with open(file_path, "rb") as file:
+                for line in self._process_cat_file(file, line_number, number_lines, squeeze_blank):
+                    output.write(line)
+                    line_number += 1
+        output.seek(0)
+        return output.read()
+
+    def _process_cat_file(
+        self, file: IO[bytes], line_number: int, number_lines: bool, squeeze_blank: bool
+    ) -> Generator[str, None, None]:
+        """The former _process_cat_file."""
+        was_blank = False
+        for byte_lines in file:
+            line = byte_lines.decode("utf-8")
+            with StringIO() as line_buffer:
+                line = line.replace("\r\n", "\n")
+                line_buffer.write(line)
+                if squeeze_blank and was_blank and line.strip() == "":
+                    continue
+                was_blank = line.strip() == ""
+                if number_lines:
+                    line_buffer.seek(0)
+                    line = f"{line_number}\t{line_buffer.read()}"
+                    line_number += 1
+                else:
+                    line = line_buffer.getvalue()
+                yield line
+
+
+def write_file(path: str, lines: int) -> None:
+    """Python-like source with some blank runs and non-ASCII text."""
+    with open(path, "w", encoding="utf-8") as file:
+        for number in range(lines):
+            if number % 10 in (3, 4):
+                file.write("\n")
+            else:
+                file.write(f"    value_{number} = compute('naïve', {number})  # line {number}\n")
+
+
+def best_of(repeats: int, work: Callable[[], Any]) -> float:
+    """Fastest of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        work()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run() -> None:
+    """Print the seconds each path takes per file size, checking they agree."""
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as top:
+        config = Config(os.path.join(top, "ai_shell.toml"))
+        tool, former_tool = CatTool(top, config), FormerCatTool(top, config)
+        print(f"{'file':<24} {'former':>9} {'chunked':>9} {'speedup':>8}")
+        for name, lines in SIZES.items():
+            file_name = f"{name}.py"
+            write_file(os.path.join(top, file_name), lines)
+            for number_lines, squeeze_blank in ((True, False), (False, False), (True, True)):
+                former = former_tool.cat_markdown([file_name], number_lines, squeeze_blank)
+                assert tool.cat_markdown([file_name], number_lines, squeeze_blank) == former
+                arguments = ([file_name], number_lines, squeeze_blank)
+                former_seconds = best_of(repeats, partial(former_tool.cat_markdown, *arguments))
+                chunked_seconds = best_of(repeats, partial(tool.cat_markdown, *arguments))
+                flags = ("-n" if number_lines else "") + (" -s" if squeeze_blank else "")
+                label = f"{name} {lines:,} {flags.strip()}"
+                print(
+                    f"{label:<24} {former_seconds * 1000:7.2f}ms {chunked_seconds * 1000:7.2f}ms "
+                    f"{former_seconds / chunked_seconds:7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,91 @@
+"""
+Compare cat_markdown of a glob reading files one after another with reading them ahead on threads, on files whose
+open costs a fixed latency, as on a cold cache, a network mount or a slow disk. Also runs with the page cache
+really dropped when /proc/sys/vm/drop_caches is writable (root on Linux).
+
+Usage:
+    python benchmarks/bench_cat_read_ahead.py [files] [lines_per_file]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import IO, Any
+
+from ai_shell.cat_tool import CatTool
+from ai_shell.utils import read_ahead
+from ai_shell.utils.config_manager import Config
+
+REAL_CACHED_OPEN = read_ahead.cached_open
+LATENCIES = (0.0, 0.001, 0.005)
+WORKERS = (1, 4, 8)
+
+
+def slow_open(latency: float) -> Callable[..., IO]:
+    """cached_open that waits the latency before opening."""
+
+    def cached_open(path: str, mode: str = "r", errors: str | None = None) -> IO:
+        time.sleep(latency)
+        return REAL_CACHED_OPEN(path, mode, errors)
+
+    return cached_open
+
+
+def drop_page_cache() -> bool:
+    """Evict every file from the page cache, False if not allowed."""
+    try:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w", encoding="utf-8") as file:
+            file.write("1\n")
+        return True
+    except OSError:
+        return False
+
+
+def timed(work: Callable[[], Any]) -> tuple[float, Any]:
+    """Seconds a call takes, and its result."""
+    started = time.perf_counter()
+    result = work()
+    return time.perf_counter() - started, result
+
+
+def run() -> None:
+    """Print the seconds per worker count and latency, checking the output is the same."""
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    lines_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    with tempfile.TemporaryDirectory() as top:
+        for number in range(files):
+            with open(os.path.join(top, f"module_{number:04}.py"), "w", encoding="utf-8") as file:
+                file.writelines(f"value_{line} = compute({number}, {line})\n" for line in range(lines_per_file))
+        tools = {}
+        for workers in WORKERS:
+            config = Config(os.path.join(top, f"ai_shell_{workers}.toml"))
+            config.set_value("cat_workers", str(workers))
+            tools[workers] = CatTool(top, config)
+        print(f"{files} files of {lines_per_file} lines")
+        print(f"{'open latency':<14}" + "".join(f"{f'{workers} workers':>12}" for workers in WORKERS))
+        for latency in LATENCIES:
+            read_ahead.cached_open = slow_open(latency)  # type: ignore[assignment]
+            row, expected = [], None
+            for tool in tools.values():
+                seconds, output = timed(partial(tool.cat_markdown, ["*.py"]))
+                assert expected is None or output == expected
+                expected = output
+                row.append(f"{seconds * 1000:10.1f}ms")
+            print(f"{latency * 1000:>10.0f} ms " + "".join(row))
+        read_ahead.cached_open = REAL_CACHED_OPEN
+        row = []
+        for tool in tools.values():
+            if not drop_page_cache():
+                print("dropped page cache: not allowed here")
+                return
+            seconds, _output = timed(partial(tool.cat_markdown, ["*.py"]))
+            row.append(f"{seconds * 1000:10.1f}ms")
+        print(f"{'cold cache':<14}" + "".join(row))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,44 @@
+"""
+Benchmark the literal search strategies grep picks from: regex alternation vs Aho-Corasick, by literal count.
+
+Usage:
+    python benchmarks/bench_grep_literals.py [megabytes]
+"""
+
+import random
+import re
+import string
+import sys
+import time
+
+from ai_shell.utils.aho_corasick import AhoCorasick
+
+
+def run() -> None:
+    """Time both strategies over the same random text at increasing literal counts."""
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    generator = random.Random(42)
+    alphabet = string.ascii_letters + "  _()\n"
+    data = "".join(generator.choice(alphabet) for _ in range(megabytes * 1_000_000)).encode("utf-8")
+    print(f"{megabytes}MB of text")
+    print("literals  regex  aho-corasick")
+    for count in (1, 4, 16, 64, 128, 500):
+        needles = [
+            "".join(generator.choice(string.ascii_lowercase) for _ in range(10)).encode("utf-8") for _ in range(count)
+        ]
+        pattern = re.compile(b"|".join(re.escape(needle) for needle in needles))
+        started = time.perf_counter()
+        regex_hits = sum(1 for _ in pattern.finditer(data))
+        regex_seconds = time.perf_counter() - started
+
+        automaton = AhoCorasick(needles)
+        started = time.perf_counter()
+        automaton_hits = sum(1 for _ in automaton.finditer(data))
+        automaton_seconds = time.perf_counter() - started
+        if regex_hits != automaton_hits:
+            raise AssertionError(f"regex found {regex_hits}, aho-corasick found {automaton_hits}")
+        print(f"{count:>8}  {regex_seconds:5.3f}  {automaton_seconds:12.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,64 @@
+"""
+Benchmark GrepTool.grep scaling from 1 to N worker processes on a synthetic tree.
+
+Usage:
+    python benchmarks/bench_grep_parallel.py [file_count] [lines_per_file]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from ai_shell.ai_logs.log_to_bash import enable_logging
+from ai_shell.grep_tool import GrepTool
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.cwd_utils import change_directory
+
+
+def make_tree(root: str, file_count: int, lines_per_file: int) -> None:
+    """Write file_count python-ish files spread over a few packages, with a sparse TODO in each.
+
+    Args:
+        root (str): The folder to fill.
+        file_count (int): How many files to write.
+        lines_per_file (int): How many lines per file.
+    """
+    for index in range(file_count):
+        package = os.path.join(root, f"package_{index % 20}")
+        os.makedirs(package, exist_ok=True)
+        with open(os.path.join(package, f"module_{index}.py"), "w", encoding="utf-8") as file:
+            for line_number in range(lines_per_file):
+                if line_number == lines_per_file // 2:
+                    file.write(f"# TODO: fix module {index}\n")
+                else:
+                    file.write(f"value_{line_number} = compute({line_number}, 'some text to scan past')\n")
+
+
+def run() -> None:
+    """Time the same grep at increasing worker counts."""
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lines_per_file = int(sys.argv[2]) if len(sys.argv) > 2 else 400
+    enable_logging(False)
+    with tempfile.TemporaryDirectory() as root, change_directory(root):
+        make_tree(root, file_count, lines_per_file)
+        config = Config(os.path.join(root, "ai_shell.toml"))
+        cpus = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, 8, cpus} & set(range(1, cpus + 1)))
+        print(f"{file_count} files x {lines_per_file} lines, {cpus} cpus")
+        print("workers  seconds  speedup")
+        baseline = 0.0
+        for workers in worker_counts:
+            config.set_value("grep_workers", str(workers))
+            tool = GrepTool(root, config)
+            started = time.perf_counter()
+            results = tool.grep(r"TODO:\s+fix", "**/*.py")
+            elapsed = time.perf_counter() - started
+            if results.matches_found != file_count:
+                raise AssertionError(f"Expected {file_count} matches, got {results.matches_found}")
+            baseline = baseline or elapsed
+            print(f"{workers:>7}  {elapsed:7.3f}  {baseline / elapsed:6.2f}x")
+
+
+if __name__ == "__main__":
+    run()
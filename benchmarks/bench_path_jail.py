@@ -0,0 +1,89 @@
+"""
+Measure the root folder checks on result lists: the former per-call resolving vs a PathJail.
+
+Usage:
+    python benchmarks/bench_path_jail.py [paths]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from ai_shell.utils.path_jail import PathJail
+
+FOLDERS = 100
+
+
+def former_is_file_in_root_folder(file_path: str, root_folder: str) -> bool:
+    """The former check, abspath and commonpath per call."""
+    if not os.path.isabs(file_path):
+        file_path = root_folder + "/" + file_path
+    absolute_file_path = os.path.abspath(file_path)
+    absolute_root_folder = os.path.abspath(root_folder)
+    common_path = os.path.commonpath([absolute_file_path, absolute_root_folder])
+    return common_path.lower() == absolute_root_folder.lower()
+
+
+def former_remove_root_folder(file_path: str) -> str:
+    """The former relativizing, resolving the root and the file per call."""
+    root = Path(".").resolve()
+    file = Path(file_path)
+    if file.resolve() == root:
+        return "."
+    file = root / file if not file.is_absolute() else file
+    file = file.resolve()
+    if root in file.parents:
+        return str(file.relative_to(root)).replace("\\", "/")
+    raise ValueError("File path is not under the root folder")
+
+
+def build_tree(top: str, paths: int) -> list[str]:
+    """Create the files, spread over FOLDERS folders, and return their relative paths."""
+    relative_paths = []
+    for number in range(paths):
+        folder = f"src/package_{number % FOLDERS}"
+        relative_paths.append(f"{folder}/module_{number}.py")
+    for number in range(FOLDERS):
+        os.makedirs(os.path.join(top, f"src/package_{number}"), exist_ok=True)
+    for relative_path in relative_paths:
+        with open(os.path.join(top, relative_path), "w", encoding="utf-8"):
+            pass
+    return relative_paths
+
+
+def timed(work: Callable[[], Any]) -> float:
+    """Seconds work takes."""
+    started = time.perf_counter()
+    work()
+    return time.perf_counter() - started
+
+
+def run() -> None:
+    """Print seconds per 100k-ish paths for each way of checking and relativizing."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    original_folder = os.getcwd()
+    with tempfile.TemporaryDirectory() as top:
+        paths = build_tree(top, count)
+        os.chdir(top)
+        try:
+            jail = PathJail(top)
+            rows = [
+                ("is_file_in_root_folder, former", lambda: [former_is_file_in_root_folder(p, top) for p in paths]),
+                ("PathJail.contains", lambda: [jail.contains(p) for p in paths]),
+                ("remove_root_folder, former", lambda: [former_remove_root_folder(p) for p in paths]),
+                ("relativize_many, cold", lambda: jail.relativize_many(paths)),
+                ("relativize_many, warm", lambda: jail.relativize_many(paths)),
+            ]
+            print(f"{count:,} paths in {FOLDERS} folders")
+            for name, work in rows:
+                print(f"{name:<32} {timed(work):8.3f}s")
+        finally:
+            os.chdir(original_folder)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,105 @@
+"""
+Measure the memory held by grep and find results: one object per match or path vs the compact containers.
+
+Usage:
+    python benchmarks/bench_result_memory.py [matches]
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import orjson
+
+from ai_shell.grep_tool import FileMatches, GrepResults
+from ai_shell.utils.json_utils import loosy_goosy_default_encoder
+from ai_shell.utils.path_list import PathList
+
+FILES = 1000
+
+
+@dataclass
+class ObjectMatch:
+    """The former layout, one object per match."""
+
+    line_number: int
+    line: str
+
+
+@dataclass
+class ObjectFileMatches:
+    """The former layout of the matches in a file."""
+
+    filename: str
+    found: list[ObjectMatch] = field(default_factory=list)
+
+
+def object_results(matches: int) -> list[ObjectFileMatches]:
+    """Grep results the way they used to be built."""
+    per_file = matches // FILES
+    data = []
+    for file_number in range(FILES):
+        file_matches = ObjectFileMatches(filename=f"src/package_{file_number % 10}/module_{file_number}.py")
+        for line_number in range(per_file):
+            file_matches.found.append(ObjectMatch(line_number + 1, f"    value_{line_number} = call()"))
+        data.append(file_matches)
+    return data
+
+
+def compact_results(matches: int) -> GrepResults:
+    """The same grep results in the columnar containers."""
+    per_file = matches // FILES
+    data = []
+    for file_number in range(FILES):
+        file_matches = FileMatches(filename=f"src/package_{file_number % 10}/module_{file_number}.py")
+        for line_number in range(per_file):
+            file_matches.add(line_number + 1, f"    value_{line_number} = call()")
+        data.append(file_matches)
+    return GrepResults(matches_found=matches, data=data)
+
+
+def path_strings(paths: int) -> list[str]:
+    """Find results as a list of strings."""
+    return [f"src/package_{number % 100}/sub/module_{number}.py" for number in range(paths)]
+
+
+def compact_paths(paths: int) -> PathList:
+    """Find results as a PathList."""
+    return PathList(f"src/package_{number % 100}/sub/module_{number}.py" for number in range(paths))
+
+
+def measure(build: Callable[[int], Any], count: int) -> tuple[Any, int, float]:
+    """Build a result, return it with the bytes it still holds and the seconds it took to build."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build(count)
+    seconds = time.perf_counter() - started
+    held, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, held, seconds
+
+
+def run() -> None:
+    """Print held memory, build time and orjson time for each layout."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{count:,} matches / paths")
+    print("layout              held MB  build s  orjson s")
+    for name, build in (
+        ("grep objects", object_results),
+        ("grep columns", compact_results),
+        ("find list[str]", path_strings),
+        ("find PathList", compact_paths),
+    ):
+        result, held, seconds = measure(build, count)
+        started = time.perf_counter()
+        orjson.dumps(result, default=loosy_goosy_default_encoder)
+        encode_seconds = time.perf_counter() - started
+        print(f"{name:<18} {held / 1_000_000:8.1f} {seconds:8.2f} {encode_seconds:9.2f}")
+        del result
+
+
+if __name__ == "__main__":
+    run()
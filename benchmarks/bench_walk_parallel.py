@@ -0,0 +1,136 @@
+"""
+Compare os.walk with scan_tree, serial and with listing threads, on a synthetic tree where every directory
+listing and every first stat of an entry costs a fixed latency, as on FUSE, overlay or network mounts.
+
+Usage:
+    python benchmarks/bench_walk_parallel.py [folders] [files_per_folder]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from ai_shell.utils.walk import scan_tree
+
+REAL_SCANDIR = os.scandir
+LATENCIES = (0.0, 0.0001, 0.001)
+
+
+class SlowEntry:
+    """A DirEntry whose first is_dir/is_file/is_symlink/stat call waits the latency, later ones are cached."""
+
+    def __init__(self, entry: os.DirEntry, latency: float) -> None:
+        self._entry = entry
+        self._latency = latency
+        self._paid = False
+        self.name = entry.name
+        self.path = entry.path
+
+    def _pay(self) -> None:
+        if not self._paid and self._latency:
+            time.sleep(self._latency)
+        self._paid = True
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        self._pay()
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        self._pay()
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        self._pay()
+        return self._entry.is_symlink()
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        self._pay()
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+
+class SlowScandir:
+    """os.scandir replacement whose listing waits the latency once."""
+
+    def __init__(self, path: Any, latency: float) -> None:
+        if latency:
+            time.sleep(latency)
+        with REAL_SCANDIR(path) as entries:
+            self._entries = iter([SlowEntry(entry, latency) for entry in entries])
+
+    def __enter__(self) -> "SlowScandir":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+    def __iter__(self) -> Iterator[SlowEntry]:
+        return self
+
+    def __next__(self) -> SlowEntry:
+        return next(self._entries)
+
+    def close(self) -> None:
+        return None
+
+
+def build_tree(top: str, folders: int, files_per_folder: int) -> None:
+    """Folders ten to a parent, each holding files_per_folder small files."""
+    for number in range(folders):
+        parts = [f"d{digit}" for digit in str(number)]
+        folder = os.path.join(top, *parts)
+        os.makedirs(folder, exist_ok=True)
+        for file_number in range(files_per_folder):
+            with open(os.path.join(folder, f"f{file_number}.txt"), "w", encoding="utf-8") as handle:
+                handle.write("x")
+
+
+def with_os_walk(top: str) -> int:
+    """Count entries the os.walk way."""
+    count = 0
+    for _folder, folder_names, file_names in os.walk(top):
+        count += len(folder_names) + len(file_names)
+    return count
+
+
+def with_scan_tree(workers: int) -> Callable[[str], int]:
+    """Count entries with scan_tree and the given number of listing threads."""
+
+    def walk(top: str) -> int:
+        return sum(1 for _item in scan_tree(top, workers=workers))
+
+    return walk
+
+
+def run() -> None:
+    """Print seconds per walk for each walker at each latency."""
+    folders = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    files_per_folder = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    walkers = (
+        ("os.walk", with_os_walk),
+        ("scan_tree 1 worker", with_scan_tree(1)),
+        ("scan_tree 8 workers", with_scan_tree(8)),
+    )
+    with tempfile.TemporaryDirectory() as top:
+        build_tree(top, folders, files_per_folder)
+        print(f"{folders} folders, {files_per_folder} files each")
+        print("latency ms  " + "".join(f"{name:>22}" for name, _walk in walkers))
+        for latency in LATENCIES:
+            os.scandir = lambda path=".", latency=latency: SlowScandir(path, latency)  # type: ignore
+            try:
+                cells = []
+                counts = set()
+                for _name, walk in walkers:
+                    started = time.perf_counter()
+                    counts.add(walk(top))
+                    cells.append(f"{time.perf_counter() - started:21.3f}s")
+                assert len(counts) == 1, counts
+            finally:
+                os.scandir = REAL_SCANDIR
+            print(f"{latency * 1000:10.1f}  " + "".join(cells))
+
+
+if __name__ == "__main__":
+    run()
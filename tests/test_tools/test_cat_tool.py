@@ -2,7 +2,9 @@ import os
 
 import pytest
 
+from ai_shell import cat_tool
 from ai_shell.cat_tool import CatTool
+from ai_shell.utils.config_manager import Config
 from tests.util import config_for_tests
 
 
@@ -33,3 +35,46 @@ def test_squeeze_blank(setup_test_file):
     expected_output = "bread\n\ncookies\n"
     actual_output = cat_tool.cat_markdown([setup_test_file], squeeze_blank=True, number_lines=False)
     assert actual_output == expected_output
+
+
+def test_chunked_read_keeps_lines_whole(tmp_path):
+    # \r alone, form feed and U+2028 are not line ends, a line longer than the buffer makes it grow.
+    content = "a\r\nb\rc\x0cd e\n \t\n\n" + "é" * 40 + "\nlast"
+    (tmp_path / "odd.txt").write_bytes(content.encode("utf-8"))
+    with open(tmp_path / "odd.txt", "rb") as file:
+        chunks = list(cat_tool.read_whole_lines(file, chunk_size=8))
+    assert "".join(chunks) == content.replace("\r\n", "\n")
+    assert all(chunk.endswith("\n") for chunk in chunks[:-1])
+
+    tool = CatTool(root_folder=str(tmp_path), config=config_for_tests())
+    numbered = tool.cat_markdown(["odd.txt"], number_lines=True, squeeze_blank=True)
+    assert numbered == "1\ta\n2\tb\rc\x0cd e\n3\t \t\n4\t" + "é" * 40 + "\n5\tlast"
+    assert "".join(tool.cat(["odd.txt"], number_lines=True, squeeze_blank=True)) == numbered
+
+
+def test_read_ahead_keeps_file_order(tmp_path):
+    for number in range(30):
+        (tmp_path / f"file_{number:02}.txt").write_text(f"file {number}\n" * (number % 4) + "\n\n\nend\n")
+    config = Config(str(tmp_path / "ai_shell.toml"))
+    config.set_value("cat_workers", "1")
+    expected = CatTool(str(tmp_path), config).cat_markdown(["*.txt"], squeeze_blank=True)
+    assert expected.startswith("1\t\n2\tend\n3\tfile 1\n")
+
+    config.set_value("cat_workers", "4")
+    config.set_value("cat_read_ahead_bytes", "64")
+    tool = CatTool(str(tmp_path), config)
+    assert tool.cat_markdown(["*.txt"], squeeze_blank=True) == expected
+    assert "".join(tool.cat(["*.txt"], squeeze_blank=True)) == expected
+    # stopping early leaves no reads queued
+    lines = tool.cat(["*.txt"])
+    assert next(lines) == "1\t\n"
+    lines.close()
+
+
+def test_overlapping_patterns_repeat_files(tmp_path):
+    (tmp_path / "a.py").write_text("a\n")
+    (tmp_path / "b.py").write_text("b\n")
+    tool = CatTool(str(tmp_path), config_for_tests())
+    assert tool.cat_markdown(["*.py", "a.py"], number_lines=True) == "1\ta\n2\tb\n3\ta\n"
+    assert tool.cat_markdown(["a.py", "a.py"], number_lines=False) == "a\na\n"
+    assert tool.cat_markdown(["b.py", "*.py", "!a.py"], number_lines=False) == "b\nb\n"
@@ -3,6 +3,7 @@ import os
 import pytest
 
 from ai_shell.find_tool import FindTool
+from ai_shell.utils.config_manager import Config
 from ai_shell.utils.read_fs import temporary_change_dir
 from tests.util import config_for_tests
 
@@ -73,3 +74,66 @@ def test_find_files_markdown_by_type(setup_test_environment):
 
         results = tool.find_files_markdown(file_type="directory")
         assert results == "test_dir\n"
+
+
+@pytest.fixture
+def nested_tree(tmp_path):
+    for relative_path in (
+        "a.txt",
+        "a/x.py",
+        "a/b/y.py",
+        "b.py",
+        ".hidden/secret.py",
+        "a/.env",
+        "a/__pycache__/x.cpython-312.pyc",
+        "node_modules/lib/index.py",
+    ):
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content")
+    return tmp_path
+
+
+def test_find_files_sorted_and_pruned(nested_tree, monkeypatch):
+    listed = []
+    original_scandir = os.scandir
+
+    def spy_scandir(path):
+        listed.append(os.path.basename(path))
+        return original_scandir(path)
+
+    monkeypatch.setattr("ai_shell.utils.walk.os.scandir", spy_scandir)
+    config = Config(str(nested_tree / "find.toml"))
+    config.set_list("excluded_folders", ["node_modules"])
+    with temporary_change_dir(str(nested_tree)):
+        tool = FindTool(str(nested_tree), config=config)
+        assert tool.find_files() == ["a.txt", "a/b/y.py", "a/x.py", "b.py", "find.toml"]
+        assert tool.find_files(file_type="directory") == ["a", "a/b"]
+    assert not {".hidden", "__pycache__", "node_modules"} & set(listed)
+
+
+def test_find_files_regex_and_limit(nested_tree, monkeypatch):
+    with temporary_change_dir(str(nested_tree)):
+        tool = FindTool(str(nested_tree), config=config_for_tests())
+        assert tool.find_files(regex=r"\.py$") == ["a/b/y.py", "a/x.py", "b.py", "node_modules/lib/index.py"]
+        assert tool.find_files(name="*.py", limit=2) == ["a/b/y.py", "a/x.py"]
+        listed = []
+        original_scandir = os.scandir
+        monkeypatch.setattr(
+            "ai_shell.utils.walk.os.scandir", lambda path: listed.append(path) or original_scandir(path)
+        )
+        assert tool.find_files(limit=1) == ["a.txt"]
+        # only the top folder was listed
+        assert len(listed) == 1
+
+
+def test_find_files_parallel_walk_same_order(nested_tree):
+    config = Config(str(nested_tree / "find.toml"))
+    with temporary_change_dir(str(nested_tree)):
+        serial = FindTool(str(nested_tree), config=config).find_files()
+        config.set_value("walk_workers", "4")
+        tool = FindTool(str(nested_tree), config=config)
+        assert tool.walk_workers == 4
+        assert tool.find_files() == serial
+        assert tool.find_files(limit=2) == serial[:2]
+        assert tool.find_files(size="-8") == ["a.txt", "a/b/y.py", "a/x.py", "b.py", "node_modules/lib/index.py"]
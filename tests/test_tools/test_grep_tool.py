@@ -1,9 +1,17 @@
 import os
+import sys
 import tempfile
+import time
 
+import orjson
 import pytest
 
+import ai_shell.grep_tool as grep_tool_module
 from ai_shell.grep_tool import GrepTool  # Make sure to import your GrepTool class correctly
+from ai_shell.replace_tool import ReplaceTool
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.fingerprint_cache import shared_cache
+from ai_shell.utils.json_utils import loosy_goosy_default_encoder
 from ai_shell.utils.read_fs import temporary_change_dir
 from tests.util import config_for_tests
 
@@ -51,3 +59,264 @@ def test_grep_print_lines_markdown(temp_file_with_content):
         results = grep_tool.grep_markdown(regex, glob_pattern).split("\n")
         results_string = "\n".join(results[1:])
         assert results_string == 'line 2: print("Hello World")\n1 matches found and 1 displayed. Skipped -1\n'
+
+
+@pytest.fixture
+def tree_of_files(tmp_path):
+    for index in range(6):
+        (tmp_path / f"module_{index}.py").write_text(f"# TODO one {index}\nx = 1\n# TODO two {index}\n")
+    return tmp_path
+
+
+def test_grep_parallel_matches_serial(tree_of_files):
+    with temporary_change_dir(str(tree_of_files)):
+        serial = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        config = Config(str(tree_of_files / "parallel.toml"))
+        config.set_value("grep_workers", "3")
+        parallel = GrepTool(root_folder=str(tree_of_files), config=config)
+        assert parallel.workers == 3
+        assert parallel.grep("TODO", "*.py") == serial.grep("TODO", "*.py")
+        assert parallel.grep("TODO", "*.py").matches_found == 12
+
+
+def test_grep_maximum_matches_total(tree_of_files):
+    with temporary_change_dir(str(tree_of_files)):
+        grep_tool = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        results = grep_tool.grep("TODO", "*.py", skip_first_matches=1, maximum_matches_total=3)
+        found = [(file_match.filename, match.line) for file_match in results.data for match in file_match.found]
+        assert found == [
+            ("module_0.py", "# TODO two 0"),
+            ("module_1.py", "# TODO one 1"),
+            ("module_1.py", "# TODO two 1"),
+        ]
+        # stopped reading once the limit was met
+        assert results.matches_found == 4
+
+
+def test_grep_stops_reading_files_at_limit(tree_of_files, mocker):
+    with temporary_change_dir(str(tree_of_files)):
+        scan_file = mocker.spy(grep_tool_module, "scan_file_literals")
+        grep_tool = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        results = grep_tool.grep("TODO", "*.py", maximum_matches_total=3)
+        assert results.matches_found == 3
+        assert scan_file.call_count == 2
+
+
+def test_iter_grep_is_lazy(tree_of_files):
+    with temporary_change_dir(str(tree_of_files)):
+        grep_tool = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        stream = grep_tool.iter_grep("TODO", "*.py")
+        filename, match = next(stream)
+        assert (filename, match.line_number, match.line) == ("module_0.py", 1, "# TODO one 0")
+        stream.close()
+
+
+def test_grep_with_trigram_index(tree_of_files):
+    with temporary_change_dir(str(tree_of_files)):
+        (tree_of_files / "nothing_here.py").write_text("x = 2\n")
+        config = Config(str(tree_of_files / "indexed.toml"))
+        config.set_flag("grep_index", True)
+        indexed = GrepTool(root_folder=str(tree_of_files), config=config)
+        plain = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        assert indexed.grep("TODO two", "*.py") == plain.grep("TODO two", "*.py")
+        assert (tree_of_files / ".ai_shell" / "trigrams.sqlite3").exists()
+
+
+def test_grep_multiline(tmp_path):
+    (tmp_path / "shapes.py").write_text(
+        "class Square:\n    @property\n    def side(self): return 1\n\n    @staticmethod\n    def make(): pass\n"
+        "    @property\n    def area(self): return 1  # @property\n"
+    )
+    (tmp_path / "empty.py").write_text("")
+    with temporary_change_dir(str(tmp_path)):
+        grep_tool = GrepTool(root_folder=str(tmp_path), config=config_for_tests())
+        results = grep_tool.grep(r"@property\s+def \w+", "*.py", multiline=True)
+        assert results.matches_found == 2
+        found = [(match.line_number, match.line) for match in results.data[0].found]
+        assert found == [
+            (2, "@property\n    def side(self): return 1"),
+            (7, "@property\n    def area(self): return 1  # @property"),
+        ]
+        # single line patterns behave like plain grep, one hit per line
+        assert grep_tool.grep("property", "*.py", multiline=True) == grep_tool.grep("property", "*.py")
+
+
+def test_grep_fixed_strings(tmp_path):
+    names = [f"name_{index}" for index in range(150)]
+    (tmp_path / "code.py").write_text("a = name_3(x)\nb = 1\nc = name_149 + name_3\nprint(d)\n")
+    with temporary_change_dir(str(tmp_path)):
+        grep_tool = GrepTool(root_folder=str(tmp_path), config=config_for_tests())
+        many = grep_tool.grep("\n".join(names), "*.py", fixed_strings=True)
+        assert [match.line_number for match in many.data[0].found] == [1, 3]
+        assert many == grep_tool.grep("|".join(names), "*.py")
+        # not a regex
+        assert grep_tool.grep("name_3(x)", "*.py", fixed_strings=True).matches_found == 1
+        # auto-detected literal, same as the regex engine's answer
+        assert grep_tool.grep(r"print\(", "*.py").data[0].found == [grep_tool_module.Match(4, "print(d)")]
+
+
+def test_grep_literals_count_lines_like_the_regex_engine(tmp_path):
+    # old Mac "\r" line ends and Windows "\r\n" ones
+    (tmp_path / "mixed.txt").write_bytes(b"a\rTODO one\r\nb\rTODO two\n")
+    with temporary_change_dir(str(tmp_path)):
+        grep_tool = GrepTool(root_folder=str(tmp_path), config=config_for_tests())
+        literal = grep_tool.grep("TODO", "*.txt")
+        assert [(match.line_number, match.line) for match in literal.data[0].found] == [
+            (2, "TODO one"),
+            (4, "TODO two"),
+        ]
+        assert literal == grep_tool.grep("TOD[O]", "*.txt")
+        assert grep_tool.grep_count("TODO", "*.txt") == grep_tool.grep_count("TOD[O]", "*.txt") == {"mixed.txt": 2}
+
+
+def test_literal_scan_with_a_limit_reads_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(grep_tool_module, "LITERAL_CHUNK_SIZE", 8)
+    path = tmp_path / "long.txt"
+    # "needle" straddles the 8 byte chunks, "\r\n" too
+    path.write_bytes(b"abc\r\nxxneedle\r\n" + b"filler\n" * 50 + b"a needle\n")
+    whole = grep_tool_module.scan_file_literals(str(path), ("needle",))
+    assert whole == [(2, "xxneedle"), (53, "a needle")]
+    assert grep_tool_module.scan_file_literals(str(path), ("needle",), 5) == whole
+    assert grep_tool_module.scan_file_literals(str(path), ("needle",), 1) == whole[:1]
+    (tmp_path / "empty.txt").write_bytes(b"")
+    assert grep_tool_module.scan_file_literals(str(tmp_path / "empty.txt"), ("needle",), 1) == []
+
+    reads = []
+    real_open = grep_tool_module.cached_open
+
+    def counting_open(*args, **kwargs):
+        file = real_open(*args, **kwargs)
+        real_read = file.read
+        file.read = lambda size=-1: reads.append(size) or real_read(size)
+        return file
+
+    monkeypatch.setattr(grep_tool_module, "cached_open", counting_open)
+    grep_tool_module.scan_file_literals(str(path), ("needle",), 1)
+    # stopped at the first match, a few chunks in
+    assert len(reads) < 5
+    assert -1 not in reads
+
+
+def test_grep_many_matches_separate_greps(tree_of_files):
+    (tree_of_files / "module_9.py").write_text("print('x')\nlogging.info('y')  # TODO\n")
+    patterns = {"todo": "TODO", "print": r"print\(", "two": r"two \d", "none": "nothing"}
+    with temporary_change_dir(str(tree_of_files)):
+        grep_tool = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        results = grep_tool.grep_many(patterns, "*.py")
+        assert list(results) == ["todo", "print", "two", "none"]
+        for name, regex in patterns.items():
+            assert results[name] == grep_tool.grep(regex, "*.py")
+        # per pattern limits, and the json string form bots send
+        limited = grep_tool.grep_many('{"todo": "TODO", "print": "print\\\\("}', "*.py", maximum_matches_per_pattern=3)
+        assert limited["todo"].matches_found == 3
+        assert [file_match.filename for file_match in limited["todo"].data] == ["module_0.py", "module_1.py"]
+        assert limited["print"].matches_found == 1
+
+
+def test_grep_cache_hits_and_write_invalidation(tree_of_files):
+    an_hour_ago = time.time() - 3600
+    for path in tree_of_files.iterdir():
+        os.utime(path, (an_hour_ago, an_hour_ago))
+    with temporary_change_dir(str(tree_of_files)):
+        grep_tool = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        first = grep_tool.grep("TODO one", "*.py")
+        first.data.clear()
+        again = GrepTool(root_folder=str(tree_of_files), config=config_for_tests()).grep("TODO one", "*.py")
+        assert again.matches_found == 6 and len(again.data) == 6
+        cache = shared_cache(str(tree_of_files), "grep")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        os.utime("module_2.py", (an_hour_ago, an_hour_ago))
+        replace_tool = ReplaceTool(str(tree_of_files), config=config_for_tests())
+        replace_tool.auto_cat = False
+        replace_tool.replace_all("module_2.py", "TODO one", "DONE one")
+        # same second, same size: only the write notification tells the cache
+        os.utime("module_2.py", (an_hour_ago, an_hour_ago))
+        assert grep_tool.grep("TODO one", "*.py").matches_found == 5
+
+
+def test_grep_files_with_matches_and_count(tree_of_files, mocker):
+    (tree_of_files / "module_9.py").write_text("nothing\n")
+    with temporary_change_dir(str(tree_of_files)):
+        grep_tool = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        scan_file = mocker.spy(grep_tool_module, "scan_file")
+        assert grep_tool.grep_files_with_matches(r"TODO \w+", "*.py") == [f"module_{i}.py" for i in range(6)]
+        # one match per file is enough
+        assert [len(result) for result in scan_file.spy_return_list] == [1] * 6 + [0]
+        assert grep_tool.grep_files_with_matches("TODO", "*.py", maximum_files=2) == ["module_0.py", "module_1.py"]
+
+        expected = {f"module_{i}.py": 2 for i in range(6)}
+        assert grep_tool.grep_count("TODO", "*.py") == expected
+        assert grep_tool.grep_count(r"TODO \w+", "*.py") == expected
+        assert grep_tool.grep_count(r"one \d\nx = 1", "*.py", multiline=True) == {f: 1 for f in expected}
+
+        markdown = grep_tool.grep_markdown("TODO", "*.py", output_mode="count")
+        assert markdown.startswith("module_0.py: 2\n")
+        assert markdown.endswith("12 matches found in 6 files.\n")
+        markdown = grep_tool.grep_markdown("x = 1", "*.py", maximum_matches=1, output_mode="files_with_matches")
+        assert markdown == "module_0.py\n1 files with matches.\n"
+        with pytest.raises(ValueError):
+            grep_tool.grep_markdown("x", "*.py", output_mode="lines")
+
+
+def test_grep_context_lines(tmp_path):
+    (tmp_path / "lines.txt").write_text("".join(f"line {number}\n" for number in range(1, 21)))
+    with temporary_change_dir(str(tmp_path)):
+        grep_tool = GrepTool(root_folder=str(tmp_path), config=config_for_tests())
+        results = grep_tool.grep(r"line (5|7|15)$", "*.txt", context_before=2, context_after=1)
+        file_matches = results.data[0]
+        assert [match.line_number for match in file_matches.found] == [5, 7, 15]
+        # windows 3-6, 5-8 and 13-16 merge, each line once
+        assert [match.line_number for match in file_matches.context] == [3, 4, 6, 8, 13, 14, 16]
+        assert file_matches.context[0].line == "line 3"
+
+        # the mapped buffer scan agrees with the ring buffer scan
+        multiline = grep_tool.grep(r"line (5|7|15)$", "*.txt", multiline=True, context_before=2, context_after=1)
+        assert multiline == results
+
+        # context of skipped matches is left out
+        skipped = grep_tool.grep(r"line (5|7|15)$", "*.txt", skip_first_matches=2, context_before=2, context_after=1)
+        assert [match.line_number for match in skipped.data[0].context] == [13, 14, 16]
+
+        markdown = grep_tool.grep_markdown("line 1[0-1]$", "*.txt", context_lines=1)
+        assert markdown.startswith("lines.txt\nline 9- line 9\nline 10: line 10\nline 11: line 11\nline 12- line 12\n")
+        assert "--" not in markdown
+        assert "--\n" in grep_tool.grep_markdown("line (2|9)$", "*.txt", context_lines=1)
+
+
+def test_grep_context_at_file_edges(tmp_path):
+    (tmp_path / "short.txt").write_text("alpha\nbeta\ngamma")
+    with temporary_change_dir(str(tmp_path)):
+        grep_tool = GrepTool(root_folder=str(tmp_path), config=config_for_tests())
+        for multiline in (False, True):
+            results = grep_tool.grep("beta", "*.txt", multiline=multiline, context_before=5, context_after=5)
+            assert results.data[0].context == [grep_tool_module.Match(1, "alpha"), grep_tool_module.Match(3, "gamma")]
+
+
+def test_grep_results_are_columnar(tree_of_files):
+    with temporary_change_dir(str(tree_of_files)):
+        tool = GrepTool(root_folder=str(tree_of_files), config=config_for_tests())
+        results = tool.grep("TODO", "*.py", context_after=1)
+    file_matches = results.data[0]
+    assert list(file_matches.line_numbers) == [1, 3]
+    assert file_matches.lines == ["# TODO one 0", "# TODO two 0"]
+    assert file_matches.found[1] == grep_tool_module.Match(3, "# TODO two 0")
+    assert file_matches.context == [grep_tool_module.Match(2, "x = 1")]
+    assert file_matches.filename is sys.intern("module_0.py")
+    encoded = orjson.loads(orjson.dumps(results, default=loosy_goosy_default_encoder))
+    assert encoded["data"][0] == {
+        "filename": "module_0.py",
+        "line_numbers": [1, 3],
+        "lines": ["# TODO one 0", "# TODO two 0"],
+        "context_line_numbers": [2],
+        "context_lines": ["x = 1"],
+    }
+    # no context columns unless context was asked for
+    with temporary_change_dir(str(tree_of_files)):
+        plain = tool.grep("TODO", "*.py")
+    assert plain.data[0].context == []
+    assert orjson.loads(orjson.dumps(plain, default=loosy_goosy_default_encoder))["data"][0] == {
+        "filename": "module_0.py",
+        "line_numbers": [1, 3],
+        "lines": ["# TODO one 0", "# TODO two 0"],
+    }
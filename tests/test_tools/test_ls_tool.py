@@ -1,3 +1,6 @@
+import os
+import time
+
 import pytest
 
 from ai_shell.ls_tool import LsTool
@@ -58,3 +61,31 @@ def test_ls_invalid_directory():
     # with pytest.raises(OSError):
     result = lstool.ls("/non/existent/directory")
     assert result.startswith("# Bad")
+
+
+def test_listing_reused_while_folder_unchanged(test_directory, monkeypatch):
+    scanned = []
+    original_scandir = os.scandir
+    monkeypatch.setattr(
+        "ai_shell.utils.listing_cache.os.scandir", lambda path: scanned.append(path) or original_scandir(path)
+    )
+    # Listings of folders changed in the last couple of seconds aren't kept, their mtime could still change.
+    os.utime(test_directory, (time.time() - 60, time.time() - 60))
+    assert LsTool(str(test_directory), config=config_for_tests()).ls(".") == ["file1.txt", "file2.txt"]
+    assert LsTool(str(test_directory), config=config_for_tests()).ls(".", all_files=True) == [
+        ".hidden1",
+        ".hidden2",
+        "file1.txt",
+        "file2.txt",
+    ]
+    assert len(scanned) == 1
+
+    # Sizes aren't covered by the folder's mtime, without a watcher long listings are scanned each time.
+    (test_directory / "file1.txt").write_text("grown")
+    os.utime(test_directory, (time.time() - 60, time.time() - 60))
+    assert LsTool(str(test_directory), config=config_for_tests()).ls(".", long=True)[0].startswith("5.0 Bytes")
+    assert len(scanned) == 2
+
+    (test_directory / "file3.txt").touch()
+    assert LsTool(str(test_directory), config=config_for_tests()).ls(".")[-1] == "file3.txt"
+    assert len(scanned) == 3
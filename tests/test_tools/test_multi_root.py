@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from ai_shell.toolkit import ToolKit
+from ai_shell.tools_registry import just_tool_names
+from tests.util import config_for_tests
+
+
+@pytest.fixture
+def monorepo_kit(tmp_path):
+    for root, files in {
+        "api": {"src/server.py": "needle = 1\nneedle = 2\n", "README.md": "api\n"},
+        "web": {"src/app.py": "needle = 3\n", "src/view.py": "needle = 4\n"},
+    }.items():
+        for relative_path, text in files.items():
+            path = tmp_path / root / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text)
+    (tmp_path / "outside.txt").write_text("needle\n")
+    roots = {"web": str(tmp_path / "web"), "api": str(tmp_path / "api")}
+    return ToolKit(roots, "gpt-4o-mini", 500, just_tool_names(), config=config_for_tests())
+
+
+def call(kit, tool, **arguments):
+    return json.loads(kit.dispatch(tool, arguments))
+
+
+def test_searches_fan_out_with_root_prefixes(monorepo_kit):
+    everything = call(monorepo_kit, "grep", regex="needle", glob_pattern="**/*.py")
+    assert everything["matches_found"] == 4
+    assert [found["filename"] for found in everything["data"]] == [
+        "web/src/app.py",
+        "web/src/view.py",
+        "api/src/server.py",
+    ]
+
+    # the limits count matches across the roots, in root order
+    limited = call(
+        monorepo_kit, "grep", regex="needle", glob_pattern="**/*.py", skip_first_matches=1, maximum_matches_total=2
+    )
+    assert [(found["filename"], found["lines"]) for found in limited["data"]] == [
+        ("web/src/view.py", ["needle = 4"]),
+        ("api/src/server.py", ["needle = 1"]),
+    ]
+
+    assert call(monorepo_kit, "grep_count", regex="needle", glob_pattern="api/**/*.py") == {"api/src/server.py": 2}
+    assert call(monorepo_kit, "find_files", name="*.py", limit=2) == ["web/src/app.py", "web/src/view.py"]
+    assert call(monorepo_kit, "ls", path="src/*.py") == ["web/src/app.py", "web/src/view.py", "api/src/server.py"]
+    markdown = monorepo_kit.dispatch(
+        "grep_markdown", {"regex": "needle", "glob_pattern": "*/*.py", "output_mode": "count"}
+    )
+    assert json.loads(markdown).endswith("4 matches found in 3 files.\n")
+
+
+def test_paths_are_routed_and_jailed_per_root(monorepo_kit):
+    assert call(monorepo_kit, "ls", path=".") == ["web", "api"]
+    assert call(monorepo_kit, "ls", path="api") == ["README.md", "src"]
+    assert call(monorepo_kit, "head", file_path="api/src/server.py", lines=1) == ["needle = 1"]
+
+    escaped = call(monorepo_kit, "head", file_path="api/../outside.txt")
+    assert "not found in root folder" in escaped["detail"]
+    to_other_root = call(monorepo_kit, "head", file_path="web/../api/README.md")
+    assert "not found in root folder" in to_other_root["detail"]
+    unknown = call(monorepo_kit, "cat", file_paths=["docs/index.md"])
+    assert "one of web, api" in unknown["detail"]
+
+
+def test_merged_searches_keep_to_the_output_budget(tmp_path):
+    for root in ("web", "api"):
+        for number in range(10):
+            path = tmp_path / root / f"module_{number}.py"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("needle\n" * 10)
+    roots = {"web": str(tmp_path / "web"), "api": str(tmp_path / "api")}
+    kit = ToolKit(roots, "gpt-4o-mini", 10, just_tool_names(), config=config_for_tests())
+
+    found = call(kit, "grep", regex="needle", glob_pattern="*.py")
+    assert [(file["filename"], len(file["lines"])) for file in found["data"]] == [("web/module_0.py", 9)]
+    assert found["truncated"].endswith("skip_first_matches=9]")
+    many = call(kit, "grep_many", patterns={"first": "needle", "second": "needle"}, glob_pattern="*.py")
+    assert [len(file["lines"]) for file in many["first"]["data"]] == [9]
+    assert many["second"]["data"] == [] and "first, second" in many["truncated"]
+    counts = call(kit, "grep_count", regex="needle", glob_pattern="*.py")
+    assert len(counts) == 11 and counts["truncated"].startswith("[truncated at 10 lines: 10 more lines")
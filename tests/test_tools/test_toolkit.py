@@ -1,3 +1,6 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from ai_shell.toolkit import ToolKit
@@ -13,6 +16,45 @@ def test_grep():
     assert result.data
 
 
+def test_dispatch_grep_many():
+    kit = ToolKit(".", "gpt-4o-mini", 500, just_tool_names(), config=config_for_tests())
+    result = kit.dispatch(
+        "grep_many",
+        {
+            "glob_pattern": "tests/test_tools/test_toolkit.py",
+            "patterns": {"dispatch": "def test_dispatch_grep_[m]any", "nope": "x{99}"},
+        },
+    )
+    parsed = json.loads(result)
+    assert parsed["dispatch"]["matches_found"] == 1
+    assert parsed["nope"] == {"matches_found": 0, "data": []}
+
+
+def test_many_roots_on_threads_ignore_cwd(tmp_path):
+    roots = []
+    for number in range(8):
+        root = tmp_path / f"root_{number}"
+        (root / "src").mkdir(parents=True)
+        (root / "src" / "module.py").write_text(f"VALUE = {number}\n")
+        roots.append(root)
+
+    def session(root) -> tuple[str, ...]:
+        kit = ToolKit(str(root), "gpt-4o-mini", 500, just_tool_names(), config=config_for_tests())
+        found = json.loads(kit.dispatch("find_files", {"name": "*.py"}))
+        listed = json.loads(kit.dispatch("ls", {"path": "src"}))
+        kit.dispatch("replace_all", {"file_path": "src/module.py", "old_text": "VALUE", "new_text": "ANSWER"})
+        head = json.loads(kit.dispatch("head", {"file_path": "src/module.py", "lines": 1}))
+        grepped = json.loads(kit.dispatch("grep_files_with_matches", {"glob_pattern": "**/*.py", "regex": "ANSWER"}))
+        return found[0], listed[0], head[0], grepped[0]
+
+    # The test runner's cwd is none of the roots.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(session, roots))
+    for number, root in enumerate(roots):
+        assert results[number] == ("src/module.py", "module.py", f"ANSWER = {number}", "src/module.py")
+        assert (root / "src" / "module.py").read_text() == f"ANSWER = {number}\n"
+
+
 # async def test_tk():
 #     # Get the directory of the current script
 #     script_dir = os.path.dirname(os.path.abspath(__file__))
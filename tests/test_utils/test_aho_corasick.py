@@ -0,0 +1,23 @@
+import re
+
+from ai_shell.utils.aho_corasick import AhoCorasick, literal_alternatives
+
+
+def test_literal_alternatives():
+    assert literal_alternatives("def main") == ["def main"]
+    assert literal_alternatives(r"a\.b|c\|d") == ["a.b", "c|d"]
+    assert literal_alternatives("^#.*") is None
+    assert literal_alternatives("x{2}") is None
+    assert literal_alternatives("(?i)todo") is None
+    assert literal_alternatives("") is None
+
+
+def test_aho_corasick_agrees_with_regex():
+    needles = [f"symbol_{index}".encode() for index in range(150)] + [b"ymbol_1", b"bo"]
+    data = b" ".join(needles[::7]) + b"\nnothing symbol_149 here symbol_ and sym\n"
+    automaton = AhoCorasick(needles)
+    ends = {end for _start, end in automaton.finditer(data)}
+    expected = {match.end() for needle in needles for match in re.finditer(re.escape(needle), data)}
+    assert ends == expected
+    # longest needle ending at a position wins
+    assert list(AhoCorasick([b"ol_1", b"symbol_1"]).finditer(b"symbol_1x")) == [(0, 8)]
@@ -0,0 +1,145 @@
+import gc
+import json
+import os
+import time
+
+from ai_shell.toolkit import ToolKit
+from ai_shell.tools_registry import just_tool_names
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.content_cache import ContentCache, _cache_of, cached_open
+
+
+def backdate(path):
+    an_hour_ago = time.time() - 3600
+    os.utime(path, (an_hour_ago, an_hour_ago))
+
+
+def test_read_validation_and_byte_budget(tmp_path):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_bytes(b"one\r\ntwo\xff\n")
+    second.write_bytes(b"x" * 60)
+    for path in (first, second):
+        backdate(path)
+    cache = ContentCache()
+
+    assert cache.read(str(first), "surrogateescape") == "one\ntwo\udcff\n"
+    assert cache.read(str(first), as_text=False) == b"one\r\ntwo\xff\n"
+    assert cache.stats()["hits"] == 1
+    first.write_bytes(b"changed\n")
+    backdate(first)
+    assert cache.read(str(first)) == "changed\n"
+
+    # 20 bytes and their text take 40 of the 200, the least recently used of six files goes
+    names = [f"file_{number}.txt" for number in range(6)]
+    for name in names:
+        (tmp_path / name).write_text(name.ljust(19) + "\n")
+        backdate(tmp_path / name)
+    cache = ContentCache(maximum_bytes=200)
+    for name in names[:5] + names[:1] + names[5:]:
+        cache.read(str(tmp_path / name))
+    assert cache.stats()["evictions"] == 1
+    cache.read(str(tmp_path / names[0]))
+    assert cache.stats()["hits"] == 2
+    cache.read(str(tmp_path / names[1]))
+    assert cache.stats()["misses"] == 7
+    # over an eighth of the budget
+    assert cache.read(str(second)) is None
+
+    recent = tmp_path / "recent.txt"
+    recent.write_text("just written\n")
+    assert cache.read(str(recent)) == "just written\n"
+    assert cache.read(str(recent)) == "just written\n"
+    assert cache.stats()["misses"] == 9
+
+
+def test_tools_of_a_toolkit_share_reads_and_writes(tmp_path):
+    source = tmp_path / "module.py"
+    source.write_text("def needle():\n    return 1\n")
+    backdate(source)
+    kit = ToolKit(str(tmp_path), "gpt-4o-mini", 500, just_tool_names(), config=Config(str(tmp_path / "x.toml")))
+
+    kit.dispatch("cat_markdown", {"file_paths": ["module.py"]})
+    kit.dispatch("grep", {"regex": "needle", "glob_pattern": "*.py"})
+    with cached_open(str(source)) as file:
+        assert file.read() == "def needle():\n    return 1\n"
+    stats = kit.get_tool_usage_for("content_cache")
+    assert (stats["hits"], stats["misses"], stats["hit_rate_percent"]) == (1, 1, 50)
+    assert stats["bytes_saved"] == source.stat().st_size
+
+    # the edit updates the entry in place, the auto-cat and later reads are hits
+    result = json.loads(kit.dispatch("replace_all", {"file_path": "module.py", "old_text": "1", "new_text": "2"}))
+    assert "return 2" in result
+    assert kit.content_cache is not None
+    hits = kit.content_cache.stats()["hits"]
+    with cached_open(str(source)) as file:
+        assert file.read() == "def needle():\n    return 2\n"
+    assert kit.content_cache.stats()["hits"] == hits + 1
+    kit.close()
+    assert _cache_of(str(source)) is None
+
+
+def test_store_serves_writes_until_the_racy_window_passes(tmp_path):
+    path = tmp_path / "written.txt"
+    path.write_bytes(b"old\n")
+    backdate(path)
+    cache = ContentCache()
+    assert cache.read(str(path)) == "old\n"
+
+    path.write_bytes(b"new\n")
+    cache.store(str(path), b"new\n")
+    assert cache.read(str(path), as_text=False) == b"new\n"
+    assert cache.stats()["hits"] == 1
+
+    # once the window passes, the entry is dropped and the file read again
+    cache._entries[str(path)].racy_until_ns = time.time_ns()
+    backdate(path)
+    assert cache.read(str(path)) == "new\n"
+    assert cache.stats()["misses"] == 2
+    assert cache.read(str(path)) == "new\n"
+    assert cache.stats()["hits"] == 2
+
+    # someone else wrote to it as well
+    path.write_bytes(b"longer\n")
+    cache.store(str(path), b"new\n")
+    assert cache.stats()["entries"] == 0
+
+
+def test_toolkits_hold_the_caches_within_a_total(tmp_path):
+    # toolkits of other tests let go of their caches once collected
+    gc.collect()
+    config = Config(str(tmp_path / "x.toml"))
+    config.set_value("content_cache_bytes", str(1024))
+    config.set_value("content_cache_total_bytes", str(1024))
+    first_root, second_root = tmp_path / "first", tmp_path / "second"
+    first_root.mkdir()
+    second_root.mkdir()
+    first = ToolKit(str(first_root), "gpt-4o-mini", 500, just_tool_names(), config=config)
+    again = ToolKit(str(first_root), "gpt-4o-mini", 500, just_tool_names(), config=config)
+    assert first.content_cache is again.content_cache
+    assert first.content_cache is not None and first.content_cache.maximum_bytes == 1024
+
+    with ToolKit(str(second_root), "gpt-4o-mini", 500, just_tool_names(), config=config) as second:
+        assert second.content_cache is not None and second.content_cache.maximum_bytes == 512
+        assert first.content_cache.maximum_bytes == 512
+    assert _cache_of(str(second_root / "file.txt")) is None
+    assert first.content_cache.maximum_bytes == 1024
+
+    first.close()
+    assert _cache_of(str(first_root / "file.txt")) is first.content_cache
+    again.close()
+    assert _cache_of(str(first_root / "file.txt")) is None
+
+
+def test_limited_scans_stream_files_not_cached(tmp_path):
+    source = tmp_path / "module.py"
+    source.write_text("needle\n" * 100)
+    backdate(source)
+    with ToolKit(str(tmp_path), "gpt-4o-mini", 500, just_tool_names(), config=Config(str(tmp_path / "x.toml"))) as kit:
+        assert json.loads(kit.dispatch("grep_files_with_matches", {"regex": "needle", "glob_pattern": "*.py"})) == [
+            "module.py"
+        ]
+        assert kit.content_cache is not None and kit.content_cache.stats()["entries"] == 0
+
+        kit.dispatch("cat_markdown", {"file_paths": ["module.py"]})
+        kit.dispatch("grep_files_with_matches", {"regex": "needle", "glob_pattern": "*.py"})
+        assert kit.content_cache.stats()["hits"] == 1
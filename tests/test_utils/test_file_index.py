@@ -0,0 +1,124 @@
+import glob
+import os
+import shutil
+import time
+
+import pytest
+
+from ai_shell.find_tool import FindTool
+from ai_shell.ls_tool import LsTool
+from ai_shell.tools_registry import recommendations
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.file_index import FileIndex, open_file_index
+from ai_shell.utils.read_fs import temporary_change_dir
+
+
+def backdate(path, seconds_ago=60):
+    """Make a directory old enough that its mtime is trusted."""
+    old = time.time() - seconds_ago
+    os.utime(path, (old, old))
+
+
+@pytest.fixture
+def indexed_tree(tmp_path):
+    root = tmp_path / "root"
+    for relative_path in ("README.md", "src/app.py", "src/lib/util.py", "src/lib/data.csv", ".git/config"):
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content")
+    for folder in (root / "src/lib", root / "src", root):
+        backdate(folder)
+    return root
+
+
+def test_refresh_lists_only_changed_folders(indexed_tree, tmp_path):
+    with FileIndex(str(tmp_path / "files.sqlite3"), str(indexed_tree)) as index:
+        assert index.refresh() == {"folders": 3, "listed": 3, "dropped": 0}
+        assert index.refresh() == {"folders": 3, "listed": 0, "dropped": 0}
+        assert [path for path, _entry in index.entries()] == [
+            "README.md",
+            "src",
+            "src/app.py",
+            "src/lib",
+            "src/lib/data.csv",
+            "src/lib/util.py",
+        ]
+
+        (indexed_tree / "src/lib/new.py").write_text("new")
+        backdate(indexed_tree / "src/lib", 30)
+        assert index.refresh() == {"folders": 3, "listed": 1, "dropped": 0}
+        assert "src/lib/new.py" in [path for path, _entry in index.entries()]
+
+        shutil.rmtree(indexed_tree / "src/lib")
+        backdate(indexed_tree / "src", 30)
+        assert index.refresh() == {"folders": 2, "listed": 1, "dropped": 1}
+        assert [path for path, _entry in index.entries()] == ["README.md", "src", "src/app.py"]
+        assert index.summary()["files"] == 2
+
+
+def test_recently_changed_folder_is_listed_again(indexed_tree, tmp_path):
+    (indexed_tree / "src/fresh.py").write_text("fresh")
+    with FileIndex(str(tmp_path / "files.sqlite3"), str(indexed_tree)) as index:
+        index.refresh()
+        # src changed less than two seconds ago, its mtime can't be trusted yet
+        assert index.refresh()["listed"] == 1
+
+
+def test_glob_matches_glob_module(indexed_tree, tmp_path):
+    with FileIndex(str(tmp_path / "files.sqlite3"), str(indexed_tree)) as index:
+        index.refresh()
+        for pattern in ("*", "*/*", "src/*.py", "src/lib/*", "*/lib", "src/?pp.py"):
+            assert index.glob(pattern) == sorted(glob.glob(pattern, root_dir=indexed_tree)), pattern
+        assert index.glob(".git/*") is None
+        # recursive and brace globs are left to the glob engine
+        assert index.glob("**/*") is None
+        assert index.glob("src/{app,lib}*") is None
+
+
+def test_tools_answer_from_index(indexed_tree):
+    config = Config(str(indexed_tree / "ai_shell.toml"))
+    config.set_flag("file_index", True)
+    with temporary_change_dir(str(indexed_tree)):
+        plain = FindTool(str(indexed_tree), config=Config(str(indexed_tree / "plain.toml")))
+        indexed = FindTool(str(indexed_tree), config=config)
+        for criteria in ({}, {"name": "*.py"}, {"file_type": "directory"}, {"size": "+3"}, {"limit": 2}):
+            assert indexed.find_files(**criteria) == plain.find_files(**criteria), criteria
+        assert sorted(LsTool(str(indexed_tree), config=config).ls("src/*")) == ["src/app.py", "src/lib"]
+    with open_file_index(str(indexed_tree), config) as index:
+        # the code, the csv, README.md and both config files
+        assert index.summary()["files"] == 6
+    assert "cut_characters" in recommendations(str(indexed_tree), config)
+    assert "format_code_as_markdown" in recommendations(str(indexed_tree), config)
+
+
+def test_ls_same_with_and_without_index(tmp_path):
+    root = tmp_path / "root"
+    for relative_path in ("a.py", "src/b.py", "node_modules/pkg/index.js", "__pycache__/x.pyc", ".git/config"):
+        path = root / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content")
+    for folder in (root / "src", root / "node_modules", root / "__pycache__", root):
+        backdate(folder)
+    plain = Config(str(tmp_path / "plain.toml"))
+    indexed = Config(str(tmp_path / "indexed.toml"))
+    for config in (plain, indexed):
+        config.set_list("excluded_folders", ["node_modules"])
+    indexed.set_flag("file_index", True)
+    with temporary_change_dir(str(root)):
+        for pattern in ("*", "*/*", "node_*", "src/*"):
+            expected = sorted(LsTool(str(root), config=plain).ls(pattern))
+            assert sorted(LsTool(str(root), config=indexed).ls(pattern)) == expected, pattern
+    with open_file_index(str(root), indexed) as index:
+        assert index.glob("*") == ["__pycache__", "a.py", "node_modules", "src"]
+        # what's inside the pruned folders isn't indexed
+        assert index.glob("*/*") is None
+        assert index.glob("src/*") == ["src/b.py"]
+
+
+def test_recommendations_without_index(tmp_path):
+    (tmp_path / "notes.txt").write_text("notes")
+    config = Config(str(tmp_path / "ai_shell.toml"))
+    recommended = recommendations(str(tmp_path), config)
+    assert "cat" in recommended
+    assert "cut_characters" not in recommended
+    assert "pytest" not in recommended
@@ -0,0 +1,55 @@
+import os
+import time
+
+from ai_shell.utils.change_events import notify_files_changed
+from ai_shell.utils.fingerprint_cache import FingerprintCache, fingerprint_files, shared_cache
+
+
+def backdate(path):
+    an_hour_ago = time.time() - 3600
+    os.utime(path, (an_hour_ago, an_hour_ago))
+
+
+def test_get_put_and_validation(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    backdate(source)
+    cache = FingerprintCache(maximum_entries=2)
+    fingerprints = fingerprint_files([str(source)])
+    assert cache.put("key", fingerprints, ["result"])
+    assert cache.get("key", fingerprints) == ["result"]
+    source.write_text("x = 22\n")
+    assert cache.get("key", fingerprint_files([str(source)])) is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_recently_written_files_are_not_cached(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    cache = FingerprintCache()
+    assert not cache.put("key", fingerprint_files([str(source)]), "result")
+
+
+def test_lru_eviction():
+    cache = FingerprintCache(maximum_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, (), key)
+    cache.get("a", ())
+    cache.put("c", (), "c")
+    assert cache.get("b", ()) is None
+    assert cache.get("a", ()) == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_write_notification_invalidates_shared_cache(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    backdate(source)
+    cache = shared_cache(str(tmp_path), "test")
+    assert shared_cache(str(tmp_path), "test") is cache
+    fingerprints = fingerprint_files([str(source)])
+    cache.put("key", fingerprints, "result")
+    notify_files_changed([str(tmp_path / "other.py")])
+    assert cache.get("key", fingerprints) == "result"
+    notify_files_changed([str(source)])
+    assert cache.get("key", fingerprints) is None
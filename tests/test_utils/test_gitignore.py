@@ -0,0 +1,137 @@
+import os
+import subprocess
+
+import pytest
+
+from ai_shell.find_tool import FindTool
+from ai_shell.git_tool import GitTool
+from ai_shell.grep_tool import GrepTool
+from ai_shell.ls_tool import LsTool
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.gitignore import GitIgnore
+from ai_shell.utils.read_fs import temporary_change_dir
+from tests.util import config_for_tests
+
+ROOT_IGNORE = """\
+# comment
+*.log
+!keep.log
+build/
+/root_only.txt
+docs/**/*.md
+!docs/keep/**
+node_modules
+*.py[co]
+[!a]x.txt
+logs/**
+!logs/important/
+"""
+
+NESTED_IGNORE = """\
+!*.log
+*.txt
+deeper/*.txt
+!deeper/keep.txt
+"""
+
+PATHS = [
+    "a.log",
+    "keep.log",
+    "sub/a.log",
+    "sub/x.txt",
+    "sub/deeper/y.txt",
+    "sub/deeper/keep.txt",
+    "build/out.o",
+    "sub/build/z",
+    "root_only.txt",
+    "sub/root_only.txt",
+    "docs/a/b/c.md",
+    "docs/x.md",
+    "docs/keep/k.md",
+    "node_modules/pkg/index.js",
+    "m.pyc",
+    "m.py",
+    "bx.txt",
+    "ax.txt",
+    "logs/a",
+    "logs/important/b",
+    "secret.env",
+]
+
+
+@pytest.fixture
+def ignoring_repo(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text(ROOT_IGNORE)
+    (tmp_path / ".git" / "info").mkdir(parents=True, exist_ok=True)
+    (tmp_path / ".git" / "info" / "exclude").write_text("secret*\n")
+    for relative_path in PATHS:
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("needle\n")
+    (tmp_path / "sub" / ".gitignore").write_text(NESTED_IGNORE)
+    return tmp_path
+
+
+def test_same_answers_as_git(ignoring_repo):
+    result = subprocess.run(
+        ["git", "-C", str(ignoring_repo), "check-ignore", "--no-index", *PATHS], capture_output=True, text=True
+    )
+    ignored_by_git = set(result.stdout.split())
+    kept = GitIgnore(str(ignoring_repo)).filter_ignored(PATHS)
+    assert set(PATHS) - set(kept) == ignored_by_git
+    assert kept == [path for path in PATHS if path not in ignored_by_git]
+
+
+def test_recompiled_when_changed(ignoring_repo):
+    assert GitIgnore(str(ignoring_repo)).is_ignored("m.py") is False
+    with open(ignoring_repo / ".gitignore", "a", encoding="utf-8") as handle:
+        handle.write("m.py\n")
+    assert GitIgnore(str(ignoring_repo)).is_ignored("m.py") is True
+    # from a root folder below the repository top
+    assert GitIgnore(str(ignoring_repo / "sub")).is_ignored("x.txt") is True
+    assert GitIgnore(str(ignoring_repo / "sub")).is_ignored("a.log") is False
+
+
+def test_walkers_prune_ignored_folders(ignoring_repo, monkeypatch):
+    config = Config(str(ignoring_repo / "respect.toml"))
+    config.set_flag("respect_gitignore", True)
+    listed = []
+    original_scandir = os.scandir
+
+    def spy_scandir(path):
+        listed.append(os.path.basename(path))
+        return original_scandir(path)
+
+    monkeypatch.setattr("ai_shell.utils.walk.os.scandir", spy_scandir)
+    with temporary_change_dir(str(ignoring_repo)):
+        found = FindTool(str(ignoring_repo), config=config).find_files(name="*.js")
+        assert found == []
+        assert "node_modules" not in listed
+        everything = FindTool(str(ignoring_repo), config=config_for_tests()).find_files(name="*.js")
+        assert everything == ["node_modules/pkg/index.js"]
+
+        grep = GrepTool(str(ignoring_repo), config=config)
+        files = [file_matches.filename for file_matches in grep.grep("needle", "**/*").data]
+        assert files == GitIgnore(str(ignoring_repo)).filter_ignored(sorted(PATHS))
+
+        assert LsTool(str(ignoring_repo), config=config).ls("logs/*") == ["logs/important"]
+        assert "build" not in LsTool(str(ignoring_repo), config=config).ls(".")
+
+
+def test_git_tool_uses_nested_ignore_files(ignoring_repo):
+    tool = GitTool(str(ignoring_repo), config=config_for_tests())
+    assert tool.is_ignored_by_gitignore(str(ignoring_repo / "sub" / "x.txt")) is True
+    assert tool.is_ignored_by_gitignore(str(ignoring_repo / "sub" / "a.log")) is False
+    assert tool.is_ignored_by_gitignore(str(ignoring_repo / "node_modules" / "pkg" / "index.js")) is True
+
+
+def test_git_tool_uses_a_given_ignore_file_alone(ignoring_repo):
+    tool = GitTool(str(ignoring_repo), config=config_for_tests())
+    # sub/.gitignore re-includes *.log and ignores *.txt below sub only
+    assert tool.is_ignored_by_gitignore("sub/a.log", "sub/.gitignore") is False
+    assert tool.is_ignored_by_gitignore("sub/deeper/y.txt", "sub/.gitignore") is True
+    assert tool.is_ignored_by_gitignore("sub/deeper/keep.txt", "sub/.gitignore") is False
+    assert tool.is_ignored_by_gitignore("bx.txt", "sub/.gitignore") is False
+    with pytest.raises(FileNotFoundError):
+        tool.is_ignored_by_gitignore("bx.txt", "missing/.gitignore")
@@ -0,0 +1,86 @@
+import glob
+import os
+
+import pytest
+
+from ai_shell.cat_tool import CatTool
+from ai_shell.utils.glob_engine import compile_glob, expand_braces, glob_in_root
+from tests.util import config_for_tests
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    for relative_path in (
+        "README.md",
+        "setup.py",
+        "src/app.py",
+        "src/app.md",
+        "src/lib/util.py",
+        "src/lib/.secret.py",
+        "src/.cache/cached.py",
+        "tests/test_app.py",
+        "node_modules/pkg/index.py",
+    ):
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative_path + "\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern", ["*", "*.py", "**/*.py", "src/**", "src/*/", "src/lib/util.py", "**/.secret.py", "*/lib/*", "src/?pp.*"]
+)
+def test_same_as_glob_module(source_tree, pattern):
+    expected = sorted(path.rstrip("/") for path in glob.glob(pattern, root_dir=source_tree, recursive=True))
+    assert list(glob_in_root(pattern, str(source_tree))) == expected
+
+
+def test_braces_and_multiple_patterns(source_tree):
+    assert expand_braces("a{b,c{d,e}}f") == ["abf", "acdf", "acef"]
+    assert list(glob_in_root("src/app.{py,md}", str(source_tree))) == ["src/app.md", "src/app.py"]
+    assert list(glob_in_root(["tests/*.py", "setup.py", "src/*.md"], str(source_tree))) == [
+        "setup.py",
+        "src/app.md",
+        "tests/test_app.py",
+    ]
+
+
+def test_exclusions_prune_the_walk(source_tree, monkeypatch):
+    listed = []
+    original_scandir = os.scandir
+    monkeypatch.setattr(
+        "ai_shell.utils.glob_engine.os.scandir", lambda path: listed.append(path) or original_scandir(path)
+    )
+    found = list(glob_in_root(["**/*.py", "!src/lib"], str(source_tree), exclude=["node_modules"]))
+    assert found == ["setup.py", "src/app.py", "tests/test_app.py"]
+    listed_names = {os.path.basename(path) for path in listed}
+    assert not {"lib", "node_modules", "pkg", ".cache"} & listed_names
+
+    # literal segments are looked up, not listed
+    listed.clear()
+    assert list(glob_in_root("src/lib/util.py", str(source_tree))) == ["src/lib/util.py"]
+    assert listed == []
+
+
+def test_only_paths_inside_the_root(source_tree):
+    root = str(source_tree / "src")
+    assert list(glob_in_root("../*", root)) == []
+    assert list(glob_in_root("lib/../../setup.py", root)) == []
+    assert list(glob_in_root("lib/../app.py", root)) == ["app.py"]
+    assert list(glob_in_root(str(source_tree / "src" / "*.py"), root)) == [os.path.join(root, "app.py")]
+    assert list(glob_in_root(str(source_tree / "*.py"), root)) == []
+
+
+def test_files_only_and_matches(source_tree):
+    compiled = compile_glob(["src/*", "!*.md"], str(source_tree))
+    assert list(compiled.iglob()) == ["src/app.py", "src/lib"]
+    assert list(compiled.iglob(files_only=True)) == ["src/app.py"]
+    assert compiled.matches("src/anything.py")
+    assert not compiled.matches("src/app.md")
+    assert compile_glob(["src/*", "!*.md"], str(source_tree)) is compiled
+
+
+def test_cat_globs_once_in_pattern_order(source_tree):
+    with_tool = CatTool(str(source_tree), config=config_for_tests())
+    output = with_tool.cat_markdown(["tests/*.py", "src/{app,lib/util}.py"], number_lines=False)
+    assert output == "tests/test_app.py\nsrc/app.py\nsrc/lib/util.py\n"
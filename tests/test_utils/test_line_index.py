@@ -0,0 +1,47 @@
+import os
+
+from ai_shell.cat_tool import CatTool
+from ai_shell.head_tail_tool import HeadTailTool
+from ai_shell.replace_tool import ReplaceTool
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.line_index import existing_line_offsets, scan_line_offsets
+
+
+def test_offsets_seek_to_every_line(tmp_path):
+    path = tmp_path / "lines.txt"
+    lines = [f"line {number}\n".encode() for number in range(300)] + [b"no newline"]
+    path.write_bytes(b"".join(lines))
+    offsets = scan_line_offsets(str(path), stride=7)
+    assert offsets.line_count == 301
+    with open(path, "rb") as file:
+        for number in (0, 6, 7, 8, 150, 300):
+            assert offsets.seek_line(file, number) == sum(map(len, lines[:number]))
+            assert file.readline() == lines[number]
+        assert offsets.seek_line(file, 301) == os.path.getsize(path)
+
+
+def test_cat_range_indexes_big_files_for_tail_and_replace(tmp_path):
+    path = tmp_path / "big.log"
+    path.write_text("".join(f"entry {number}\n" for number in range(1, 5001)))
+    config = Config(str(tmp_path / "ai_shell.toml"))
+    config.set_value("line_index_min_bytes", "1000")
+    full_path = str(path)
+    assert existing_line_offsets(str(tmp_path), config, full_path) is None
+
+    cat_tool = CatTool(str(tmp_path), config)
+    assert cat_tool.cat_range("big.log", 4999) == "4999\tentry 4999\n5000\tentry 5000\n"
+    assert cat_tool.cat_range("big.log", 1200, 1201) == "1200\tentry 1200\n1201\tentry 1201\n"
+    assert cat_tool.cat_range("big.log", 6000) == ""
+    assert existing_line_offsets(str(tmp_path), config, full_path).line_count == 5000
+
+    assert HeadTailTool(str(tmp_path), config).tail("big.log", 2) == ["entry 4999", "entry 5000"]
+
+    replace_tool = ReplaceTool(str(tmp_path), config)
+    replace_tool.auto_cat = False
+    replace_tool.replace_line_by_line("big.log", "entry", "item", 10, 12)
+    changed = path.read_text().split("\n")
+    assert changed[9:13] == ["entry 10", "item 11", "item 12", "entry 13"]
+    assert changed[-1] == "entry 5000"
+    # the index of the old version is stale
+    assert existing_line_offsets(str(tmp_path), config, full_path) is None
+    assert cat_tool.cat_range("big.log", 12, 12) == "12\titem 12\n"
@@ -0,0 +1,85 @@
+import json
+
+from ai_shell.toolkit import ToolKit
+from ai_shell.tools_registry import just_tool_names
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.output_budget import OutputSink, using_sink
+
+
+def test_sink_cuts_lines_tokens_and_results():
+    sink = OutputSink(maximum_lines=3)
+    assert sink.take(["a\n", "b\n"]) == ["a\n", "b\n"]
+    assert sink.take(["c\n", "d\n"]) == ["c\n"]
+    assert sink.full and sink.take(["e\n"]) == []
+
+    # unknown models are estimated at 4 characters a token
+    sink = OutputSink(maximum_tokens=4, token_model="no-such-model")
+    assert sink.take(["12345678", "1234", "12345678"]) == ["12345678", "1234"]
+    assert sink.budget == "4 tokens"
+
+    sink = OutputSink(maximum_lines=2)
+    assert sink.finish("one\ntwo\nthree\nfour\n") == (
+        "one\ntwo\n[truncated at 2 lines: 2 more lines not shown, continue with a narrower call, e.g. fewer files or "
+        "a line range]\n"
+    )
+    assert OutputSink(maximum_lines=2).finish(["a", "b", "c"])[2].startswith("[truncated at 2 lines: 1 more lines")
+    assert OutputSink().finish("one\ntwo\nthree\n") == "one\ntwo\nthree\n"
+    with using_sink(OutputSink(maximum_lines=1)) as sink:
+        sink.take(["a", "b"])
+        sink.truncate("skip_first_matches=1", more_lines=1)
+        assert sink.finish({"found": 1})["truncated"].endswith("continue with skip_first_matches=1]")
+
+
+def test_dispatch_stops_reading_at_the_budget(tmp_path):
+    for number in range(5):
+        (tmp_path / f"module_{number}.py").write_text("".join(f"needle_{number} = {line}\n" for line in range(4)))
+    kit = ToolKit(str(tmp_path), "gpt-4o-mini", 6, just_tool_names(), config=Config(str(tmp_path / "x.toml")))
+
+    markdown = json.loads(kit.dispatch("cat_markdown", {"file_paths": ["*.py"]}))
+    assert markdown.splitlines()[-2:] == [
+        "6\tneedle_1 = 1",
+        "[truncated at 6 lines: at least 2 more lines and 3 more files not shown, continue with "
+        'cat_range(file_path="module_1.py", start_line=3), then cat_markdown(file_paths=["module_2.py", '
+        '"module_3.py", "module_4.py"])]',
+    ]
+    lines = json.loads(kit.dispatch("cat", {"file_paths": ["module_4.py", "module_3.py"]}))
+    assert len(lines) == 7 and lines[-1].startswith("[truncated at 6 lines")
+
+    # a file name and its matches count as lines
+    found = json.loads(kit.dispatch("grep", {"regex": "needle", "glob_pattern": "*.py", "context_after": 1}))
+    assert [(file["filename"], file["lines"]) for file in found["data"]] == [
+        ("module_0.py", [f"needle_0 = {line}" for line in range(4)]),
+    ]
+    assert found["truncated"].endswith("continue with the same search and skip_first_matches=4]")
+    # cached results are cut the same way
+    assert json.loads(kit.dispatch("grep", {"regex": "needle", "glob_pattern": "*.py", "context_after": 1})) == found
+    markdown = json.loads(kit.dispatch("grep_markdown", {"regex": "needle", "glob_pattern": "*.py"}))
+    assert markdown.endswith("skip_first_matches=4]\n")
+
+    # tools that don't stream are cut by dispatch
+    small = ToolKit(str(tmp_path), "gpt-4o-mini", 3, just_tool_names(), config=Config(str(tmp_path / "x.toml")))
+    assert json.loads(small.dispatch("find_files", {"name": "*.py"})) == [
+        "module_0.py",
+        "module_1.py",
+        "module_2.py",
+        "[truncated at 3 lines: 2 more lines not shown, continue with a narrower call, e.g. a narrower pattern or a "
+        "limit]",
+    ]
+    unlimited = ToolKit(str(tmp_path), "gpt-4o-mini", 0, just_tool_names(), config=Config(str(tmp_path / "x.toml")))
+    assert json.loads(unlimited.dispatch("cat_markdown", {"file_paths": ["*.py"]})).count("\n") == 20
+
+
+def test_grep_many_and_counts_keep_to_the_budget(tmp_path):
+    for number in range(10):
+        (tmp_path / f"module_{number}.py").write_text("needle = 1\n" * 10)
+    kit = ToolKit(str(tmp_path), "gpt-4o-mini", 10, just_tool_names(), config=Config(str(tmp_path / "x.toml")))
+
+    many = json.loads(kit.dispatch("grep_many", {"patterns": {"a": "needle", "b": "= 1"}, "glob_pattern": "*.py"}))
+    assert [(file["filename"], len(file["lines"])) for file in many["a"]["data"]] == [("module_0.py", 9)]
+    assert many["b"]["data"] == []
+    assert many["truncated"].startswith("[truncated at 10 lines: at least 1")
+    counts = json.loads(kit.dispatch("grep_count", {"regex": "needle", "glob_pattern": "*.py"}))
+    assert list(counts) == [f"module_{number}.py" for number in range(10)]
+    small = ToolKit(str(tmp_path), "gpt-4o-mini", 3, just_tool_names(), config=Config(str(tmp_path / "x.toml")))
+    counts = json.loads(small.dispatch("grep_count", {"regex": "needle", "glob_pattern": "*.py"}))
+    assert list(counts)[3:] == ["truncated"]
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from ai_shell.grep_tool import GrepTool
+from ai_shell.utils.change_events import notify_files_changed
+from ai_shell.utils.path_jail import PathJail, path_jail
+from ai_shell.utils.read_fs import remove_root_folder
+from tests.util import config_for_tests
+
+
+@pytest.fixture
+def linked_tree(tmp_path):
+    root = tmp_path / "root"
+    (root / "src" / "many").mkdir(parents=True)
+    (tmp_path / "outside").mkdir()
+    (tmp_path / "outside" / "secret.txt").write_text("needle\n")
+    (root / "src" / "app.py").write_text("needle\n")
+    for number in range(40):
+        (root / "src" / "many" / f"module_{number}.py").write_text("needle\n")
+    os.symlink(root / "src" / "app.py", root / "src" / "many" / "alias.py")
+    os.symlink(tmp_path / "outside" / "secret.txt", root / "src" / "many" / "escape.txt")
+    return root
+
+
+def test_contains(linked_tree):
+    jail = PathJail(str(linked_tree))
+    assert jail.contains("src/app.py")
+    assert jail.contains(str(linked_tree / "src"))
+    assert jail.contains(str(linked_tree))
+    assert not jail.contains("../outside/secret.txt")
+    assert not jail.contains(str(linked_tree) + "_sibling/x")
+    assert not jail.contains("/etc/passwd")
+    with pytest.raises(ValueError):
+        PathJail("src/*")
+    assert jail.absolute_inside("./src/app.py") == str(linked_tree / "src" / "app.py")
+    with pytest.raises(ValueError):
+        jail.absolute_inside("../outside/secret.txt")
+
+
+def test_relativize(linked_tree):
+    jail = PathJail(str(linked_tree))
+    assert jail.relativize(str(linked_tree)) == "."
+    assert jail.relativize("src/app.py") == "src/app.py"
+    assert jail.relativize(str(linked_tree / "src" / "app.py")) == "src/app.py"
+    assert jail.relativize("src/many/alias.py") == "src/many/alias.py"
+    assert jail.resolves_inside("src/many/alias.py")
+    assert not jail.resolves_inside("src/many/escape.txt")
+    with pytest.raises(ValueError):
+        jail.relativize("src/many/escape.txt")
+    with pytest.raises(ValueError):
+        jail.relativize("../outside/secret.txt")
+
+
+def test_relativize_many_same_as_one_by_one(linked_tree):
+    jail = PathJail(str(linked_tree), maximum_entries=8)
+    paths = sorted(f"src/many/{name}" for name in os.listdir(linked_tree / "src" / "many") if name != "escape.txt")
+    paths.append(str(linked_tree / "src" / "app.py"))
+    assert jail.relativize_many(paths) == [PathJail(str(linked_tree)).relativize(path) for path in paths]
+    assert len(jail._real_paths) <= 8
+    with pytest.raises(ValueError):
+        jail.relativize_many(paths + ["src/many/escape.txt"])
+
+
+def test_shared_jail_forgets_changed_links(linked_tree):
+    jail = path_jail(str(linked_tree))
+    assert jail is path_jail(str(linked_tree) + "/")
+    assert remove_root_folder("src/many/alias.py", str(linked_tree)) == "src/many/alias.py"
+    os.remove(linked_tree / "src" / "many" / "alias.py")
+    os.symlink(linked_tree.parent / "outside" / "secret.txt", linked_tree / "src" / "many" / "alias.py")
+    notify_files_changed([str(linked_tree / "src" / "many" / "alias.py")])
+    assert not jail.resolves_inside("src/many/alias.py")
+
+
+def test_grep_skips_links_out_of_the_root(linked_tree):
+    tool = GrepTool(str(linked_tree), config=config_for_tests())
+    files = tool.grep_files_with_matches("needle", "src/many/*")
+    assert "src/many/escape.txt" not in files
+    assert "src/many/alias.py" in files
+    assert len(files) == 41
@@ -0,0 +1,28 @@
+import orjson
+
+from ai_shell.utils.json_utils import loosy_goosy_default_encoder
+from ai_shell.utils.path_list import PathList
+
+
+def test_path_list_round_trips_paths():
+    paths = ["a.py", "src/a.py", "src/b.py", "src/deep/c.py", "src/d.py"]
+    compact = PathList(paths)
+    assert list(compact) == paths
+    assert [compact[index] for index in range(len(compact))] == paths
+    assert compact[-1] == "src/d.py"
+    assert compact[1:3] == ["src/a.py", "src/b.py"]
+    assert "src/deep/c.py" in compact
+    assert compact == PathList(paths)
+    assert compact != paths[:-1]
+
+
+def test_path_list_shares_folders():
+    compact = PathList(f"src/package/module_{index}.py" for index in range(1000))
+    # pylint: disable=protected-access
+    assert compact._folders == ["src/package/"]
+    assert len(compact._names) == 1000
+
+
+def test_path_list_serializes_as_list():
+    compact = PathList(["x/y.txt", "z.txt"])
+    assert orjson.loads(orjson.dumps(compact, default=loosy_goosy_default_encoder)) == ["x/y.txt", "z.txt"]
@@ -0,0 +1,25 @@
+import pytest
+
+from ai_shell.utils.read_ahead import ReadAhead
+
+
+def test_files_come_in_order_within_the_window(tmp_path):
+    paths = []
+    for number in range(20):
+        path = tmp_path / f"{number}.txt"
+        # every 5th file is bigger than the window, streamed rather than read ahead
+        path.write_bytes(f"{number}\n".encode() * (200 if number % 5 == 0 else 10))
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.txt"))
+
+    with ReadAhead(paths, workers=3, window_bytes=100) as read_ahead:
+        for number, path in enumerate(paths[:-1]):
+            with read_ahead.open(path) as file:
+                assert file.read() == f"{number}\n".encode() * (200 if number % 5 == 0 else 10)
+            assert read_ahead._in_flight_bytes <= 100
+        with pytest.raises(FileNotFoundError):
+            read_ahead.open(paths[-1])
+
+    with ReadAhead(paths[:3], workers=2) as read_ahead:
+        with pytest.raises(ValueError):
+            read_ahead.open(paths[1])
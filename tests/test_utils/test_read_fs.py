@@ -1,5 +1,5 @@
 # Example usage
-from ai_shell.utils.read_fs import is_file_in_root_folder, sanitize_path
+from ai_shell.utils.read_fs import is_file_in_root_folder, sanitize_path, tree
 
 
 def test_sanitize_path():
@@ -13,3 +13,29 @@ def test_sanitize_path():
 
 def test_is_file_in_root_folder_rejects_rooted_path_without_drive(tmp_path):
     assert is_file_in_root_folder("/outside_test_file.txt", str(tmp_path)) is False
+
+
+def test_tree_same_with_listing_threads(tmp_path):
+    for relative_path in ("a/b/c.txt", "a/d.txt", "e/f.txt", "g.txt", "a/__pycache__/x.pyc"):
+        path = tmp_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content")
+    serial = tree(tmp_path)
+    assert "__pycache__" not in serial
+    assert serial.endswith("\n3 directories, 4 files\n")
+    assert tree(tmp_path, workers=4) == serial
+    assert tree(tmp_path, length_limit=2, workers=4) == tree(tmp_path, length_limit=2)
+
+
+def test_tree_follows_symlinked_folders(tmp_path):
+    (tmp_path / "e").mkdir()
+    (tmp_path / "e/f.txt").write_text("content")
+    (tmp_path / "d").mkdir()
+    (tmp_path / "d/__pycache__").mkdir()
+    (tmp_path / "d/link").symlink_to("../e")
+    listing = tree(tmp_path)
+    assert "│   └── link\n│       └── f.txt\n" in listing
+    assert listing.endswith("\n3 directories, 2 files\n")
+    assert tree(tmp_path, workers=4) == listing
+    # a listing of folders alone shows __pycache__
+    assert "__pycache__" in tree(tmp_path, limit_to_directories=True)
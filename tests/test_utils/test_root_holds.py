@@ -0,0 +1,17 @@
+from ai_shell.utils.root_holds import RootHolds
+
+
+def test_values_dropped_once_nothing_holds_them(tmp_path):
+    dropped: list[list[str]] = []
+    holds: RootHolds[list[str]] = RootHolds(on_drop=dropped.append)
+    value = holds.hold(str(tmp_path), lambda: ["first"])
+    assert holds.hold(str(tmp_path), lambda: ["second"]) is value
+
+    holds.release(str(tmp_path))
+    assert holds.get(str(tmp_path)) is value
+    # a finalizer's release waits for the next hold or release
+    holds.release(str(tmp_path), later=True)
+    assert holds.get(str(tmp_path)) is value and not dropped
+    other = holds.hold(str(tmp_path / "other"), lambda: ["other"])
+    assert dropped == [value]
+    assert holds.items() == [(str(tmp_path / "other"), other)]
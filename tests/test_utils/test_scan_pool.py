@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+import ai_shell.utils.scan_pool as scan_pool_module
+from ai_shell.toolkit import ToolKit
+from ai_shell.tools_registry import just_tool_names
+from ai_shell.utils.config_manager import Config
+
+# pylint: disable=protected-access
+
+
+def test_toolkit_reuses_one_pool_until_closed(tmp_path):
+    for index in range(4):
+        (tmp_path / f"module_{index}.py").write_text(f"# TODO {index}\n")
+    config = Config(str(tmp_path / "x.toml"))
+    config.set_value("grep_workers", "2")
+    kit = ToolKit(str(tmp_path), "gpt-4o-mini", 500, just_tool_names(), config=config)
+    assert scan_pool_module._POOLS.get(str(tmp_path)).pool is None
+
+    first = json.loads(kit.dispatch("grep", {"regex": "TODO", "glob_pattern": "*.py"}))
+    pool = scan_pool_module._POOLS.get(str(tmp_path)).pool
+    assert pool is not None
+    assert pool._mp_context.get_start_method() != "fork"
+    assert json.loads(kit.dispatch("grep", {"regex": "TODO", "glob_pattern": "*.py"})) == first
+    assert scan_pool_module._POOLS.get(str(tmp_path)).pool is pool
+
+    kit.close()
+    assert scan_pool_module._POOLS.get(str(tmp_path)) is None
+    with pytest.raises(RuntimeError):
+        pool.submit(print)
@@ -0,0 +1,32 @@
+import os
+
+from ai_shell.utils.trigram_index import TrigramIndex, required_trigrams
+
+
+def test_required_trigrams_drops_optional_and_unsafe_parts():
+    assert required_trigrams("colou?r") == [{b"col", b"olo"}]
+    assert required_trigrams("foo(bar)?baz") == [{b"foo", b"baz"}]
+    # k, i and s can match non-ascii letters when ignoring case
+    assert required_trigrams("(?i)kiss") is None
+    assert required_trigrams("print|x") is None
+
+
+def test_narrow_and_refresh(tmp_path):
+    has_it = tmp_path / "has_it.py"
+    lacks_it = tmp_path / "lacks_it.py"
+    has_it.write_text("def needle():\n    pass\n")
+    lacks_it.write_text("def haystack():\n    pass\n")
+    paths = [str(has_it), str(lacks_it)]
+
+    with TrigramIndex(str(tmp_path / "index.sqlite3")) as index:
+        # just written, the files could change again without their mtime changing, so both stay candidates
+        assert index.narrow("NEEDLE|needle", paths) == paths
+        for path in paths:
+            os.utime(path, ns=(2, 2))
+        assert index.narrow("NEEDLE|needle", paths) == [str(has_it)]
+        # no literals, nothing to narrow with
+        assert index.narrow("^def", paths) == paths
+
+        lacks_it.write_text("needle = 1\n")
+        os.utime(lacks_it, ns=(1, 1))
+        assert index.narrow("needle", paths) == paths
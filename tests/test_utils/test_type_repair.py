@@ -1,6 +1,6 @@
 import pytest
 
-from ai_shell.utils.type_repair import convert_to_list
+from ai_shell.utils.type_repair import convert_to_dict, convert_to_list
 
 
 def test_convert_single_item_string():
@@ -25,3 +25,10 @@ def test_convert_empty_string():
 def test_convert_non_list_non_string():
     with pytest.raises(TypeError):
         convert_to_list(Exception("This is not a list or string"))
+
+
+def test_convert_to_dict():
+    assert convert_to_dict('{"a": "b"}') == {"a": "b"}
+    assert convert_to_dict({"a": "b"}) == {"a": "b"}
+    with pytest.raises(TypeError):
+        convert_to_dict("[1, 2]")
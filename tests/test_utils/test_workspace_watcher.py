@@ -0,0 +1,160 @@
+import errno
+import os
+import time
+
+import pytest
+
+import ai_shell.utils.workspace_watcher as watcher_module
+from ai_shell.grep_tool import GrepTool
+from ai_shell.toolkit import ToolKit
+from ai_shell.tools_registry import just_tool_names
+from ai_shell.utils.change_events import add_change_listener, remove_change_listener
+from ai_shell.utils.config_manager import Config
+from ai_shell.utils.file_index import FileIndex
+from ai_shell.utils.fingerprint_cache import shared_cache
+from ai_shell.utils.read_fs import temporary_change_dir
+from ai_shell.utils.workspace_watcher import WorkspaceWatcher, live_watcher, stop_watchers, watch_root
+
+
+@pytest.fixture
+def reported():
+    changes: list[str] = []
+    add_change_listener(changes.extend)
+    yield changes
+    remove_change_listener(changes.extend)
+    stop_watchers()
+
+
+def wait_for(condition, seconds=5.0):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def inotify_works():
+    try:
+        watcher_module.Inotify().close()
+    except OSError:
+        return False
+    return True
+
+
+@pytest.mark.skipif(not inotify_works(), reason="needs Linux inotify")
+def test_inotify_reports_changes(tmp_path, reported):
+    (tmp_path / "old.txt").write_text("old")
+    (tmp_path / ".git").mkdir()
+    watcher = WorkspaceWatcher(str(tmp_path))
+    watcher.start()
+    try:
+        assert watcher.live
+        (tmp_path / "old.txt").write_text("changed")
+        assert wait_for(lambda: str(tmp_path / "old.txt") in reported)
+
+        (tmp_path / "package").mkdir()
+        (tmp_path / "package" / "new.py").write_text("new")
+        assert wait_for(lambda: str(tmp_path / "package" / "new.py") in reported)
+
+        # hidden folders are not watched
+        (tmp_path / ".git" / "index").write_text("index")
+        time.sleep(0.3)
+        assert str(tmp_path / ".git" / "index") not in reported
+    finally:
+        watcher.stop()
+    assert watcher.mode == "stopped"
+
+
+def test_polling_fallback_when_inotify_limit_reached(tmp_path, reported, monkeypatch):
+    def out_of_watches():
+        raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+
+    monkeypatch.setattr(watcher_module, "Inotify", out_of_watches)
+    (tmp_path / "file.txt").write_text("one")
+    watcher = WorkspaceWatcher(str(tmp_path), poll_seconds=0.05)
+    watcher.start()
+    try:
+        assert watcher.mode == "polling"
+        assert not watcher.live
+        (tmp_path / "added.txt").write_text("two")
+        assert wait_for(lambda: str(tmp_path / "added.txt") in reported)
+        os.remove(tmp_path / "file.txt")
+        assert wait_for(lambda: str(tmp_path / "file.txt") in reported)
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.skipif(not inotify_works(), reason="needs Linux inotify")
+def test_watched_index_lists_only_reported_folders(tmp_path, reported):
+    root = tmp_path / "root"
+    (root / "a").mkdir(parents=True)
+    (root / "b").mkdir()
+    (root / "a" / "one.py").write_text("one")
+    config = Config(str(tmp_path / "ai_shell.toml"))
+    watcher = watch_root(str(root), config)
+    assert live_watcher(str(root / "a")) is watcher
+    with FileIndex(str(tmp_path / "files.sqlite3"), str(root)) as index:
+        assert index.refresh()["listed"] == 3
+        assert index.refresh() == {"folders": 0, "listed": 0, "dropped": 0}
+
+        (root / "b" / "c").mkdir()
+        (root / "b" / "c" / "two.py").write_text("two")
+        assert wait_for(lambda: str(root / "b" / "c" / "two.py") in reported)
+        index.refresh()
+        assert [path for path, _entry in index.entries()] == ["a", "a/one.py", "b", "b/c", "b/c/two.py"]
+
+        reported.clear()
+        os.remove(root / "b" / "c" / "two.py")
+        os.rmdir(root / "b" / "c")
+        assert wait_for(lambda: str(root / "b" / "c") in reported)
+        assert index.refresh()["dropped"] == 1
+        assert [path for path, _entry in index.entries()] == ["a", "a/one.py", "b"]
+
+
+@pytest.mark.skipif(not inotify_works(), reason="needs Linux inotify")
+def test_watched_grep_cache_skips_stat(tmp_path, reported, monkeypatch):
+    (tmp_path / "module.py").write_text("# TODO first\n")
+    config = Config(str(tmp_path / "ai_shell.toml"))
+    watch_root(str(tmp_path), config)
+    with temporary_change_dir(str(tmp_path)):
+        tool = GrepTool(root_folder=str(tmp_path), config=config)
+        monkeypatch.setattr("ai_shell.grep_tool.fingerprint_files", lambda paths: pytest.fail("stat'ed files"))
+        assert tool.grep("TODO", "*.py").data[0].lines == ["# TODO first"]
+        assert tool.grep("TODO", "*.py").data[0].lines == ["# TODO first"]
+        assert shared_cache(str(tmp_path), "grep").stats()["hits"] == 1
+
+        (tmp_path / "module.py").write_text("# TODO second\n")
+        assert wait_for(lambda: str(tmp_path / "module.py") in reported)
+        assert tool.grep("TODO", "*.py").data[0].lines == ["# TODO second"]
+
+
+def test_toolkit_starts_one_watcher_per_root(tmp_path, reported):
+    config = Config(str(tmp_path / "ai_shell.toml"))
+    config.set_flag("watch_workspace", True)
+    first = ToolKit(str(tmp_path), "gpt-4o-mini", 500, just_tool_names(), config=config)
+    second = ToolKit(str(tmp_path), "gpt-4o-mini", 500, just_tool_names(), config=config)
+    assert first.root_folder == second.root_folder
+    assert watch_root(str(tmp_path), config).mode in ("inotify", "polling")
+    # pylint: disable=protected-access
+    assert list(watcher_module._WATCHERS) == [str(tmp_path)]
+
+
+@pytest.mark.skipif(not inotify_works(), reason="needs Linux inotify")
+def test_watched_caches_stat_files_in_unwatched_folders(tmp_path, reported):
+    workflow = tmp_path / ".github" / "build.yml"
+    workflow.parent.mkdir()
+    workflow.write_text("# TODO first\n")
+    os.utime(workflow, (1_000_000, 1_000_000))
+    config = Config(str(tmp_path / "ai_shell.toml"))
+    watcher = watch_root(str(tmp_path), config)
+    assert watcher.watches_folder(str(tmp_path))
+    assert not watcher.watches_folder(str(workflow.parent))
+    with temporary_change_dir(str(tmp_path)):
+        tool = GrepTool(root_folder=str(tmp_path), config=config)
+        assert tool.grep("TODO", ".github/*.yml").data[0].lines == ["# TODO first"]
+
+        # hidden folders are not watched, the change is only seen by stat'ing the file
+        workflow.write_text("# TODO second\n")
+        os.utime(workflow, (2_000_000, 2_000_000))
+        assert tool.grep("TODO", ".github/*.yml").data[0].lines == ["# TODO second"]